@@ -1,4 +1,5 @@
 # app/config/categories.py
+import os
 
 # Central place for all product categories used in Pinecone filters
 CATEGORIES = [
@@ -12,12311 +13,13 @@ CATEGORIES = [
     "Luxury Goods"
 ]
 
-
-# Auto-generated category embeddings
-CATEGORY_EMBEDDINGS = {
-  "Fragrance & Beauty": [
-    0.037918634712696075,
-    0.0047851367853581905,
-    -0.019781816750764847,
-    -0.0026556984521448612,
-    -0.0024204496294260025,
-    -0.03711007535457611,
-    -0.03635727986693382,
-    0.032063551247119904,
-    -0.034154653549194336,
-    0.04639456421136856,
-    -0.0004831315018236637,
-    -0.008573515340685844,
-    -0.0361621119081974,
-    -0.04126439616084099,
-    -0.009249637834727764,
-    0.026152705773711205,
-    -0.03769558295607567,
-    0.008336523547768593,
-    0.03766770288348198,
-    -0.0009444807074032724,
-    0.012644192203879356,
-    0.006506809964776039,
-    -0.04957303777337074,
-    -0.022793002426624298,
-    0.00954936258494854,
-    -0.044331345707178116,
-    -0.018582919612526894,
-    0.00829470157623291,
-    0.03805804252624512,
-    -0.03053007833659649,
-    0.06780744343996048,
-    -0.038448382169008255,
-    0.03181261941790581,
-    0.002880492014810443,
-    0.026947325095534325,
-    0.02227719873189926,
-    0.0005689538083970547,
-    -0.04157109186053276,
-    0.018192579969763756,
-    0.0024796975776553154,
-    -0.030836772173643112,
-    0.025553256273269653,
-    -0.043439142405986786,
-    0.01146620512008667,
-    0.0378628745675087,
-    -0.025121096521615982,
-    -0.013299403712153435,
-    0.009967582300305367,
-    0.058996934443712234,
-    0.0043390351347625256,
-    0.00686578219756484,
-    -0.03736100718379021,
-    -0.03800227865576744,
-    0.024828342720866203,
-    -0.005457774270325899,
-    0.010476416908204556,
-    -0.044861093163490295,
-    0.026780037209391594,
-    0.0008342622313648462,
-    -0.005067435093224049,
-    -0.0008307771058753133,
-    -0.006290729623287916,
-    -0.011975039727985859,
-    0.022123850882053375,
-    -0.06362523883581161,
-    0.010852815583348274,
-    0.0022078542970120907,
-    0.0236294437199831,
-    0.02468893490731716,
-    -0.03197990730404854,
-    0.026347875595092773,
-    -0.07316066324710846,
-    -0.01113859936594963,
-    0.019767876714468002,
-    -0.022360842674970627,
-    -0.014135844074189663,
-    -0.027170374989509583,
-    0.04572541266679764,
-    -0.00036180406459607184,
-    -0.010120930150151253,
-    -0.021621987223625183,
-    -0.005931756924837828,
-    -0.03984244912862778,
-    -0.012971797958016396,
-    -0.04564176872372627,
-    -0.035604484379291534,
-    -0.0012651162687689066,
-    0.010601882822811604,
-    -0.08258455991744995,
-    0.008364404551684856,
-    -0.023699147626757622,
-    -0.027142493054270744,
-    -0.026389697566628456,
-    -0.01234446745365858,
-    0.003990518394857645,
-    0.02144075743854046,
-    0.0176070723682642,
-    -0.005991004873067141,
-    0.009458747692406178,
-    0.021231647580862045,
-    0.009375103749334812,
-    -0.05420134216547012,
-    -0.021022537723183632,
-    0.04801168292760849,
-    0.016910038888454437,
-    -0.004112498834729195,
-    -0.010824933648109436,
-    -0.023866435512900352,
-    -0.022263256832957268,
-    -0.006663642358034849,
-    -0.10332828015089035,
-    -0.04831837862730026,
-    0.009577243588864803,
-    -0.001984803471714258,
-    -0.006381344050168991,
-    0.061450496315956116,
-    0.0426863469183445,
-    -0.05760286748409271,
-    0.011145569384098053,
-    -0.0019377537537366152,
-    -0.01943330094218254,
-    0.033820077776908875,
-    0.011131628416478634,
-    -0.047175243496894836,
-    -0.0017286436632275581,
-    -0.042546939104795456,
-    -0.021691689267754555,
-    -0.03518626466393471,
-    -0.02927541732788086,
-    -0.022890588268637657,
-    0.03769558295607567,
-    -0.04812321066856384,
-    -0.013013619929552078,
-    -0.009556332603096962,
-    0.020729783922433853,
-    -0.037890754640102386,
-    0.020144274458289146,
-    0.011075866408646107,
-    0.012281734496355057,
-    -0.002730629639700055,
-    0.05456380173563957,
-    -0.03368066996335983,
-    -0.00406370684504509,
-    0.03591118007898331,
-    -0.026319993659853935,
-    -0.007723134011030197,
-    -0.038671430200338364,
-    -0.015850547701120377,
-    -0.011717136949300766,
-    0.029554231092333794,
-    -0.07868117094039917,
-    0.011570760048925877,
-    -0.014665589667856693,
-    -0.010378831997513771,
-    0.06066981703042984,
-    -0.04709159955382347,
-    0.024898044764995575,
-    -0.03457287326455116,
-    -0.03724948316812515,
-    -0.017063386738300323,
-    0.03822533041238785,
-    0.0048339287750422955,
-    -0.03482380509376526,
-    -0.073774054646492,
-    0.026389697566628456,
-    -0.007507053203880787,
-    -0.04263058304786682,
-    -0.019712114706635475,
-    -0.0337643139064312,
-    -0.00290314550511539,
-    -0.0010908577824011445,
-    -0.01803923398256302,
-    0.021301351487636566,
-    -0.03697067126631737,
-    -0.019935164600610733,
-    -0.041487447917461395,
-    0.03172897547483444,
-    0.042546939104795456,
-    -0.019949106499552727,
-    0.01813681796193123,
-    0.04408041387796402,
-    0.04483320936560631,
-    0.008587455376982689,
-    -0.02498168870806694,
-    -4.372797775431536e-05,
-    -0.036859143525362015,
-    -0.009807264432311058,
-    -0.019042961299419403,
-    0.023713087663054466,
-    -0.007395527791231871,
-    -0.02107829973101616,
-    0.02756071463227272,
-    0.026027239859104156,
-    -0.014540123753249645,
-    0.01299967896193266,
-    0.008455019444227219,
-    0.02336457185447216,
-    0.03474016115069389,
-    -0.062398459762334824,
-    0.006520750466734171,
-    0.030362790450453758,
-    -0.00017360495985485613,
-    0.024870164692401886,
-    -0.017802242189645767,
-    -0.03476804122328758,
-    0.0196563508361578,
-    -0.00545080378651619,
-    -0.035046856850385666,
-    -0.011689255945384502,
-    0.020938893780112267,
-    0.03139439970254898,
-    0.00832955352962017,
-    0.032398127019405365,
-    -0.020144274458289146,
-    -0.02924753539264202,
-    0.0267660953104496,
-    0.014693471603095531,
-    0.0070992885157465935,
-    0.005618092138320208,
-    0.08330947160720825,
-    0.0046805813908576965,
-    0.011696225963532925,
-    0.07550269365310669,
-    0.0192938931286335,
-    0.006384829059243202,
-    -0.014484360814094543,
-    0.05319761484861374,
-    -0.018987199291586876,
-    -0.012170209549367428,
-    -0.03535355255007744,
-    -0.012909065000712872,
-    -0.0036977638956159353,
-    -0.0465339720249176,
-    0.015055928379297256,
-    0.02500957064330578,
-    -0.02944270521402359,
-    -0.012748747132718563,
-    0.014498301781713963,
-    0.026389697566628456,
-    -0.03518626466393471,
-    -0.045251429080963135,
-    0.004457530565559864,
-    0.010943429544568062,
-    -0.012295675463974476,
-    0.017704656347632408,
-    -0.01129891723394394,
-    -0.0006473700632341206,
-    0.001257274649105966,
-    -0.011041014455258846,
-    -0.0264036376029253,
-    -0.01007910817861557,
-    -0.0027916200924664736,
-    0.008908091112971306,
-    0.003729130607098341,
-    0.053978294134140015,
-    0.011968069709837437,
-    -0.0009000448044389486,
-    0.009925760328769684,
-    -0.005349733866751194,
-    0.04288151487708092,
-    0.02683579921722412,
-    -0.03356914594769478,
-    0.019042961299419403,
-    -0.03334609419107437,
-    0.005290485918521881,
-    -0.014226458966732025,
-    -0.012860272079706192,
-    -0.020994655787944794,
-    -0.00707140751183033,
-    -0.010267307050526142,
-    -0.0002552886144258082,
-    -0.0315895676612854,
-    0.030362790450453758,
-    0.0487087182700634,
-    0.006963367108255625,
-    -0.007256121374666691,
-    0.011654403991997242,
-    -0.014777115546166897,
-    0.018331987783312798,
-    -0.007618578616529703,
-    -0.0364130437374115,
-    0.0043250941671431065,
-    0.042045075446367264,
-    -0.10076319426298141,
-    -0.040957704186439514,
-    -0.0017242871690541506,
-    0.004283272195607424,
-    -0.03315092623233795,
-    -0.03875507414340973,
-    0.021329231560230255,
-    -0.0008891536854207516,
-    -0.044721685349941254,
-    0.012769658118486404,
-    -0.02059037610888481,
-    -0.003037324408069253,
-    -0.004896662198007107,
-    0.016910038888454437,
-    -0.012198090553283691,
-    0.025455672293901443,
-    0.01562749594449997,
-    0.03724948316812515,
-    0.056822191923856735,
-    0.055428121238946915,
-    0.02459135092794895,
-    -0.014595886692404747,
-    0.01569719985127449,
-    0.03019550070166588,
-    -0.015432327054440975,
-    0.04090194031596184,
-    0.005809776019304991,
-    0.035771772265434265,
-    -0.026096943765878677,
-    0.05372736230492592,
-    -0.08475930243730545,
-    -0.034879568964242935,
-    -0.016157241538167,
-    -0.037026431411504745,
-    0.03883872181177139,
-    -0.04028854891657829,
-    -0.026891561225056648,
-    0.018875673413276672,
-    -0.017105208709836006,
-    0.05171990394592285,
-    0.013822179287672043,
-    0.025887833908200264,
-    -0.013703683391213417,
-    -0.04118075221776962,
-    -0.012469933368265629,
-    -0.0157947838306427,
-    -0.03680337965488434,
-    -0.029052365571260452,
-    -0.005618092138320208,
-    -0.02553931623697281,
-    -0.04608787223696709,
-    0.02693338319659233,
-    0.011745018884539604,
-    0.01777436025440693,
-    -0.01249084435403347,
-    0.02825774811208248,
-    -0.02630605362355709,
-    -0.026877621188759804,
-    -0.06429439038038254,
-    -0.006782138254493475,
-    0.0009976295987144113,
-    0.003511307528242469,
-    0.03209143504500389,
-    0.054340749979019165,
-    0.055957868695259094,
-    0.007827688939869404,
-    0.07606032490730286,
-    -0.007904362864792347,
-    0.009542391635477543,
-    -0.013613068498671055,
-    -0.040427956730127335,
-    -0.027449188753962517,
-    -0.06122744455933571,
-    -0.003251662477850914,
-    0.00034612082527019083,
-    0.026459401473402977,
-    0.042909398674964905,
-    -0.03571600839495659,
-    -0.030056094750761986,
-    0.01714703068137169,
-    0.04706371948122978,
-    0.02349003776907921,
-    0.018150757998228073,
-    0.01212838664650917,
-    0.0327884666621685,
-    0.024842282757163048,
-    0.022430546581745148,
-    0.006736831273883581,
-    0.026110883802175522,
-    0.028662027791142464,
-    0.011264065280556679,
-    -0.02332274802029133,
-    0.0058202315121889114,
-    -0.01972605474293232,
-    -0.02015821635723114,
-    -0.02425677329301834,
-    0.0015526426723226905,
-    0.05422922596335411,
-    0.020534614101052284,
-    0.02134317345917225,
-    -0.0047851367853581905,
-    0.02732372283935547,
-    -0.035604484379291534,
-    0.020799485966563225,
-    -0.007015644572675228,
-    -0.03000033274292946,
-    0.0243543591350317,
-    -0.01810893602669239,
-    -0.09033557027578354,
-    0.022388724610209465,
-    0.0390617698431015,
-    0.012337497435510159,
-    0.023601561784744263,
-    0.04427558183670044,
-    0.03800227865576744,
-    0.001185828703455627,
-    -0.003955666441470385,
-    -0.0011701453477144241,
-    -0.019224191084504128,
-    0.01110374741256237,
-    0.012449022382497787,
-    -0.021203765645623207,
-    0.04979608952999115,
-    -0.025525376200675964,
-    0.012016861699521542,
-    0.005757498554885387,
-    0.007214299403131008,
-    -0.013313344679772854,
-    -0.0426863469183445,
-    0.028996603563427925,
-    0.03189626336097717,
-    -0.024228893220424652,
-    -0.008524722419679165,
-    0.04711947962641716,
-    0.021594105288386345,
-    -0.0016598115907981992,
-    -0.031115585938096046,
-    0.044861093163490295,
-    0.016157241538167,
-    0.010371861979365349,
-    -0.04070676863193512,
-    -0.025037452578544617,
-    -0.00028186303097754717,
-    0.024758638814091682,
-    -0.05001914128661156,
-    -0.014568004757165909,
-    -0.06908998638391495,
-    -0.036998551338911057,
-    0.019307835027575493,
-    0.01847139373421669,
-    0.027937112376093864,
-    -0.004645729903131723,
-    -0.02679397724568844,
-    -0.0029606507159769535,
-    0.013794297352433205,
-    -0.028076518326997757,
-    -0.03390372171998024,
-    -0.03086465410888195,
-    -0.000895688368473202,
-    -0.023113638162612915,
-    -0.0012520469026640058,
-    -0.019684232771396637,
-    0.04982397332787514,
-    0.05456380173563957,
-    -0.0031889292877167463,
-    0.008371375501155853,
-    -0.0342382974922657,
-    -0.013627009466290474,
-    -0.01572508178651333,
-    -0.04173837974667549,
-    -0.009444806724786758,
-    0.012414171360433102,
-    0.06953608244657516,
-    0.007500083185732365,
-    0.04070676863193512,
-    0.0711532011628151,
-    -0.026919443160295486,
-    0.05492625758051872,
-    0.027281900867819786,
-    0.03284423053264618,
-    0.0595545619726181,
-    -0.016366351395845413,
-    -0.0033997821155935526,
-    -0.03301151841878891,
-    -0.015139573253691196,
-    0.006607879884541035,
-    -0.04090194031596184,
-    -0.04909905791282654,
-    -0.012149297632277012,
-    -0.02167774923145771,
-    -0.03211931511759758,
-    -0.0011562047293409705,
-    -0.0285783838480711,
-    0.01695186085999012,
-    0.005513536743819714,
-    0.028299570083618164,
-    0.023016054183244705,
-    -0.008238938637077808,
-    0.056989479809999466,
-    -0.02924753539264202,
-    0.017063386738300323,
-    -0.03945210948586464,
-    -0.026459401473402977,
-    0.019544826820492744,
-    0.009472688660025597,
-    0.0017356140306219459,
-    -0.03872719407081604,
-    0.0356881283223629,
-    -0.0417104996740818,
-    0.025929655879735947,
-    -0.01625482738018036,
-    -0.009082349948585033,
-    0.009347222745418549,
-    0.0446101576089859,
-    0.057379815727472305,
-    0.01463770866394043,
-    -0.07243574410676956,
-    0.03248177096247673,
-    0.009521480649709702,
-    0.045753296464681625,
-    0.020506732165813446,
-    0.05866235867142677,
-    -0.014526182785630226,
-    0.03404312953352928,
-    -0.0011187391355633736,
-    -0.004652700386941433,
-    -0.0254417322576046,
-    -0.021538343280553818,
-    0.061506256461143494,
-    0.008852328173816204,
-    0.01412887405604124,
-    -0.016408173367381096,
-    -0.00042540839058347046,
-    0.020966775715351105,
-    0.03485168516635895,
-    -0.0009061438613571227,
-    -0.005760984029620886,
-    0.02204020693898201,
-    0.01880596950650215,
-    2.877987026295159e-05,
-    -0.004185687750577927,
-    0.017439784482121468,
-    -0.037584058940410614,
-    0.001769594382494688,
-    0.03853202611207962,
-    -0.04360643029212952,
-    -0.04118075221776962,
-    0.019489062950015068,
-    -0.012497815303504467,
-    -0.0008011531317606568,
-    0.013278492726385593,
-    0.01007910817861557,
-    -0.011919276788830757,
-    -0.0025633415207266808,
-    -0.007688282057642937,
-    0.0019778332207351923,
-    0.05743557959794998,
-    0.060948628932237625,
-    -0.00686578219756484,
-    -0.01378035731613636,
-    0.0022305080201476812,
-    0.006942456122487783,
-    0.008162264712154865,
-    -0.002756768371909857,
-    -0.008434108458459377,
-    0.009396014735102654,
-    0.01856897957623005,
-    0.003265602979809046,
-    0.003270830726251006,
-    0.028174104169011116,
-    0.014958344399929047,
-    0.01774647831916809,
-    0.008782625198364258,
-    -0.002814273815602064,
-    -0.0024518161080777645,
-    0.01092251855880022,
-    0.011884424835443497,
-    -0.0165196992456913,
-    0.0098281754180789,
-    0.035771772265434265,
-    -0.005151079501956701,
-    0.00290314550511539,
-    0.006904119160026312,
-    0.05169202387332916,
-    -0.008915061131119728,
-    0.009605124592781067,
-    0.0030530078802257776,
-    -0.02283482626080513,
-    -0.01042762491852045,
-    -0.02105041965842247,
-    -0.04215659946203232,
-    0.013884912244975567,
-    -0.019252071157097816,
-    0.0025232620537281036,
-    -0.02736554481089115,
-    0.02428465522825718,
-    0.007242180407047272,
-    -0.01263722125440836,
-    -0.002812531078234315,
-    0.014721352607011795,
-    0.010769171640276909,
-    -0.02114800363779068,
-    0.005499596241861582,
-    -0.006130411755293608,
-    -0.009967582300305367,
-    0.025260502472519875,
-    0.010413683950901031,
-    -0.0022897557355463505,
-    0.0032481772359460592,
-    0.016017835587263107,
-    -0.0021782303228974342,
-    0.02599935792386532,
-    0.003516535274684429,
-    -0.034015245735645294,
-    0.0016336728585883975,
-    -0.017133088782429695,
-    0.007967095822095871,
-    -0.00325863272882998,
-    -0.017537368461489677,
-    -0.019405419006943703,
-    -0.025818130001425743,
-    0.017272496595978737,
-    0.004701492376625538,
-    0.006548631936311722,
-    -0.011354679241776466,
-    0.01629664935171604,
-    0.017634954303503036,
-    0.014135844074189663,
-    0.007270061876624823,
-    0.0027132038958370686,
-    -0.0032220385037362576,
-    -0.039703041315078735,
-    0.03354126214981079,
-    0.006060708314180374,
-    -0.024870164692401886,
-    0.004391312599182129,
-    -0.01325061172246933,
-    -0.004377372097223997,
-    -0.030390670523047447,
-    0.01668698713183403,
-    -0.025190798565745354,
-    0.00971665047109127,
-    0.04842990264296532,
-    -0.019377537071704865,
-    -0.032927874475717545,
-    0.018596859648823738,
-    -0.011487116105854511,
-    0.02227719873189926,
-    0.017160970717668533,
-    -0.007974065840244293,
-    0.006196629721671343,
-    0.009416925720870495,
-    0.006649701856076717,
-    -0.005917816422879696,
-    0.021134063601493835,
-    -0.01232355646789074,
-    0.014198577031493187,
-    0.011807751841843128,
-    0.012253853492438793,
-    0.02746312879025936,
-    -0.017453724518418312,
-    0.00510577205568552,
-    -0.030111856758594513,
-    0.012428111396729946,
-    -0.00011609968350967392,
-    -0.009904849343001842,
-    0.01596207357943058,
-    0.005687795113772154,
-    0.015683259814977646,
-    -0.0043982830829918385,
-    0.002530232537537813,
-    -0.0031941570341587067,
-    0.04586482048034668,
-    -0.01219112053513527,
-    0.008915061131119728,
-    -0.00545080378651619,
-    0.023671265691518784,
-    -0.024228893220424652,
-    0.024312537163496017,
-    0.007667371071875095,
-    -0.03460075333714485,
-    0.0383368544280529,
-    0.02365732565522194,
-    -0.01113859936594963,
-    -0.0215801652520895,
-    0.021175885573029518,
-    0.02025580033659935,
-    0.06384829431772232,
-    0.004900147207081318,
-    0.018150757998228073,
-    0.04500049725174904,
-    0.01462376769632101,
-    -0.012497815303504467,
-    -0.010859785601496696,
-    -0.009946671314537525,
-    0.006600909400731325,
-    0.03409888967871666,
-    -0.017063386738300323,
-    -0.009695739485323429,
-    -0.03805804252624512,
-    -0.03476804122328758,
-    0.02908024750649929,
-    -0.03635727986693382,
-    0.04483320936560631,
-    0.006785623263567686,
-    -0.0007000832702033222,
-    0.00878959521651268,
-    -0.02068796195089817,
-    -0.0007602024124935269,
-    0.02329486794769764,
-    0.026319993659853935,
-    0.013759446330368519,
-    -0.019739994779229164,
-    0.04260270297527313,
-    0.003927784971892834,
-    -0.03708219528198242,
-    -0.12011285126209259,
-    0.012295675463974476,
-    0.004157806281000376,
-    0.003049522638320923,
-    -0.016031775623559952,
-    -0.0254417322576046,
-    -0.011375590227544308,
-    -0.019907284528017044,
-    -0.019154487177729607,
-    0.03153380751609802,
-    0.0034538020845502615,
-    -0.030028212815523148,
-    0.0021224678494036198,
-    -0.027546772733330727,
-    0.003201127517968416,
-    -0.013571246527135372,
-    -0.004119469318538904,
-    0.012602370232343674,
-    -0.005844627972692251,
-    0.058829646557569504,
-    -0.012002920731902122,
-    -0.0282159261405468,
-    0.032007791101932526,
-    -0.00579932052642107,
-    -0.008949913084506989,
-    -0.005900390446186066,
-    0.009751502424478531,
-    0.029582111164927483,
-    -0.0467849038541317,
-    0.006576513405889273,
-    0.029359061270952225,
-    -0.033262450248003006,
-    -0.022542070597410202,
-    0.004663155879825354,
-    0.016031775623559952,
-    -0.03429406136274338,
-    0.025135036557912827,
-    -0.00047267600893974304,
-    0.007618578616529703,
-    0.008218027651309967,
-    -0.0337643139064312,
-    0.020437030121684074,
-    -0.03000033274292946,
-    0.004091587848961353,
-    -0.030390670523047447,
-    -0.007325824815779924,
-    0.04009338095784187,
-    -0.01907084323465824,
-    -0.0028752642683684826,
-    0.009312370792031288,
-    -0.007127169985324144,
-    0.028940841555595398,
-    0.012051713652908802,
-    -0.009911819361150265,
-    -0.010169722139835358,
-    0.003823230043053627,
-    -0.012832391075789928,
-    0.005645973142236471,
-    0.005332307890057564,
-    0.012072624638676643,
-    0.010518238879740238,
-    0.010141841135919094,
-    0.038810838013887405,
-    -0.032007791101932526,
-    0.0053044268861413,
-    -0.005719162058085203,
-    0.012065653689205647,
-    -0.009458747692406178,
-    0.023587621748447418,
-    -0.001538701937533915,
-    -0.04369007423520088,
-    0.002047536661848426,
-    0.006879723165184259,
-    -0.029386943206191063,
-    -0.016436055302619934,
-    0.002883977023884654,
-    -0.01629664935171604,
-    -0.032175078988075256,
-    0.0033039399422705173,
-    -0.051636260002851486,
-    0.0067891087383031845,
-    0.047732871025800705,
-    -0.0004291113873478025,
-    0.009277518838644028,
-    -0.03214719519019127,
-    -0.03172897547483444,
-    -0.01757919043302536,
-    0.013933704234659672,
-    0.021914741024374962,
-    -0.011933217756450176,
-    -0.041152872145175934,
-    0.001929040881805122,
-    0.012428111396729946,
-    -0.024925926700234413,
-    -0.01840168982744217,
-    0.006440591532737017,
-    0.023141520097851753,
-    -0.004251905716955662,
-    -0.05921998620033264,
-    0.04692431166768074,
-    -0.003113998332992196,
-    -0.0037953488063067198,
-    -0.02401978336274624,
-    0.01263722125440836,
-    0.006938971113413572,
-    0.007033070549368858,
-    0.02095283381640911,
-    0.03468439728021622,
-    0.008991735056042671,
-    -0.019572706893086433,
-    0.01500016637146473,
-    0.01639423333108425,
-    0.015055928379297256,
-    -0.01810893602669239,
-    0.03747253492474556,
-    0.011410442180931568,
-    -0.02736554481089115,
-    -0.0009610352572053671,
-    -0.011243154294788837,
-    0.018192579969763756,
-    -0.017997412011027336,
-    0.03348550200462341,
-    -0.009131141938269138,
-    -0.027044909074902534,
-    0.008664129301905632,
-    -0.01757919043302536,
-    0.03136651962995529,
-    -0.052918802946805954,
-    -0.01755131036043167,
-    0.030083976686000824,
-    0.008155294694006443,
-    0.005422922316938639,
-    0.014595886692404747,
-    0.04190566763281822,
-    0.024465885013341904,
-    -0.00022762507433071733,
-    0.002477954840287566,
-    0.0016127618728205562,
-    0.012072624638676643,
-    -0.021371055394411087,
-    -0.010643704794347286,
-    0.021008597686886787,
-    -0.010546120814979076,
-    -0.006538176443427801,
-    -0.023420333862304688,
-    -0.013159996829926968,
-    -0.018443513661623,
-    -0.019642410799860954,
-    -0.0069145746529102325,
-    -0.03697067126631737,
-    0.010594912804663181,
-    -0.0330393984913826,
-    -0.023545799776911736,
-    -0.01003031525760889,
-    0.014414657838642597,
-    -0.031199229881167412,
-    0.0032778012100607157,
-    0.03903388977050781,
-    -0.03819745033979416,
-    -0.01757919043302536,
-    0.00973059143871069,
-    0.00740249827504158,
-    0.05297456309199333,
-    -0.021621987223625183,
-    -0.04162685573101044,
-    -0.0017173169180750847,
-    -0.025748426094651222,
-    0.04349490627646446,
-    0.025302324444055557,
-    0.0032290087547153234,
-    0.0424354150891304,
-    -0.017927708104252815,
-    -0.010532179847359657,
-    -0.0006521621835418046,
-    -0.01481893751770258,
-    -0.028689907863736153,
-    -0.03552084043622017,
-    -0.017927708104252815,
-    -0.011305887252092361,
-    0.03323457017540932,
-    0.0219426229596138,
-    0.049851853400468826,
-    0.01784406416118145,
-    -0.007967095822095871,
-    -0.026556985452771187,
-    0.0092217568308115,
-    -0.011703196913003922,
-    -0.017439784482121468,
-    0.03356914594769478,
-    0.0030111856758594513,
-    0.007778896484524012,
-    0.02247236855328083,
-    -0.04926634579896927,
-    0.009159022942185402,
-    -0.022151732817292213,
-    0.00740946875885129,
-    -0.01649181917309761,
-    -0.029916688799858093,
-    0.017202792689204216,
-    0.0009279261576011777,
-    -0.027909230440855026,
-    -0.02428465522825718,
-    0.023016054183244705,
-    0.016868216916918755,
-    0.021789275109767914,
-    0.015111691318452358,
-    0.009096289984881878,
-    -0.02355973981320858,
-    0.012943916954100132,
-    0.006837901193648577,
-    0.0021869433112442493,
-    -0.0098281754180789,
-    0.009235696867108345,
-    -0.02963787503540516,
-    -0.0014655134873464704,
-    0.011940187774598598,
-    0.001017669215798378,
-    -0.004645729903131723,
-    0.039675161242485046,
-    -0.007890421897172928,
-    -0.00018297135829925537,
-    0.011034044437110424,
-    -0.029136009514331818,
-    -0.009758472442626953,
-    -0.014121904037892818,
-    0.024898044764995575,
-    -0.027937112376093864,
-    0.03797439858317375,
-    -0.045223549008369446,
-    -0.018847791478037834,
-    -0.016923978924751282,
-    0.00475028483197093,
-    0.039730921387672424,
-    0.015028047375380993,
-    0.038448382169008255,
-    0.03125499188899994,
-    0.0006120827747508883,
-    -0.005297456402331591,
-    -0.0256787221878767,
-    0.015251098200678825,
-    0.010343980975449085,
-    -0.010629764758050442,
-    -0.01355033554136753,
-    -0.03591118007898331,
-    -0.007555845659226179,
-    0.026041179895401,
-    -0.013898853212594986,
-    -0.016561521217226982,
-    -0.01168228592723608,
-    0.016185123473405838,
-    0.00631861062720418,
-    0.004917573183774948,
-    -0.05269575119018555,
-    -0.002118982607498765,
-    -0.004628303926438093,
-    -0.013264551758766174,
-    0.012616310268640518,
-    0.004067191854119301,
-    0.0004901018692180514,
-    0.03875507414340973,
-    0.014721352607011795,
-    -0.014303131960332394,
-    -0.018262283876538277,
-    -0.030307026579976082,
-    -0.04162685573101044,
-    0.008280760608613491,
-    0.03016762062907219,
-    -0.008183175697922707,
-    -0.021635927259922028,
-    -0.036329399794340134,
-    0.033624906092882156,
-    -0.02845291793346405,
-    -0.04444286972284317,
-    0.01110374741256237,
-    0.03287211060523987,
-    0.054508037865161896,
-    0.0352141447365284,
-    0.003265602979809046,
-    -0.004478441551327705,
-    0.023113638162612915,
-    -0.020674020051956177,
-    -0.0021695175673812628,
-    0.02481440082192421,
-    0.017439784482121468,
-    0.005875994451344013,
-    0.012476904317736626,
-    -0.016268767416477203,
-    0.027616476640105247,
-    0.03013973869383335,
-    0.02802075631916523,
-    -0.02927541732788086,
-    0.01721673272550106,
-    0.02464711293578148,
-    0.036663975566625595,
-    -0.011473175138235092,
-    -0.009061438962817192,
-    0.025037452578544617,
-    -0.03875507414340973,
-    0.04840202257037163,
-    0.0012990966206416488,
-    -0.011626522988080978,
-    -0.0026487282011657953,
-    -0.004440105054527521,
-    -0.04034431278705597,
-    -0.02871778979897499,
-    -0.029693637043237686,
-    0.0046805813908576965,
-    0.001807059976272285,
-    0.010274277068674564,
-    -0.05216600373387337,
-    -0.03850414231419563,
-    0.028829315677285194,
-    0.017927708104252815,
-    -0.015139573253691196,
-    -0.018750207498669624,
-    -0.0072352103888988495,
-    -0.012407200410962105,
-    0.017523428425192833,
-    0.0030878593679517508,
-    -0.022751180455088615,
-    0.030028212815523148,
-    0.016547581180930138,
-    0.020604318007826805,
-    -0.025372028350830078,
-    0.008866269141435623,
-    0.02729584090411663,
-    0.0065277209505438805,
-    0.021189825609326363,
-    0.000901787425391376,
-    0.011152539402246475,
-    0.004987276624888182,
-    0.03964727744460106,
-    0.011312857270240784,
-    -0.025399910286068916,
-    -0.008559574373066425,
-    0.01589236967265606,
-    -0.003183701541274786,
-    0.014344953931868076,
-    -0.022695418447256088,
-    -0.01668698713183403,
-    0.024772578850388527,
-    -0.016338471323251724,
-    0.01982363872230053,
-    -0.0229045283049345,
-    0.030613722279667854,
-    -0.0010621051769703627,
-    -0.026515163481235504,
-    0.03875507414340973,
-    -0.016213005408644676,
-    0.030725248157978058,
-    -0.009918790310621262,
-    0.002425677375867963,
-    0.012909065000712872,
-    0.0015395733062177896,
-    0.006785623263567686,
-    0.01629664935171604,
-    0.03195202723145485,
-    -0.036831263452768326,
-    0.0014001665404066443,
-    -0.018025292083621025,
-    0.014832877553999424,
-    -0.025567198172211647,
-    0.013891882263123989,
-    -0.013271522708237171,
-    0.0007837273296900094,
-    0.0034938815515488386,
-    -0.02696126513183117,
-    -0.006388314068317413,
-    -0.01534868311136961,
-    -0.0002631302340887487,
-    0.0014437311328947544,
-    0.007890421897172928,
-    -0.012686014175415039,
-    0.029219655320048332,
-    0.026543045416474342,
-    -0.0003650714352261275,
-    0.013173937797546387,
-    -0.016087539494037628,
-    0.0017687231302261353,
-    -0.0034886538051068783,
-    0.0008460247190669179,
-    0.04698007553815842,
-    -0.018987199291586876,
-    -0.008768684230744839,
-    0.016199063509702682,
-    -0.007012159563601017,
-    -0.008482900448143482,
-    0.0274910107254982,
-    -0.01428919192403555,
-    0.030836772173643112,
-    0.012511755339801311,
-    -0.055037785321474075,
-    0.014052200131118298,
-    -0.013592157512903214,
-    0.01873626746237278,
-    0.019084783270955086,
-    0.0038023190572857857,
-    0.004656185396015644,
-    0.00014202062448021024,
-    0.03646880388259888,
-    0.0102463960647583,
-    0.05888541042804718,
-    0.02015821635723114,
-    -0.013229700736701488,
-    -0.03474016115069389,
-    0.04455439746379852,
-    -0.02201232500374317,
-    0.004792106803506613,
-    0.009814235381782055,
-    -0.009312370792031288,
-    -0.019516944885253906,
-    0.007695252541452646,
-    0.004684066865593195,
-    0.04458227753639221,
-    -0.02144075743854046,
-    0.030251264572143555,
-    -0.020004868507385254,
-    -0.017007622867822647,
-    -0.017830122262239456,
-    0.003607149701565504,
-    0.01794164814054966,
-    -0.029888806864619255,
-    -0.006092074792832136,
-    -0.0029414824675768614,
-    0.013173937797546387,
-    0.008915061131119728,
-    0.010804022662341595,
-    -0.01870838552713394,
-    0.03591118007898331,
-    0.02871778979897499,
-    0.004659670405089855,
-    0.014045230112969875,
-    0.017063386738300323,
-    0.03716583922505379,
-    0.025358088314533234,
-    -0.01880596950650215,
-    0.006395284552127123,
-    0.020897071808576584,
-    -0.0564318522810936,
-    -0.039535753428936005,
-    -0.008685040287673473,
-    0.04960092157125473,
-    -0.03164533153176308,
-    -0.01866656355559826,
-    -0.016533641144633293,
-    0.007304913830012083,
-    0.01343184057623148,
-    -0.02459135092794895,
-    0.10795658826828003,
-    0.0003502594481687993,
-    -0.02908024750649929,
-    0.0019708629697561264,
-    -0.002666153945028782,
-    -0.006897148676216602,
-    -0.028522619977593422,
-    0.003129681572318077,
-    -0.000992401735857129,
-    -0.020032750442624092,
-    -0.018889613449573517,
-    0.04405253380537033,
-    0.008204086683690548,
-    -0.012748747132718563,
-    -0.014749233610928059,
-    0.007060952018946409,
-    -0.041292279958724976,
-    -0.015808725729584694,
-    -0.009054468013346195,
-    0.009709680452942848,
-    -0.0012163239298388362,
-    0.00351479253731668,
-    -0.010497327893972397,
-    -0.018499275669455528,
-    0.010797052644193172,
-    -0.0196563508361578,
-    0.006388314068317413,
-    -0.02061825804412365,
-    0.010058197192847729,
-    0.013627009466290474,
-    -0.014170696027576923,
-    0.03013973869383335,
-    -0.03697067126631737,
-    0.03872719407081604,
-    0.040232788771390915,
-    -0.011508027091622353,
-    0.0023577166721224785,
-    0.009918790310621262,
-    -0.014010378159582615,
-    -0.035604484379291534,
-    -0.033624906092882156,
-    0.009375103749334812,
-    0.028146222233772278,
-    0.0356881283223629,
-    0.006586968898773193,
-    0.0023246074561029673,
-    -0.0036838233936578035,
-    -0.015418386086821556,
-    -0.012699955143034458,
-    -0.009507540613412857,
-    0.013606098480522633,
-    -0.015557792969048023,
-    0.011494086124002934,
-    0.006803049240261316,
-    -0.025288384407758713,
-    -0.04357855021953583,
-    0.0361621119081974,
-    -0.01234446745365858,
-    -0.012093535624444485,
-    -0.03518626466393471,
-    -0.029526349157094955,
-    -0.004980306141078472,
-    -0.003732615616172552,
-    0.0040462808683514595,
-    -0.0010063424706459045,
-    0.012497815303504467,
-    0.01044156588613987,
-    0.002037081168964505,
-    -0.01445647981017828,
-    -0.018680503591895103,
-    -0.002730629639700055,
-    0.022430546581745148,
-    0.0017669805092737079,
-    -0.04182202368974686,
-    -0.03105982393026352,
-    0.04586482048034668,
-    0.009430866688489914,
-    -0.0007493112934753299,
-    0.019307835027575493,
-    -0.05224964767694473,
-    -0.02736554481089115,
-    0.03421041741967201,
-    0.040623124688863754,
-    -0.015808725729584694,
-    0.004645729903131723,
-    0.0011300659971311688,
-    -0.033067282289266586,
-    0.003997488413006067,
-    -0.0130205899477005,
-    -0.020311562344431877,
-    -0.002814273815602064,
-    0.015641437843441963,
-    -0.0025023510679602623,
-    0.002540688030421734,
-    -0.0267660953104496,
-    -0.008817477151751518,
-    0.003192414529621601,
-    0.0232669860124588,
-    -0.009465718641877174,
-    -0.01281845010817051,
-    0.013076352886855602,
-    -0.03334609419107437,
-    -0.017788300290703773,
-    0.017927708104252815,
-    -0.02599935792386532,
-    -0.010065167210996151,
-    -0.0042031132616102695,
-    0.023016054183244705,
-    -0.012985738925635815,
-    -0.017160970717668533,
-    -0.002059734659269452,
-    -0.013480632565915585,
-    -0.007113229483366013,
-    0.016561521217226982,
-    -0.015571733936667442,
-    -0.002934511983767152,
-    0.015585673972964287,
-    -0.018122877925634384,
-    -0.044191937893629074,
-    -0.017955590039491653,
-    0.00014539688709191978,
-    -0.018331987783312798,
-    0.003767467336729169,
-    0.004359946120530367,
-    0.022653596475720406,
-    -0.025162918493151665,
-    0.014303131960332394,
-    0.00599797535687685,
-    -0.015836605802178383,
-    0.0364130437374115,
-    -0.015474149025976658,
-    0.0013566019479185343,
-    -0.008043769747018814,
-    0.020632198080420494,
-    -0.018429571762681007,
-    -0.02637575753033161,
-    -0.008350464515388012,
-    -0.0016101478831842542,
-    -0.003823230043053627,
-    -0.0011501056142151356,
-    0.026487281545996666,
-    0.010985251516103745,
-    0.00040776474634185433,
-    -0.018959317356348038,
-    0.015655377879738808,
-    -0.01827622391283512,
-    -0.006548631936311722,
-    0.0208552498370409,
-    0.00911720097064972,
-    0.016840334981679916,
-    -0.008866269141435623,
-    0.007730104029178619,
-    -0.026124823838472366,
-    -0.029414823278784752,
-    -0.0038720224983990192,
-    0.04394100606441498,
-    0.01444253884255886,
-    0.014386776834726334,
-    -0.003798833815380931,
-    -0.0006970337126404047,
-    0.004694522358477116,
-    0.020144274458289146,
-    -0.029359061270952225,
-    -0.00580629101023078,
-    -0.014735293574631214,
-    -0.0014498301316052675,
-    -0.012699955143034458,
-    0.006736831273883581,
-    -0.006451047491282225,
-    -0.03889448195695877,
-    0.014763174578547478,
-    -0.04812321066856384,
-    0.0007375488057732582,
-    -0.008141353726387024,
-    -0.03331821411848068,
-    -0.0011806008405983448,
-    0.009772413410246372,
-    0.04714736342430115,
-    0.005858568474650383,
-    -0.012002920731902122,
-    0.016199063509702682,
-    -0.01803923398256302,
-    0.008385315537452698,
-    -0.03013973869383335,
-    -0.011905335821211338,
-    -0.02643151953816414,
-    0.01876414753496647,
-    -0.010455505922436714,
-    -0.0069773076102137566,
-    0.008252879604697227,
-    -0.000901787425391376,
-    -0.05330913886427879,
-    0.007967095822095871,
-    0.013299403712153435,
-    0.0016153757460415363,
-    0.04304880276322365,
-    -0.012783599086105824,
-    0.033457618206739426,
-    -0.00830864254385233,
-    0.015571733936667442,
-    -0.03153380751609802,
-    0.034154653549194336,
-    -0.04118075221776962,
-    0.04619939625263214,
-    0.03816956654191017,
-    -0.050437361001968384,
-    -0.005168505012989044,
-    0.013682772405445576,
-    0.0032568902242928743,
-    0.02210991084575653,
-    0.03493533283472061,
-    0.010713408701121807,
-    -0.017788300290703773,
-    0.004983791150152683,
-    -0.004321609158068895,
-    0.0229045283049345,
-    -0.0007414696156047285,
-    0.04645032808184624,
-    -0.013090293854475021,
-    -0.000982817611657083,
-    -0.028243808075785637,
-    -0.01748160645365715,
-    -0.03446134924888611,
-    -0.0031157408375293016,
-    -0.019684232771396637,
-    0.02276512235403061,
-    -0.0035095647908747196,
-    0.019140547141432762,
-    -0.00459345243871212,
-    -0.02105041965842247,
-    0.02059037610888481,
-    0.06507506966590881,
-    0.0015003650914877653,
-    -0.036887027323246,
-    0.029749400913715363,
-    -0.010664615780115128,
-    -0.024033723399043083,
-    -4.103241735720076e-05,
-    -0.01516745425760746,
-    0.010086078196763992,
-    -0.02947058714926243,
-    -0.04645032808184624,
-    0.0025633415207266808,
-    0.0019865462090820074,
-    -0.05356007441878319,
-    -0.012351437471807003,
-    0.00758372712880373,
-    0.017662834376096725,
-    0.004370401613414288,
-    0.009869997389614582,
-    -0.04536295682191849,
-    0.008190146647393703,
-    0.004684066865593195,
-    0.0215801652520895,
-    -0.026278171688318253,
-    -0.064628966152668,
-    0.014498301781713963,
-    -0.014184636995196342,
-    0.03089253604412079,
-    -0.02389431744813919,
-    -0.02705884911119938,
-    0.017718598246574402,
-    -0.019851520657539368,
-    0.0010891151614487171,
-    -0.003589723724871874,
-    0.035437196493148804,
-    0.02553931623697281,
-    0.000989787862636149,
-    0.03421041741967201,
-    -0.0035182777792215347,
-    0.003889448242262006,
-    -0.013222729787230492,
-    -0.006008430849760771,
-    0.0013714139349758625,
-    -0.00494893966242671,
-    0.009465718641877174,
-    0.05743557959794998,
-    -0.001304324367083609,
-    -0.011926247738301754,
-    0.03736100718379021,
-    -0.011800780892372131,
-    -0.02276512235403061,
-    0.0036803381517529488,
-    -0.00494893966242671,
-    0.005433377809822559,
-    -0.00901961699128151,
-    -0.004854840226471424,
-    -0.005558844190090895,
-    -2.355211654503364e-05,
-    0.02346215583384037,
-    0.018331987783312798,
-    -0.012985738925635815,
-    0.002683579921722412,
-    -0.008392286486923695,
-    0.009110230952501297,
-    0.00722823990508914,
-    0.006186174228787422,
-    -0.007242180407047272,
-    0.005321852397173643,
-    -0.03348550200462341,
-    0.028438976034522057,
-    -0.045223549008369446,
-    0.037193719297647476,
-    0.022542070597410202,
-    0.03354126214981079,
-    0.065576933324337,
-    0.02141287736594677,
-    0.009472688660025597,
-    0.011006162501871586,
-    0.0002692292910069227,
-    0.0010124414693564177,
-    -0.016408173367381096,
-    0.01718885265290737,
-    0.013696713373064995,
-    0.018987199291586876,
-    0.019642410799860954,
-    -0.04946151375770569,
-    0.01856897957623005,
-    -0.012288704514503479,
-    -0.005353219341486692,
-    -0.018429571762681007,
-    0.008134383708238602,
-    0.03426617756485939,
-    -0.024228893220424652,
-    -0.0038092893082648516,
-    -0.0008577871485613286,
-    -0.005632032640278339,
-    0.008448048494756222,
-    0.0057087065652012825,
-    -0.025135036557912827,
-    -0.01057400181889534,
-    -0.009068408980965614,
-    0.017523428425192833,
-    0.019489062950015068,
-    -0.018457453697919846,
-    0.030725248157978058,
-    -0.002824729308485985,
-    0.021719571202993393,
-    -0.006245422177016735,
-    -0.02184503711760044,
-    0.028996603563427925,
-    -0.04859719052910805,
-    -0.0039033889770507812,
-    0.01219112053513527,
-    0.006524235941469669,
-    -0.024410121142864227,
-    0.011786840856075287,
-    -0.004704977851361036,
-    0.024828342720866203,
-    0.041487447917461395,
-    -0.006541661452502012,
-    0.00794618483632803,
-    0.009249637834727764,
-    0.04544660076498985,
-    -0.007827688939869404,
-    -0.009612095542252064,
-    0.012532666325569153,
-    -0.0397866852581501,
-    0.008364404551684856,
-    -0.00010482734069228172,
-    -0.0019900312181562185,
-    0.022082028910517693,
-    0.01325061172246933,
-    0.05194295570254326,
-    0.015223217196762562,
-    0.007458261214196682,
-    0.012023831717669964,
-    -0.006008430849760771,
-    -0.009918790310621262,
-    0.0019499518675729632,
-    -0.020269740372896194,
-    -0.04193355143070221,
-    -0.007060952018946409,
-    0.019056903198361397,
-    -0.028271688148379326,
-    0.01498622540384531,
-    0.021496521309018135,
-    -0.0064649879932403564,
-    -0.022179612889885902,
-    0.003823230043053627,
-    0.004987276624888182,
-    -0.013271522708237171,
-    0.0012564032804220915,
-    -0.027783764526247978,
-    0.055957868695259094,
-    -0.014087052084505558,
-    -0.013097263872623444,
-    -0.0032307514920830727,
-    0.005335793364793062
-  ],
-  "Electronics": [
-    -0.013970895670354366,
-    0.0013863053172826767,
-    -0.034788087010383606,
-    -0.035344697535037994,
-    0.027691317722201347,
-    0.03203286975622177,
-    -0.023892458528280258,
-    0.03167107701301575,
-    -0.04171787574887276,
-    -0.01626691035926342,
-    0.036791883409023285,
-    -0.02501959353685379,
-    -0.012781143188476562,
-    -0.030752670019865036,
-    0.02950029820203781,
-    0.02130422554910183,
-    0.0030196059960871935,
-    -0.0016541735967621207,
-    0.010652112774550915,
-    0.038322556763887405,
-    0.04394431412220001,
-    0.015919029712677002,
-    0.07330545783042908,
-    -0.007402905263006687,
-    0.012238449417054653,
-    0.002861320273950696,
-    -0.006442754063755274,
-    0.08588483184576035,
-    0.016336485743522644,
-    -0.038350388407707214,
-    0.06451103091239929,
-    -0.037264999002218246,
-    0.014123963192105293,
-    -0.02560403198003769,
-    -0.018103720620274544,
-    0.04644905403256416,
-    0.0016541735967621207,
-    -0.00765337934717536,
-    -0.00954585149884224,
-    0.032283347100019455,
-    0.021401630714535713,
-    -0.02006576955318451,
-    -0.051931656897068024,
-    0.015682470053434372,
-    0.007695124950259924,
-    0.012154958210885525,
-    -0.0713016614317894,
-    -0.027677401900291443,
-    0.04753444343805313,
-    0.027858300134539604,
-    -0.0005779170896857977,
-    -0.003548384876921773,
-    0.02790004573762417,
-    0.02346108667552471,
-    -0.007479439023882151,
-    0.018632499501109123,
-    -0.00825173407793045,
-    0.03523337468504906,
-    -0.0039797574281692505,
-    -0.0035762153565883636,
-    0.00990069005638361,
-    -0.014610996469855309,
-    0.042858924716711044,
-    -0.007674252148717642,
-    -0.04970521852374077,
-    -0.02360023930668831,
-    -0.031337108463048935,
-    0.02552054077386856,
-    0.025631863623857498,
-    -0.03670838847756386,
-    0.0019098659977316856,
-    0.010366850532591343,
-    -0.03940794616937637,
-    0.032756462693214417,
-    0.029249824583530426,
-    -0.007535099983215332,
-    -0.012509796768426895,
-    -0.0029239386785775423,
-    0.04324854910373688,
-    0.015807706862688065,
-    -0.017227061092853546,
-    -0.009197970852255821,
-    -0.013963938690721989,
-    0.020998090505599976,
-    -0.0509854219853878,
-    -0.010478172451257706,
-    -0.03055785596370697,
-    -0.06451103091239929,
-    -0.018173297867178917,
-    -0.03790510073304176,
-    -0.0707450583577156,
-    -0.032728634774684906,
-    -0.02805311419069767,
-    0.03759896382689476,
-    -0.026035405695438385,
-    0.03815557435154915,
-    -0.02151295356452465,
-    -0.04514102265238762,
-    0.010659069754183292,
-    0.019203023985028267,
-    0.007945599034428596,
-    -0.03988106548786163,
-    -0.01761668734252453,
-    -0.057275108993053436,
-    0.019397838041186333,
-    0.013191643171012402,
-    0.009921562857925892,
-    -0.03464893624186516,
-    -0.04912078008055687,
-    0.025172660127282143,
-    -0.04013153910636902,
-    -0.012808973900973797,
-    -0.024407321587204933,
-    -0.0009523238986730576,
-    -0.016378231346607208,
-    0.0014254419365897775,
-    0.02572927065193653,
-    -0.038851335644721985,
-    -0.019049957394599915,
-    -0.029834264889359474,
-    -0.025896253064274788,
-    0.008683106862008572,
-    0.02483869530260563,
-    -0.040882959961891174,
-    0.016378231346607208,
-    0.04107777401804924,
-    -0.026884233579039574,
-    0.00019111705478280783,
-    0.015209351666271687,
-    -0.024560390040278435,
-    0.05972418934106827,
-    -0.04672735929489136,
-    0.019815294072031975,
-    -0.015543317422270775,
-    -0.011723585426807404,
-    0.029750771820545197,
-    0.0073124561458826065,
-    0.01626691035926342,
-    -0.00650537246838212,
-    -0.013309922069311142,
-    0.06445536762475967,
-    0.013393414206802845,
-    0.04310939833521843,
-    0.037348490208387375,
-    0.013678676448762417,
-    0.005833962466567755,
-    -0.006286207586526871,
-    -0.034287139773368835,
-    -0.010158121585845947,
-    0.02135988511145115,
-    0.0212207343429327,
-    -0.02584059163928032,
-    -0.04319288954138756,
-    -0.003447499591857195,
-    0.043387703597545624,
-    0.005586966872215271,
-    0.04252495989203453,
-    0.02183300442993641,
-    -0.01977354846894741,
-    -0.0306413471698761,
-    0.04305373877286911,
-    -0.020135344937443733,
-    -0.012210618704557419,
-    0.019884871318936348,
-    0.001759407576173544,
-    -0.007242879830300808,
-    0.007215049583464861,
-    0.015807706862688065,
-    -0.05115240439772606,
-    0.03289561718702316,
-    -0.054881688207387924,
-    -0.02552054077386856,
-    -0.010575578548014164,
-    0.03167107701301575,
-    0.03462110459804535,
-    0.013296007178723812,
-    0.025506626814603806,
-    -0.07586586475372314,
-    -0.032255515456199646,
-    -0.014597081579267979,
-    0.011445281095802784,
-    0.011306128464639187,
-    -0.05849964916706085,
-    -0.006915871985256672,
-    0.0013915235176682472,
-    -0.015960775315761566,
-    0.05424158647656441,
-    -0.03562300279736519,
-    -0.09473492205142975,
-    -0.05209863930940628,
-    -0.017992399632930756,
-    0.004491141997277737,
-    0.014847556129097939,
-    -0.011306128464639187,
-    0.008523081429302692,
-    0.000587048998568207,
-    -0.030363043770194054,
-    -0.01122959516942501,
-    0.0371258482336998,
-    -0.029333315789699554,
-    0.017157485708594322,
-    0.021554699167609215,
-    0.020441479980945587,
-    -0.012321940623223782,
-    -0.05368497595191002,
-    -0.01152181439101696,
-    -0.04917643964290619,
-    0.02952812984585762,
-    0.028247926384210587,
-    -0.02575710043311119,
-    0.022236546501517296,
-    -0.02855406329035759,
-    -0.0035866517573595047,
-    -0.003694494953379035,
-    -0.003336177673190832,
-    -0.0008488293387927115,
-    0.014005684293806553,
-    0.01573813147842884,
-    0.02001010812819004,
-    0.0021986071951687336,
-    -0.05652368441224098,
-    0.017519280314445496,
-    0.014597081579267979,
-    0.0070063211023807526,
-    -0.005580009426921606,
-    0.007931684143841267,
-    -0.03200504183769226,
-    -0.05226562172174454,
-    0.0639544203877449,
-    -0.01212712749838829,
-    0.002501263516023755,
-    -0.00100711511913687,
-    -0.033368732780218124,
-    -0.016392147168517113,
-    -0.002560403198003769,
-    0.07859324663877487,
-    -0.027065131813287735,
-    -0.026647675782442093,
-    -0.03142059966921806,
-    -0.00875268317759037,
-    -0.026647675782442093,
-    -0.0012297589564695954,
-    -0.024476898834109306,
-    0.002035103039816022,
-    -0.03503856062889099,
-    0.025590118020772934,
-    0.011855780147016048,
-    0.014555335976183414,
-    0.0006205324898473918,
-    -0.029194163158535957,
-    0.012948126532137394,
-    0.024129018187522888,
-    0.0330069363117218,
-    -0.024115102365612984,
-    0.046337731182575226,
-    -0.01644780859351158,
-    -0.005997466389089823,
-    -0.02655026875436306,
-    0.019759634509682655,
-    0.009072733111679554,
-    -0.03768245503306389,
-    -0.0290271807461977,
-    0.017644518986344337,
-    -0.01529284380376339,
-    0.022166969254612923,
-    0.02204173244535923,
-    0.016517383977770805,
-    -0.02396203577518463,
-    -0.04438960179686546,
-    -0.045308005064725876,
-    0.0321163609623909,
-    -0.0002145990147255361,
-    0.027204284444451332,
-    0.028150521218776703,
-    0.004411129746586084,
-    -0.010408596135675907,
-    -0.024950016289949417,
-    -0.006324474234133959,
-    0.014861471019685268,
-    0.02755216509103775,
-    -0.0165034681558609,
-    0.0007375074783340096,
-    0.009698919020593166,
-    -0.0004913817392662168,
-    -0.044333938509225845,
-    0.01877165213227272,
-    0.03008473850786686,
-    -0.019370006397366524,
-    -0.0009610209381207824,
-    0.008244777098298073,
-    0.05257175862789154,
-    -0.012878550216555595,
-    -0.013386456295847893,
-    -0.055967073887586594,
-    0.017185315489768982,
-    -0.018841227516531944,
-    0.010332061909139156,
-    -0.006957617588341236,
-    0.013233388774096966,
-    -0.02625804953277111,
-    0.0004661603888962418,
-    0.03993672505021095,
-    -0.011027824133634567,
-    0.015543317422270775,
-    -0.07731304317712784,
-    0.06161666288971901,
-    -0.026703335344791412,
-    0.05861097201704979,
-    0.0064253597520291805,
-    -0.02604931965470314,
-    0.010332061909139156,
-    -0.01626691035926342,
-    0.04358251765370369,
-    -0.035400357097387314,
-    -0.03002907708287239,
-    -0.0018176776356995106,
-    -0.030780499801039696,
-    -0.003847562475129962,
-    0.008126497268676758,
-    -0.0701327845454216,
-    0.020580632612109184,
-    -0.026675505563616753,
-    0.06005815416574478,
-    -0.042858924716711044,
-    0.040743809193372726,
-    -0.0020733699202537537,
-    -0.01477797981351614,
-    0.002777828834950924,
-    -0.0033483535517007113,
-    -0.025270067155361176,
-    -0.0271068774163723,
-    0.026118896901607513,
-    0.010074630379676819,
-    -0.010693858377635479,
-    0.00664452463388443,
-    0.006359262391924858,
-    0.03364703804254532,
-    0.022737493738532066,
-    -0.07085637748241425,
-    -0.008898792788386345,
-    0.017519280314445496,
-    -0.005120806396007538,
-    -0.015919029712677002,
-    0.022890562191605568,
-    0.0456698015332222,
-    -0.007242879830300808,
-    -0.006808028556406498,
-    0.02410118654370308,
-    0.02528398297727108,
-    0.051319386810064316,
-    -0.02277923934161663,
-    -0.01028335839509964,
-    -0.01026944350451231,
-    -0.021526869386434555,
-    -0.019523074850440025,
-    -0.03857303038239479,
-    0.01228715293109417,
-    -0.004011066630482674,
-    0.027413012459874153,
-    0.005381717346608639,
-    0.016545213758945465,
-    0.054826024919748306,
-    0.018075890839099884,
-    0.05056796595454216,
-    0.03857303038239479,
-    0.028888028115034103,
-    -0.031838059425354004,
-    -0.00046659522922709584,
-    -0.029249824583530426,
-    0.01900821179151535,
-    0.0621732696890831,
-    -0.01906387135386467,
-    0.022403528913855553,
-    -0.0007983866380527616,
-    -0.02536747418344021,
-    -0.032812125980854034,
-    -0.004108473192900419,
-    0.015752045437693596,
-    -0.029778603464365005,
-    0.011055653914809227,
-    -0.002428208477795124,
-    0.0007035890594124794,
-    0.025325728580355644,
-    -0.0545198917388916,
-    0.011097400449216366,
-    0.014186582528054714,
-    -0.025450965389609337,
-    0.015209351666271687,
-    -0.02776089496910572,
-    -0.014972792938351631,
-    -0.026953810825943947,
-    -0.03498290106654167,
-    -0.056356701999902725,
-    -0.031197957694530487,
-    0.006821943912655115,
-    -0.0029813391156494617,
-    -0.010130290873348713,
-    0.026202388107776642,
-    0.02133205533027649,
-    0.016127757728099823,
-    0.024476898834109306,
-    -0.02186083421111107,
-    0.015988605096936226,
-    0.0030091695953160524,
-    0.03258948028087616,
-    -0.00999113917350769,
-    0.019620481878519058,
-    0.01301074493676424,
-    0.018757736310362816,
-    -0.054325077682733536,
-    0.0055104331113398075,
-    -0.05705246329307556,
-    0.03946360573172569,
-    0.05326751992106438,
-    -0.03258948028087616,
-    -0.06668180972337723,
-    -0.001883774995803833,
-    -0.011974059976637363,
-    -0.012802015990018845,
-    -0.04102211445569992,
-    -0.02212522365152836,
-    -0.022111307829618454,
-    -0.036903202533721924,
-    -0.051903825253248215,
-    0.0019985756371170282,
-    -0.02398986555635929,
-    0.0029274176340550184,
-    -0.06289686262607574,
-    0.014972792938351631,
-    -0.05413026362657547,
-    -0.02913850173354149,
-    -0.002861320273950696,
-    -0.0589449368417263,
-    0.03000124730169773,
-    -0.0272599458694458,
-    -0.016893096268177032,
-    -0.021401630714535713,
-    0.011744458228349686,
-    -0.01703224703669548,
-    -0.03350788727402687,
-    0.00518690375611186,
-    0.06295252591371536,
-    0.06913089007139206,
-    0.022403528913855553,
-    -0.023795051500201225,
-    -0.019954446703195572,
-    -0.022417442873120308,
-    0.030669178813695908,
-    -0.02095634490251541,
-    -0.0324224978685379,
-    0.04700566455721855,
-    -0.0026908586733043194,
-    -0.06211761012673378,
-    0.025715354830026627,
-    -0.024407321587204933,
-    0.00041376083390787244,
-    0.08438198268413544,
-    0.02913850173354149,
-    -0.04912078008055687,
-    0.017700178548693657,
-    0.0021533826366066933,
-    0.009643257595598698,
-    0.003395317355170846,
-    0.003590130712836981,
-    0.03442629054188728,
-    -0.006053127348423004,
-    0.004717264790087938,
-    -0.00990069005638361,
-    -0.00487728975713253,
-    0.01626691035926342,
-    -0.051402878016233444,
-    0.02913850173354149,
-    -0.008036048151552677,
-    0.033786192536354065,
-    0.014694488607347012,
-    -0.0015489396173506975,
-    0.030669178813695908,
-    0.014597081579267979,
-    0.0176862645894289,
-    -0.015390249900519848,
-    -0.0424414686858654,
-    -0.026564184576272964,
-    -0.03562300279736519,
-    -0.006853253114968538,
-    0.01116697583347559,
-    0.023057544603943825,
-    -0.015724215656518936,
-    0.01573813147842884,
-    -0.03403666615486145,
-    0.012203660793602467,
-    0.009810240939259529,
-    -0.016169503331184387,
-    0.021290309727191925,
-    -0.016656536608934402,
-    -0.0026404159143567085,
-    -0.03768245503306389,
-    -0.07642246782779694,
-    0.0014384874375537038,
-    0.03002907708287239,
-    -0.02849840186536312,
-    0.03105880506336689,
-    -0.010102461092174053,
-    -0.011173933744430542,
-    0.010485129430890083,
-    0.041300419718027115,
-    0.056412361562252045,
-    0.039825402200222015,
-    0.027593910694122314,
-    -0.0007949077989906073,
-    0.01671219803392887,
-    0.046337731182575226,
-    -0.004098036792129278,
-    0.012134085409343243,
-    -0.01756102591753006,
-    -0.010394680313766003,
-    -0.03668056055903435,
-    -0.04455658420920372,
-    0.015278927981853485,
-    0.006752368062734604,
-    -0.04619858041405678,
-    -0.016837434843182564,
-    -0.028748875483870506,
-    -0.020733701065182686,
-    0.006418402306735516,
-    -0.026035405695438385,
-    -0.02552054077386856,
-    -0.014332692138850689,
-    -0.010833011008799076,
-    -0.027440844103693962,
-    -0.012899423018097878,
-    0.005225170869380236,
-    0.019731802865862846,
-    -0.05051230266690254,
-    -0.0018489868380129337,
-    0.012266280129551888,
-    -0.0034962028730660677,
-    0.034342799335718155,
-    0.008418717421591282,
-    -0.04466790333390236,
-    -0.01879948191344738,
-    0.027120793238282204,
-    0.02784438617527485,
-    -0.01115306094288826,
-    0.00452245119959116,
-    0.0011445280397310853,
-    0.020149260759353638,
-    0.007187218870967627,
-    -0.012029720470309258,
-    -0.016127757728099823,
-    0.04842501878738403,
-    0.01319860015064478,
-    -0.03857303038239479,
-    0.01168183982372284,
-    -0.021025920286774635,
-    -0.01328904926776886,
-    0.014214412309229374,
-    0.0029065448325127363,
-    -0.00012632424477487803,
-    0.0238646287471056,
-    -0.00539215374737978,
-    -0.01557114813476801,
-    -0.007152430713176727,
-    0.03155975416302681,
-    0.01426311582326889,
-    -0.0028352292720228434,
-    0.03768245503306389,
-    -0.00023134078946895897,
-    -0.004024981986731291,
-    0.028484486043453217,
-    -0.020260581746697426,
-    -0.048898134380578995,
-    -0.030752670019865036,
-    0.016614791005849838,
-    -0.0024229902774095535,
-    -0.009058818221092224,
-    -0.009796325117349625,
-    -0.038879167288541794,
-    0.0010219000978395343,
-    -0.04269194230437279,
-    -0.02486652508378029,
-    -0.019370006397366524,
-    -0.02206956222653389,
-    -0.006891520228236914,
-    -0.04541932791471481,
-    -0.030780499801039696,
-    0.021638190373778343,
-    -0.0006314038182608783,
-    7.786552487232257e-06,
-    0.011640094220638275,
-    -0.0321163609623909,
-    -0.022292206063866615,
-    0.005545221269130707,
-    -0.006915871985256672,
-    -0.0003763636341318488,
-    0.030279552564024925,
-    -0.001234977156855166,
-    0.0030944005120545626,
-    0.020149260759353638,
-    -0.0176862645894289,
-    0.028888028115034103,
-    0.01950915902853012,
-    0.04013153910636902,
-    -0.0021046793553978205,
-    0.029221992939710617,
-    0.02805311419069767,
-    -0.02852623164653778,
-    0.01061036717146635,
-    0.009156224317848682,
-    -0.022208714857697487,
-    -0.016225164756178856,
-    -0.028206180781126022,
-    0.03999238461256027,
-    0.01861858367919922,
-    -0.01426311582326889,
-    -0.05760907381772995,
-    -0.030836161226034164,
-    0.027621742337942123,
-    0.004358947277069092,
-    -0.005006005987524986,
-    -0.001595033798366785,
-    -0.01735229790210724,
-    -0.018382025882601738,
-    0.00822390429675579,
-    -0.01274635549634695,
-    0.02899934910237789,
-    0.0025986700784415007,
-    0.010923459194600582,
-    0.02277923934161663,
-    0.03356354683637619,
-    0.006957617588341236,
-    0.026745082810521126,
-    0.006049648392945528,
-    0.020733701065182686,
-    -0.012120169587433338,
-    -0.024769118055701256,
-    0.024351662024855614,
-    0.010485129430890083,
-    0.001306292717345059,
-    -0.00553130591288209,
-    -0.027134709060192108,
-    0.0371258482336998,
-    -0.019606566056609154,
-    0.006668876390904188,
-    -0.00265607051551342,
-    0.005847877357155085,
-    0.030307382345199585,
-    -0.015098029747605324,
-    -0.0026091064792126417,
-    -0.0015602457569912076,
-    -0.002254268154501915,
-    -0.008523081429302692,
-    0.01353952381759882,
-    -0.008864005096256733,
-    -0.004564197268337011,
-    0.019996192306280136,
-    -0.03289561718702316,
-    0.01571029983460903,
-    -0.021234648302197456,
-    -0.0008840523078106344,
-    -0.03670838847756386,
-    0.007931684143841267,
-    -0.06022513657808304,
-    0.0029987331945449114,
-    -0.0015915550757199526,
-    -0.022153053432703018,
-    0.007750785909593105,
-    0.020970258861780167,
-    0.0004252843791618943,
-    -0.03256164863705635,
-    0.016225164756178856,
-    0.008703979663550854,
-    0.013428201898932457,
-    0.0030944005120545626,
-    -0.039797574281692505,
-    0.014847556129097939,
-    -0.019968362525105476,
-    0.01776975579559803,
-    0.0139987263828516,
-    0.01779758557677269,
-    0.02198607102036476,
-    0.011473111808300018,
-    -0.04717264696955681,
-    -0.05507650226354599,
-    -0.007416820153594017,
-    -0.026091065257787704,
-    -0.03946360573172569,
-    0.0001668741024332121,
-    0.0017246194183826447,
-    0.021610360592603683,
-    -0.01143136527389288,
-    -0.0014532724162563682,
-    -0.003383141476660967,
-    -0.018660331144928932,
-    0.004769446793943644,
-    -0.03720933943986893,
-    -0.03915747255086899,
-    0.039352286607027054,
-    -8.512210479239002e-05,
-    -0.00954585149884224,
-    -0.10085762292146683,
-    0.010909544304013252,
-    0.009100563824176788,
-    -0.0020124909933656454,
-    -0.014847556129097939,
-    -0.020900683477520943,
-    0.008446548134088516,
-    -0.026383286342024803,
-    -0.011862738057971,
-    0.030947482213377953,
-    -0.015682470053434372,
-    0.02430991642177105,
-    -0.012635033577680588,
-    0.012795059010386467,
-    0.024240339174866676,
-    0.01555723324418068,
-    -0.0005487820599228144,
-    -0.011020866222679615,
-    0.006394050549715757,
-    0.05513216182589531,
-    -0.044834885746240616,
-    -0.008982283994555473,
-    0.0013341231970116496,
-    -0.021916495636105537,
-    -0.0450853630900383,
-    -0.03960276022553444,
-    -0.043832991272211075,
-    -0.013129024766385555,
-    0.03320175036787987,
-    -0.03236683830618858,
-    -0.011563559994101524,
-    0.0038927870336920023,
-    -0.007590760942548513,
-    0.010575578548014164,
-    -0.003847562475129962,
-    0.043359871953725815,
-    0.036290932446718216,
-    -0.03053002618253231,
-    -0.0719139352440834,
-    0.01682351902127266,
-    -0.022083478048443794,
-    -0.03665272891521454,
-    0.016656536608934402,
-    0.037376321852207184,
-    0.010422511026263237,
-    0.03194937855005264,
-    0.0038092955946922302,
-    -0.016072096303105354,
-    0.01895255036652088,
-    -0.020733701065182686,
-    -0.017018333077430725,
-    -0.001627212855964899,
-    0.011654009111225605,
-    0.018994295969605446,
-    -0.009420613758265972,
-    0.01237760204821825,
-    -0.022974053397774696,
-    -0.005322577431797981,
-    -0.012161915190517902,
-    0.015682470053434372,
-    -0.00481815030798316,
-    -0.018632499501109123,
-    0.03709801658987999,
-    -0.00619575846940279,
-    0.032394666224718094,
-    0.030836161226034164,
-    -0.02913850173354149,
-    -0.05109674483537674,
-    -0.04859200119972229,
-    -0.018020229414105415,
-    -0.001697658677585423,
-    0.010589494369924068,
-    -0.012871592305600643,
-    0.005051230546087027,
-    0.005858313757926226,
-    0.0028439261950552464,
-    -0.009378868155181408,
-    -0.02604931965470314,
-    0.017171399667859077,
-    -0.0427197702229023,
-    0.003927574958652258,
-    -0.04171787574887276,
-    -0.018368110060691833,
-    -0.00028352290973998606,
-    0.004254583269357681,
-    -0.02222263067960739,
-    0.012029720470309258,
-    0.02947246842086315,
-    0.016392147168517113,
-    -0.02454647421836853,
-    -0.06272988021373749,
-    0.040855132043361664,
-    -0.011020866222679615,
-    0.0026908586733043194,
-    0.009963308461010456,
-    0.04550281912088394,
-    0.02454647421836853,
-    -0.0021846918389201164,
-    -0.07430735230445862,
-    0.06434404850006104,
-    0.006828901823610067,
-    0.0013654323993250728,
-    0.005155594553798437,
-    -0.021345971152186394,
-    -0.0032335526775568724,
-    0.06106005236506462,
-    0.03189371898770332,
-    -0.01971788890659809,
-    0.0010506001999601722,
-    -0.023321934044361115,
-    0.011396577581763268,
-    0.035344697535037994,
-    -0.0070341513492167,
-    0.002109897555783391,
-    0.05499301105737686,
-    -0.024268170818686485,
-    -0.028456656262278557,
-    0.002212522318586707,
-    0.017199231311678886,
-    -0.009789368137717247,
-    0.023892458528280258,
-    0.0024351661559194326,
-    -0.02230612188577652,
-    0.001840289798565209,
-    0.004115430638194084,
-    0.027468673884868622,
-    0.04118909686803818,
-    -0.01529284380376339,
-    0.017964567989110947,
-    -0.004752052947878838,
-    -0.015404165722429752,
-    0.03592913597822189,
-    0.021874750033020973,
-    -0.017783669754862785,
-    0.03843387961387634,
-    0.04091079160571098,
-    -0.0031535401940345764,
-    -0.01276027038693428,
-    0.030279552564024925,
-    0.0026508523151278496,
-    -0.008390886709094048,
-    0.01647563837468624,
-    -0.004602463915944099,
-    -0.012697651982307434,
-    -0.015626808628439903,
-    0.05165335163474083,
-    -0.00929537694901228,
-    0.01451359037309885,
-    0.0034127114340662956,
-    -0.036847542971372604,
-    -0.013929150067269802,
-    0.007625548634678125,
-    -0.014193539507687092,
-    -0.01582162268459797,
-    -0.010102461092174053,
-    0.025297896936535835,
-    0.02071978524327278,
-    -0.004804234951734543,
-    0.01879948191344738,
-    0.011020866222679615,
-    -0.0002561272995080799,
-    -0.02501959353685379,
-    0.01953699067234993,
-    0.012871592305600643,
-    -0.0465603768825531,
-    0.0038545201532542706,
-    -0.01774192415177822,
-    0.028832366690039635,
-    0.0228349007666111,
-    0.014416183345019817,
-    -0.04104994237422943,
-    0.008794428780674934,
-    -0.020970258861780167,
-    -0.004734658636152744,
-    -0.04377732798457146,
-    -0.002643894637003541,
-    0.0068776048719882965,
-    -0.006985447835177183,
-    0.014179624617099762,
-    0.024142932146787643,
-    -0.029945585876703262,
-    0.006950660143047571,
-    0.01555723324418068,
-    0.030919652432203293,
-    -0.05012267827987671,
-    0.009232758544385433,
-    0.021735597401857376,
-    0.012968999333679676,
-    -0.0031518007162958384,
-    -0.0012262801174074411,
-    0.037738118320703506,
-    0.02024666778743267,
-    0.0021986071951687336,
-    0.018451601266860962,
-    -0.015390249900519848,
-    0.006752368062734604,
-    0.008585699833929539,
-    -0.008105624467134476,
-    0.02552054077386856,
-    0.04647688567638397,
-    0.0013802173780277371,
-    -0.017073992639780045,
-    -0.019954446703195572,
-    -0.003767549991607666,
-    -0.00302830315195024,
-    -0.012767228297889233,
-    0.012516753748059273,
-    -0.02958378940820694,
-    -0.03150409087538719,
-    0.02280707098543644,
-    0.030140399932861328,
-    0.004755531437695026,
-    0.012398474849760532,
-    0.054798197001218796,
-    -0.031170126050710678,
-    -0.005413026548922062,
-    -0.0033274805173277855,
-    -0.006881083827465773,
-    -0.004745095036923885,
-    -0.048842474818229675,
-    -0.022083478048443794,
-    -0.03222768381237984,
-    -0.0015245879767462611,
-    0.025937998667359352,
-    -0.02628587931394577,
-    0.014089175499975681,
-    0.017394043505191803,
-    -0.02006576955318451,
-    0.034231480211019516,
-    0.039296623319387436,
-    -0.003083963878452778,
-    -0.021693851798772812,
-    0.030697008594870567,
-    -0.023975949734449387,
-    -0.03615178167819977,
-    0.060280799865722656,
-    0.0036040458362549543,
-    -0.01550157181918621,
-    -0.008105624467134476,
-    -0.030363043770194054,
-    -0.05173684284090996,
-    0.0019585692789405584,
-    -0.011591390706598759,
-    -0.01706007868051529,
-    -0.007037630304694176,
-    0.0356508307158947,
-    -0.04358251765370369,
-    -0.019523074850440025,
-    0.006975011434406042,
-    -0.020316243171691895,
-    -0.008370013907551765,
-    0.01477797981351614,
-    -0.03695886582136154,
-    0.03796076029539108,
-    8.321963105117902e-05,
-    0.0341758169233799,
-    0.053935449570417404,
-    0.0341758169233799,
-    0.011987974867224693,
-    0.012690694071352482,
-    0.007632506545633078,
-    0.017129654064774513,
-    -0.030863991007208824,
-    0.009712833911180496,
-    -0.016461722552776337,
-    -0.04469573497772217,
-    0.02646677754819393,
-    -0.0033500927966088057,
-    0.0031518007162958384,
-    0.013163812458515167,
-    -0.03954709693789482,
-    0.024936100468039513,
-    -0.04015936702489853,
-    0.008648318238556385,
-    0.03843387961387634,
-    0.00875268317759037,
-    -0.03439846262335777,
-    -0.02069195546209812,
-    -0.013831743970513344,
-    0.03921313211321831,
-    -0.0045955064706504345,
-    0.022208714857697487,
-    0.02095634490251541,
-    0.04341553524136543,
-    0.02963945083320141,
-    0.006933265831321478,
-    0.01629474014043808,
-    0.017157485708594322,
-    0.00331530487164855,
-    0.006794113665819168,
-    -0.023294104263186455,
-    -0.0010279880370944738,
-    -0.02222263067960739,
-    -0.015376335009932518,
-    -0.04817454516887665,
-    0.015181521885097027,
-    0.05404677242040634,
-    -0.026411116123199463,
-    0.0281366053968668,
-    0.010492087341845036,
-    0.017046162858605385,
-    -0.0341758169233799,
-    -0.0077647012658417225,
-    -0.009538893587887287,
-    0.006223588716238737,
-    0.007082854863256216,
-    -0.040882959961891174,
-    0.0022560073994100094,
-    0.04644905403256416,
-    -0.024602135643363,
-    0.009858944453299046,
-    0.013240346685051918,
-    -0.0030822246335446835,
-    -0.010596451349556446,
-    0.009845028631389141,
-    0.025937998667359352,
-    -0.014374437741935253,
-    0.03470459580421448,
-    -0.010986078530550003,
-    -0.019578736275434494,
-    0.008126497268676758,
-    0.012370644137263298,
-    0.0010332062374800444,
-    0.016308655962347984,
-    -0.006634088233113289,
-    -0.02312711998820305,
-    0.002069891197606921,
-    0.01953699067234993,
-    0.030223891139030457,
-    -0.014040471985936165,
-    -0.01028335839509964,
-    0.0007614242495037615,
-    -0.019759634509682655,
-    -0.025645777583122253,
-    -0.02472737245261669,
-    0.012363686226308346,
-    0.030446534976363182,
-    -0.01632256992161274,
-    -0.06384310126304626,
-    -0.017018333077430725,
-    -0.008877919986844063,
-    0.001944654155522585,
-    0.00022188277216628194,
-    0.0021568613592535257,
-    0.021638190373778343,
-    -0.04024285823106766,
-    -0.027273861691355705,
-    -0.006634088233113289,
-    0.017310552299022675,
-    0.028484486043453217,
-    0.015237182378768921,
-    0.028693214058876038,
-    -0.009065776132047176,
-    -0.014694488607347012,
-    -0.04667169973254204,
-    -0.018382025882601738,
-    0.0356508307158947,
-    -0.011271340772509575,
-    0.01415875181555748,
-    -0.006519287824630737,
-    -0.004557239357382059,
-    -0.008356099016964436,
-    0.002233395352959633,
-    0.014360522851347923,
-    -0.036318764090538025,
-    -0.0017237497959285975,
-    -0.0007857759483158588,
-    -0.012370644137263298,
-    -0.04405563324689865,
-    -0.012628075666725636,
-    0.03303476795554161,
-    -0.0055382633581757545,
-    0.02380896732211113,
-    -0.00848829373717308,
-    0.005399111192673445,
-    -0.020413650199770927,
-    -0.029388977214694023,
-    -0.021415546536445618,
-    -0.044890549033880234,
-    0.02051105722784996,
-    -0.005468687508255243,
-    0.03289561718702316,
-    0.017380129545927048,
-    -0.00518690375611186,
-    -0.01265590637922287,
-    0.015014538541436195,
-    0.01895255036652088,
-    0.004946866072714329,
-    0.016753943637013435,
-    -0.019495245069265366,
-    -0.006975011434406042,
-    -0.043860822916030884,
-    0.019606566056609154,
-    -0.02280707098543644,
-    -0.009977223351597786,
-    -0.006192279513925314,
-    0.043387703597545624,
-    0.008996199816465378,
-    0.02572927065193653,
-    0.04700566455721855,
-    -0.02225046046078205,
-    0.023141035810112953,
-    0.02309929020702839,
-    -0.008905750699341297,
-    0.002963945036754012,
-    0.011487026698887348,
-    -0.0450853630900383,
-    0.01264199148863554,
-    -9.572159615345299e-05,
-    0.008564827032387257,
-    0.005225170869380236,
-    -0.008084751665592194,
-    0.010561663657426834,
-    0.015334589406847954,
-    0.006039211992174387,
-    -0.015682470053434372,
-    0.004828586708754301,
-    0.012850719504058361,
-    0.01302465982735157,
-    -0.049760881811380386,
-    0.0365414060652256,
-    -0.021081581711769104,
-    -0.04322072118520737,
-    0.020316243171691895,
-    -0.025450965389609337,
-    -0.022055648267269135,
-    -0.009566724300384521,
-    -0.0012610681587830186,
-    0.004045854788273573,
-    -0.01985703967511654,
-    -0.022500935941934586,
-    -0.017227061092853546,
-    0.01744970493018627,
-    0.008196073584258556,
-    0.0038232109509408474,
-    -0.02062237821519375,
-    -0.005611318629235029,
-    0.012579372152686119,
-    -0.01054774783551693,
-    -0.041300419718027115,
-    0.011264382861554623,
-    0.02109549567103386,
-    -0.012266280129551888,
-    0.005569573026150465,
-    -0.014972792938351631,
-    -0.004031939432024956,
-    -0.013504736125469208,
-    -0.005896580871194601,
-    0.09952176362276077,
-    -0.011396577581763268,
-    -0.013101194053888321,
-    0.018549008294939995,
-    0.03896265849471092,
-    -0.0038092955946922302,
-    -0.029249824583530426,
-    -0.004592027515172958,
-    -0.039240963757038116,
-    -0.004696391988545656,
-    -0.006592342630028725,
-    -0.010742561891674995,
-    0.010742561891674995,
-    0.01918911002576351,
-    -0.014499674551188946,
-    0.010443383827805519,
-    -0.01140353549271822,
-    -0.012697651982307434,
-    0.0014524026773869991,
-    -0.004870332311838865,
-    0.02913850173354149,
-    0.006574948783963919,
-    -0.0053643230348825455,
-    0.03250598907470703,
-    0.02472737245261669,
-    -0.0439164824783802,
-    -0.0344819538295269,
-    -0.010805180296301842,
-    -0.015223267488181591,
-    -0.0028630595188587904,
-    -0.00690891407430172,
-    -0.00545129319652915,
-    0.003548384876921773,
-    0.03161541372537613,
-    0.024936100468039513,
-    0.014304861426353455,
-    -0.01708790846168995,
-    -0.020817192271351814,
-    -0.010039841756224632,
-    0.019662227481603622,
-    -0.014722318388521671,
-    0.005833962466567755,
-    0.006192279513925314,
-    -0.013142939656972885,
-    0.0019603087566792965,
-    -0.010686900466680527,
-    0.007100248709321022,
-    0.024950016289949417,
-    0.011097400449216366,
-    0.01249588094651699,
-    0.004769446793943644,
-    -0.022890562191605568,
-    0.018103720620274544,
-    -0.016614791005849838,
-    -0.001842029276303947,
-    0.01115306094288826,
-    0.0016506947576999664,
-    0.02038581855595112,
-    -0.014889301732182503,
-    0.03450978174805641,
-    -0.027955707162618637,
-    0.009789368137717247,
-    -0.016044266521930695,
-    0.015668554231524467,
-    -0.01355343870818615,
-    -0.018103720620274544,
-    -0.044834885746240616,
-    -0.011459195986390114,
-    0.028915857896208763,
-    -0.0030439577531069517,
-    -0.0008275216678157449,
-    -0.030390873551368713,
-    0.00508253974840045,
-    0.007590760942548513,
-    -0.007131557911634445,
-    0.016141673550009727,
-    0.006536681670695543,
-    -0.01239151693880558,
-    0.009392783977091312,
-    -0.007625548634678125,
-    0.018075890839099884,
-    0.02312711998820305,
-    -0.009580639190971851,
-    0.01671219803392887,
-    -0.012321940623223782,
-    0.01184882316738367,
-    -0.04792407155036926,
-    -0.018910804763436317,
-    -0.003611003514379263,
-    -0.0017576680984348059,
-    0.009079691022634506,
-    0.03392534330487251,
-    -0.002273401478305459,
-    0.004727701190859079,
-    -0.015084114857017994,
-    -0.015167606063187122,
-    -0.019815294072031975,
-    0.0050581879913806915,
-    0.013824786059558392,
-    -0.008397844620049,
-    0.0006701055681332946,
-    0.0034822875168174505,
-    -0.004797277506440878,
-    0.008717894554138184,
-    -0.010471214540302753,
-    -0.01895255036652088,
-    0.019996192306280136,
-    -0.009448444470763206,
-    -0.014103090390563011,
-    0.00010969118739012629,
-    -0.007799489423632622,
-    0.005273873917758465,
-    -0.03008473850786686,
-    0.019147364422678947,
-    -0.01169575471431017,
-    0.0032683408353477716,
-    0.01389436237514019,
-    0.002614324912428856,
-    -0.022111307829618454,
-    0.02254268154501915,
-    -0.011090442538261414,
-    0.0042893714271485806,
-    0.03988106548786163,
-    -0.015932943671941757,
-    0.02454647421836853,
-    -0.016141673550009727,
-    -0.006348825991153717,
-    0.018131552264094353,
-    0.007785574067384005,
-    -0.015598978847265244,
-    0.028331419453024864,
-    0.02219480089843273,
-    -0.01505628414452076,
-    0.006456668954342604,
-    0.07196959853172302,
-    0.015153691172599792,
-    0.011424408294260502,
-    -0.017046162858605385,
-    -0.024087272584438324,
-    -0.015445911325514317,
-    0.03247815743088722,
-    -0.03108663484454155,
-    0.03111446648836136,
-    0.008314353413879871,
-    0.0026508523151278496,
-    -0.0045676757581532,
-    -0.03868435323238373,
-    0.01597468927502632,
-    -0.025395303964614868,
-    0.0013845658395439386,
-    -0.0022351345978677273,
-    0.05323968827724457,
-    -0.024741288274526596,
-    -0.018020229414105415,
-    0.0068602110259234905,
-    0.028693214058876038,
-    -0.0054930392652750015,
-    0.013859573751688004,
-    0.04717264696955681,
-    0.002963945036754012,
-    -0.03309042751789093,
-    0.02507525309920311,
-    0.0044702691957354546,
-    0.002776089357212186,
-    -0.011549645103514194,
-    0.018465517088770866,
-    -0.007646421901881695,
-    -0.027440844103693962,
-    0.019787464290857315,
-    -0.007549014873802662,
-    0.011709670536220074,
-    0.008196073584258556,
-    -0.013372541405260563,
-    0.005124285351485014,
-    0.031531922519207,
-    -0.012308025732636452,
-    0.015223267488181591,
-    0.006147054955363274,
-    -0.016851350665092468,
-    -0.00788298062980175,
-    0.0017333164578303695,
-    -0.006627130787819624,
-    0.0010471214773133397,
-    0.017101824283599854,
-    -0.019105616956949234,
-    0.025200489908456802,
-    0.006046169437468052,
-    -0.015418080613017082,
-    0.03640225529670715,
-    -0.03403666615486145,
-    0.025200489908456802,
-    -0.044779226183891296,
-    0.021290309727191925,
-    0.01724097691476345,
-    0.01635040156543255,
-    0.033285241574048996,
-    -0.03965841978788376,
-    -0.01655912958085537,
-    -0.0027517378330230713,
-    0.014277031645178795,
-    -0.01476406492292881,
-    -0.013588227331638336,
-    -0.009156224317848682,
-    0.027705233544111252,
-    0.02522832155227661,
-    -0.02660593017935753,
-    0.016837434843182564,
-    0.037376321852207184,
-    0.0028317503165453672,
-    0.05900059640407562,
-    0.005242564715445042,
-    -0.0036388339940458536,
-    0.04792407155036926,
-    0.018368110060691833,
-    -0.0013297746190801263,
-    0.014430099166929722,
-    0.014903216622769833,
-    0.029778603464365005,
-    -0.03651357814669609,
-    0.00031070111435838044,
-    -0.04447309300303459,
-    -0.02083110623061657,
-    0.011974059976637363,
-    0.00319006759673357,
-    0.008272606879472733,
-    -0.03097531385719776,
-    0.012509796768426895,
-    -0.018256789073348045,
-    0.007208091672509909,
-    0.006943702232092619,
-    0.0026160641573369503,
-    0.011180891655385494,
-    -0.006881083827465773,
-    0.013609100133180618,
-    -0.005813089665025473,
-    0.003611003514379263,
-    -0.017018333077430725,
-    -0.010436425916850567,
-    -0.024950016289949417,
-    0.015195436775684357,
-    0.00694022374227643,
-    0.01042946893721819,
-    -0.03208853304386139,
-    0.0020646729972213507,
-    -0.011445281095802784,
-    0.05463121458888054,
-    0.0421353317797184,
-    -0.0377102866768837,
-    0.0030178665183484554,
-    -0.0009192752186208963,
-    -0.035344697535037994,
-    0.018576838076114655,
-    -0.01061036717146635,
-    -0.010394680313766003,
-    -0.028428824618458748,
-    -0.03219985589385033,
-    0.00197422388009727,
-    -0.007298540789633989,
-    -0.005479123909026384,
-    -0.05766473338007927,
-    0.005458251107484102,
-    0.0306413471698761,
-    0.008509166538715363,
-    -0.01697658747434616,
-    0.026327624917030334,
-    0.015807706862688065,
-    0.019425667822360992,
-    0.032283347100019455,
-    0.01504236925393343,
-    0.006957617588341236,
-    0.009086648933589458,
-    0.00142892065923661,
-    -0.02599366009235382,
-    -0.0014376176986843348,
-    -0.01729663647711277,
-    0.027426928281784058,
-    0.030863991007208824,
-    0.013922193087637424,
-    0.0016411280957981944,
-    -0.0003896265698131174,
-    -0.027329521253705025,
-    -0.008585699833929539,
-    -0.00947627518326044,
-    -0.03412015736103058,
-    0.043805159628391266,
-    0.03150409087538719,
-    -0.022180885076522827,
-    0.0041536977514624596,
-    0.022153053432703018,
-    0.018493346869945526,
-    -0.01608601212501526,
-    0.022890562191605568,
-    -0.02148512378334999,
-    0.019731802865862846,
-    0.03957492858171463,
-    0.004056291189044714,
-    -0.024476898834109306,
-    -0.005559136625379324,
-    0.03167107701301575,
-    -0.023850712925195694,
-    0.006884562782943249,
-    -0.012266280129551888,
-    -0.005997466389089823,
-    0.007729913108050823,
-    0.021290309727191925,
-    0.008481335826218128,
-    0.01726880669593811,
-    0.0002491696795914322,
-    0.02560403198003769,
-    -0.00798734463751316,
-    0.0036701431963592768,
-    0.013449074700474739,
-    -0.03851737082004547,
-    -0.007834277115762234,
-    0.010603409260511398,
-    0.00041832675924524665,
-    0.027482589706778526,
-    0.000822738278657198,
-    0.025645777583122253,
-    0.028971519321203232,
-    0.03609611839056015,
-    0.007799489423632622,
-    0.02336367964744568,
-    -0.025924082845449448,
-    0.07391773164272308,
-    -0.03871218487620354,
-    -0.011688797734677792,
-    -0.0036875372752547264,
-    -0.00041767448419705033,
-    -0.02478303387761116,
-    0.02678682841360569,
-    0.012767228297889233,
-    -0.003816253272816539,
-    0.01800631359219551,
-    0.0019098659977316856,
-    0.012850719504058361,
-    -0.014457928948104382,
-    0.010791264474391937,
-    -0.0017733228160068393,
-    0.0013610839378088713,
-    -0.017658432945609093,
-    -0.009392783977091312,
-    0.005138200707733631,
-    -0.033340904861688614,
-    -0.0017646257765591145,
-    0.02805311419069767,
-    0.06439971178770065,
-    0.03592913597822189,
-    -0.001460229977965355,
-    -0.008787470869719982,
-    0.012975956313312054,
-    -0.01821504347026348,
-    -0.018145466223359108,
-    0.011633136309683323,
-    -0.0044320025481283665,
-    0.002612585434690118,
-    -0.006147054955363274,
-    -0.006300122477114201,
-    0.05557744950056076,
-    -0.01779758557677269,
-    -0.0027726106345653534,
-    -0.01505628414452076,
-    0.0077647012658417225,
-    -0.012815931811928749,
-    -0.02763565629720688,
-    0.010770391672849655,
-    -0.007009799592196941,
-    0.007277667988091707,
-    0.02634154073894024,
-    -0.009469317272305489,
-    -0.013650845736265182,
-    0.008272606879472733,
-    0.0005313880392350256,
-    -0.006140097510069609,
-    -0.031281448900699615,
-    -0.01729663647711277,
-    -0.051820334047079086,
-    -0.0001464361121179536,
-    0.009253631345927715,
-    0.031309280544519424,
-    0.010735603980720043,
-    -0.03364703804254532,
-    -0.0067314947955310345,
-    -0.01168183982372284,
-    0.02507525309920311,
-    -0.01293421071022749,
-    0.005333013832569122,
-    0.0058165681548416615,
-    0.016753943637013435
-  ],
-  "Comfort": [
-    0.04238530248403549,
-    -0.03589949756860733,
-    -0.03183164820075035,
-    0.06497183442115784,
-    0.04292578622698784,
-    -0.03242902457714081,
-    -0.015787813812494278,
-    0.07219724357128143,
-    0.039057061076164246,
-    -0.0006124889478087425,
-    -0.017992418259382248,
-    0.04116210341453552,
-    0.009038878604769707,
-    0.021306436508893967,
-    0.04568509757518768,
-    0.040223367512226105,
-    -0.0005800421349704266,
-    0.04412053897976875,
-    0.030693786218762398,
-    0.028844762593507767,
-    -0.023340363055467606,
-    0.0020019232761114836,
-    -0.00870463252067566,
-    -0.061046212911605835,
-    -0.0003040221054106951,
-    -0.015645582228899002,
-    -0.011186590418219566,
-    0.000810281082522124,
-    -0.01554601825773716,
-    -0.06519940495491028,
-    0.06969395279884338,
-    -0.03217300400137901,
-    0.023155460134148598,
-    -0.05527157336473465,
-    0.04255598038434982,
-    0.005948876962065697,
-    0.0010311860824003816,
-    0.009451353922486305,
-    -0.0057390835136175156,
-    0.0038473906461149454,
-    -0.013682772405445576,
-    0.0085837347432971,
-    -0.026369916275143623,
-    0.06320814788341522,
-    0.02998262271285057,
-    -0.02998262271285057,
-    -0.012552022933959961,
-    0.026241905987262726,
-    0.009650479070842266,
-    0.020453041419386864,
-    -0.023681720718741417,
-    -0.026881953701376915,
-    -0.0013725442113354802,
-    0.04101986810564995,
-    0.01937207393348217,
-    -0.0019219174282625318,
-    -0.012665809132158756,
-    -0.007872572168707848,
-    0.05766107887029648,
-    0.0028002033941447735,
-    -0.048159945756196976,
-    -0.0371226966381073,
-    -0.02244429849088192,
-    -0.03171785920858383,
-    0.012480907142162323,
-    -0.025317395105957985,
-    -0.004469658248126507,
-    0.018689358606934547,
-    0.009209558367729187,
-    -0.024890698492527008,
-    0.018646689131855965,
-    0.04596956446766853,
-    -0.02338303253054619,
-    0.0061480021104216576,
-    -0.0057533071376383305,
-    0.011997316032648087,
-    0.01978454925119877,
-    -0.024748465046286583,
-    0.05871360003948212,
-    -0.024464000016450882,
-    -0.001534333685413003,
-    0.019286734983325005,
-    -0.025559190660715103,
-    -0.02830427885055542,
-    0.009522469714283943,
-    -0.043068017810583115,
-    -0.09023233503103256,
-    0.03607017546892166,
-    0.0006267122225835919,
-    -0.03109203651547432,
-    0.029271461069583893,
-    0.03902861475944519,
-    -0.03555813804268837,
-    0.010233632288873196,
-    -0.004466102458536625,
-    -0.04710742458701134,
-    0.013497869484126568,
-    -0.01429437194019556,
-    -0.009785600006580353,
-    0.012637362815439701,
-    -0.006283123046159744,
-    -0.05888427793979645,
-    -0.01671232469379902,
-    -0.020780175924301147,
-    0.010418535210192204,
-    0.029214566573500633,
-    0.0014649953227490187,
-    -0.03427804633975029,
-    -0.02779224142432213,
-    0.0376916266977787,
-    -0.03299795463681221,
-    -0.012388455681502819,
-    -0.025374287739396095,
-    0.06434600800275803,
-    0.02715219557285309,
-    -0.012864935211837292,
-    -0.010219409130513668,
-    -0.004892800003290176,
-    -0.028233163058757782,
-    -0.04403520002961159,
-    -0.016911450773477554,
-    -0.02105041779577732,
-    0.010375864803791046,
-    -0.026057004928588867,
-    -0.06280989944934845,
-    0.002142377896234393,
-    -0.013170734979212284,
-    0.0014436604687944055,
-    -0.07236792892217636,
-    -0.03365222364664078,
-    0.030011069029569626,
-    0.0025868546217679977,
-    0.013554763048887253,
-    0.006738267373293638,
-    -0.007659223396331072,
-    -0.010219409130513668,
-    0.013099618256092072,
-    0.0004142523102927953,
-    -0.01895960047841072,
-    -0.06161514297127724,
-    0.00890375766903162,
-    -0.012957385741174221,
-    0.03772007301449776,
-    -0.02208871580660343,
-    0.022984782233834267,
-    -0.020808624103665352,
-    -0.03370911628007889,
-    0.023240799084305763,
-    -0.02881631627678871,
-    0.04616868868470192,
-    -0.040166474878787994,
-    -0.00536572327837348,
-    -0.03348154574632645,
-    -0.010539432987570763,
-    -0.01769373007118702,
-    -0.04520150646567345,
-    0.04878576844930649,
-    -0.007908130064606667,
-    -0.013120952993631363,
-    0.023511040955781937,
-    0.00489991158246994,
-    -0.03510299697518349,
-    -0.0004502549418248236,
-    -0.01959964632987976,
-    0.04557131230831146,
-    0.02012590691447258,
-    -0.03811832517385483,
-    0.03897172212600708,
-    -0.05407681688666344,
-    -0.0008258377783931792,
-    0.015062428079545498,
-    -0.0010534098837524652,
-    -0.05293895676732063,
-    0.04079229757189751,
-    0.0075454371981322765,
-    -0.03248591721057892,
-    0.017764845862984657,
-    -0.036980465054512024,
-    -0.030295534059405327,
-    0.023966185748577118,
-    0.057092148810625076,
-    0.0011671959655359387,
-    0.02784913405776024,
-    -0.023994632065296173,
-    0.04511616751551628,
-    -0.02621345967054367,
-    -0.06229786202311516,
-    -8.995098323794082e-05,
-    0.043295592069625854,
-    -0.006798716261982918,
-    -0.048984892666339874,
-    -0.001635674387216568,
-    0.030011069029569626,
-    -0.004579888191074133,
-    0.02592899464070797,
-    -0.012374232523143291,
-    0.0033389092423021793,
-    0.01267292071133852,
-    0.012701367028057575,
-    0.005884872283786535,
-    -0.03601328283548355,
-    0.002117487136274576,
-    0.05160197243094444,
-    -0.023710167035460472,
-    0.008142814040184021,
-    0.018234213814139366,
-    -0.07379025220870972,
-    0.05979456752538681,
-    -0.029214566573500633,
-    -0.03143339604139328,
-    0.04076385125517845,
-    0.023639051243662834,
-    0.015460679307579994,
-    0.0424421951174736,
-    0.013014279305934906,
-    0.03393668681383133,
-    0.019357850775122643,
-    0.007780120708048344,
-    -0.04099142178893089,
-    0.061216894537210464,
-    0.007965023629367352,
-    0.010084288194775581,
-    0.11082760989665985,
-    0.015147767029702663,
-    0.009565139189362526,
-    0.026839284226298332,
-    -0.009230893105268478,
-    -0.05160197243094444,
-    0.01977032609283924,
-    -0.020908186212182045,
-    0.012608916498720646,
-    0.005035032518208027,
-    -0.0396544374525547,
-    0.011115474626421928,
-    -0.03897172212600708,
-    0.05074857547879219,
-    0.01504820492118597,
-    0.016911450773477554,
-    0.032685041427612305,
-    -0.004690118599683046,
-    -0.03874414786696434,
-    0.022316288203001022,
-    -0.008548176847398281,
-    0.03820366412401199,
-    -0.025217832997441292,
-    0.006791604682803154,
-    0.018134651705622673,
-    -0.022572306916117668,
-    -0.006468025501817465,
-    0.013462311588227749,
-    0.016911450773477554,
-    0.025914771482348442,
-    0.023624828085303307,
-    -0.010247855447232723,
-    0.04986673593521118,
-    0.017025237902998924,
-    0.015062428079545498,
-    0.006788048893213272,
-    0.003187787253409624,
-    0.0055008442141115665,
-    -0.04127588868141174,
-    -0.009607809595763683,
-    0.007837014272809029,
-    -0.05282517150044441,
-    0.002677527954801917,
-    -0.012715591117739677,
-    -0.011833748780190945,
-    -0.023937739431858063,
-    0.011264818720519543,
-    -0.015915824100375175,
-    -0.001695234328508377,
-    -0.07913819700479507,
-    -0.020282363519072533,
-    0.0641753301024437,
-    -0.08004848659038544,
-    -0.015432232059538364,
-    -0.0106105487793684,
-    0.04207238927483559,
-    0.0028499849140644073,
-    0.03555813804268837,
-    -0.06036349758505821,
-    -0.05768952518701553,
-    0.012957385741174221,
-    -0.020566828548908234,
-    0.0042314184829592705,
-    0.007065402343869209,
-    0.016840334981679916,
-    -0.005308830179274082,
-    0.022600753232836723,
-    0.006048439536243677,
-    0.006620925385504961,
-    -0.029385246336460114,
-    0.015204660594463348,
-    0.036326196044683456,
-    0.01809198223054409,
-    0.040507830679416656,
-    -0.025559190660715103,
-    -0.05191488191485405,
-    0.05336565524339676,
-    -0.008839753456413746,
-    0.07549703866243362,
-    0.04036559909582138,
-    -0.01769373007118702,
-    0.042299963533878326,
-    0.028546074405312538,
-    0.04534373804926872,
-    -0.0029513256158679724,
-    -0.034420277923345566,
-    0.016043832525610924,
-    0.0181488748639822,
-    -0.00745298620313406,
-    0.01240979041904211,
-    -0.01330585591495037,
-    0.0138890091329813,
-    -0.05171575769782066,
-    -0.024862250313162804,
-    -0.01334141381084919,
-    0.0259716659784317,
-    0.0006364907021634281,
-    -0.03345309942960739,
-    0.01565980538725853,
-    -0.022373180836439133,
-    0.03891482949256897,
-    -0.019926780834794044,
-    0.02534584142267704,
-    -0.01746615767478943,
-    -0.0323721319437027,
-    -0.0213491078466177,
-    -0.01435837708413601,
-    -0.03003951534628868,
-    -0.01325607392936945,
-    -0.07026288658380508,
-    0.013440976850688457,
-    -0.021121535450220108,
-    0.012680032290518284,
-    0.004594111815094948,
-    0.00755254877731204,
-    0.04850130155682564,
-    -0.011442609131336212,
-    0.014920195564627647,
-    -0.015261553227901459,
-    -0.01594427041709423,
-    -0.06002213805913925,
-    0.021676242351531982,
-    0.014806409366428852,
-    -0.029100781306624413,
-    0.034192707389593124,
-    -0.004412765149027109,
-    0.03362377732992172,
-    0.024620456621050835,
-    0.018476009368896484,
-    0.010966130532324314,
-    -0.015261553227901459,
-    0.02506137639284134,
-    -0.027650009840726852,
-    -0.018163098022341728,
-    0.053280316293239594,
-    0.0027468663174659014,
-    0.003623374504968524,
-    0.04321024939417839,
-    -0.0018099092412739992,
-    -0.01831955276429653,
-    0.026170790195465088,
-    -0.0036411534529179335,
-    -0.008341939188539982,
-    0.019571200013160706,
-    -0.026526372879743576,
-    0.0023592824582010508,
-    -0.005099037196487188,
-    -0.05609652027487755,
-    -0.034590959548950195,
-    0.04443345218896866,
-    -0.005490176845341921,
-    0.00800058152526617,
-    -0.037378717213869095,
-    0.026057004928588867,
-    0.022131385281682014,
-    0.026113897562026978,
-    -0.021946484223008156,
-    0.013327190652489662,
-    0.0404793843626976,
-    0.009202446788549423,
-    0.004490992985665798,
-    0.008377498015761375,
-    0.06349261105060577,
-    -0.00714718597009778,
-    0.010190962813794613,
-    -0.006126667372882366,
-    0.0015636691823601723,
-    0.0026348582468926907,
-    0.03222989663481712,
-    -0.04389296844601631,
-    -0.036695998162031174,
-    -0.04042249172925949,
-    0.03962599113583565,
-    0.011727074161171913,
-    0.03177475184202194,
-    0.05291051045060158,
-    0.03672444820404053,
-    0.006816495209932327,
-    0.037606287747621536,
-    0.014457939192652702,
-    -0.01487752515822649,
-    0.034534063190221786,
-    -0.043295592069625854,
-    -0.002890876727178693,
-    -0.05706370249390602,
-    -0.022230949252843857,
-    4.533662649919279e-05,
-    0.0046865628100931644,
-    0.030238641425967216,
-    -0.02129221335053444,
-    0.03348154574632645,
-    0.03663910552859306,
-    -0.04810304939746857,
-    -0.027521999552845955,
-    -0.019869888201355934,
-    -0.019585423171520233,
-    0.03797609359025955,
-    0.008491283282637596,
-    -0.05643787980079651,
-    0.0009618476615287364,
-    0.0001186752924695611,
-    0.0049248021095991135,
-    0.005650188308209181,
-    0.06440290063619614,
-    0.0040251812897622585,
-    -0.053621675819158554,
-    0.012281781062483788,
-    -0.06741823256015778,
-    0.007893906906247139,
-    0.014977088198065758,
-    -0.037094250321388245,
-    0.01275826059281826,
-    0.01693989709019661,
-    0.0043203141540288925,
-    -0.01447216235101223,
-    0.031291164457798004,
-    0.005077702458947897,
-    -0.008925093337893486,
-    -0.049383144825696945,
-    -0.018632465973496437,
-    0.022401627153158188,
-    -0.012864935211837292,
-    -0.008640628308057785,
-    0.033083293586969376,
-    0.014187697321176529,
-    -0.0418732650578022,
-    -0.03800453990697861,
-    -0.00852684210985899,
-    -0.018646689131855965,
-    -0.017252808436751366,
-    -0.014607283286750317,
-    0.014322818256914616,
-    -0.0020019232761114836,
-    0.04158879816532135,
-    0.038886379450559616,
-    0.02262919954955578,
-    0.06593901664018631,
-    0.032855719327926636,
-    0.06019281968474388,
-    0.03968288376927376,
-    0.024464000016450882,
-    -0.026199236512184143,
-    0.03200232610106468,
-    -0.027237534523010254,
-    -0.009003320708870888,
-    0.0029655487742275,
-    -0.07305064052343369,
-    -0.020837070420384407,
-    -0.005497288424521685,
-    -0.011215036734938622,
-    0.04042249172925949,
-    -0.04099142178893089,
-    -0.025488074868917465,
-    -0.007228969596326351,
-    0.0376916266977787,
-    0.0438360758125782,
-    -0.0004951470764353871,
-    -0.011847971938550472,
-    -0.011094139888882637,
-    0.02964126504957676,
-    -0.014891749247908592,
-    0.024720018729567528,
-    0.017480380833148956,
-    0.00979982316493988,
-    0.000752943626139313,
-    0.022714540362358093,
-    -0.021377554163336754,
-    -0.016171840950846672,
-    0.04702208191156387,
-    -0.052114009857177734,
-    0.00884686503559351,
-    -0.0175799448043108,
-    0.03288416564464569,
-    -0.006286678835749626,
-    0.004775458015501499,
-    0.010631883516907692,
-    0.01171996258199215,
-    -0.024378661066293716,
-    -0.024165311828255653,
-    0.01194753497838974,
-    -0.02564452961087227,
-    0.03891482949256897,
-    0.010013172402977943,
-    0.050264984369277954,
-    0.01366143673658371,
-    -0.01844756305217743,
-    -0.02506137639284134,
-    -0.019741879776120186,
-    0.0178644098341465,
-    0.036041729152202606,
-    -0.0287594236433506,
-    0.0174519345164299,
-    -0.0005702636553905904,
-    0.029043888673186302,
-    -0.0005707081290893257,
-    0.027735348790884018,
-    -0.012651585973799229,
-    0.0024944033939391375,
-    -0.034249600023031235,
-    0.011705739423632622,
-    0.03578571230173111,
-    -0.004046516492962837,
-    -0.011023023165762424,
-    -0.0017379040364176035,
-    -0.01978454925119877,
-    0.013732553459703922,
-    -0.004619002342224121,
-    -0.017352372407913208,
-    0.015076651237905025,
-    -0.012665809132158756,
-    -0.020908186212182045,
-    -0.009821157902479172,
-    0.012167994864284992,
-    0.0516304187476635,
-    0.020367702469229698,
-    -0.03149028867483139,
-    0.0025459628086537123,
-    -0.02830427885055542,
-    -0.0034420278389006853,
-    -0.037264931946992874,
-    -0.011471055448055267,
-    0.002867763862013817,
-    0.01769373007118702,
-    0.047818586230278015,
-    0.018831590190529823,
-    0.023880846798419952,
-    0.017096353694796562,
-    0.0184333398938179,
-    -0.02621345967054367,
-    -0.03331086412072182,
-    0.038943275809288025,
-    0.017892856150865555,
-    0.05134595185518265,
-    -0.032741934061050415,
-    0.01058921404182911,
-    -0.012047098018229008,
-    0.013817893341183662,
-    0.026654381304979324,
-    -0.043352484703063965,
-    -0.02627035416662693,
-    0.02564452961087227,
-    -0.014578836970031261,
-    -0.06571143865585327,
-    0.03507454693317413,
-    0.0017094576032832265,
-    0.025018706917762756,
-    -0.001431215088814497,
-    -0.050947703421115875,
-    -0.004487437196075916,
-    0.02261497639119625,
-    -0.03663910552859306,
-    -0.028162047266960144,
-    -9.495134145254269e-05,
-    -0.020965078845620155,
-    0.018134651705622673,
-    -0.0006467136554419994,
-    -0.008064585737884045,
-    0.01249513030052185,
-    -0.014273037202656269,
-    0.001083634328097105,
-    0.0003446917107794434,
-    0.027052631601691246,
-    0.0048074605874717236,
-    -0.0011894197668880224,
-    0.00236995005980134,
-    -0.013760999776422977,
-    -0.018419116735458374,
-    -0.010461204685270786,
-    -0.00552573474124074,
-    0.008612181060016155,
-    0.004409209359437227,
-    0.02540273405611515,
-    0.0027184197679162025,
-    0.02639836259186268,
-    -0.040450938045978546,
-    0.02035347931087017,
-    0.009287785738706589,
-    -0.005635965149849653,
-    -0.026369916275143623,
-    -0.05308119207620621,
-    0.019556976854801178,
-    -0.007580995559692383,
-    -0.0063186814077198505,
-    0.012296004220843315,
-    -0.025943217799067497,
-    -0.022927887737751007,
-    -0.0466238334774971,
-    0.02592899464070797,
-    -0.0027006405871361494,
-    -0.01826266013085842,
-    0.025957440957427025,
-    -0.022714540362358093,
-    -0.03248591721057892,
-    -0.005379946436733007,
-    -0.007310753688216209,
-    -0.03999579697847366,
-    0.03481853008270264,
-    -0.02511826902627945,
-    -0.05114682763814926,
-    0.013718330301344395,
-    -0.014301483519375324,
-    0.011563506908714771,
-    0.023937739431858063,
-    0.03114893101155758,
-    -0.029214566573500633,
-    -0.015176214277744293,
-    0.04101986810564995,
-    -0.016385190188884735,
-    0.014173474162817001,
-    0.05481642857193947,
-    -0.02580098621547222,
-    -0.034590959548950195,
-    -0.04690829664468765,
-    0.012360009364783764,
-    0.023937739431858063,
-    0.017835963517427444,
-    0.038317449390888214,
-    -0.02146289311349392,
-    -0.010333195328712463,
-    0.02481958083808422,
-    0.005721304565668106,
-    -0.04247064143419266,
-    0.03368066996335983,
-    0.012665809132158756,
-    0.0034562512300908566,
-    -0.006805827841162682,
-    -0.0016383412294089794,
-    -0.0022170499432832003,
-    -0.012907604686915874,
-    -0.027166418731212616,
-    -0.016669655218720436,
-    -0.006503583863377571,
-    -0.006620925385504961,
-    0.01240979041904211,
-    -0.03518833592534065,
-    0.007115183863788843,
-    -0.029086558148264885,
-    -0.00402873707935214,
-    -0.012260446324944496,
-    -0.016157617792487144,
-    -0.0012187552638351917,
-    -0.015332669951021671,
-    -0.0072609721682965755,
-    0.07720383256673813,
-    -0.013988572172820568,
-    -0.00643957918509841,
-    0.028105152770876884,
-    -0.005927541758865118,
-    0.0669630914926529,
-    0.04969605430960655,
-    0.049496930092573166,
-    0.01982721872627735,
-    0.05404837056994438,
-    -0.018660912290215492,
-    0.03868725523352623,
-    -0.016598539426922798,
-    0.026227682828903198,
-    0.003299795323982835,
-    -0.019926780834794044,
-    0.03649687394499779,
-    0.003066889476031065,
-    -0.012651585973799229,
-    0.017238585278391838,
-    -0.02076595276594162,
-    0.043295592069625854,
-    0.02348259463906288,
-    0.007324976846575737,
-    6.700486846966669e-05,
-    -0.014792186208069324,
-    0.017352372407913208,
-    0.025843655690550804,
-    0.018063534051179886,
-    -0.012779595330357552,
-    0.0020001453813165426,
-    0.010183851234614849,
-    0.00835616234689951,
-    0.029100781306624413,
-    -0.03174630552530289,
-    0.022003376856446266,
-    -0.019471637904644012,
-    -0.018945377320051193,
-    -0.014116581529378891,
-    -0.06838541477918625,
-    -0.026199236512184143,
-    0.012744037434458733,
-    -0.015674028545618057,
-    0.018888482823967934,
-    0.010781227611005306,
-    -0.017537273466587067,
-    -0.030238641425967216,
-    0.0031611185986548662,
-    0.0049674720503389835,
-    0.03527367487549782,
-    0.03222989663481712,
-    -0.009373125620186329,
-    0.02715219557285309,
-    0.023468371480703354,
-    -0.012715591117739677,
-    -0.01977032609283924,
-    -0.02139177732169628,
-    -0.01821999065577984,
-    0.024919144809246063,
-    -0.01055365614593029,
-    0.016740772873163223,
-    0.00459766760468483,
-    0.00916688796132803,
-    -0.025089822709560394,
-    0.010134070180356503,
-    0.028218939900398254,
-    0.024606231600046158,
-    -0.002810870995745063,
-    0.046424705535173416,
-    -0.03245747089385986,
-    0.004067851230502129,
-    -0.02632724680006504,
-    -0.0009280674275942147,
-    -0.02157667838037014,
-    -0.033908240497112274,
-    0.03174630552530289,
-    -0.02389506995677948,
-    0.021420223638415337,
-    -0.0029406582470983267,
-    -0.0011938645038753748,
-    0.02639836259186268,
-    0.012786706909537315,
-    0.010283414274454117,
-    0.002090818714350462,
-    0.012082655914127827,
-    -0.023809731006622314,
-    0.01078833919018507,
-    0.014450827613472939,
-    -0.0025904104113578796,
-    -0.014038353227078915,
-    -0.018163098022341728,
-    0.0001922361843753606,
-    -0.015432232059538364,
-    -0.005401281174272299,
-    -0.0017476825742051005,
-    0.023041674867272377,
-    0.015289999544620514,
-    0.005383502226322889,
-    0.013348525390028954,
-    -0.046026457101106644,
-    0.0213491078466177,
-    -0.03166096657514572,
-    -0.03120582364499569,
-    -0.024222204461693764,
-    -0.032286789268255234,
-    0.009280674159526825,
-    0.022344734519720078,
-    -0.024606231600046158,
-    0.005881316494196653,
-    -0.0010062953224405646,
-    -0.01279381848871708,
-    -0.053678568452596664,
-    0.0026401919312775135,
-    -0.014109469950199127,
-    -0.015631357207894325,
-    -0.005554181523621082,
-    0.010418535210192204,
-    -0.0008529508486390114,
-    -0.046652279794216156,
-    -0.03663910552859306,
-    -0.007943687960505486,
-    0.027351321652531624,
-    -0.040450938045978546,
-    0.003422470996156335,
-    -0.02986883744597435,
-    0.022814102470874786,
-    0.002147711580619216,
-    0.013334302231669426,
-    -0.010425646789371967,
-    0.00032135669607669115,
-    0.029129227623343468,
-    -0.009586474858224392,
-    -0.06713376939296722,
-    -0.0030544442124664783,
-    -0.011783967725932598,
-    -0.006606702227145433,
-    -0.0002777979534585029,
-    0.005653744097799063,
-    -0.00870463252067566,
-    0.0024375105276703835,
-    0.004675895441323519,
-    -0.040450938045978546,
-    0.010247855447232723,
-    0.014201920479536057,
-    -0.0011138587724417448,
-    -0.005106148775666952,
-    0.022899441421031952,
-    0.008192595094442368,
-    0.030494660139083862,
-    -0.010311860591173172,
-    -0.005618186201900244,
-    -0.02272876352071762,
-    0.0026935290079563856,
-    -0.01780751533806324,
-    0.007808567490428686,
-    0.03530212119221687,
-    -0.04360850155353546,
-    0.010333195328712463,
-    -0.006638704799115658,
-    -0.0031451175455003977,
-    0.02870253100991249,
-    0.006002213805913925,
-    0.0005640409654006362,
-    0.004579888191074133,
-    0.006528474390506744,
-    0.01325607392936945,
-    -0.015759367495775223,
-    -0.01482063252478838,
-    0.0012445348547771573,
-    -0.015261553227901459,
-    -0.008619292639195919,
-    -0.0048892442137002945,
-    0.018874259665608406,
-    -0.010617660358548164,
-    -0.0006796049419790506,
-    0.017210138961672783,
-    -0.021121535450220108,
-    -0.025502298027276993,
-    0.008192595094442368,
-    0.012054209597408772,
-    -0.0010125180706381798,
-    -0.005067035090178251,
-    0.0018010197672992945,
-    -0.05248381197452545,
-    0.017850186675786972,
-    -0.04087763652205467,
-    -0.009351790882647038,
-    0.01647053100168705,
-    -0.03806143254041672,
-    0.03723648190498352,
-    -0.021477116271853447,
-    -0.02969815768301487,
-    -0.03174630552530289,
-    -0.017238585278391838,
-    -0.007303641643375158,
-    -0.011293265037238598,
-    0.024264873936772346,
-    0.0034118033945560455,
-    0.023639051243662834,
-    -0.02435021474957466,
-    -0.012345786206424236,
-    0.04651004821062088,
-    -0.022927887737751007,
-    0.03510299697518349,
-    -0.0171674694865942,
-    -0.01601538620889187,
-    -0.02981194481253624,
-    -0.012381344102323055,
-    -0.028745200484991074,
-    -0.028332725167274475,
-    -0.002633080119267106,
-    0.03533056750893593,
-    0.007566771935671568,
-    -0.026170790195465088,
-    -0.005692858248949051,
-    0.02198915369808674,
-    -0.015119320712983608,
-    0.01014829333871603,
-    -0.01971343159675598,
-    -0.013533428311347961,
-    0.002478402340784669,
-    -0.019528530538082123,
-    0.025416957214474678,
-    -0.009408683516085148,
-    0.026426808908581734,
-    -0.02483380399644375,
-    0.006279567256569862,
-    0.010368753224611282,
-    -0.017963971942663193,
-    -0.010631883516907692,
-    -0.014721069484949112,
-    -0.004220751114189625,
-    0.01837644726037979,
-    -0.0031611185986548662,
-    0.010752781294286251,
-    -0.03612706810235977,
-    -0.0159015990793705,
-    0.03387979418039322,
-    -0.012623139657080173,
-    0.0035664814058691263,
-    0.014486386440694332,
-    0.005635965149849653,
-    0.010802562348544598,
-    -0.027521999552845955,
-    0.03919929265975952,
-    0.007445874623954296,
-    -0.05515778437256813,
-    0.00870463252067566,
-    0.036923572421073914,
-    0.034192707389593124,
-    0.01226755790412426,
-    -0.016442082822322845,
-    -0.009081549011170864,
-    0.02964126504957676,
-    0.04779013991355896,
-    -0.0027290871366858482,
-    -0.0016170063754543662,
-    -0.01622873544692993,
-    0.02338303253054619,
-    0.041958604007959366,
-    0.026185013353824615,
-    0.0023183906450867653,
-    0.026782389730215073,
-    0.011513725854456425,
-    -0.03387979418039322,
-    -0.0035700371954590082,
-    0.00012567579688038677,
-    -0.02860296703875065,
-    0.008690409362316132,
-    0.017437711358070374,
-    0.020794399082660675,
-    0.0052199349738657475,
-    0.005031476728618145,
-    0.02523205615580082,
-    0.004327425733208656,
-    -0.0371226966381073,
-    -0.023880846798419952,
-    0.03160407394170761,
-    0.03217300400137901,
-    0.005020809359848499,
-    0.03356688469648361,
-    -0.008605069480836391,
-    0.00392917450517416,
-    -0.012310228310525417,
-    0.01984144188463688,
-    0.033083293586969376,
-    -0.021932261064648628,
-    0.04847285524010658,
-    -0.005671523045748472,
-    0.009650479070842266,
-    0.01168440468609333,
-    -0.01844756305217743,
-    0.012431125156581402,
-    -0.006923169828951359,
-    -0.00244995579123497,
-    -0.027066856622695923,
-    0.0034846977796405554,
-    -0.030722232535481453,
-    -0.04286889359354973,
-    0.015730921179056168,
-    0.057092148810625076,
-    -0.02627035416662693,
-    0.004981695208698511,
-    -0.015873152762651443,
-    0.01861824095249176,
-    -0.049496930092573166,
-    -0.025146715342998505,
-    0.02018279954791069,
-    -0.004928357899188995,
-    0.024691572412848473,
-    0.033908240497112274,
-    -0.0026224127504974604,
-    0.030750678852200508,
-    0.03356688469648361,
-    -0.014301483519375324,
-    0.017594167962670326,
-    0.10877946019172668,
-    0.018632465973496437,
-    0.005084814038127661,
-    -0.01681188866496086,
-    -0.02585787884891033,
-    0.027877582237124443,
-    0.03393668681383133,
-    -0.01886003650724888,
-    0.004789681173861027,
-    0.039113953709602356,
-    0.008370386436581612,
-    -0.025729870423674583,
-    -0.001916583743877709,
-    0.018874259665608406,
-    0.022074492648243904,
-    -0.02355371229350567,
-    0.008043251000344753,
-    0.031348057091236115,
-    0.008327716030180454,
-    0.0029246569611132145,
-    -0.015247330069541931,
-    0.01441526971757412,
-    -0.016285628080368042,
-    -0.04093452915549278,
-    0.030779125168919563,
-    -0.006940948776900768,
-    -0.009764265269041061,
-    -0.024606231600046158,
-    -0.03948375955224037,
-    0.006372018717229366,
-    -0.012303115800023079,
-    0.03277038037776947,
-    -0.010098511353135109,
-    -0.005006586201488972,
-    -0.008277934975922108,
-    0.020680613815784454,
-    -0.012772483751177788,
-    -0.023055898025631905,
-    0.04360850155353546,
-    -0.05035032704472542,
-    0.04315335676074028,
-    -0.0019023604691028595,
-    -0.0009111773106269538,
-    0.061387572437524796,
-    -0.009380237199366093,
-    0.014493498019874096,
-    0.006229786202311516,
-    0.044461898505687714,
-    0.01837644726037979,
-    -0.005248381290584803,
-    0.019500084221363068,
-    0.00777300912886858,
-    0.005486621055752039,
-    -0.0018988046795129776,
-    0.01476373989135027,
-    -0.019727656617760658,
-    -0.021946484223008156,
-    -0.011670181527733803,
-    0.001838355790823698,
-    -0.011613287962973118,
-    -0.00844150222837925,
-    -0.004206527955830097,
-    0.00219749310053885,
-    -0.013590320944786072,
-    -0.009323344565927982,
-    -0.007694781292229891,
-    0.007972135208547115,
-    0.02494759112596512,
-    0.016626985743641853,
-    0.01762261427938938,
-    -0.03171785920858383,
-    -0.016385190188884735,
-    -0.03200232610106468,
-    0.014145027846097946,
-    0.007068958133459091,
-    -0.0043558720499277115,
-    0.0008640628075227141,
-    0.026085451245307922,
-    0.006652927957475185,
-    -0.024094196036458015,
-    0.015617134980857372,
-    0.01607227884232998,
-    -0.04204394295811653,
-    0.02378128282725811,
-    0.013640101999044418,
-    -0.011883529834449291,
-    -0.0209366325289011,
-    0.00015923379396554083,
-    0.025658752769231796,
-    0.0038189440965652466,
-    0.03578571230173111,
-    -0.010767004452645779,
-    -0.0020979302935302258,
-    -0.02661171182990074,
-    0.00489991158246994,
-    -0.03840279206633568,
-    -0.02383817732334137,
-    -0.010432758368551731,
-    0.03242902457714081,
-    0.013014279305934906,
-    0.003961176611483097,
-    0.0003042443422600627,
-    -0.013064060360193253,
-    -0.04210083559155464,
-    0.005436839535832405,
-    -0.02129221335053444,
-    -0.03919929265975952,
-    0.006496472284197807,
-    -0.015176214277744293,
-    -0.009102883748710155,
-    0.03800453990697861,
-    -0.007616553455591202,
-    0.004796793218702078,
-    -0.0026259685400873423,
-    -0.02824738621711731,
-    0.002673972165212035,
-    0.04761946201324463,
-    0.02662593498826027,
-    -0.00018023532174993306,
-    0.03220145031809807,
-    0.043807629495859146,
-    0.022543860599398613,
-    -0.004053628072142601,
-    -0.0008467282168567181,
-    -0.0421292819082737,
-    -0.03171785920858383,
-    -0.0015334447380155325,
-    -0.023041674867272377,
-    0.0027113081887364388,
-    -0.008206818252801895,
-    0.0249902606010437,
-    0.000854284327942878,
-    -0.0012889825738966465,
-    -0.001555668655782938,
-    0.009323344565927982,
-    0.023752836510539055,
-    -0.02208871580660343,
-    0.015688251703977585,
-    0.0028286499436944723,
-    -0.007694781292229891,
-    -0.025075599551200867,
-    0.000900065409950912,
-    -0.016541646793484688,
-    -0.02732287347316742,
-    0.002654415089637041,
-    -0.004892800003290176,
-    0.034704744815826416,
-    0.01362587884068489,
-    -0.0002302389475516975,
-    0.010567879304289818,
-    0.007758785970509052,
-    0.0021850476041436195,
-    -0.05046411231160164,
-    -0.01895960047841072,
-    -0.019059162586927414,
-    -0.013135177083313465,
-    -0.020837070420384407,
-    -0.023127013817429543,
-    0.02186114341020584,
-    0.01861824095249176,
-    -0.0625254288315773,
-    0.001863246550783515,
-    0.012018650770187378,
-    0.012232000008225441,
-    0.0022792767267674208,
-    -0.027934474870562553,
-    0.1239130049943924,
-    -0.011634623631834984,
-    -0.019585423171520233,
-    0.007908130064606667,
-    0.03240057826042175,
-    -0.0052981628105044365,
-    0.008420167490839958,
-    -0.02395196259021759,
-    0.011563506908714771,
-    0.011734185740351677,
-    -0.010318972170352936,
-    0.026170790195465088,
-    -0.026953069493174553,
-    0.0046403370797634125,
-    -0.024904921650886536,
-    -0.011798190884292126,
-    -0.007822791114449501,
-    -0.023468371480703354,
-    0.013561874628067017,
-    -0.0031326720491051674,
-    0.03114893101155758,
-    -0.008142814040184021,
-    -0.0014241035096347332,
-    -0.006421799771487713,
-    0.023767059668898582,
-    -0.01029052585363388,
-    -0.010162516497075558,
-    -0.04238530248403549,
-    -0.011442609131336212,
-    0.05549914389848709,
-    0.010283414274454117,
-    0.0240088552236557,
-    -0.04830217733979225,
-    0.012438236735761166,
-    0.027906028553843498,
-    -0.03021019510924816,
-    -0.014777963049709797,
-    -0.0059915464371442795,
-    -0.008533953689038754,
-    0.007324976846575737,
-    -0.011151032522320747,
-    -0.02516094036400318,
-    0.0011654180707409978,
-    -0.015247330069541931,
-    0.0012080877786502242,
-    0.0103260837495327,
-    -0.034249600023031235,
-    -0.02139177732169628,
-    0.006898278836160898,
-    0.03635464236140251,
-    0.0438360758125782,
-    0.0009689592989161611,
-    0.0309782512485981,
-    -0.00985671579837799,
-    -0.0007698337431065738,
-    -0.0480177104473114,
-    0.018163098022341728,
-    -0.0028464291244745255,
-    0.023297693580389023,
-    0.0059097628109157085,
-    -0.0050492556765675545,
-    -0.00015001090650912374,
-    0.002377061638981104,
-    0.0015930046793073416,
-    0.009906497783958912,
-    -0.019500084221363068,
-    -0.0032269011717289686,
-    0.02070906013250351,
-    -0.012971608899533749,
-    -0.004373650997877121,
-    0.01954275369644165,
-    -0.009472688660025597,
-    0.007282306905835867,
-    -0.018532902002334595,
-    0.013953014276921749,
-    -0.018163098022341728,
-    0.013554763048887253,
-    0.012160883285105228,
-    0.005827979184687138,
-    -0.05928253009915352,
-    0.020040567964315414,
-    0.02494759112596512,
-    0.00933756772428751,
-    -0.0027184197679162025,
-    -0.02662593498826027,
-    -0.029897283762693405,
-    -0.007524102460592985,
-    -0.020908186212182045,
-    -0.0034064697101712227,
-    -0.010432758368551731,
-    0.010105622932314873,
-    0.02110731229186058,
-    0.004018069710582495,
-    0.026355693116784096,
-    -0.0032340127509087324,
-    0.018476009368896484,
-    0.016257181763648987,
-    -0.004814572166651487,
-    0.021548232063651085,
-    -0.01833377592265606,
-    -0.006969395559281111,
-    -0.03444872424006462,
-    -0.02435021474957466,
-    0.043409377336502075,
-    -0.03444872424006462,
-    0.0037727185990661383,
-    -0.013640101999044418,
-    -0.0073889815248548985,
-    0.020609498023986816,
-    0.0240088552236557,
-    -0.007115183863788843,
-    -0.03652532026171684,
-    0.04101986810564995,
-    -0.024549338966608047,
-    -0.009238004684448242,
-    -0.02076595276594162,
-    0.036695998162031174,
-    -0.008455725386738777,
-    0.012160883285105228,
-    -0.03171785920858383,
-    -0.018077757209539413,
-    -0.0019805883057415485,
-    0.024520892649888992,
-    -0.03316863253712654,
-    0.010219409130513668,
-    -0.01275826059281826,
-    0.028617190197110176,
-    0.061103105545043945,
-    -0.02308434434235096,
-    0.026981515809893608,
-    -0.006482248660176992,
-    -0.0040714070200920105,
-    -0.004281200002878904,
-    0.00019156947382725775,
-    0.01322051603347063,
-    -0.012608916498720646,
-    -0.001173418597318232,
-    -0.022415850311517715,
-    0.02464890293776989,
-    -0.0010951906442642212,
-    0.0010329639771953225,
-    0.012260446324944496,
-    0.006770269945263863,
-    0.03177475184202194,
-    -0.017437711358070374,
-    0.008085920475423336,
-    -0.00716496491804719,
-    0.0067631579004228115,
-    -0.013846339657902718,
-    0.0039896233938634396,
-    -0.033140186220407486,
-    0.01699679158627987,
-    -0.01078833919018507,
-    0.013476534746587276,
-    0.012800930067896843,
-    0.032685041427612305,
-    -0.02975505031645298,
-    0.005689302459359169,
-    0.02129221335053444,
-    0.039882007986307144,
-    0.01873202808201313,
-    0.0041958605870604515,
-    -0.020851293578743935,
-    0.0018828035099431872,
-    -0.005035032518208027,
-    0.003298017429187894,
-    0.03971133008599281,
-    0.002368172165006399,
-    -0.002249052282422781,
-    0.006368462927639484,
-    -0.013348525390028954,
-    -0.013376971706748009,
-    0.00046981193008832633,
-    0.009728707373142242,
-    -0.00038247223710641265,
-    0.014322818256914616,
-    -0.017793292179703712,
-    0.025601860135793686,
-    -0.01961386948823929,
-    -0.023283470422029495,
-    -0.009415795095264912,
-    -0.0038722814060747623,
-    -0.027237534523010254,
-    0.016726549714803696,
-    0.01400990691035986,
-    0.015759367495775223,
-    -0.00718985591083765,
-    -0.01618606597185135,
-    -0.026995738968253136,
-    -0.01577359065413475,
-    -0.0026650824584066868,
-    -0.004483881406486034,
-    0.012317339889705181,
-    0.023852400481700897,
-    -0.01622873544692993,
-    -0.003468696493655443,
-    0.004046516492962837,
-    -0.0379476472735405,
-    0.018547125160694122,
-    -0.01548912562429905,
-    -0.0421292819082737,
-    -0.01831955276429653,
-    0.005326609127223492,
-    -0.005269716493785381,
-    0.000373582704924047,
-    -0.019386297091841698,
-    0.004665228072553873,
-    -0.01820576749742031,
-    -0.007438762579113245,
-    0.008505507372319698,
-    0.023923516273498535,
-    -0.0006129334215074778,
-    0.008612181060016155,
-    0.023283470422029495,
-    0.02058105170726776,
-    0.02255808375775814,
-    0.03427804633975029,
-    0.04531529173254967,
-    -0.02348259463906288,
-    0.002755755791440606,
-    -0.0019361407030373812,
-    0.01078833919018507,
-    0.004270532634109259,
-    0.0065569207072257996,
-    0.018689358606934547,
-    0.005714192986488342,
-    -0.006816495209932327,
-    -0.03225834295153618,
-    0.0055506257340312,
-    -0.018191544339060783,
-    0.006382686085999012,
-    0.038772594183683395,
-    0.0014516609953716397,
-    -0.004907023161649704,
-    -0.002681083744391799,
-    0.004114076960831881,
-    -0.03550124540925026,
-    -0.005369279067963362,
-    -0.026355693116784096,
-    -0.012260446324944496,
-    -0.026953069493174553,
-    -0.016612762585282326,
-    -0.04101986810564995,
-    -0.023240799084305763,
-    -0.04722120985388756,
-    0.011471055448055267,
-    0.0015103319892659783,
-    0.007289418485015631,
-    0.006418243981897831,
-    0.0272090882062912,
-    -0.012914716266095638,
-    0.00803613942116499,
-    -0.004903467372059822,
-    -0.005276828072965145,
-    -0.013312967494130135,
-    -0.047989264130592346,
-    -0.043068017810583115,
-    -0.011691516265273094,
-    -0.024904921650886536,
-    0.019400520250201225,
-    -0.009636255912482738,
-    -0.012075544334948063,
-    0.02238740399479866,
-    -0.016086502000689507,
-    -0.012224888429045677,
-    -0.005554181523621082,
-    -0.012239111587405205,
-    -0.015389562584459782,
-    -0.016626985743641853,
-    -0.006094665266573429,
-    -0.03777696564793587,
-    0.03214455768465996,
-    -0.046424705535173416,
-    0.0323721319437027,
-    -0.025246279314160347,
-    0.019500084221363068,
-    0.030579999089241028,
-    0.0053052743896842,
-    0.008477060124278069,
-    -0.026128120720386505,
-    -0.007303641643375158,
-    0.025616083294153214,
-    -0.00718985591083765,
-    -0.014479273930191994,
-    0.014280148781836033,
-    -0.002958437195047736,
-    0.012075544334948063,
-    0.04946848377585411,
-    -0.013576097786426544,
-    -0.028261609375476837,
-    -0.016840334981679916,
-    0.031916987150907516,
-    0.008142814040184021,
-    0.011271930299699306,
-    -0.004067851230502129,
-    0.029442138969898224,
-    0.009117106907069683,
-    -0.02233051136136055,
-    -0.005042144097387791,
-    -0.0038438348565250635,
-    0.03533056750893593,
-    -0.01920139603316784,
-    0.006624481175094843,
-    0.0056252977810800076,
-    -0.000512037193402648,
-    0.017124800011515617,
-    -0.004732788540422916,
-    0.04844440892338753,
-    0.03026708774268627,
-    0.027920251712203026,
-    -0.00459766760468483,
-    -0.0023308361414819956,
-    -0.012950274161994457,
-    0.0017210139194503427,
-    -0.017963971942663193,
-    -0.00028468735399656,
-    0.01948586106300354,
-    0.03345309942960739,
-    0.03387979418039322,
-    0.017779069021344185,
-    -0.017594167962670326,
-    0.00019279179105069488,
-    0.01705368421971798,
-    -0.007396093104034662,
-    0.024904921650886536,
-    0.002254385966807604,
-    0.000898287515155971,
-    0.0073747579008340836,
-    0.01925828866660595,
-    0.005692858248949051,
-    0.00023801729548722506,
-    0.010141181759536266,
-    -0.008683297783136368,
-    0.01026919111609459,
-    -0.004298978950828314,
-    0.018461786210536957,
-    -0.025957440957427025,
-    -0.0014001016970723867,
-    0.008213929831981659,
-    -0.03717958927154541,
-    0.01176974456757307,
-    -0.01769373007118702,
-    -0.0031468954402953386,
-    -0.017963971942663193,
-    0.016840334981679916,
-    0.01977032609283924,
-    -0.018461786210536957,
-    -0.009188223630189896,
-    0.02517516352236271,
-    0.03925618529319763,
-    -0.014507721178233624,
-    -0.020680613815784454,
-    0.005603962577879429,
-    -0.02523205615580082,
-    0.013739665038883686,
-    -0.013853451237082481,
-    0.04070695862174034,
-    -0.026128120720386505,
-    -0.023695943877100945,
-    -0.007573883514851332,
-    0.0077943443320691586,
-    -0.010070065036416054,
-    0.02935680001974106,
-    -0.0004898133920505643,
-    -0.023909293115139008,
-    0.03555813804268837,
-    -0.005916874390095472,
-    -0.011847971938550472,
-    -0.012352897785604,
-    0.016342520713806152,
-    -0.0027450884226709604,
-    0.014265925623476505,
-    -0.024890698492527008,
-    -0.016982566565275192,
-    0.02609967440366745,
-    0.006041327957063913,
-    0.01078833919018507,
-    0.010489651001989841,
-    -0.002396618714556098,
-    0.038601916283369064,
-    0.01612917147576809,
-    -0.025431182235479355,
-    0.00040025130147114396,
-    0.008071697317063808,
-    0.007780120708048344,
-    -0.008491283282637596,
-    -0.03399358317255974,
-    0.022572306916117668,
-    0.0014347708784043789
-  ],
-  "Food & Beverage": [
-    -0.057778313755989075,
-    0.02216210961341858,
-    0.014114417135715485,
-    -0.032906126230955124,
-    0.01617792807519436,
-    -0.02236846089363098,
-    -0.007229167502373457,
-    0.038078662008047104,
-    0.0021959198638796806,
-    -0.011039785109460354,
-    0.03882152587175369,
-    0.0003239282814320177,
-    -0.05621004477143288,
-    -0.05543966963887215,
-    0.004580995067954063,
-    0.041407790035009384,
-    0.007882612757384777,
-    0.012917580083012581,
-    0.0011547064641490579,
-    0.0326860174536705,
-    0.0204012468457222,
-    0.003528604283928871,
-    -0.02129543572664261,
-    -0.022712379693984985,
-    0.01109481230378151,
-    0.0025535952299833298,
-    -0.04911156743764877,
-    -0.0023420851211994886,
-    -0.010867825709283352,
-    -0.0360976904630661,
-    0.017526088282465935,
-    -0.03851887583732605,
-    0.03326380252838135,
-    -0.03750087693333626,
-    0.014011241495609283,
-    0.013371552340686321,
-    0.015875279903411865,
-    0.033704016357660294,
-    0.02825634740293026,
-    -0.005231000948697329,
-    -0.05219307541847229,
-    0.025449972599744797,
-    0.02817380614578724,
-    -0.020208653062582016,
-    0.037280768156051636,
-    0.02668807841837406,
-    -0.04905654117465019,
-    0.022533543407917023,
-    0.02738967165350914,
-    -0.001845122897066176,
-    -0.009148232638835907,
-    -0.046497784554958344,
-    0.0032913004979491234,
-    -0.04611259698867798,
-    0.03197066858410835,
-    0.05211053788661957,
-    0.0072429245337843895,
-    0.006114871706813574,
-    0.05909896269440651,
-    0.001253583119250834,
-    -0.006727046798914671,
-    -0.008398490957915783,
-    0.03692309558391571,
-    -0.02229967713356018,
-    -0.013062026351690292,
-    0.013963093049824238,
-    -0.0328235849738121,
-    0.02213459648191929,
-    0.015600144863128662,
-    0.011658838018774986,
-    -0.00045139307621866465,
-    -0.008900611661374569,
-    -0.029659533873200417,
-    -0.021102841943502426,
-    -0.0012346674920991063,
-    -0.020882733166217804,
-    0.006923079956322908,
-    -0.07555202394723892,
-    -0.02653675340116024,
-    -0.03513471782207489,
-    -0.031035209074616432,
-    0.028586508706212044,
-    -0.036345310509204865,
-    0.026220349594950676,
-    0.031337857246398926,
-    -0.05211053788661957,
-    -0.03783103823661804,
-    0.0413527637720108,
-    -0.039839524775743484,
-    -0.0032878611236810684,
-    0.008776800706982613,
-    -0.02644045650959015,
-    -0.006355614401400089,
-    -0.0032827025279402733,
-    0.01462341658771038,
-    0.0240192711353302,
-    0.02578013390302658,
-    -0.026866916567087173,
-    -0.026137808337807655,
-    0.03249342367053032,
-    -0.026811888441443443,
-    -0.05821853131055832,
-    -0.022093327715992928,
-    -0.001989568816497922,
-    0.03356644883751869,
-    -0.007139748893678188,
-    -0.012993242591619492,
-    -0.01247048657387495,
-    -0.025092296302318573,
-    -0.045754920691251755,
-    -0.007690018508583307,
-    -0.026344159618020058,
-    -0.038106173276901245,
-    0.011239257641136646,
-    0.015022361651062965,
-    -0.013034512288868427,
-    0.04718562215566635,
-    -0.03430931270122528,
-    0.020937761291861534,
-    -0.013062026351690292,
-    0.0005898202653042972,
-    0.026811888441443443,
-    -0.018131384626030922,
-    -0.08908865600824356,
-    -0.0530184805393219,
-    0.025051025673747063,
-    -0.026247862726449966,
-    0.004350569564849138,
-    0.021749408915638924,
-    -0.05986933782696724,
-    0.07665256410837173,
-    -0.0704895406961441,
-    0.0008873098413459957,
-    -0.008666747249662876,
-    -0.01458214595913887,
-    0.009182624518871307,
-    0.006771755870431662,
-    0.02752723917365074,
-    -0.03769347071647644,
-    -0.01715465635061264,
-    0.002517483662813902,
-    -0.006940275896340609,
-    0.0547243170440197,
-    -0.005203487351536751,
-    0.007332343142479658,
-    -0.06641754508018494,
-    -0.03535482659935951,
-    -0.04982691630721092,
-    0.04209562763571739,
-    0.01792503334581852,
-    -0.037225741893053055,
-    0.013818646781146526,
-    -0.05634761229157448,
-    -0.021763164550065994,
-    0.00746991066262126,
-    -0.036455366760492325,
-    0.023317676037549973,
-    0.0015287179267033935,
-    -0.005354811437427998,
-    -0.018379006534814835,
-    -0.01419695746153593,
-    -0.017787465825676918,
-    -0.019328221678733826,
-    0.026798132807016373,
-    0.004003211855888367,
-    -0.03799612075090408,
-    -0.04459935426712036,
-    0.03711568936705589,
-    -0.08364098519086838,
-    -0.002520922804251313,
-    0.002003325382247567,
-    0.03161299228668213,
-    0.0007849940448068082,
-    -0.011369946412742138,
-    -0.021942002698779106,
-    0.013034512288868427,
-    0.028779102489352226,
-    -0.004250833299010992,
-    0.0041992454789578915,
-    -0.02048378810286522,
-    0.0017092751804739237,
-    0.03238337114453316,
-    -0.039949577301740646,
-    -0.026041511446237564,
-    0.015889035537838936,
-    0.022671109065413475,
-    -1.0384727829659823e-05,
-    -0.04005962982773781,
-    -0.005323858931660652,
-    0.01637052185833454,
-    -0.015751469880342484,
-    -0.0024418216198682785,
-    0.024514513090252876,
-    -0.044076599180698395,
-    -0.015380037017166615,
-    0.000486214819829911,
-    -0.008006423711776733,
-    -0.031035209074616432,
-    0.04957929626107216,
-    0.05161529406905174,
-    -0.013123931363224983,
-    -0.022038299590349197,
-    0.026000240817666054,
-    -0.06603235751390457,
-    -0.020841462537646294,
-    -0.0427834652364254,
-    -0.0022836190182715654,
-    0.03601514920592308,
-    0.011314920149743557,
-    0.01799381710588932,
-    0.03447439521551132,
-    0.0231663528829813,
-    0.01807635836303234,
-    0.010138718411326408,
-    -0.04710308462381363,
-    0.004051360301673412,
-    -0.04118768498301506,
-    0.004777028691023588,
-    -0.008412247523665428,
-    0.03675801306962967,
-    0.003258628072217107,
-    -0.006544769741594791,
-    0.06729798018932343,
-    0.04677291959524155,
-    0.023386459797620773,
-    0.0034598205238580704,
-    -0.03673049807548523,
-    -0.034694500267505646,
-    -0.03155796602368355,
-    -0.045122113078832626,
-    -0.005977304186671972,
-    -0.01715465635061264,
-    -0.02921931818127632,
-    0.0008559272391721606,
-    -0.0378035269677639,
-    0.03879401087760925,
-    -0.05549469590187073,
-    0.013529755175113678,
-    0.011954608373343945,
-    -0.012718107551336288,
-    -0.02052505873143673,
-    0.06251063197851181,
-    0.0035010906867682934,
-    0.003280982840806246,
-    -0.013474727980792522,
-    0.006479425355792046,
-    0.0001594922214280814,
-    -0.015627657994627953,
-    0.016618143767118454,
-    -0.022932488471269608,
-    0.03673049807548523,
-    -0.003284421982243657,
-    -0.001658547087572515,
-    -0.03485958278179169,
-    0.05733809992671013,
-    -0.04113265872001648,
-    0.021034058183431625,
-    -0.022863704711198807,
-    0.04564486816525459,
-    -0.0011762013891711831,
-    -0.023400217294692993,
-    0.031117748469114304,
-    -0.0029834932647645473,
-    0.0017505453433841467,
-    0.005289467051625252,
-    0.002357561606913805,
-    0.0326860174536705,
-    0.005231000948697329,
-    -0.006661701947450638,
-    0.04801102727651596,
-    -0.04735070466995239,
-    -0.0111911091953516,
-    0.004756393376737833,
-    0.02660553716123104,
-    -0.022451002150774002,
-    -0.0223822183907032,
-    -0.006132067646831274,
-    -0.02740342915058136,
-    -0.018241439014673233,
-    -0.021570570766925812,
-    -0.06674771010875702,
-    -0.027843644842505455,
-    0.02495472878217697,
-    -0.0730758085846901,
-    -0.006496621295809746,
-    0.009609083645045757,
-    0.009574691765010357,
-    -0.014884794130921364,
-    -0.0003106014337390661,
-    0.04652529954910278,
-    -0.01634300872683525,
-    -0.01619168557226658,
-    0.03540985286235809,
-    -0.03703314810991287,
-    0.0446268692612648,
-    0.021983273327350616,
-    0.041490331292152405,
-    -0.027623536065220833,
-    0.04905654117465019,
-    0.0032001619692891836,
-    -0.0031416958663612604,
-    0.03521725907921791,
-    -0.013495363295078278,
-    0.025119809433817863,
-    0.008811192587018013,
-    -0.026110295206308365,
-    -0.005004014819860458,
-    0.052688319236040115,
-    -0.006589479278773069,
-    0.009794799610972404,
-    -0.03331882879137993,
-    -0.011995879001915455,
-    0.03857390210032463,
-    -0.033016178756952286,
-    -0.013337160460650921,
-    0.011246136389672756,
-    0.05290842801332474,
-    0.013062026351690292,
-    0.005072798579931259,
-    -0.02825634740293026,
-    0.029329372569918633,
-    -0.03959190100431442,
-    0.045809950679540634,
-    -0.027087023481726646,
-    0.07929385453462601,
-    -0.06922392547130585,
-    -0.01412817370146513,
-    0.018241439014673233,
-    -0.009382097981870174,
-    -0.008921246975660324,
-    -0.039977092295885086,
-    0.014114417135715485,
-    -0.020992787554860115,
-    -0.010805920697748661,
-    -0.03761092945933342,
-    0.01069586630910635,
-    0.04547978565096855,
-    0.018585357815027237,
-    0.02908175066113472,
-    0.014458335004746914,
-    0.012291648425161839,
-    -0.04990945756435394,
-    -0.01791127771139145,
-    0.010819677263498306,
-    0.01550384797155857,
-    0.011796405538916588,
-    0.01638427935540676,
-    0.04707556962966919,
-    0.00750430254265666,
-    0.048396214842796326,
-    -0.03865644335746765,
-    0.02990715578198433,
-    0.030539965257048607,
-    0.02663305215537548,
-    -0.06372122466564178,
-    -0.03353893756866455,
-    0.040554873645305634,
-    0.01493982132524252,
-    -0.039646927267313004,
-    0.021845705807209015,
-    -0.05310102179646492,
-    -0.007937639951705933,
-    0.01723719760775566,
-    0.03450190648436546,
-    0.014705956913530827,
-    0.0028648413717746735,
-    -0.010166231542825699,
-    0.0019551769364625216,
-    -0.01957584358751774,
-    0.020992787554860115,
-    0.018640384078025818,
-    0.024638323113322258,
-    0.009739773347973824,
-    -0.005392642691731453,
-    -0.05538463965058327,
-    -0.0047013661824166775,
-    0.004876764956861734,
-    0.033676501363515854,
-    -0.02128167822957039,
-    0.007586842868477106,
-    -0.006345297209918499,
-    -0.03574001416563988,
-    0.02319386601448059,
-    -0.008370976895093918,
-    0.03527228534221649,
-    0.00044236521353013813,
-    -0.028022482991218567,
-    0.0197546798735857,
-    0.0025140445213764906,
-    0.016453063115477562,
-    0.014733470045030117,
-    -0.02561505325138569,
-    -0.020855220034718513,
-    0.034722015261650085,
-    -0.03747336193919182,
-    -0.004783906973898411,
-    0.03087012842297554,
-    0.047378215938806534,
-    0.030374884605407715,
-    -0.028724076226353645,
-    0.026124052703380585,
-    -0.007359856739640236,
-    -0.003679928369820118,
-    -0.03232834115624428,
-    0.018379006534814835,
-    -0.0017462463583797216,
-    0.004357447847723961,
-    0.008322828449308872,
-    -0.03576752915978432,
-    -0.0008959078113548458,
-    0.00809584278613329,
-    -0.033676501363515854,
-    0.026399187743663788,
-    0.030429912731051445,
-    -0.007710653822869062,
-    0.004684170242398977,
-    0.006393445655703545,
-    0.0015553715638816357,
-    -0.016040360555052757,
-    -0.0021701259538531303,
-    -0.009402732364833355,
-    0.018131384626030922,
-    0.02048378810286522,
-    0.04217816889286041,
-    -0.0037418336141854525,
-    -0.0001540110242785886,
-    0.04179298132658005,
-    -0.008687382563948631,
-    -0.02472086437046528,
-    -0.022794920951128006,
-    -0.04952426999807358,
-    -0.008845584467053413,
-    0.00812335591763258,
-    0.06498684734106064,
-    -0.06768316775560379,
-    -0.03491460904479027,
-    -0.020071085542440414,
-    -0.027623536065220833,
-    -0.05395394191145897,
-    -0.003193283686414361,
-    -0.006847417913377285,
-    0.0021408929023891687,
-    0.021694380789995193,
-    -0.0530184805393219,
-    -0.03967444226145744,
-    -0.0036627324298024178,
-    0.006899005733430386,
-    0.008350342512130737,
-    0.002376477001234889,
-    -0.05849366635084152,
-    0.019135627895593643,
-    0.0011701828334480524,
-    -0.028448941186070442,
-    -0.025051025673747063,
-    -0.04270092397928238,
-    0.018255196511745453,
-    0.02990715578198433,
-    0.013543511740863323,
-    0.012381067499518394,
-    -0.05755820497870445,
-    0.045947518199682236,
-    0.021199138835072517,
-    -0.015572631731629372,
-    0.016521846875548363,
-    0.008233409374952316,
-    -0.04256335645914078,
-    -0.01369483582675457,
-    0.038216229528188705,
-    0.06927894800901413,
-    -0.03353893756866455,
-    -0.03750087693333626,
-    0.06201539188623428,
-    -0.012071540579199791,
-    -0.030567480251193047,
-    -0.019328221678733826,
-    -0.05942912399768829,
-    0.022918730974197388,
-    0.0005395222106017172,
-    -0.022561056539416313,
-    0.015916550531983376,
-    0.03359396383166313,
-    0.03598763421177864,
-    -0.06091485172510147,
-    -0.0011134363012388349,
-    0.02579388953745365,
-    0.04041730612516403,
-    0.05838361009955406,
-    0.026069024577736855,
-    -0.04468189552426338,
-    -0.06493181735277176,
-    -0.0047048055566847324,
-    -0.03607017546892166,
-    0.010936609469354153,
-    -0.015448820777237415,
-    -0.04514962434768677,
-    0.017003333196043968,
-    -0.04371892288327217,
-    -0.0074974242597818375,
-    0.04016968607902527,
-    -0.05040470138192177,
-    0.01958959922194481,
-    -0.017842493951320648,
-    -0.015049874782562256,
-    -0.012346675619482994,
-    0.04457184299826622,
-    0.012903823517262936,
-    -0.0018193291034549475,
-    -0.0005412417813204229,
-    0.002113379305228591,
-    -0.018984302878379822,
-    -0.0005734841688536108,
-    0.046497784554958344,
-    0.004512211307883263,
-    0.01327525544911623,
-    -0.01621919870376587,
-    0.010847190394997597,
-    -0.06432652473449707,
-    -0.0022870581597089767,
-    -0.003315374720841646,
-    0.022629840299487114,
-    0.015228712931275368,
-    -0.005640264134854078,
-    -0.008735531009733677,
-    -0.011074176989495754,
-    -0.014705956913530827,
-    -0.038216229528188705,
-    0.019218167290091515,
-    -0.037390824407339096,
-    0.006847417913377285,
-    -0.03593260794878006,
-    0.04209562763571739,
-    -0.01546257734298706,
-    -0.03395163640379906,
-    -0.013330282643437386,
-    0.02985212951898575,
-    0.006912762764841318,
-    -0.012738742865622044,
-    -0.007786315865814686,
-    -0.005795027129352093,
-    -0.015063632279634476,
-    0.04534221813082695,
-    0.0004939530044794083,
-    -0.01957584358751774,
-    0.006744242738932371,
-    0.0073667350225150585,
-    0.0021632476709783077,
-    0.004993697162717581,
-    -0.02646797150373459,
-    -0.011768892407417297,
-    -0.008061450906097889,
-    -0.011438730172812939,
-    -0.005574919283390045,
-    0.016466818749904633,
-    0.0044915759935975075,
-    -0.017594872042536736,
-    0.006420959252864122,
-    0.04990945756435394,
-    -0.014981091022491455,
-    -0.024445729330182076,
-    -0.011473122052848339,
-    0.0238817036151886,
-    -0.02820131927728653,
-    0.01376361958682537,
-    -0.015765225514769554,
-    -0.027169564738869667,
-    0.00038540372042916715,
-    -0.0009707100689411163,
-    -0.0011564260348677635,
-    0.039894551038742065,
-    0.02561505325138569,
-    -0.02218962460756302,
-    0.02048378810286522,
-    0.013412822969257832,
-    0.061079930514097214,
-    0.011961487121880054,
-    0.045837461948394775,
-    0.07571710646152496,
-    0.011012271977961063,
-    -0.020222410559654236,
-    0.03175055980682373,
-    -0.005323858931660652,
-    -0.018337735906243324,
-    -0.021955760195851326,
-    -0.025504998862743378,
-    -0.003930988721549511,
-    0.0009380378178320825,
-    0.04781843349337578,
-    0.031998179852962494,
-    0.006754559930413961,
-    -0.016508089378476143,
-    0.019961031153798103,
-    -0.0015837448881939054,
-    -0.008859341964125633,
-    -0.005509574897587299,
-    0.03711568936705589,
-    0.015930306166410446,
-    0.005746878683567047,
-    0.025271134451031685,
-    -0.010640839114785194,
-    0.01799381710588932,
-    0.007222289219498634,
-    0.00861859880387783,
-    -0.04880891740322113,
-    0.0062455604784190655,
-    -0.02315259538590908,
-    0.012332919053733349,
-    0.024500757455825806,
-    0.012573661282658577,
-    0.010076813399791718,
-    0.015077388845384121,
-    0.012958850711584091,
-    0.025491241365671158,
-    -0.023290162906050682,
-    -0.03942682221531868,
-    -0.059484150260686874,
-    -0.02833888679742813,
-    -0.00618021609261632,
-    -0.017484817653894424,
-    -0.005705608520656824,
-    -0.0011375105241313577,
-    0.016026603057980537,
-    0.024597054347395897,
-    0.02410181052982807,
-    -0.019892247393727303,
-    0.01799381710588932,
-    0.010688988491892815,
-    0.0006972948322072625,
-    -0.009547178633511066,
-    0.013041391037404537,
-    -0.031255315989255905,
-    0.02670183591544628,
-    0.009602205827832222,
-    0.01539379358291626,
-    -0.01979595050215721,
-    -0.009767286479473114,
-    -9.83929421636276e-05,
-    0.024459486827254295,
-    0.006981546524912119,
-    -0.04129773750901222,
-    -0.027981212362647057,
-    0.04900151491165161,
-    -0.01891551911830902,
-    0.04539724811911583,
-    -0.05593490973114967,
-    -0.001394589664414525,
-    0.03356644883751869,
-    0.016810737550258636,
-    -0.00037100212648510933,
-    -0.003955062944442034,
-    -0.00427146814763546,
-    0.025119809433817863,
-    -0.013481606729328632,
-    -0.0238817036151886,
-    0.0007940219365991652,
-    -0.008742408826947212,
-    0.022574812173843384,
-    -0.004670413676649332,
-    0.0032225167378783226,
-    0.0214605163782835,
-    0.013928701169788837,
-    0.0030780709348618984,
-    0.02218962460756302,
-    -0.0013610576279461384,
-    0.008439760655164719,
-    -0.011383703909814358,
-    0.017581116408109665,
-    0.0021649671252816916,
-    -0.011823919601738453,
-    0.03194315358996391,
-    -0.007834464311599731,
-    0.014183200895786285,
-    0.011989000253379345,
-    0.02990715578198433,
-    0.007751923985779285,
-    0.00047761687892489135,
-    -0.010193745605647564,
-    0.01330276858061552,
-    -0.017539845779538155,
-    0.024486999958753586,
-    0.05076237767934799,
-    -0.01785624958574772,
-    -0.0043264953419566154,
-    -0.034749530255794525,
-    -0.005482061300426722,
-    0.0007200794643722475,
-    -0.05056978017091751,
-    0.04443427547812462,
-    -0.0013687957543879747,
-    0.019397005438804626,
-    0.03334634006023407,
-    -0.01887424848973751,
-    0.03529980033636093,
-    0.02225840836763382,
-    -0.016659414395689964,
-    -0.011397460475564003,
-    0.015228712931275368,
-    0.011369946412742138,
-    0.024170594289898872,
-    -0.009712259285151958,
-    -0.10301048308610916,
-    0.019424518570303917,
-    -0.03329131379723549,
-    0.020979030057787895,
-    -0.010854069143533707,
-    -0.02998969703912735,
-    0.02561505325138569,
-    0.02227216400206089,
-    0.015311253257095814,
-    0.022726137191057205,
-    0.014141930267214775,
-    -0.011383703909814358,
-    -0.0023506830912083387,
-    -0.01809011586010456,
-    0.023455243557691574,
-    0.010599569417536259,
-    -0.004312738310545683,
-    -0.017374765127897263,
-    0.0031743680592626333,
-    0.04019719734787941,
-    0.0005025509744882584,
-    -0.01462341658771038,
-    -0.011562541127204895,
-    0.02576637640595436,
-    -0.0102694071829319,
-    -0.01974092423915863,
-    0.014100659638643265,
-    0.030484938994050026,
-    0.0011461084941402078,
-    0.0358225554227829,
-    0.004336812533438206,
-    0.003380719106644392,
-    -0.0025278013199567795,
-    -0.004347130190581083,
-    0.006689215544611216,
-    0.039784494787454605,
-    0.004343691281974316,
-    -0.009299557656049728,
-    -0.03485958278179169,
-    -0.0031554526649415493,
-    -0.030319858342409134,
-    -0.008639233186841011,
-    -0.03959190100431442,
-    0.02140549011528492,
-    -0.0030092871747910976,
-    -0.02575262077152729,
-    0.011438730172812939,
-    -0.025078538805246353,
-    0.009175746701657772,
-    -0.005389203317463398,
-    -0.004801102913916111,
-    -0.03527228534221649,
-    0.01073713693767786,
-    -0.0005193169927224517,
-    -0.023675352334976196,
-    0.03271353244781494,
-    -0.03194315358996391,
-    0.01366044394671917,
-    0.028049996122717857,
-    0.026137808337807655,
-    0.016783224418759346,
-    0.03447439521551132,
-    0.03496963530778885,
-    0.012167837470769882,
-    -0.015325009822845459,
-    -0.02137797698378563,
-    -0.009237651713192463,
-    -0.01715465635061264,
-    -0.0215293001383543,
-    -0.016948305070400238,
-    -0.014279497787356377,
-    0.02485843189060688,
-    -0.012917580083012581,
-    0.009155111387372017,
-    0.001612977939657867,
-    0.004051360301673412,
-    -0.019163141027092934,
-    -0.0360976904630661,
-    0.004993697162717581,
-    -0.0058225407265126705,
-    -0.012222864665091038,
-    0.018351493403315544,
-    -0.026330403983592987,
-    -0.009966759011149406,
-    0.016879521310329437,
-    -0.021983273327350616,
-    0.020277436822652817,
-    0.040527358651161194,
-    0.014375794678926468,
-    -0.032080721110105515,
-    -0.00936146266758442,
-    0.008797436021268368,
-    0.016439305618405342,
-    -0.02307005599141121,
-    -0.0027908990159630775,
-    -0.02657802402973175,
-    0.03956438973546028,
-    0.004952426999807358,
-    -0.06806835532188416,
-    0.01419695746153593,
-    0.032135747373104095,
-    0.020800193771719933,
-    -0.010537664406001568,
-    8.732306741876528e-05,
-    0.015352523885667324,
-    0.0376659594476223,
-    0.049276646226644516,
-    -0.004402157384902239,
-    0.026261620223522186,
-    0.034639474004507065,
-    0.007889491505920887,
-    -0.009416489861905575,
-    -0.009113841690123081,
-    0.016920791938900948,
-    0.034006666392087936,
-    0.03860141709446907,
-    -0.03364899009466171,
-    -0.003458100836724043,
-    -0.0012596016749739647,
-    -0.005819101817905903,
-    0.003528604283928871,
-    0.02575262077152729,
-    -0.018186412751674652,
-    -0.0212541650980711,
-    0.021611841395497322,
-    -0.025243621319532394,
-    0.030264832079410553,
-    -0.013075782917439938,
-    0.000613034819252789,
-    -0.0012406861642375588,
-    -0.0009363181889057159,
-    0.010455123148858547,
-    0.03598763421177864,
-    0.004832055419683456,
-    0.01330276858061552,
-    0.018406519666314125,
-    0.012539269402623177,
-    0.004354008473455906,
-    0.020084843039512634,
-    -0.013144566677510738,
-    -0.006348736118525267,
-    0.02747221291065216,
-    0.0007983209216035903,
-    -0.010166231542825699,
-    -0.014375794678926468,
-    0.0014152247458696365,
-    0.008900611661374569,
-    0.01027628593146801,
-    0.011418095789849758,
-    -0.011342433281242847,
-    0.015104901976883411,
-    -0.020937761291861534,
-    -0.044076599180698395,
-    0.015269982628524303,
-    0.02300127223134041,
-    0.013791133649647236,
-    -0.015118658542633057,
-    0.027568509802222252,
-    -0.01892927661538124,
-    0.015476333908736706,
-    -0.011053541675209999,
-    -0.03158547729253769,
-    0.021075328812003136,
-    -0.014375794678926468,
-    -0.023551542311906815,
-    0.038271255791187286,
-    -0.014183200895786285,
-    0.028586508706212044,
-    0.0328235849738121,
-    0.02814629301428795,
-    -0.002177004236727953,
-    0.012752499431371689,
-    -0.020703895017504692,
-    -0.008178383111953735,
-    -0.03540985286235809,
-    0.011246136389672756,
-    -0.007573086302727461,
-    -0.028806617483496666,
-    0.0395093597471714,
-    0.023303920403122902,
-    0.007463032379746437,
-    0.038023632019758224,
-    -0.006262756418436766,
-    0.026357917115092278,
-    -0.018213925883173943,
-    0.018406519666314125,
-    0.021116597577929497,
-    -0.016067873686552048,
-    0.04627767950296402,
-    0.008013301528990269,
-    0.0037865431513637304,
-    0.02660553716123104,
-    -0.0020772679708898067,
-    0.013756741769611835,
-    -0.002484811469912529,
-    -0.015916550531983376,
-    -0.01888800598680973,
-    -0.023812919855117798,
-    -0.0249409731477499,
-    0.02056632936000824,
-    -0.004742636810988188,
-    -0.013529755175113678,
-    0.014375794678926468,
-    -0.007944517768919468,
-    -0.033759042620658875,
-    0.006661701947450638,
-    -0.0477634072303772,
-    -0.009217016398906708,
-    0.0007235186058096588,
-    0.003848448395729065,
-    -0.006813026033341885,
-    -0.02396424300968647,
-    -0.025257376953959465,
-    -0.013419701717793941,
-    -0.00473231915384531,
-    0.024225622415542603,
-    -0.030457425862550735,
-    0.007394248619675636,
-    0.008405368775129318,
-    -0.023331433534622192,
-    -0.024500757455825806,
-    0.048506271094083786,
-    0.0005519892438314855,
-    -0.05153275281190872,
-    -0.036427851766347885,
-    0.01238794531673193,
-    0.02223089337348938,
-    0.01979595050215721,
-    -0.024638323113322258,
-    -0.007944517768919468,
-    -0.012105932459235191,
-    0.019218167290091515,
-    0.012766255997121334,
-    0.007215410936623812,
-    -0.011218622326850891,
-    0.013681079261004925,
-    0.0029645778704434633,
-    0.01539379358291626,
-    0.0058259801007807255,
-    -0.0038725226186215878,
-    -0.044957030564546585,
-    0.02151554450392723,
-    0.017649900168180466,
-    0.003999772481620312,
-    -0.037198230624198914,
-    0.04880891740322113,
-    -0.034666988998651505,
-    -0.03917919844388962,
-    -0.02225840836763382,
-    -0.002802936127409339,
-    -0.025449972599744797,
-    0.018282709643244743,
-    -0.0549994520843029,
-    0.007614356465637684,
-    -0.025546269491314888,
-    -0.03012726455926895,
-    0.03612520173192024,
-    0.06234555318951607,
-    0.009382097981870174,
-    -0.026674320921301842,
-    0.00642439816147089,
-    -0.03681303933262825,
-    -0.0038450092542916536,
-    -0.020249923691153526,
-    -0.020112356171011925,
-    0.021130355075001717,
-    0.05678782984614372,
-    -0.02919180504977703,
-    0.0025914262514561415,
-    -0.010950366035103798,
-    0.03186061233282089,
-    -0.020979030057787895,
-    0.010606447234749794,
-    0.03854639083147049,
-    0.02575262077152729,
-    0.029714561998844147,
-    0.0028373280074447393,
-    -0.0006207729456946254,
-    0.014981091022491455,
-    -0.012133445590734482,
-    -0.02055257186293602,
-    -0.0008787118713371456,
-    0.026674320921301842,
-    -0.0034047935623675585,
-    0.03433682769536972,
-    0.008646111935377121,
-    0.00750430254265666,
-    0.02833888679742813,
-    0.03540985286235809,
-    0.03607017546892166,
-    -0.011431852355599403,
-    0.029301859438419342,
-    0.009113841690123081,
-    0.01154878456145525,
-    0.0038278133142739534,
-    0.0038312524557113647,
-    0.0358225554227829,
-    -0.0007471630233339965,
-    0.018406519666314125,
-    0.016122901812195778,
-    0.02910926565527916,
-    -0.028558995574712753,
-    0.012965728528797626,
-    -0.006279952358454466,
-    -0.012271013110876083,
-    -0.001953457249328494,
-    -0.0054029603488743305,
-    0.018268952146172523,
-    0.008797436021268368,
-    -0.012566783465445042,
-    -0.06581225246191025,
-    0.03444688022136688,
-    0.02908175066113472,
-    0.003201881656423211,
-    0.010840312577784061,
-    -0.0010111205046996474,
-    -0.02483091875910759,
-    0.029824616387486458,
-    -0.02150178700685501,
-    -0.0053616901859641075,
-    0.022010786458849907,
-    0.023757891729474068,
-    0.007855099625885487,
-    -0.020882733166217804,
-    0.0044915759935975075,
-    0.003131378209218383,
-    -0.010606447234749794,
-    0.028641534969210625,
-    -0.011803284287452698,
-    0.04286600649356842,
-    0.00535137252882123,
-    0.004556920845061541,
-    0.012277891859412193,
-    0.014719713479280472,
-    0.01321335043758154,
-    0.010936609469354153,
-    0.011466244235634804,
-    0.0021185381338000298,
-    -0.03436433896422386,
-    -0.018172655254602432,
-    0.035464879125356674,
-    -0.009801678359508514,
-    0.006317783612757921,
-    -0.01807635836303234,
-    0.008749287575483322,
-    -0.007291072979569435,
-    -0.030374884605407715,
-    -0.03009974956512451,
-    -0.0013705153251066804,
-    0.03263099119067192,
-    -0.006338418461382389,
-    0.015380037017166615,
-    -0.03395163640379906,
-    0.01704460196197033,
-    -0.023812919855117798,
-    -0.01370171457529068,
-    0.011239257641136646,
-    0.040609899908304214,
-    0.029356885701417923,
-    0.020387491211295128,
-    -0.010193745605647564,
-    0.01157629769295454,
-    0.012656202539801598,
-    0.03664796054363251,
-    -0.03678552806377411,
-    -0.00686805322766304,
-    -0.011651960201561451,
-    0.024239378049969673,
-    7.0059968493296765e-06,
-    -0.015407550148665905,
-    0.018351493403315544,
-    -0.01887424848973751,
-    0.03230082988739014,
-    0.008529179729521275,
-    0.013357795774936676,
-    -0.03260347619652748,
-    -0.02916429191827774,
-    -0.02568383701145649,
-    -0.03838130831718445,
-    0.022973759099841118,
-    -0.000329516944475472,
-    0.03084261529147625,
-    -0.005021210759878159,
-    0.020758923143148422,
-    0.050184592604637146,
-    -0.011032906360924244,
-    3.9658105379203334e-05,
-    -0.007758802268654108,
-    0.006087358109652996,
-    -0.018365249037742615,
-    0.0016516688046976924,
-    -0.015187442302703857,
-    -0.0012776573421433568,
-    -0.02235470525920391,
-    0.010124961845576763,
-    -0.03620774298906326,
-    0.03150293976068497,
-    0.0016060995403677225,
-    0.04297605901956558,
-    0.03516223281621933,
-    -0.010675230994820595,
-    0.033814068883657455,
-    -0.01373610645532608,
-    0.009327070787549019,
-    -0.018681654706597328,
-    0.025257376953959465,
-    0.014362038113176823,
-    0.017361007630825043,
-    0.027706077322363853,
-    -0.004990257788449526,
-    -0.03631779924035072,
-    -0.004388400353491306,
-    0.009547178633511066,
-    0.020208653062582016,
-    0.005874128546565771,
-    0.015930306166410446,
-    0.017636142671108246,
-    -0.022671109065413475,
-    0.02488594502210617,
-    -0.05062481015920639,
-    0.005767513997852802,
-    -0.019053086638450623,
-    -0.012704350985586643,
-    -0.021034058183431625,
-    0.02058008499443531,
-    -0.03153045102953911,
-    -0.0018158898456022143,
-    -0.038271255791187286,
-    0.05915398895740509,
-    -0.010964122600853443,
-    -0.0007011638954281807,
-    -0.010138718411326408,
-    -0.005255075171589851,
-    -0.000713201065082103,
-    -0.01288318820297718,
-    0.009244530461728573,
-    0.002168406266719103,
-    0.01503611821681261,
-    -0.022877460345625877,
-    -0.042535845190286636,
-    0.0074080051854252815,
-    0.02738967165350914,
-    -0.005843176040798426,
-    -0.0073254648596048355,
-    -0.022533543407917023,
-    0.007772558834403753,
-    -0.014114417135715485,
-    -0.015682686120271683,
-    0.11830797791481018,
-    0.00448813708499074,
-    -0.03147542476654053,
-    0.008302193135023117,
-    0.031337857246398926,
-    -0.00404448201879859,
-    -0.017801223322749138,
-    -0.004085752181708813,
-    0.010290042497217655,
-    -0.0029112703632563353,
-    -0.0002355842007091269,
-    -0.011823919601738453,
-    0.0029817738104611635,
-    -0.01642554998397827,
-    0.031337857246398926,
-    0.0026240984443575144,
-    -0.004818298853933811,
-    -0.015118658542633057,
-    0.010750893503427505,
-    -0.003762468695640564,
-    0.03846384957432747,
-    0.014059389941394329,
-    0.020194895565509796,
-    -0.010792164131999016,
-    0.04622264951467514,
-    -0.057943396270275116,
-    -0.04036227986216545,
-    -0.05045972764492035,
-    0.028036238625645638,
-    0.029824616387486458,
-    0.011314920149743557,
-    -0.0015510725788772106,
-    -0.02137797698378563,
-    0.014210714027285576,
-    0.03161299228668213,
-    0.01638427935540676,
-    -0.007978909648954868,
-    0.003253469243645668,
-    0.009127598255872726,
-    -0.000563596491701901,
-    -0.004415913950651884,
-    -0.0029147095046937466,
-    0.011321797966957092,
-    0.03838130831718445,
-    0.021144112572073936,
-    0.007820707745850086,
-    0.007380491588264704,
-    -0.020126113668084145,
-    0.0075799645856022835,
-    -0.021721893921494484,
-    0.022602327167987823,
-    -0.0038140565156936646,
-    -0.01419695746153593,
-    -0.015338766388595104,
-    -0.018145142123103142,
-    -0.03565747290849686,
-    -0.025202350690960884,
-    -0.019355734810233116,
-    -0.003134817350655794,
-    -0.009609083645045757,
-    -0.015531361103057861,
-    -0.0212541650980711,
-    -0.044131625443696976,
-    0.03695060685276985,
-    0.001271638786420226,
-    0.015297496691346169,
-    -0.015751469880342484,
-    -0.022561056539416313,
-    0.016122901812195778,
-    0.008364099077880383,
-    -0.0028235712088644505,
-    -0.011280528269708157,
-    -0.007683140225708485,
-    0.018681654706597328,
-    0.011342433281242847,
-    0.0392342284321785,
-    0.00858420692384243,
-    0.0019826903007924557,
-    0.010400096885859966,
-    -0.030429912731051445,
-    -0.01807635836303234,
-    0.04536973312497139,
-    0.03155796602368355,
-    0.025532511994242668,
-    0.019369492307305336,
-    -0.01703084632754326,
-    -0.035382337868213654,
-    -0.0074080051854252815,
-    -0.035519905388355255,
-    -0.006706411484628916,
-    0.011755135841667652,
-    0.02646797150373459,
-    -0.025436215102672577,
-    0.02921931818127632,
-    -0.010413853451609612,
-    0.011679473333060741,
-    0.0012054344406351447,
-    -0.022093327715992928,
-    0.00469792727380991,
-    -0.019823463633656502,
-    0.006028892006725073,
-    -0.019314464181661606,
-    0.015710199251770973,
-    0.0018605992663651705,
-    -0.03799612075090408,
-    -0.04047233238816261,
-    -0.029494453221559525,
-    -0.006386567372828722,
-    0.008439760655164719,
-    -0.022024543955922127,
-    0.037225741893053055,
-    -0.01697581820189953,
-    0.01243609469383955,
-    -0.006310905329883099,
-    -0.013818646781146526,
-    0.03428180143237114,
-    0.019823463633656502,
-    -0.005702169146388769,
-    0.002388514345511794,
-    0.007758802268654108,
-    -0.018227683380246162,
-    0.02828386053442955,
-    0.039096660912036896,
-    0.0042817858047783375,
-    0.01288318820297718,
-    0.009911731816828251,
-    0.017429791390895844,
-    0.02842142805457115,
-    0.006324661895632744,
-    0.0004733178939204663,
-    -0.0021391732152551413,
-    -0.013653566129505634,
-    -0.009994273073971272,
-    -0.03516223281621933,
-    0.01114983856678009,
-    0.013075782917439938,
-    -0.00987733993679285,
-    -0.001576866488903761,
-    -0.020263679325580597,
-    -0.017732439562678337,
-    -0.029659533873200417,
-    0.031227802857756615,
-    0.01408690307289362,
-    0.030347371473908424,
-    0.01638427935540676,
-    0.0017660217126831412,
-    -0.04542475938796997,
-    0.003958502318710089,
-    0.018681654706597328,
-    0.0055680410005152225,
-    0.010468880645930767,
-    0.025271134451031685,
-    0.02220338024199009,
-    -0.011259892955422401,
-    0.03342888131737709,
-    0.04206811636686325,
-    0.004202684387564659,
-    0.026316646486520767,
-    0.01802133210003376,
-    -0.006187094375491142,
-    -0.008054572157561779,
-    0.011418095789849758,
-    0.0029783344361931086,
-    0.014430821873247623,
-    0.017718683928251266,
-    0.005079676862806082,
-    0.021653110161423683,
-    -0.005860371980816126,
-    0.0038759619928896427,
-    -0.01876419596374035,
-    -0.010145597159862518,
-    -0.021763164550065994,
-    -0.024321919307112694,
-    0.0017780588241294026,
-    -0.02737591601908207,
-    -0.011452487669885159,
-    -0.04187552258372307,
-    0.057723287492990494,
-    -0.006015135440975428,
-    -0.008054572157561779,
-    -0.02489970251917839,
-    -0.016439305618405342,
-    -0.00473231915384531,
-    -0.01239482406526804,
-    0.011383703909814358,
-    -0.004298981744796038,
-    0.012078419327735901,
-    -0.013419701717793941,
-    -0.007958275265991688,
-    -0.00688524916768074,
-    0.025064783170819283,
-    -0.01203714869916439,
-    0.01718216948211193,
-    0.039894551038742065,
-    0.012099053710699081,
-    0.03491460904479027,
-    0.0004857849271502346,
-    0.030484938994050026,
-    9.034578397404402e-06,
-    -0.014953577890992165,
-    -0.043278709053993225,
-    -0.012271013110876083,
-    -0.004474380053579807,
-    0.014747226610779762,
-    0.013894309289753437,
-    -0.02657802402973175,
-    -0.022629840299487114,
-    -0.008453517220914364,
-    0.0026550511829555035,
-    -0.0042370762676000595,
-    -0.006888688076287508,
-    0.006967789493501186,
-    -0.019397005438804626,
-    -0.012236621230840683,
-    0.009574691765010357,
-    0.03007223643362522,
-    -0.01500860508531332,
-    0.08974897861480713,
-    -0.0585486926138401,
-    -0.005598993971943855,
-    -0.0031743680592626333,
-    0.006627310067415237,
-    0.026674320921301842,
-    -0.019190654158592224,
-    -0.012408580631017685,
-    -0.0014831486623734236,
-    -0.005984182469546795,
-    -0.0037452727556228638,
-    0.01462341658771038,
-    -0.027788618579506874,
-    0.04033476486802101,
-    0.04005962982773781,
-    -0.013440336100757122,
-    0.015558874234557152,
-    0.007917004637420177,
-    -0.008109599351882935,
-    -0.04732318967580795,
-    0.0076212347485125065,
-    -0.021680625155568123,
-    -0.0057434397749602795,
-    -0.03276855871081352,
-    -0.015668928623199463,
-    -0.04990945756435394,
-    -0.011253014206886292,
-    -0.024528270587325096,
-    0.0073667350225150585,
-    -0.014265741221606731,
-    -0.02894418314099312,
-    -0.02985212951898575,
-    -0.011431852355599403,
-    -0.023620324209332466,
-    0.0005571480141952634,
-    0.014499605633318424,
-    0.002653331495821476,
-    0.009973637759685516,
-    -0.07769807428121567,
-    0.005925716366618872,
-    0.016067873686552048,
-    -0.03197066858410835,
-    -0.023537784814834595,
-    -0.005430473480373621,
-    -0.0001846412633312866,
-    -0.034694500267505646,
-    -0.012553026899695396,
-    0.032025694847106934,
-    0.01250487845391035,
-    0.00406167795881629,
-    0.005420156288892031,
-    -0.00035036701592616737,
-    -0.016920791938900948,
-    0.014114417135715485,
-    0.0026240984443575144,
-    0.022492272779345512,
-    -0.03444688022136688,
-    -0.025216106325387955,
-    0.02059384249150753,
-    0.01883297972381115,
-    0.007985788397490978,
-    0.031282830983400345,
-    0.02919180504977703,
-    0.02924683317542076,
-    -0.02301502786576748,
-    0.0013851318508386612,
-    0.011768892407417297,
-    0.03967444226145744,
-    -0.008047693409025669,
-    -0.014816010370850563,
-    0.005231000948697329,
-    0.0051071904599666595,
-    -0.014637173153460026,
-    -0.007421762216836214,
-    0.02568383701145649,
-    0.015971576794981956,
-    -0.009574691765010357,
-    0.02751348353922367,
-    0.04283849149942398,
-    0.016535602509975433,
-    0.009340827353298664,
-    0.02905423752963543,
-    -0.02653675340116024,
-    -0.009100084193050861,
-    -0.02390921674668789,
-    0.01701708883047104,
-    -0.008769922889769077,
-    0.04388400539755821,
-    0.032190773636102676,
-    0.021102841943502426,
-    0.016700685024261475,
-    0.025876430794596672,
-    -0.015765225514769554,
-    0.04473692178726196,
-    0.008556692861020565,
-    -0.004316177684813738,
-    0.00028695701621472836,
-    -0.0250097569078207,
-    0.029549481347203255,
-    -0.005344494245946407,
-    0.03155796602368355,
-    0.029494453221559525,
-    0.020428761839866638,
-    -0.010633961297571659,
-    -0.0012922738678753376,
-    0.03180558606982231,
-    -0.037170715630054474,
-    0.028022482991218567,
-    0.0006169038824737072,
-    0.027100780978798866,
-    0.007607478182762861,
-    -0.00815774779766798,
-    -0.01377049833536148,
-    -0.016769468784332275,
-    -0.029494453221559525,
-    -0.01976843737065792,
-    -0.005722804460674524,
-    -0.03406169265508652,
-    0.0345294214785099,
-    -0.02234094776213169,
-    0.008983151987195015,
-    -0.016934549435973167,
-    -0.020717652514576912,
-    -0.025078538805246353,
-    -0.033759042620658875,
-    -0.003344607772305608,
-    -0.013337160460650921,
-    8.006853749975562e-05,
-    0.029301859438419342,
-    -0.01892927661538124,
-    0.031117748469114304,
-    0.006417519878596067,
-    0.014403308741748333,
-    0.005801905877888203,
-    0.008948760107159615,
-    -0.008680503815412521,
-    0.01883297972381115,
-    -0.018255196511745453,
-    -0.005310102365911007,
-    0.04033476486802101,
-    -0.04220568388700485,
-    0.0036283405497670174,
-    -0.020951516926288605,
-    0.007841343060135841,
-    -0.0038518875371664762,
-    -0.014066267758607864,
-    -0.024652080610394478,
-    0.012649323791265488,
-    0.011376825161278248,
-    -0.021130355075001717,
-    0.00945775955915451,
-    -0.021639354526996613,
-    -0.013969970867037773,
-    -0.02905423752963543,
-    -0.037143200635910034,
-    -0.007215410936623812,
-    -0.029659533873200417,
-    0.0008137972326949239,
-    0.004020407795906067,
-    -0.045067086815834045,
-    0.021790677681565285,
-    0.00447094114497304,
-    0.015971576794981956,
-    0.005451108794659376,
-    0.01151439268141985,
-    -0.01895678974688053,
-    -0.002866561058908701,
-    0.031145263463258743,
-    0.006489743012934923,
-    0.030512452125549316,
-    0.021969515830278397,
-    0.029769588261842728
-  ],
-  "Connectivity": [
-    0.005367533769458532,
-    -0.008832740597426891,
-    0.018160510808229446,
-    0.022757211700081825,
-    0.03824456408619881,
-    0.007708316203206778,
-    0.03917804732918739,
-    0.03383173048496246,
-    -0.007047098129987717,
-    -0.0033414489589631557,
-    0.023803846910595894,
-    0.03295481950044632,
-    0.013768891803920269,
-    0.00929241068661213,
-    0.01558635663241148,
-    -0.021554997190833092,
-    -0.03159702569246292,
-    0.017085589468479156,
-    0.05629192292690277,
-    0.03434090316295624,
-    0.03516123816370964,
-    0.01202214416116476,
-    0.021710578352212906,
-    0.009759152308106422,
-    -0.044920388609170914,
-    0.01200800109654665,
-    -0.03408631682395935,
-    0.031653597950935364,
-    0.01724117062985897,
-    -0.050747595727443695,
-    0.03830114006996155,
-    -0.051398202776908875,
-    0.017665481194853783,
-    -0.001367518911138177,
-    -0.028839003294706345,
-    0.07218944281339645,
-    -0.025345509871840477,
-    0.021554997190833092,
-    0.029984643682837486,
-    0.003730400698259473,
-    0.007779034785926342,
-    0.04845631495118141,
-    -0.053915783762931824,
-    0.04602359980344772,
-    0.01902327500283718,
-    -0.028400547802448273,
-    -0.03193647414445877,
-    -0.011760486289858818,
-    0.04757940396666527,
-    0.022290470078587532,
-    -0.003337913192808628,
-    0.009214620105922222,
-    -0.024892911314964294,
-    -0.026448717340826988,
-    -0.048258304595947266,
-    0.014285136945545673,
-    0.005378141533583403,
-    0.03951749578118324,
-    -0.0351046621799469,
-    0.0011765790404751897,
-    -0.007969974540174007,
-    -0.011421037837862968,
-    0.020861957222223282,
-    0.01237573754042387,
-    -0.02045178972184658,
-    -0.01273640152066946,
-    -0.035698696970939636,
-    0.02330881729722023,
-    -0.009532853029668331,
-    -0.003574820002540946,
-    0.04933322221040726,
-    0.029532045125961304,
-    -0.047862280160188675,
-    0.021017538383603096,
-    -0.0027120544109493494,
-    -0.0008088428294286132,
-    -0.013224358670413494,
-    0.01792006753385067,
-    -0.020140627399086952,
-    -0.030946414917707443,
-    0.0062691946513950825,
-    -0.011993857100605965,
-    -0.002950729336589575,
-    -0.07015275210142136,
-    -0.0219085905700922,
-    -0.015883374959230423,
-    -0.05309544876217842,
-    -0.02978663146495819,
-    -0.057564858347177505,
-    0.03329426795244217,
-    -0.010636062361299992,
-    0.02432716265320778,
-    -0.007192071061581373,
-    0.008189202286303043,
-    0.020847812294960022,
-    0.008387213572859764,
-    0.04347773268818855,
-    -0.029560331255197525,
-    -0.04223308712244034,
-    0.028188392519950867,
-    0.010529984720051289,
-    -0.03236078470945358,
-    -0.027806513011455536,
-    -0.04938979819417,
-    0.02872585318982601,
-    0.002257687970995903,
-    0.003129293443635106,
-    -0.038159701973199844,
-    -0.024242300540208817,
-    0.0004914935561828315,
-    -0.06392952054738998,
-    0.005866099614650011,
-    -0.027071040123701096,
-    0.01569950580596924,
-    0.05267113819718361,
-    -0.07869554311037064,
-    0.028909722343087196,
-    -0.08582396805286407,
-    0.03468035161495209,
-    -0.0005449744057841599,
-    0.013853753916919231,
-    -0.041808776557445526,
-    0.04206336289644241,
-    0.011159379035234451,
-    -0.002671391237527132,
-    0.0022046491503715515,
-    -0.047833990305662155,
-    0.050379857420921326,
-    -0.03468035161495209,
-    -0.06138365715742111,
-    0.024284731596708298,
-    -0.022460194304585457,
-    0.027863088995218277,
-    -0.013500161468982697,
-    -0.047183383256196976,
-    -0.003758688224479556,
-    -0.04446779191493988,
-    -0.03436918929219246,
-    -0.011831204406917095,
-    0.0007615498034283519,
-    -0.007032954599708319,
-    0.03733936697244644,
-    0.09572456032037735,
-    0.0010934848105534911,
-    0.016604702919721603,
-    0.020140627399086952,
-    -0.020508363842964172,
-    0.04056413099169731,
-    0.023832133039832115,
-    0.00545593211427331,
-    -0.03086155280470848,
-    -0.011654408648610115,
-    -0.05046471953392029,
-    -0.012319162487983704,
-    -0.008380142040550709,
-    3.127083618892357e-05,
-    -0.011343247257173061,
-    0.03943263366818428,
-    -0.0038081910461187363,
-    -0.008571081794798374,
-    -0.011421037837862968,
-    -0.011336174793541431,
-    -0.0007575718918815255,
-    -0.02872585318982601,
-    -0.012686898931860924,
-    0.013047562912106514,
-    -0.030352380126714706,
-    -0.010522912256419659,
-    -0.07581023126840591,
-    -0.029899781569838524,
-    0.016618847846984863,
-    -0.024638324975967407,
-    -0.04865432530641556,
-    0.044920388609170914,
-    0.02405843324959278,
-    -0.03343570604920387,
-    0.008160914294421673,
-    -0.034991513937711716,
-    0.02371898479759693,
-    -0.04019639268517494,
-    0.04237452521920204,
-    -0.008691303431987762,
-    0.011406893841922283,
-    -0.017354318872094154,
-    0.004794714041054249,
-    0.0020437645725905895,
-    -0.03827285021543503,
-    0.06664511561393738,
-    0.03977208212018013,
-    -0.03575527295470238,
-    -0.03824456408619881,
-    0.04647619649767876,
-    0.0072062150575220585,
-    -0.006117150187492371,
-    0.0214984230697155,
-    0.013146569021046162,
-    -0.0021657540928572416,
-    0.0010705012828111649,
-    0.012927341274917126,
-    -0.03770710155367851,
-    -0.011746342293918133,
-    -0.004218358546495438,
-    0.0013692869106307626,
-    -0.015048895962536335,
-    -0.013478945940732956,
-    -0.003963771741837263,
-    -0.022884506732225418,
-    -0.025713246315717697,
-    0.009780367836356163,
-    -0.024595893919467926,
-    0.023916995152831078,
-    -0.028061099350452423,
-    0.01397397555410862,
-    0.012616179883480072,
-    0.03912147134542465,
-    -0.0030780225060880184,
-    -0.017340175807476044,
-    0.04636304825544357,
-    -0.01967388577759266,
-    0.022389477118849754,
-    -0.023832133039832115,
-    -0.007340580224990845,
-    0.05552816390991211,
-    0.005042228847742081,
-    0.023040086030960083,
-    0.03697163239121437,
-    -0.00635759299620986,
-    -0.04938979819417,
-    0.04922007396817207,
-    -0.029136020690202713,
-    -0.010883577167987823,
-    0.027452921494841576,
-    -0.0026554795913398266,
-    -0.033492282032966614,
-    -0.015091327019035816,
-    0.0043562594801187515,
-    0.04271397367119789,
-    0.04115816578269005,
-    -0.0012313858605921268,
-    0.013089993968605995,
-    -0.012467671185731888,
-    -0.026759879663586617,
-    -0.030380666255950928,
-    0.05405721813440323,
-    -0.010834073647856712,
-    -0.008564010262489319,
-    0.003790511516854167,
-    0.001955366460606456,
-    -0.018174653872847557,
-    -0.02330881729722023,
-    -0.023436110466718674,
-    0.043619170784950256,
-    0.019490018486976624,
-    0.018867695704102516,
-    0.033548854291439056,
-    -0.031059565022587776,
-    0.01569950580596924,
-    -0.010791642591357231,
-    0.052925724536180496,
-    0.0028128281701356173,
-    -0.023535115644335747,
-    -0.004016810562461615,
-    -0.00894588977098465,
-    -0.011003797873854637,
-    0.005965105257928371,
-    -0.002802220406010747,
-    0.015331770293414593,
-    -3.9558159187436104e-05,
-    -0.021738866344094276,
-    -0.02296936884522438,
-    0.04627818614244461,
-    -0.03114442713558674,
-    0.0018227692926302552,
-    -0.05425523221492767,
-    -0.07315121591091156,
-    -0.020267920568585396,
-    -0.03518952429294586,
-    0.0381031259894371,
-    0.02763678878545761,
-    -0.0024769154842942953,
-    -0.021243836730718613,
-    -0.028428835794329643,
-    0.01609553024172783,
-    0.0053993575274944305,
-    -0.0287117101252079,
-    0.009730865247547626,
-    -0.022078314796090126,
-    0.057168833911418915,
-    -0.006951628252863884,
-    0.01307584997266531,
-    -0.015642931684851646,
-    -0.033492282032966614,
-    -0.004327971953898668,
-    -0.041695624589920044,
-    0.01965974271297455,
-    0.03705649450421333,
-    0.03898003697395325,
-    -0.022488482296466827,
-    0.02038107067346573,
-    0.04916349798440933,
-    0.05255798622965813,
-    0.039234623312950134,
-    -0.02145599201321602,
-    0.006527317222207785,
-    -0.014596298336982727,
-    0.006049967370927334,
-    -0.015657074749469757,
-    0.055811040103435516,
-    0.043930329382419586,
-    -0.02729734033346176,
-    -0.039913520216941833,
-    -0.02653357945382595,
-    0.0031947081442922354,
-    -0.020904388278722763,
-    -0.05665966123342514,
-    0.02289864979684353,
-    -0.0016176856588572264,
-    -0.012566677294671535,
-    -0.004798250272870064,
-    -0.007991190068423748,
-    -0.01823122799396515,
-    -0.014921602793037891,
-    0.04265739768743515,
-    -0.03550068661570549,
-    0.010289541445672512,
-    -0.01059363130480051,
-    -0.06104420870542526,
-    -0.014893315732479095,
-    -0.024878768250346184,
-    -0.009278266690671444,
-    0.021286267787218094,
-    -0.05298229679465294,
-    0.035698696970939636,
-    0.002091499511152506,
-    0.014207346364855766,
-    0.007863896898925304,
-    0.01257374882698059,
-    0.0522468276321888,
-    -0.048569463193416595,
-    0.0006996711599640548,
-    -0.013005131855607033,
-    -0.015883374959230423,
-    -0.015473207458853722,
-    0.02509092353284359,
-    0.03213448449969292,
-    0.00322829931974411,
-    -0.024581748992204666,
-    0.004441121593117714,
-    0.013478945940732956,
-    0.03233249858021736,
-    -0.02441202476620674,
-    -0.004582558758556843,
-    -0.032785095274448395,
-    0.023054230958223343,
-    -0.017113875597715378,
-    0.030550390481948853,
-    0.0438171811401844,
-    -0.02183787152171135,
-    0.030748402699828148,
-    -0.004755818750709295,
-    0.0008773513836786151,
-    0.005392285529524088,
-    -0.00015160278417170048,
-    0.03326598182320595,
-    -0.030663540586829185,
-    0.051398202776908875,
-    -0.03558554872870445,
-    -0.010445121675729752,
-    -0.028909722343087196,
-    -0.01618039235472679,
-    -0.014836740680038929,
-    0.05450981855392456,
-    0.03903660923242569,
-    0.042091649025678635,
-    -0.03691505640745163,
-    0.02333710342645645,
-    -0.023124948143959045,
-    0.022375332191586494,
-    0.02332296036183834,
-    0.01127252820879221,
-    0.06573991477489471,
-    -0.008620585314929485,
-    0.03083326481282711,
-    -0.025996120646595955,
-    0.011428109370172024,
-    -0.012474742718040943,
-    -0.03550068661570549,
-    -0.00118718680460006,
-    -0.06296774744987488,
-    -0.04865432530641556,
-    0.03739594295620918,
-    -0.023421965539455414,
-    -0.02367655374109745,
-    -0.04265739768743515,
-    -0.0032919461373239756,
-    -0.06562676280736923,
-    0.0062727308832108974,
-    0.0063788085244596004,
-    0.037820253521203995,
-    -0.0219085905700922,
-    0.014850884675979614,
-    -0.005731734447181225,
-    -0.009638931602239609,
-    0.03227592259645462,
-    0.007029418833553791,
-    -0.038584012538194656,
-    -0.00753151997923851,
-    -0.02294108085334301,
-    0.03595328330993652,
-    -0.0017272992990911007,
-    0.006290410179644823,
-    -0.04862603917717934,
-    0.026010263711214066,
-    0.011145235039293766,
-    0.008663016371428967,
-    -0.04664592072367668,
-    -0.04090357944369316,
-    0.0004411066183820367,
-    0.050379857420921326,
-    -0.0030939343851059675,
-    0.03490665182471275,
-    0.03765052929520607,
-    -0.051850803196430206,
-    0.03323769569396973,
-    0.006170189008116722,
-    0.05974298715591431,
-    0.007460801396518946,
-    0.014320495538413525,
-    0.03906489908695221,
-    -0.07671542465686798,
-    -0.03948920965194702,
-    0.07914814352989197,
-    -0.02408672124147415,
-    0.06506101787090302,
-    0.014072980731725693,
-    0.0022064170334488153,
-    0.06279802322387695,
-    0.013450657948851585,
-    -0.01895255781710148,
-    -0.0344257652759552,
-    -0.024935342371463776,
-    0.021017538383603096,
-    -0.00844378862529993,
-    -0.03518952429294586,
-    -0.008373070508241653,
-    0.012757617048919201,
-    0.0064707426354289055,
-    -0.01825951598584652,
-    -0.04992726072669029,
-    -0.00016906141536310315,
-    -0.05629192292690277,
-    0.012510102242231369,
-    -0.03221934661269188,
-    0.04271397367119789,
-    -0.04002666845917702,
-    -0.0025759213604032993,
-    0.018443383276462555,
-    -0.0035942676477134228,
-    0.011442253366112709,
-    -0.019617311656475067,
-    -0.019461730495095253,
-    -0.001997797517105937,
-    -0.015077183954417706,
-    0.035302672535181046,
-    0.02981491945683956,
-    0.0015664147213101387,
-    0.014709447510540485,
-    -0.001948294579051435,
-    0.008648872375488281,
-    0.03151216357946396,
-    -0.04183706268668175,
-    0.02038107067346573,
-    0.04582558572292328,
-    0.014228561893105507,
-    0.0002857469371519983,
-    -0.015897518023848534,
-    0.020140627399086952,
-    0.0013507233234122396,
-    -0.01724117062985897,
-    -0.020522508770227432,
-    -0.010452194139361382,
-    0.0072203585878014565,
-    -0.07937444001436234,
-    0.004865432623773813,
-    0.009568212553858757,
-    0.05346318334341049,
-    0.04480724036693573,
-    0.038527436554431915,
-    -0.0762062519788742,
-    -0.010558271780610085,
-    0.002894154516980052,
-    -0.029475469142198563,
-    0.026052694767713547,
-    -0.01799078658223152,
-    0.03649074584245682,
-    -0.027721650898456573,
-    -0.05527357757091522,
-    0.00036508424091152847,
-    0.016222823411226273,
-    -0.05762143060564995,
-    -0.030012929812073708,
-    -0.010614846833050251,
-    -0.03303968161344528,
-    0.0416390523314476,
-    -0.008196273818612099,
-    0.0023478541988879442,
-    0.0261941310018301,
-    -0.03227592259645462,
-    -0.04407176747918129,
-    -0.0010042026406154037,
-    0.0061631170101463795,
-    0.01364867016673088,
-    -0.00247161160223186,
-    0.016675421968102455,
-    -0.0315687358379364,
-    2.6837116820388474e-05,
-    -0.008599369786679745,
-    0.03547239676117897,
-    0.008705447427928448,
-    -0.013401155360043049,
-    -0.02076295018196106,
-    0.003159348852932453,
-    0.015133758075535297,
-    0.01202921662479639,
-    -0.01397397555410862,
-    -0.011166450567543507,
-    -0.011527115479111671,
-    0.00970257818698883,
-    -0.031738460063934326,
-    -0.038584012538194656,
-    0.019985048100352287,
-    -0.018712114542722702,
-    -0.03589671105146408,
-    0.009603572078049183,
-    0.002022549044340849,
-    0.018542390316724777,
-    0.008655943907797337,
-    -0.0359249971807003,
-    -0.012757617048919201,
-    -0.011428109370172024,
-    -0.006527317222207785,
-    -0.007588095031678677,
-    -0.020239634439349174,
-    -0.0059474254958331585,
-    -0.035670410841703415,
-    -0.006230299826711416,
-    0.022332901135087013,
-    -0.03431261330842972,
-    0.022120745852589607,
-    0.015034752897918224,
-    0.011548331007361412,
-    -0.011067444458603859,
-    -0.003840014338493347,
-    -0.002540562069043517,
-    -0.000242652851738967,
-    -0.017764486372470856,
-    0.00966014713048935,
-    -0.012312090024352074,
-    0.020579082891345024,
-    0.03236078470945358,
-    -0.030889838933944702,
-    0.0017361390637233853,
-    0.03951749578118324,
-    -0.030210942029953003,
-    -0.0075103044509887695,
-    0.06675826013088226,
-    -0.00165746477432549,
-    -0.009412632323801517,
-    -0.0006117150187492371,
-    -0.01831609010696411,
-    -0.024214014410972595,
-    0.0011350319255143404,
-    0.0044481935910880566,
-    -0.0039602359756827354,
-    0.026406286284327507,
-    -0.010805786587297916,
-    0.003864765865728259,
-    -0.008465004153549671,
-    -0.00601107208058238,
-    -0.004914935678243637,
-    -0.016420835629105568,
-    0.015275195240974426,
-    -0.025713246315717697,
-    -0.0063611287623643875,
-    -0.017410894855856895,
-    -0.002936585573479533,
-    0.025303078815340996,
-    -0.04370403289794922,
-    0.008705447427928448,
-    0.008705447427928448,
-    -0.014214417897164822,
-    0.0033980237785726786,
-    -0.0052119530737400055,
-    0.0011739270994439721,
-    0.013747676275670528,
-    0.012566677294671535,
-    0.003346752841025591,
-    0.004398690536618233,
-    0.003977915272116661,
-    0.025246502831578255,
-    0.02582639455795288,
-    -0.014667016454041004,
-    0.019150570034980774,
-    -0.028230823576450348,
-    0.024822192266583443,
-    -9.558047167956829e-05,
-    0.005890850909054279,
-    0.015869230031967163,
-    -0.014249777421355247,
-    0.0257839635014534,
-    0.0027792369946837425,
-    -0.028839003294706345,
-    0.0019429906969889998,
-    -0.02255920134484768,
-    -0.004214822314679623,
-    0.017283601686358452,
-    -0.014638729393482208,
-    -0.014044693671166897,
-    0.0352461002767086,
-    0.004992725793272257,
-    -0.024242300540208817,
-    0.016576416790485382,
-    0.0017396750627085567,
-    0.029164308682084084,
-    0.0074183703400194645,
-    0.019857754930853844,
-    -0.031681887805461884,
-    -0.027113471180200577,
-    0.018386809155344963,
-    -0.03909318521618843,
-    0.01650569774210453,
-    0.01618039235472679,
-    0.022728925570845604,
-    -0.013938616029918194,
-    0.0026802311185747385,
-    -0.016222823411226273,
-    -0.01058655884116888,
-    0.06755030900239944,
-    0.013981047086417675,
-    -0.030720114707946777,
-    0.0019376868149265647,
-    -0.0048901839181780815,
-    -0.027155902236700058,
-    0.0030320556834340096,
-    0.008302351459860802,
-    0.02869756706058979,
-    -0.025585953146219254,
-    0.006852622609585524,
-    0.033577144145965576,
-    0.01613796129822731,
-    0.00363493082113564,
-    -0.040281254798173904,
-    0.02615169994533062,
-    -0.0066687543876469135,
-    0.040733855217695236,
-    -0.038159701973199844,
-    -0.009023680351674557,
-    0.006332841701805592,
-    -0.01971631683409214,
-    -0.025939544662833214,
-    -0.003611947176977992,
-    -0.02659015543758869,
-    -0.03371857851743698,
-    -0.013613310642540455,
-    -0.02688717283308506,
-    -0.005470075644552708,
-    0.030946414917707443,
-    0.015487351454794407,
-    0.009426775388419628,
-    0.02473733015358448,
-    -0.0021038753911852837,
-    0.07275518774986267,
-    0.03516123816370964,
-    -0.000982987112365663,
-    0.03343570604920387,
-    -0.03620786964893341,
-    0.013754747807979584,
-    -0.04056413099169731,
-    0.007517376448959112,
-    -0.026038551703095436,
-    -0.011725126765668392,
-    0.01715630665421486,
-    -0.02797623723745346,
-    0.03185161203145981,
-    -0.0005445324350148439,
-    -0.009752080775797367,
-    0.01468116044998169,
-    0.0027527175843715668,
-    -0.01715630665421486,
-    -0.0608179084956646,
-    -0.010105673223733902,
-    0.01325971819460392,
-    0.030295804142951965,
-    0.032417360693216324,
-    -0.027749938890337944,
-    -0.05747999623417854,
-    0.017722055315971375,
-    0.040309544652700424,
-    -0.012623251415789127,
-    -0.051850803196430206,
-    0.016675421968102455,
-    -0.02291279286146164,
-    0.0002417688665445894,
-    -0.02504849247634411,
-    0.0009750312892720103,
-    -0.03881031274795532,
-    -0.009978380054235458,
-    -0.024567605927586555,
-    0.01644912175834179,
-    -0.015147902071475983,
-    -0.03114442713558674,
-    0.0293906070291996,
-    -0.0020861956290900707,
-    0.0006382344290614128,
-    0.018132222816348076,
-    0.009087326936423779,
-    -0.042459387332201004,
-    0.023110805079340935,
-    0.029673481360077858,
-    -0.011887779459357262,
-    -0.010034955106675625,
-    -0.02405843324959278,
-    -0.008663016371428967,
-    -0.006286874413490295,
-    -0.0364624559879303,
-    0.03417117893695831,
-    -0.022743068635463715,
-    0.02759435772895813,
-    -0.011357390321791172,
-    -0.008394286036491394,
-    0.005774165503680706,
-    0.001836912939324975,
-    0.021399417892098427,
-    0.032502222806215286,
-    0.02045178972184658,
-    0.03196476027369499,
-    0.02978663146495819,
-    -0.004957366734743118,
-    -0.028103530406951904,
-    0.022417763248085976,
-    0.012269658967852592,
-    -0.011916066519916058,
-    0.017269456759095192,
-    -0.016972439363598824,
-    0.026788167655467987,
-    0.027650931850075722,
-    -0.010459265671670437,
-    0.051426492631435394,
-    -0.006315161939710379,
-    0.006074719130992889,
-    -0.014094196259975433,
-    0.011767557822167873,
-    -0.017269456759095192,
-    -0.014207346364855766,
-    -0.0021445383317768574,
-    7.331519009312615e-05,
-    -0.029305744916200638,
-    -0.009638931602239609,
-    0.039262909442186356,
-    0.025953689590096474,
-    0.004971510265022516,
-    0.00295603321865201,
-    0.013224358670413494,
-    0.03371857851743698,
-    0.031653597950935364,
-    0.00259713688865304,
-    -0.005869635380804539,
-    -0.07829952239990234,
-    0.014030549675226212,
-    0.03006950579583645,
-    0.028471266850829124,
-    0.009589428082108498,
-    0.009964236058294773,
-    0.02905115857720375,
-    0.0048477528616786,
-    0.003016144037246704,
-    -0.09131172299385071,
-    -0.011739270761609077,
-    0.00440222630277276,
-    -0.028061099350452423,
-    -0.005965105257928371,
-    -0.01093307975679636,
-    0.009745009243488312,
-    -0.011668551713228226,
-    -0.004154711961746216,
-    -0.024694899097085,
-    0.009264123626053333,
-    0.008556937798857689,
-    0.024836337193846703,
-    -0.04865432530641556,
-    -0.018542390316724777,
-    -0.02257334440946579,
-    -0.02114483155310154,
-    -0.015105471014976501,
-    0.0329265333712101,
-    0.01649155281484127,
-    -0.0105441277846694,
-    -0.07841266691684723,
-    0.001750282826833427,
-    -0.003023215802386403,
-    0.01606724224984646,
-    0.004632061813026667,
-    -0.021243836730718613,
-    0.033463992178440094,
-    0.020564939826726913,
-    0.04257253557443619,
-    -0.01398811861872673,
-    -0.008323566988110542,
-    0.00046188017586246133,
-    -0.0261234138160944,
-    0.0016159176593646407,
-    0.03595328330993652,
-    0.011392749845981598,
-    -0.005098803900182247,
-    -0.022389477118849754,
-    -0.015048895962536335,
-    0.00035513946204446256,
-    0.015628788620233536,
-    -0.023761415854096413,
-    0.019589023664593697,
-    0.04922007396817207,
-    -0.03335084393620491,
-    0.007736603729426861,
-    -0.02793380618095398,
-    -0.022078314796090126,
-    0.024440312758088112,
-    0.03900832310318947,
-    0.01520447712391615,
-    0.02436959370970726,
-    0.00753151997923851,
-    0.029192596673965454,
-    0.020890243351459503,
-    0.0236058346927166,
-    0.022884506732225418,
-    0.03193647414445877,
-    -0.041016727685928345,
-    -0.0011482916306704283,
-    -0.004087529145181179,
-    -0.007167319767177105,
-    -0.05269942432641983,
-    0.018542390316724777,
-    0.013330437242984772,
-    -0.009080255404114723,
-    -0.007149640005081892,
-    -0.002114483155310154,
-    -0.01862725242972374,
-    0.013514304533600807,
-    -0.019093994051218033,
-    -0.06030873581767082,
-    0.01719873957335949,
-    -0.038555726408958435,
-    0.004395154770463705,
-    -0.011180594563484192,
-    0.004009739030152559,
-    0.011597833596169949,
-    0.019150570034980774,
-    -0.0008663015905767679,
-    -0.0146953035145998,
-    -0.02659015543758869,
-    0.015218621119856834,
-    -0.017467468976974487,
-    0.03688676655292511,
-    0.003251282963901758,
-    -0.006202012300491333,
-    0.03125757724046707,
-    -0.01753818802535534,
-    0.03773539140820503,
-    0.03847086429595947,
-    0.012432311661541462,
-    0.003914268687367439,
-    0.004062777850776911,
-    0.03501980006694794,
-    0.03544411063194275,
-    -0.005498363170772791,
-    -0.009150973521173,
-    -0.005236704833805561,
-    0.05663137137889862,
-    0.006421239580959082,
-    0.02622241899371147,
-    0.021243836730718613,
-    0.04376060515642166,
-    -0.007446657866239548,
-    -0.014850884675979614,
-    -0.0038718378636986017,
-    -0.03261537104845047,
-    0.012587892822921276,
-    0.014921602793037891,
-    0.016406690701842308,
-    0.0304089542478323,
-    0.02869756706058979,
-    0.00022011132386978716,
-    0.000711162865627557,
-    -0.005395821295678616,
-    -0.003631394822150469,
-    0.00412996020168066,
-    0.017000727355480194,
-    -0.040705569088459015,
-    0.03699991852045059,
-    0.001484204432927072,
-    0.030550390481948853,
-    -0.018740402534604073,
-    -0.020946819335222244,
-    -0.005155378486961126,
-    0.025218216702342033,
-    -0.013535520061850548,
-    0.042091649025678635,
-    0.036717042326927185,
-    -0.059346962720155716,
-    -0.019461730495095253,
-    0.019193001091480255,
-    0.03538753464818001,
-    0.0008327102987095714,
-    0.00017668574582785368,
-    -0.008203345350921154,
-    -0.01239695306867361,
-    0.013542592525482178,
-    -0.011597833596169949,
-    0.023916995152831078,
-    0.022431908175349236,
-    -0.0005060792318545282,
-    -0.030210942029953003,
-    -0.01615210436284542,
-    0.018443383276462555,
-    0.026646729558706284,
-    0.024652468040585518,
-    -0.009914733469486237,
-    -0.020282065495848656,
-    0.0037869755178689957,
-    0.0026254241820424795,
-    -0.0028057564049959183,
-    0.027396345511078835,
-    -0.0168027151376009,
-    -0.018202941864728928,
-    0.028428835794329643,
-    0.025614239275455475,
-    -0.014391214586794376,
-    0.009391416795551777,
-    0.013394083827733994,
-    -0.002114483155310154,
-    -0.010975510813295841,
-    -0.04981410875916481,
-    0.03632102161645889,
-    0.010607774369418621,
-    -0.00448708888143301,
-    -0.011223025619983673,
-    -0.003642002586275339,
-    -0.015600500628352165,
-    -0.0018917197594419122,
-    -0.00968136265873909,
-    -0.004635597579181194,
-    -0.0010068545816466212,
-    -0.02613755688071251,
-    0.03586842119693756,
-    0.011470540426671505,
-    -0.010296612977981567,
-    0.027877232059836388,
-    0.03490665182471275,
-    0.0010501696961000562,
-    0.030946414917707443,
-    0.013111209496855736,
-    0.002948961453512311,
-    0.04475066438317299,
-    -0.0020048695150762796,
-    -0.02152671106159687,
-    0.029673481360077858,
-    0.04039440676569939,
-    -0.01859896443784237,
-    0.013959831558167934,
-    -0.05586761236190796,
-    -0.02719833515584469,
-    -0.010430978611111641,
-    -0.015218621119856834,
-    0.023931140080094337,
-    0.02045178972184658,
-    -0.01132203172892332,
-    0.013641598634421825,
-    -0.043194860219955444,
-    -0.016618847846984863,
-    0.014228561893105507,
-    -0.018174653872847557,
-    0.024525174871087074,
-    0.05453810468316078,
-    0.014193202368915081,
-    -0.016930008307099342,
-    -0.03702820464968681,
-    -0.021243836730718613,
-    -0.009745009243488312,
-    0.03377515450119972,
-    0.029956355690956116,
-    0.007103673182427883,
-    -0.007503232453018427,
-    -0.016576416790485382,
-    -0.07705487310886383,
-    -0.039234623312950134,
-    -0.017396749928593636,
-    -0.016901720315217972,
-    0.03541582450270653,
-    0.01967388577759266,
-    -0.010098601691424847,
-    0.0052119530737400055,
-    -0.0032495150808244944,
-    0.01965974271297455,
-    0.00619494030252099,
-    0.011675624176859856,
-    -0.021654004231095314,
-    0.024836337193846703,
-    -0.015642931684851646,
-    0.017057301476597786,
-    0.02548694610595703,
-    -0.011611977592110634,
-    0.023860421031713486,
-    -0.006187868770211935,
-    0.023888709023594856,
-    0.00807605218142271,
-    0.011590762063860893,
-    -0.005158914253115654,
-    -0.03114442713558674,
-    0.005777701269835234,
-    -0.02941889502108097,
-    0.01235452201217413,
-    0.01132203172892332,
-    0.01718459464609623,
-    -0.0005096151726320386,
-    0.002703214529901743,
-    -0.009971308521926403,
-    -0.039970096200704575,
-    0.015345914289355278,
-    0.016420835629105568,
-    0.04336458444595337,
-    -0.04743796959519386,
-    0.016378404572606087,
-    -0.005590297281742096,
-    0.022757211700081825,
-    0.02691546082496643,
-    -0.011364462785422802,
-    0.028839003294706345,
-    -0.019914329051971436,
-    -0.031653597950935364,
-    -0.04582558572292328,
-    0.0067748320288956165,
-    -0.018754545599222183,
-    -0.0036879696417599916,
-    -0.035302672535181046,
-    0.01271518599241972,
-    -0.015119615010917187,
-    0.0010280701098963618,
-    -0.0011774629820138216,
-    0.0023885173723101616,
-    0.033548854291439056,
-    -0.0005927094025537372,
-    -0.01610967330634594,
-    -0.031427301466464996,
-    -0.000723980600014329,
-    -0.01093307975679636,
-    -0.009059039875864983,
-    0.008309423923492432,
-    -0.018386809155344963,
-    -0.004773498512804508,
-    0.02692960388958454,
-    -0.011548331007361412,
-    -0.0035553723573684692,
-    0.02828739956021309,
-    0.010049098171293736,
-    -0.012121150270104408,
-    0.03332255780696869,
-    -0.021257979795336723,
-    -0.013012203387916088,
-    0.008309423923492432,
-    0.017311887815594673,
-    0.0034864218905568123,
-    0.007906327955424786,
-    0.0011297280434519053,
-    -0.004055705852806568,
-    0.03295481950044632,
-    -0.024185726419091225,
-    -0.003346752841025591,
-    0.004791178274899721,
-    -0.028230823576450348,
-    -0.0012402256252244115,
-    -0.020932674407958984,
-    -0.016024811193346977,
-    0.0014249776722863317,
-    0.01235452201217413,
-    -0.011258385144174099,
-    -0.0208195261657238,
-    -0.017000727355480194,
-    -0.00929241068661213,
-    -0.011668551713228226,
-    0.019787035882472992,
-    0.03012607991695404,
-    -0.020197203382849693,
-    0.027085185050964355,
-    -0.030918126925826073,
-    -0.004416370298713446,
-    -0.02370483987033367,
-    0.04723995551466942,
-    -0.027905520051717758,
-    -0.0006139249308034778,
-    0.0123474495485425,
-    -0.025175785645842552,
-    0.0007054170127958059,
-    0.009773296304047108,
-    0.008726662956178188,
-    -0.02797623723745346,
-    0.009575285017490387,
-    -0.04509011283516884,
-    -0.008507435210049152,
-    -0.007757819257676601,
-    -0.04376060515642166,
-    0.021625716239213943,
-    -0.04811686649918556,
-    -0.005689302925020456,
-    0.03971550986170769,
-    0.015473207458853722,
-    -0.021639861166477203,
-    -0.025670815259218216,
-    -0.004614382050931454,
-    -0.023817989975214005,
-    -0.038866885006427765,
-    0.02072051912546158,
-    -0.015048895962536335,
-    -0.01557221356779337,
-    0.010289541445672512,
-    -0.007425442337989807,
-    -0.013924472033977509,
-    0.01861310936510563,
-    0.01164026465266943,
-    0.00030342655372805893,
-    -0.02255920134484768,
-    -0.026462862268090248,
-    0.01964559778571129,
-    0.025020204484462738,
-    0.04059241712093353,
-    0.007623454090207815,
-    -0.011371534317731857,
-    -0.010883577167987823,
-    0.01164026465266943,
-    -0.009405559860169888,
-    -0.00617372477427125,
-    0.021597430109977722,
-    -0.038131412118673325,
-    -0.053915783762931824,
-    0.024694899097085,
-    0.010438050143420696,
-    0.009829871356487274,
-    0.007545663509517908,
-    0.0013374636182561517,
-    0.09685605764389038,
-    -3.2513933547306806e-05,
-    -0.028923865407705307,
-    0.02831568568944931,
-    0.017269456759095192,
-    -0.0033290733117610216,
-    -0.011633193120360374,
-    0.012432311661541462,
-    -0.03337913006544113,
-    -0.001014810404740274,
-    -0.03691505640745163,
-    0.0049078636802732944,
-    0.006622787099331617,
-    -0.02260163240134716,
-    -0.022743068635463715,
-    0.003953163977712393,
-    0.0002158019196940586,
-    -0.021059969440102577,
-    0.03233249858021736,
-    0.012750545516610146,
-    0.04743796959519386,
-    -0.03838600218296051,
-    0.008641800843179226,
-    0.03219106048345566,
-    0.02398771420121193,
-    -0.02328052930533886,
-    0.001267629093490541,
-    0.009122686460614204,
-    -0.011307887732982635,
-    0.029560331255197525,
-    -0.03558554872870445,
-    -0.010395619086921215,
-    0.013521376997232437,
-    0.01793421059846878,
-    0.0025582415983080864,
-    -0.006311625707894564,
-    -0.03759395331144333,
-    -0.009737936779856682,
-    0.012227227911353111,
-    -0.025571808218955994,
-    0.002540562069043517,
-    -0.03434090316295624,
-    -0.005088196136057377,
-    -0.04226137325167656,
-    -0.021300410851836205,
-    0.007927543483674526,
-    0.018881838768720627,
-    0.014249777421355247,
-    -0.019815323874354362,
-    -0.005367533769458532,
-    0.034878361970186234,
-    0.004239574074745178,
-    0.011951426044106483,
-    -0.011894850991666317,
-    0.01574193686246872,
-    -0.02941889502108097,
-    0.012906125746667385,
-    0.01006324216723442,
-    -0.0009193404694087803,
-    0.0033803442493081093,
-    -0.03255879506468773,
-    0.012821263633668423,
-    0.01557221356779337,
-    0.01558635663241148,
-    -0.010105673223733902,
-    0.009716721251606941,
-    -0.012856623157858849,
-    0.018146365880966187,
-    0.006965772248804569,
-    0.018881838768720627,
-    0.014051765203475952,
-    -0.006134829483926296,
-    0.03943263366818428,
-    0.015232764184474945,
-    -0.03951749578118324,
-    -0.03609472140669823,
-    -0.0016928240656852722,
-    -0.004094601143151522,
-    -0.010819930583238602,
-    -0.04195021465420723,
-    0.003244211198762059,
-    0.021399417892098427,
-    -0.020310351625084877,
-    -0.0038789096288383007,
-    -0.024878768250346184,
-    -0.0008123787702061236,
-    -0.018033217638731003,
-    0.03414288908243179,
-    0.010459265671670437,
-    0.014667016454041004,
-    0.019504161551594734,
-    -0.0023849813733249903,
-    -3.5331624530954286e-05,
-    -0.013676957227289677,
-    0.0038046552799642086,
-    -0.011710982769727707,
-    0.02615169994533062,
-    -0.01219186931848526,
-    -0.04873918741941452,
-    -0.010926008224487305,
-    -0.0027792369946837425,
-    0.010155175812542439,
-    0.026632586494088173,
-    0.028046956285834312,
-    -0.023535115644335747,
-    -0.004861896857619286,
-    -0.006873838137835264,
-    -0.030267516151070595,
-    0.028032813221216202,
-    0.025713246315717697,
-    -0.011831204406917095,
-    -0.015232764184474945,
-    0.021215548738837242,
-    -0.009384344331920147,
-    0.0024079647846519947,
-    -0.017113875597715378,
-    0.019277863204479218,
-    -0.04670249670743942,
-    -0.016746141016483307,
-    -0.009073182940483093,
-    0.010084457695484161,
-    -7.97240572865121e-05,
-    0.01750990003347397,
-    -0.03861229866743088,
-    0.023563403636217117,
-    -0.014426573179662228,
-    0.02039521560072899,
-    0.03383173048496246,
-    0.017297744750976562,
-    0.012771761044859886,
-    -0.012297946959733963,
-    0.02326638624072075,
-    -0.02656186744570732,
-    -0.001478016609326005,
-    0.00898832082748413,
-    0.004437585826963186,
-    -0.0276226457208395,
-    -0.03046552836894989,
-    0.00985815841704607,
-    -0.03329426795244217,
-    0.02219146490097046,
-    0.01383253838866949,
-    -0.014412430115044117,
-    -0.010756283067166805,
-    0.010628989897668362,
-    0.009943020530045033,
-    0.006113613955676556,
-    0.01717045158147812,
-    -0.01937686838209629,
-    0.022431908175349236,
-    -0.01615210436284542,
-    0.00898832082748413,
-    -0.020310351625084877,
-    0.005752949975430965,
-    -0.008436717092990875,
-    0.010155175812542439,
-    0.003840014338493347,
-    0.033860016614198685,
-    -0.01543077640235424,
-    -0.01024711038917303,
-    0.0027438777033239603,
-    0.007068313658237457,
-    -0.0030815585050731897,
-    -0.026264850050210953,
-    0.0005706098745577037,
-    -0.02615169994533062,
-    -0.014822596684098244,
-    -0.010883577167987823,
-    0.0036384668201208115,
-    -0.003056806977838278,
-    -0.015869230031967163,
-    -0.03762223944067955,
-    0.005802452564239502,
-    -0.047833990305662155,
-    0.0005233169067651033,
-    -0.018061503767967224,
-    -0.012121150270104408,
-    -0.009561141021549702,
-    -0.024581748992204666,
-    -0.010636062361299992,
-    -0.019108138978481293,
-    0.013917400501668453,
-    0.0032565868459641933,
-    0.020564939826726913,
-    -0.0009661914664320648,
-    -0.0026678552385419607,
-    -0.007807322312146425,
-    -0.018499959260225296,
-    0.017043158411979675,
-    -0.0006448642816394567,
-    -0.00545593211427331,
-    -0.022389477118849754,
-    0.012503030709922314,
-    -0.0013224359136074781,
-    -0.017722055315971375,
-    -0.008316495455801487,
-    -0.0176230501383543,
-    -0.03555725887417793,
-    0.008090196177363396,
-    0.004253717605024576,
-    -0.02011234126985073,
-    -0.03521781042218208,
-    0.005098803900182247,
-    -0.007920471951365471,
-    0.04664592072367668,
-    -0.01823122799396515,
-    0.010268325917422771,
-    0.047522831708192825,
-    0.02724076621234417,
-    0.03052210435271263,
-    -0.006817263085395098,
-    0.012679826468229294,
-    0.03838600218296051,
-    -0.02011234126985073,
-    -0.008196273818612099,
-    0.018019072711467743,
-    0.026293138042092323,
-    0.050719305872917175,
-    -0.00011558054393390194,
-    0.016378404572606087,
-    0.003832942573353648,
-    -0.05866806581616402,
-    0.0016777963610365987,
-    -0.036009859293699265,
-    0.00046585811651311815,
-    -0.021696435287594795,
-    0.0060570393688976765,
-    -0.027028609067201614,
-    -0.05552816390991211,
-    -0.01610967330634594,
-    -0.02584053948521614,
-    0.019433442503213882,
-    0.013556735590100288,
-    -0.022332901135087013,
-    0.010784571059048176,
-    -0.01825951598584652,
-    -0.0423179492354393,
-    -0.016364259645342827,
-    -0.022389477118849754,
-    0.025614239275455475,
-    -0.03275680914521217,
-    -0.01024711038917303,
-    0.02975834347307682,
-    -0.009391416795551777,
-    0.02224803902208805,
-    0.000853483856189996,
-    0.02405843324959278,
-    0.018132222816348076,
-    -0.04124302789568901,
-    -0.006626323331147432,
-    -0.03643416985869408,
-    0.02584053948521614,
-    -0.01394568756222725,
-    -0.0012808887986466289,
-    -0.05527357757091522,
-    0.007750747259706259,
-    -0.008160914294421673,
-    -0.022884506732225418,
-    -0.006322233472019434,
-    -0.021385272964835167,
-    -0.0013392315013334155,
-    0.03377515450119972,
-    0.002901226282119751,
-    -0.0009785671718418598,
-    0.028032813221216202,
-    0.02156914211809635,
-    0.00411935243755579,
-    -0.007991190068423748,
-    -0.020649801939725876,
-    -0.014186130836606026,
-    -0.0022364724427461624,
-    0.014836740680038929,
-    -0.03830114006996155,
-    0.018118079751729965,
-    -0.031681887805461884,
-    0.004815929569303989,
-    -0.004434049595147371,
-    0.019263718277215958,
-    0.03663218021392822,
-    -0.011081588454544544,
-    -0.011498827487230301,
-    0.014016406610608101,
-    0.024822192266583443,
-    -0.03538753464818001,
-    0.017014870420098305,
-    0.015473207458853722,
-    0.012453527189791203,
-    0.011491755954921246,
-    0.0219085905700922,
-    0.005045764613896608,
-    0.011654408648610115,
-    0.00475935498252511,
-    0.012778832577168941,
-    0.02507677860558033,
-    -0.009610643610358238,
-    0.01610967330634594,
-    -0.032813381403684616,
-    -0.02009819634258747,
-    0.05411379411816597,
-    0.0037692959886044264,
-    -0.016420835629105568,
-    0.010720924474298954,
-    0.012651539407670498,
-    0.018061503767967224,
-    0.0020190130453556776,
-    0.038584012538194656,
-    -0.013125353492796421,
-    0.009426775388419628,
-    0.0060393596068024635,
-    -0.004978582262992859,
-    0.009737936779856682,
-    0.01968802884221077,
-    -0.029928067699074745,
-    0.03159702569246292,
-    0.01022589486092329,
-    0.01218479685485363,
-    0.020564939826726913,
-    0.026703305542469025,
-    0.03417117893695831,
-    0.03552897274494171,
-    0.012198940850794315,
-    -0.01930614933371544,
-    0.0104097630828619,
-    -0.01399519108235836,
-    0.07982704043388367,
-    -0.00040773634100332856,
-    0.005176594015210867,
-    0.008733734488487244,
-    0.009844014421105385,
-    0.018188796937465668,
-    0.04158247634768486,
-    0.020593225955963135,
-    0.014553867280483246,
-    -0.01538834534585476,
-    0.017679624259471893,
-    0.03759395331144333,
-    -0.00787804089486599,
-    0.009200476109981537,
-    -0.011838276870548725,
-    -0.04701365903019905,
-    0.0012216620380058885,
-    0.017014870420098305,
-    0.012312090024352074,
-    0.014582154341042042,
-    0.0039284126833081245,
-    0.0037763677537441254,
-    0.030380666255950928,
-    -0.0008548098267056048,
-    0.00706477789208293,
-    -0.011421037837862968,
-    -0.03807483986020088,
-    0.00322829931974411,
-    -0.022672349587082863,
-    0.0063788085244596004,
-    0.017693767324090004,
-    -0.00090873270528391,
-    0.028768284246325493,
-    0.004815929569303989,
-    0.021809585392475128,
-    0.014525579288601875,
-    -0.016222823411226273,
-    -0.007460801396518946,
-    0.030267516151070595,
-    -0.026038551703095436,
-    0.040281254798173904,
-    0.02504849247634411,
-    -0.0019712781067937613,
-    -0.021059969440102577,
-    0.020678088068962097,
-    0.0006086210487410426,
-    -0.0038859813939779997,
-    0.020861957222223282,
-    -0.003468742361292243,
-    -0.012941485270857811,
-    -0.009433847852051258,
-    -0.04016810655593872,
-    -0.005714054685086012,
-    0.02544451504945755,
-    -0.0047699627466499805,
-    -0.0033874160144478083,
-    0.03049381636083126,
-    -0.02687302976846695,
-    0.017340175807476044,
-    0.028570273891091347,
-    0.0068809096701443195,
-    0.024100864306092262,
-    -0.040705569088459015,
-    -0.026986178010702133,
-    0.019122282043099403
-  ],
-  "Travel Essentials": [
-    0.007687792181968689,
-    0.013120105490088463,
-    -0.016112668439745903,
-    -0.007345047779381275,
-    -0.04180743917822838,
-    -0.05634274706244469,
-    0.004573609679937363,
-    0.039684634655714035,
-    0.00409819046035409,
-    0.02052043378353119,
-    0.0045072720386087894,
-    0.03263810649514198,
-    -0.02289384789764881,
-    -0.02668246254324913,
-    0.022657979279756546,
-    0.022731687873601913,
-    -0.03599921241402626,
-    0.014491083100438118,
-    0.00013520894572138786,
-    0.060205068439245224,
-    0.00532175088301301,
-    0.04166002199053764,
-    -0.008948206901550293,
-    -0.029807699844241142,
-    -0.013820336200296879,
-    0.031075485050678253,
-    0.018662981688976288,
-    0.04166002199053764,
-    0.008491214364767075,
-    -0.050180718302726746,
-    0.03711957857012749,
-    -0.04151260480284691,
-    0.049384668469429016,
-    -0.02591589465737343,
-    0.04416610673069954,
-    0.06291753798723221,
-    -0.0019201053073629737,
-    -0.015950510278344154,
-    -0.004931095987558365,
-    0.002163343131542206,
-    0.021861929446458817,
-    0.04071655124425888,
-    0.014188878238201141,
-    -0.020299309864640236,
-    -0.0007868377724662423,
-    0.017645804211497307,
-    -0.005248042289167643,
-    0.0019809147343039513,
-    -0.02963080070912838,
-    0.01934110000729561,
-    -0.001244751620106399,
-    -0.019061006605625153,
-    -0.01152800302952528,
-    -0.04127673804759979,
-    -0.018191248178482056,
-    -0.032048437744379044,
-    -0.052333004772663116,
-    -0.01627482660114765,
-    0.02049095183610916,
-    -0.009537874720990658,
-    0.00021663376537617296,
-    -0.024250082671642303,
-    0.0016888449899852276,
-    0.039389800280332565,
-    0.03431865945458412,
-    0.0012106613721698523,
-    0.007083382923156023,
-    0.04230865463614464,
-    -0.01359183993190527,
-    -0.006692728027701378,
-    0.0232623890042305,
-    0.004249292425811291,
-    -0.00684751570224762,
-    -0.050387103110551834,
-    0.007709904573857784,
-    0.008977689780294895,
-    -0.020461468026041985,
-    -0.011004672385752201,
-    0.017468905076384544,
-    -0.05324698984622955,
-    -0.04065758362412453,
-    -0.019532741978764534,
-    -0.008233235217630863,
-    0.005959328729659319,
-    -0.03933083266019821,
-    -0.017011912539601326,
-    -0.06362514197826385,
-    -0.06368410587310791,
-    -0.013945640064775944,
-    0.02638762816786766,
-    0.016599144786596298,
-    -0.03797459602355957,
-    -0.00484633119776845,
-    0.011668048799037933,
-    0.0018003290751948953,
-    0.04201382026076317,
-    0.04398920759558678,
-    0.02498716674745083,
-    -0.03756183013319969,
-    0.031252387911081314,
-    -0.003359263064339757,
-    -0.07942823320627213,
-    -0.06610174477100372,
-    0.0052664694376289845,
-    0.056755512952804565,
-    -0.011424810625612736,
-    -0.017734255641698837,
-    -0.01593576930463314,
-    -0.041158802807331085,
-    0.004219809081405401,
-    -0.07211635261774063,
-    -0.013613952323794365,
-    0.04059861972928047,
-    0.04726186394691467,
-    -0.01976860873401165,
-    0.01745416224002838,
-    0.021434418857097626,
-    -0.06014610081911087,
-    -0.012722079642117023,
-    -0.020579401403665543,
-    -0.003939717076718807,
-    0.02044672705233097,
-    0.013024284504354,
-    -0.062150970101356506,
-    -0.04133570194244385,
-    -0.045669760555028915,
-    -0.04561079293489456,
-    0.001556169823743403,
-    -0.0160537026822567,
-    -0.06704521179199219,
-    0.0288347490131855,
-    -0.03540954366326332,
-    0.07418019324541092,
-    -0.020476208999753,
-    -0.0089555773884058,
-    -0.007105495315045118,
-    -0.005469167605042458,
-    -0.036264561116695404,
-    -0.01648121140897274,
-    0.0002952945069409907,
-    -0.008498584851622581,
-    -0.00851332675665617,
-    0.024795524775981903,
-    -0.008380651473999023,
-    0.017807964235544205,
-    0.00048325108946301043,
-    -0.02162606082856655,
-    0.05162540450692177,
-    0.036353010684251785,
-    0.0033518921118229628,
-    -0.031046003103256226,
-    0.021183811128139496,
-    0.01564093492925167,
-    -0.008970319293439388,
-    0.016790786758065224,
-    -0.025473643094301224,
-    -0.028259823098778725,
-    0.004426192957907915,
-    0.006773807108402252,
-    -0.015213425271213055,
-    -0.01707087829709053,
-    -0.012766305357217789,
-    -0.061561305075883865,
-    0.007411385420709848,
-    0.027404803782701492,
-    -0.0358223095536232,
-    -0.02870207279920578,
-    -0.029262257739901543,
-    -0.0587603822350502,
-    -0.0321074053645134,
-    0.00026834485470317304,
-    -0.07824889570474625,
-    0.0051374793983995914,
-    0.017719512805342674,
-    0.011107864789664745,
-    -0.03647094592452049,
-    0.021021652966737747,
-    0.04045120254158974,
-    -0.031340837478637695,
-    0.015036525204777718,
-    0.01057716365903616,
-    -0.016761302947998047,
-    -0.02044672705233097,
-    -0.018397631123661995,
-    -0.025060875341296196,
-    0.0005541954888030887,
-    -0.01146166492253542,
-    -0.01854504831135273,
-    -0.027286870405077934,
-    -0.03711957857012749,
-    -0.040274299681186676,
-    0.0013903258368372917,
-    -0.021257519721984863,
-    0.0073782168328762054,
-    -0.004525699187070131,
-    0.019901283085346222,
-    -0.03405330702662468,
-    -0.009884304367005825,
-    -0.007813096977770329,
-    0.010820401832461357,
-    -0.017807964235544205,
-    -0.010547680780291557,
-    0.03523264452815056,
-    0.005240671336650848,
-    -0.04345850646495819,
-    0.007650937885046005,
-    -0.015699900686740875,
-    0.04690806195139885,
-    0.02208305336534977,
-    0.001512866117991507,
-    0.07777716219425201,
-    -0.005200131796300411,
-    -0.03148825466632843,
-    0.0031141822692006826,
-    -0.03225482255220413,
-    0.055782560259103775,
-    0.015832576900720596,
-    0.028937941417098045,
-    -0.028569398447871208,
-    0.05681448057293892,
-    -0.020328791812062263,
-    0.009486278519034386,
-    0.044284041970968246,
-    -0.023232905194163322,
-    0.01024547591805458,
-    -0.006265218835324049,
-    0.008107930421829224,
-    -0.05380717292428017,
-    -0.0001801250473363325,
-    -0.04829378053545952,
-    -0.007267653942108154,
-    0.028186114504933357,
-    -0.05805278196930885,
-    -0.0056313262321054935,
-    -0.02081526815891266,
-    0.03275603801012039,
-    0.019827574491500854,
-    -0.0028396183624863625,
-    -0.024751299992203712,
-    0.016746561974287033,
-    -0.0058266534470021725,
-    0.025046134367585182,
-    -0.03720802813768387,
-    0.018780915066599846,
-    0.029527608305215836,
-    -0.032136887311935425,
-    -0.009427311830222607,
-    -0.02887897379696369,
-    -0.01268522534519434,
-    0.012788417749106884,
-    0.023468773812055588,
-    0.009869562461972237,
-    0.0491487979888916,
-    -0.011270022951066494,
-    0.07494676113128662,
-    0.011594340205192566,
-    -0.009545245207846165,
-    0.00011453603656264022,
-    0.014011978171765804,
-    0.023026522248983383,
-    0.011704903095960617,
-    -0.023542480543255806,
-    0.014896479435265064,
-    -0.013053768314421177,
-    -0.030987035483121872,
-    0.009272524155676365,
-    -0.04522750899195671,
-    0.000829680822789669,
-    0.011653306894004345,
-    -0.006921224296092987,
-    -0.016584403812885284,
-    -0.011962883174419403,
-    0.01761632226407528,
-    -0.007879434153437614,
-    -0.062445804476737976,
-    -0.035556960850954056,
-    -0.014004606753587723,
-    -0.021847186610102654,
-    0.009788483381271362,
-    0.0775412991642952,
-    -0.04475577548146248,
-    -0.012478841468691826,
-    0.01673181913793087,
-    -0.05501599237322807,
-    0.016805527731776237,
-    -0.010724580846726894,
-    0.052539389580488205,
-    0.005539190489798784,
-    -0.03838736563920975,
-    0.038298916071653366,
-    0.018102796748280525,
-    0.00016469233378302306,
-    0.01804383099079132,
-    -0.044785257428884506,
-    0.00596301443874836,
-    -0.014188878238201141,
-    -0.06775281578302383,
-    -0.03316880762577057,
-    0.025149326771497726,
-    -0.018368147313594818,
-    -0.016849754378199577,
-    0.0454338937997818,
-    0.03552747517824173,
-    0.028230339288711548,
-    -0.011594340205192566,
-    0.02575373463332653,
-    -0.009360973723232746,
-    -0.04080500081181526,
-    -0.0038217834662646055,
-    0.053423888981342316,
-    -0.020623626187443733,
-    -0.022834880277514458,
-    0.02065310999751091,
-    -0.05301112309098244,
-    -0.024766040965914726,
-    -0.04451990872621536,
-    -0.07653886079788208,
-    -0.020122408866882324,
-    0.006689042784273624,
-    -0.04661322757601738,
-    0.01926739141345024,
-    -0.0027308983262628317,
-    0.036353010684251785,
-    0.03467245772480965,
-    0.02963080070912838,
-    -0.016171636059880257,
-    0.012405133806169033,
-    0.015626193955540657,
-    -0.054102007299661636,
-    -0.03425969183444977,
-    -0.020092925056815147,
-    0.006327871233224869,
-    0.012486212886869907,
-    -0.002561368979513645,
-    -0.027449030429124832,
-    -0.01163119450211525,
-    0.005421257112175226,
-    -0.010982559993863106,
-    -0.009744258597493172,
-    0.030117275193333626,
-    0.00027203027275390923,
-    -0.0344071090221405,
-    -0.0023899967782199383,
-    -0.003202632535248995,
-    -0.016908720135688782,
-    0.003331622341647744,
-    0.01951799914240837,
-    0.036559395492076874,
-    0.01064350176602602,
-    0.06303547322750092,
-    -0.02478078380227089,
-    0.009582099504768848,
-    -0.029822442680597305,
-    0.032726556062698364,
-    -0.059025734663009644,
-    -0.02267272211611271,
-    0.012567291967570782,
-    0.01845659874379635,
-    0.022731687873601913,
-    0.010672984644770622,
-    0.0037849294021725655,
-    -0.027847055345773697,
-    0.014085686765611172,
-    0.028009213507175446,
-    0.008778677321970463,
-    0.044107142835855484,
-    -0.012928463518619537,
-    0.010385521687567234,
-    0.00328739732503891,
-    -0.0066485027782619,
-    0.026962554082274437,
-    0.006139914505183697,
-    0.036529913544654846,
-    -0.006427377462387085,
-    -0.01108575239777565,
-    -0.01693820394575596,
-    0.017247779294848442,
-    0.05103573575615883,
-    0.03039736859500408,
-    0.01230931282043457,
-    0.009950641542673111,
-    -0.02625495195388794,
-    0.0060404082760214806,
-    -0.019282132387161255,
-    0.04083448648452759,
-    0.020373018458485603,
-    -0.015331359580159187,
-    -0.02056466042995453,
-    -0.004820533096790314,
-    -0.012036590836942196,
-    0.00012968081864528358,
-    0.009442053735256195,
-    -0.02448594942688942,
-    0.03632352873682976,
-    0.01951799914240837,
-    0.031458768993616104,
-    0.03308035433292389,
-    0.08974742144346237,
-    -0.008189009502530098,
-    -0.05495702475309372,
-    0.02355722337961197,
-    -0.010658242739737034,
-    -0.030957551673054695,
-    -0.005417571868747473,
-    0.018323922529816628,
-    0.014483711682260036,
-    0.008233235217630863,
-    -0.021213294938206673,
-    -0.004393023904412985,
-    -0.011542744934558868,
-    -0.009206186048686504,
-    -0.03081013634800911,
-    0.04112932085990906,
-    0.004595722537487745,
-    -0.01306850928813219,
-    0.00037061533657833934,
-    0.024500692263245583,
-    -0.013105363585054874,
-    0.0009181309724226594,
-    -0.07152668386697769,
-    0.021021652966737747,
-    0.04310470446944237,
-    -0.056961897760629654,
-    0.007849950343370438,
-    -0.05368924140930176,
-    -0.04080500081181526,
-    0.024250082671642303,
-    -0.034878842532634735,
-    -0.011837578378617764,
-    -0.030987035483121872,
-    -0.02840724028646946,
-    -0.0344071090221405,
-    0.034584008157253265,
-    0.08084343373775482,
-    -0.0221715047955513,
-    -0.022053571417927742,
-    -0.023277131840586662,
-    0.012228232808411121,
-    0.019871801137924194,
-    0.02094794437289238,
-    0.0028838433790951967,
-    -0.01752787083387375,
-    -0.002120960969477892,
-    0.02292332984507084,
-    -0.034495558589696884,
-    -0.029350707307457924,
-    0.003331622341647744,
-    0.0160537026822567,
-    -0.014439486898481846,
-    -0.053925108164548874,
-    -0.009685290977358818,
-    -0.019665416330099106,
-    -0.06044093519449234,
-    -0.019709641113877296,
-    -0.035674892365932465,
-    0.005756630562245846,
-    0.008845014497637749,
-    -0.031458768993616104,
-    0.01845659874379635,
-    -0.004157157149165869,
-    0.041836921125650406,
-    0.010459230281412601,
-    -0.007193945348262787,
-    -0.0011470878962427378,
-    0.04251503944396973,
-    0.03461349010467529,
-    -0.016658112406730652,
-    -0.026535045355558395,
-    0.011373215354979038,
-    -0.02482500858604908,
-    0.0038438960909843445,
-    0.019576966762542725,
-    0.0004731161752715707,
-    0.011056268587708473,
-    0.01441737450659275,
-    -0.024972425773739815,
-    -0.03700164705514908,
-    0.01129950676113367,
-    -0.03137031942605972,
-    0.04051017016172409,
-    -0.0038512670435011387,
-    0.036942679435014725,
-    -0.069462850689888,
-    -0.050681937485933304,
-    -0.03101651929318905,
-    0.016658112406730652,
-    0.00454044109210372,
-    0.04404817521572113,
-    -0.022790655493736267,
-    -0.02739006280899048,
-    -0.005174333695322275,
-    0.012825272046029568,
-    -0.05192023888230324,
-    -0.017925897613167763,
-    0.003265284700319171,
-    -0.03676578029990196,
-    -0.028820006176829338,
-    0.026151761412620544,
-    0.025473643094301224,
-    0.03405330702662468,
-    0.02650556154549122,
-    -0.06380204111337662,
-    -0.01981283351778984,
-    0.0665145143866539,
-    0.03278552368283272,
-    -0.008704968728125095,
-    0.01879565604031086,
-    0.0158915426582098,
-    0.004643633030354977,
-    -0.019871801137924194,
-    -0.039684634655714035,
-    0.0028930569533258677,
-    -0.009626324288547039,
-    -0.010120171122252941,
-    -0.008012109436094761,
-    -0.0013543929671868682,
-    0.007989997044205666,
-    0.05867193266749382,
-    -0.03131135180592537,
-    0.010871997103095055,
-    -0.006346298381686211,
-    0.010267588309943676,
-    0.04416610673069954,
-    -0.023630931973457336,
-    0.008093188516795635,
-    -0.028038697317242622,
-    0.0007988153956830502,
-    -0.048912931233644485,
-    -0.01656966097652912,
-    -0.032431721687316895,
-    -0.02824508026242256,
-    0.009744258597493172,
-    -0.06958078593015671,
-    -0.018721947446465492,
-    0.010193879716098309,
-    -0.004680486861616373,
-    0.030839618295431137,
-    -0.02212727814912796,
-    0.00796788465231657,
-    0.00532175088301301,
-    0.020918460562825203,
-    0.044401973485946655,
-    -0.017984863370656967,
-    -0.044018689543008804,
-    -0.0019827575888484716,
-    -0.017837446182966232,
-    0.0057345181703567505,
-    -0.005690292920917273,
-    -0.005782428663223982,
-    -0.010466600768268108,
-    -0.03110496886074543,
-    0.005867193453013897,
-    0.008144784718751907,
-    0.020387759432196617,
-    0.041070353239774704,
-    0.003873379435390234,
-    0.00467680161818862,
-    0.016835011541843414,
-    0.0033205661457031965,
-    0.010938335210084915,
-    0.007547745946794748,
-    -0.009714774787425995,
-    0.029940376058220863,
-    0.01693820394575596,
-    0.017350971698760986,
-    0.03903599828481674,
-    -0.0037628167774528265,
-    -0.003565646708011627,
-    -0.004960579331964254,
-    -0.058937281370162964,
-    -0.014874367043375969,
-    -0.012707337737083435,
-    0.009383087046444416,
-    0.008299572393298149,
-    0.038033563643693924,
-    0.01963593252003193,
-    0.04923725128173828,
-    -0.019061006605625153,
-    -0.01879565604031086,
-    0.0627996027469635,
-    0.005542876198887825,
-    0.058141231536865234,
-    -0.03823994845151901,
-    0.017896413803100586,
-    -0.0336405411362648,
-    -0.013953011482954025,
-    0.01458690408617258,
-    -0.0344071090221405,
-    0.024500692263245583,
-    -0.022952813655138016,
-    0.01947377435863018,
-    0.0012290885206311941,
-    -0.00127239222638309,
-    -0.002401052974164486,
-    -0.0017330701230093837,
-    0.03372899070382118,
-    -0.04310470446944237,
-    0.021861929446458817,
-    -0.024412240833044052,
-    -0.00718657486140728,
-    0.004853702150285244,
-    -0.008255347609519958,
-    0.002401052974164486,
-    0.007518262602388859,
-    -0.01707087829709053,
-    0.01723303832113743,
-    -0.009648436680436134,
-    -0.011719645000994205,
-    -0.018176505342125893,
-    0.00728976633399725,
-    0.007046528626233339,
-    -0.019842317327857018,
-    -0.0053512342274188995,
-    -0.03207791969180107,
-    -0.019503258168697357,
-    0.0030828563030809164,
-    -0.03296242281794548,
-    -0.01219874992966652,
-    -0.005800855811685324,
-    -0.018309181556105614,
-    -0.0034034880809485912,
-    0.021861929446458817,
-    -0.010215992107987404,
-    -0.004009739961475134,
-    -0.020594142377376556,
-    0.05749259889125824,
-    0.0035251069348305464,
-    -0.04681961238384247,
-    -0.010437117889523506,
-    -0.02233366295695305,
-    0.0052222441881895065,
-    0.04740928113460541,
-    0.023675156757235527,
-    0.007035472430288792,
-    -0.044578876346349716,
-    0.038800131529569626,
-    -0.009515762329101562,
-    0.02321816422045231,
-    -0.007241855841130018,
-    -0.004787364508956671,
-    0.02815663069486618,
-    -0.012213491834700108,
-    0.02890845760703087,
-    -0.012147153727710247,
-    0.020888976752758026,
-    0.0454338937997818,
-    -0.007547745946794748,
-    0.03591075912117958,
-    -0.00470997067168355,
-    0.00037568280822597444,
-    -0.016510695219039917,
-    -0.015287133865058422,
-    0.04590562731027603,
-    -0.01424784492701292,
-    0.03650042787194252,
-    0.040863968431949615,
-    0.019002040848135948,
-    -0.005830339156091213,
-    0.0017920369282364845,
-    0.011034156195819378,
-    -0.013879302889108658,
-    -0.022746430709958076,
-    -0.024692334234714508,
-    -0.009943271055817604,
-    -0.008505956269800663,
-    0.01135847344994545,
-    0.031635671854019165,
-    0.02709522843360901,
-    -0.016997169703245163,
-    0.004573609679937363,
-    -0.029616057872772217,
-    -0.005660809576511383,
-    0.009670550003647804,
-    0.009530503302812576,
-    0.017262520268559456,
-    -0.012464100494980812,
-    0.033021390438079834,
-    -0.004094504751265049,
-    0.026033828034996986,
-    0.012161895632743835,
-    0.009545245207846165,
-    -0.007989997044205666,
-    -0.029601316899061203,
-    0.04142415151000023,
-    -0.000539453758392483,
-    -0.017262520268559456,
-    0.02040250040590763,
-    -0.00515222130343318,
-    0.014196248725056648,
-    0.018397631123661995,
-    -0.0015202369540929794,
-    -0.022186245769262314,
-    0.040067918598651886,
-    -0.0009674234897829592,
-    0.011992366053164005,
-    0.015007042326033115,
-    0.029026390984654427,
-    -0.007098124362528324,
-    0.006928595248609781,
-    -0.10737848281860352,
-    -0.0011157618137076497,
-    0.02251056395471096,
-    -0.012007107958197594,
-    -0.04236762225627899,
-    -0.03729648143053055,
-    -0.026579270139336586,
-    -0.03476090729236603,
-    -0.029453899711370468,
-    0.05112418532371521,
-    -0.00040562686626799405,
-    -0.023955248296260834,
-    0.0023402434308081865,
-    -0.038033563643693924,
-    0.010068574920296669,
-    -0.01230931282043457,
-    -0.033021390438079834,
-    0.02305600605905056,
-    0.03924238309264183,
-    0.015043896622955799,
-    -0.003103126073256135,
-    -0.021611319854855537,
-    0.03523264452815056,
-    0.008152155205607414,
-    0.011557485908269882,
-    -0.036559395492076874,
-    0.0005334649467840791,
-    0.029350707307457924,
-    -0.028259823098778725,
-    -0.006349983625113964,
-    0.005262783728539944,
-    0.03275603801012039,
-    0.005295952782034874,
-    0.001774531090632081,
-    -0.003268970176577568,
-    0.01618637703359127,
-    0.006773807108402252,
-    -0.06108957156538963,
-    0.0179111547768116,
-    -0.005200131796300411,
-    -0.006401579361408949,
-    0.018780915066599846,
-    -0.02044672705233097,
-    0.011424810625612736,
-    -0.010333925485610962,
-    -0.003563803853467107,
-    0.009832708165049553,
-    0.004949523136019707,
-    0.002629549242556095,
-    -0.03355209156870842,
-    0.005937216337770224,
-    -0.04059861972928047,
-    0.014822770841419697,
-    -0.01068035513162613,
-    -0.012987430207431316,
-    0.004850016441196203,
-    -0.05053452029824257,
-    -0.022702205926179886,
-    0.008373280987143517,
-    0.0018943073228001595,
-    0.013348601758480072,
-    0.017763737589120865,
-    0.03237275406718254,
-    -0.007525633554905653,
-    0.03260862082242966,
-    -0.0050011188723146915,
-    -0.008719710633158684,
-    -0.044107142835855484,
-    0.0013857190497219563,
-    -0.04817584902048111,
-    0.009486278519034386,
-    0.028554657474160194,
-    0.008859756402671337,
-    0.006814347114413977,
-    -0.027832314372062683,
-    -0.003921289928257465,
-    0.01816176436841488,
-    -0.060381967574357986,
-    -0.023955248296260834,
-    -0.04339953884482384,
-    -0.024721816182136536,
-    0.026033828034996986,
-    -0.010016979649662971,
-    -0.03299190476536751,
-    -0.0003365251759532839,
-    -0.014513195492327213,
-    -0.013871931470930576,
-    -0.013790852390229702,
-    0.03260862082242966,
-    0.02144916169345379,
-    0.0005850608577020466,
-    -0.0201518926769495,
-    -0.04855913296341896,
-    0.006718526128679514,
-    -0.0328739732503891,
-    0.0199307668954134,
-    -0.008550181053578854,
-    -0.00802685134112835,
-    -0.028510430827736855,
-    0.024648107588291168,
-    0.0030957551207393408,
-    -0.011166831478476524,
-    0.007591971196234226,
-    0.0037038500886410475,
-    -0.023085489869117737,
-    0.019753865897655487,
-    0.0005343863158486784,
-    -0.033817440271377563,
-    -0.025974860414862633,
-    -0.04413662478327751,
-    -0.015228167176246643,
-    -0.006464231759309769,
-    0.05380717292428017,
-    -0.02500190958380699,
-    0.04112932085990906,
-    0.034200724214315414,
-    -0.007286081090569496,
-    -0.042426589876413345,
-    0.01897255703806877,
-    0.013370714150369167,
-    0.004275090526789427,
-    0.04472629353404045,
-    -0.06132543832063675,
-    -0.0025318856351077557,
-    0.023616189137101173,
-    -0.0029114841017872095,
-    -0.014513195492327213,
-    -0.03139980137348175,
-    0.013989865779876709,
-    0.013112735003232956,
-    -0.017365712672472,
-    0.01795537956058979,
-    0.017631063237786293,
-    0.027537479996681213,
-    0.007908917963504791,
-    0.04531595855951309,
-    0.0024876603856682777,
-    0.005646067671477795,
-    0.022348403930664062,
-    0.015449292957782745,
-    0.017940638586878777,
-    0.004802105948328972,
-    -0.00978111196309328,
-    -0.008815531618893147,
-    -0.03785666450858116,
-    0.015183942392468452,
-    -0.013481277041137218,
-    0.002653504488989711,
-    0.0002992102818097919,
-    -0.030249951407313347,
-    -0.010466600768268108,
-    -0.022024087607860565,
-    -0.02251056395471096,
-    -0.0004731161752715707,
-    0.014174136333167553,
-    0.006659558974206448,
-    0.02562106028199196,
-    0.003471668343991041,
-    0.0035287924110889435,
-    -0.030544785782694817,
-    0.00014442250540014356,
-    -0.007687792181968689,
-    0.010886739008128643,
-    0.04446094110608101,
-    -0.011218427680432796,
-    -0.029601316899061203,
-    0.011727015487849712,
-    0.030249951407313347,
-    0.004297202918678522,
-    -0.004463047254830599,
-    -0.005867193453013897,
-    -0.025945376604795456,
-    0.0015294505283236504,
-    0.029557092115283012,
-    -0.02149338647723198,
-    -0.0006882527377456427,
-    -0.04021533578634262,
-    0.005214873235672712,
-    0.003399802604690194,
-    -0.012729451060295105,
-    -0.0049753207713365555,
-    0.03697216138243675,
-    0.02398473210632801,
-    0.025105100125074387,
-    -0.0033666337840259075,
-    -0.0010558736976236105,
-    -0.027301613241434097,
-    -0.044107142835855484,
-    0.0835559070110321,
-    0.022481080144643784,
-    0.0026700887829065323,
-    -0.011321619153022766,
-    -0.006338927429169416,
-    0.004691543523222208,
-    0.0252820011228323,
-    -0.00891135260462761,
-    -0.0049163540825247765,
-    -0.0005813754396513104,
-    0.05121263489127159,
-    0.004164528101682663,
-    0.016510695219039917,
-    -0.03558644279837608,
-    -0.012213491834700108,
-    0.03682474419474602,
-    0.017365712672472,
-    -0.029144324362277985,
-    -0.0019717011600732803,
-    0.027670154348015785,
-    -0.0160537026822567,
-    -0.004956893622875214,
-    0.03490832448005676,
-    0.008034221827983856,
-    -0.04003843292593956,
-    -0.041158802807331085,
-    0.014940704219043255,
-    0.07052425295114517,
-    0.023999473080039024,
-    -0.022392628714442253,
-    0.024751299992203712,
-    0.04148311913013458,
-    -0.027640672400593758,
-    -0.001896150060929358,
-    -0.0008213886176235974,
-    0.006187824998050928,
-    -0.0068217176012694836,
-    0.029232773929834366,
-    -0.01369503140449524,
-    -0.027507996186614037,
-    0.02845146507024765,
-    0.02335083857178688,
-    -0.023409806191921234,
-    -0.016952944919466972,
-    -0.007238170597702265,
-    -0.008439618162810802,
-    -0.001752418582327664,
-    0.05684396252036095,
-    -0.009324120357632637,
-    0.03296242281794548,
-    -0.003969200421124697,
-    0.015169200487434864,
-    -0.01727726310491562,
-    -0.049502599984407425,
-    0.002732741180807352,
-    -0.026652978733181953,
-    0.006486344151198864,
-    0.010083316825330257,
-    -0.0188398826867342,
-    -0.023925766348838806,
-    0.04796946421265602,
-    0.004577295389026403,
-    -0.01897255703806877,
-    0.0012521224562078714,
-    -0.026667719706892967,
-    -0.017350971698760986,
-    -0.009559987112879753,
-    -0.013525501824915409,
-    0.004673116374760866,
-    -0.023380322381854057,
-    -0.010282330214977264,
-    0.012699967250227928,
-    -0.021021652966737747,
-    -0.015817835927009583,
-    0.028716815635561943,
-    0.00668167183175683,
-    -0.04555182531476021,
-    0.04755669832229614,
-    0.081256203353405,
-    -0.04552234336733818,
-    0.015567226335406303,
-    0.015272392891347408,
-    -0.008358539082109928,
-    -0.020918460562825203,
-    -0.02625495195388794,
-    0.016952944919466972,
-    0.019665416330099106,
-    0.02081526815891266,
-    0.015994735062122345,
-    -0.0036246133968234062,
-    0.004348799120634794,
-    0.044195592403411865,
-    -0.01897255703806877,
-    0.018353406339883804,
-    0.05044606700539589,
-    0.02917380817234516,
-    0.0395372174680233,
-    -0.01829443871974945,
-    0.040067918598651886,
-    0.028731556609272957,
-    0.035674892365932465,
-    -0.030028825625777245,
-    -0.017483646050095558,
-    0.06120750308036804,
-    0.001110233599320054,
-    -0.0028230338357388973,
-    0.005030602216720581,
-    -0.03835787996649742,
-    0.04092293605208397,
-    0.021861929446458817,
-    0.07323672622442245,
-    0.005181704647839069,
-    0.01580309309065342,
-    -0.02187667042016983,
-    -0.0010577163193374872,
-    0.019061006605625153,
-    0.008247976191341877,
-    -0.033611055463552475,
-    0.029955117031931877,
-    0.025311484932899475,
-    0.012670484371483326,
-    -0.0199307668954134,
-    0.007746758870780468,
-    0.01976860873401165,
-    0.010842514224350452,
-    0.031163936480879784,
-    -0.033316224813461304,
-    -0.007072326727211475,
-    -0.023571964353322983,
-    0.021228035911917686,
-    -3.3283977245446295e-05,
-    0.014225732535123825,
-    0.02756696380674839,
-    -0.0002471536863595247,
-    0.015419809147715569,
-    -0.013540243729948997,
-    0.0033131951931864023,
-    -0.0005795327597297728,
-    0.003936031833291054,
-    0.027404803782701492,
-    0.009331490844488144,
-    0.024382757022976875,
-    0.004577295389026403,
-    0.02820085547864437,
-    0.004463047254830599,
-    -0.012471470981836319,
-    0.0398615337908268,
-    0.01951799914240837,
-    0.024810267612338066,
-    0.005314379930496216,
-    -0.03738493099808693,
-    -0.01351075991988182,
-    0.02280539646744728,
-    0.0017920369282364845,
-    -0.005745574366301298,
-    -0.008262718096375465,
-    0.035763341933488846,
-    -0.03484936058521271,
-    0.01519868429750204,
-    0.03912444785237312,
-    0.026918329298496246,
-    0.03275603801012039,
-    0.014174136333167553,
-    -0.012972688302397728,
-    -0.027979731559753418,
-    -0.025267260149121284,
-    0.00013682132703252137,
-    0.002828562166541815,
-    -0.03042685054242611,
-    0.0020638369023799896,
-    0.015073379501700401,
-    -0.04796946421265602,
-    -0.005867193453013897,
-    -0.033994339406490326,
-    -0.005922474432736635,
-    0.0017146429745480418,
-    -0.024707075208425522,
-    0.01779322139918804,
-    -0.031340837478637695,
-    -0.008314314298331738,
-    0.007562487851828337,
-    0.0017699243035167456,
-    0.018648240715265274,
-    0.010525567457079887,
-    0.01761632226407528,
-    0.011734386906027794,
-    0.0008177031995728612,
-    -0.01630431041121483,
-    -0.016805527731776237,
-    -0.007271339185535908,
-    -0.004621520172804594,
-    -0.010466600768268108,
-    0.03670681267976761,
-    -0.02423534169793129,
-    0.04614149406552315,
-    -0.00828483048826456,
-    -0.013650806620717049,
-    -0.038210462778806686,
-    -0.008763935416936874,
-    -0.0073782168328762054,
-    -0.009456794708967209,
-    -0.010098058730363846,
-    0.006372096017003059,
-    -0.04210226982831955,
-    0.007827837951481342,
-    -0.021979862824082375,
-    0.012972688302397728,
-    0.022348403930664062,
-    0.0206973347812891,
-    -0.00583770964294672,
-    0.018869364634156227,
-    0.03316880762577057,
-    -0.00916933175176382,
-    0.03862323239445686,
-    0.017011912539601326,
-    0.0010715366806834936,
-    -0.026328660547733307,
-    0.012419874779880047,
-    -0.005413886159658432,
-    -0.00562764098867774,
-    0.001986442832276225,
-    -0.020092925056815147,
-    0.009744258597493172,
-    0.014933333732187748,
-    0.01414465345442295,
-    -0.021095361560583115,
-    0.0007333991816267371,
-    -0.0055023361928761005,
-    -0.030338400974869728,
-    0.01219874992966652,
-    -0.004558868240565062,
-    -0.003895492060109973,
-    -0.009184073656797409,
-    0.004046594258397818,
-    -0.010569793172180653,
-    -0.0005399144720286131,
-    -0.009220927953720093,
-    -0.018220730125904083,
-    0.02933596633374691,
-    -0.04089345410466194,
-    0.035851795226335526,
-    0.006021981127560139,
-    0.003193418961018324,
-    0.009139848873019218,
-    0.008388022892177105,
-    -0.007754129823297262,
-    -0.013186442665755749,
-    -0.01888410747051239,
-    0.005992497783154249,
-    0.002653504488989711,
-    -0.03190102055668831,
-    -0.01963593252003193,
-    0.02262849733233452,
-    0.022997038438916206,
-    -0.016658112406730652,
-    0.00573083246126771,
-    -0.030146759003400803,
-    -0.018220730125904083,
-    -0.034790392965078354,
-    0.009368345141410828,
-    0.09859243035316467,
-    -0.008130042813718319,
-    -0.039596185088157654,
-    0.041748471558094025,
-    0.0052222441881895065,
-    -0.025576835498213768,
-    0.003090227022767067,
-    0.0001744817418511957,
-    0.03481987491250038,
-    0.04454939067363739,
-    -0.016127411276102066,
-    0.03641197830438614,
-    0.010739322751760483,
-    -0.03823994845151901,
-    0.007709904573857784,
-    -0.014970188029110432,
-    0.001231852569617331,
-    -0.016613885760307312,
-    0.0031473510898649693,
-    -0.003193418961018324,
-    0.03936031833291054,
-    -0.02212727814912796,
-    -0.013613952323794365,
-    0.009279894642531872,
-    0.03490832448005676,
-    -0.011771240271627903,
-    -0.011881803162395954,
-    -0.024559658020734787,
-    -0.01825021393597126,
-    0.022348403930664062,
-    0.012736821547150612,
-    -0.005052714608609676,
-    -0.026107536628842354,
-    -0.027242645621299744,
-    0.035380057990550995,
-    -0.0017975650262087584,
-    -0.00041092466562986374,
-    -0.0069838762283325195,
-    0.004219809081405401,
-    0.027006778866052628,
-    0.027964988723397255,
-    0.014535307884216309,
-    -0.013179072178900242,
-    -0.03402382507920265,
-    0.009972753934562206,
-    0.03190102055668831,
-    0.002710628556087613,
-    -0.013518131338059902,
-    -0.01085725612938404,
-    -0.006589536089450121,
-    0.006781178060919046,
-    -0.015036525204777718,
-    -0.03962566703557968,
-    -0.011690161190927029,
-    -0.03573385998606682,
-    -0.06291753798723221,
-    0.01727726310491562,
-    -0.029468640685081482,
-    -0.001347022014670074,
-    0.0003215531469322741,
-    -0.010120171122252941,
-    -0.022834880277514458,
-    0.00015870352217461914,
-    0.009228299371898174,
-    0.007433497812598944,
-    0.026166502386331558,
-    -0.031222902238368988,
-    -0.012316683307290077,
-    -0.02060888521373272,
-    -0.0030957551207393408,
-    -0.017896413803100586,
-    0.01711510308086872,
-    0.018353406339883804,
-    -0.00980322528630495,
-    -0.005399144720286131,
-    0.014616386964917183,
-    0.0011931556509807706,
-    -0.00250793038867414,
-    -0.004842645488679409,
-    -0.05021020025014877,
-    0.006545310840010643,
-    0.026078052818775177,
-    -0.0004159921081736684,
-    0.008432247675955296,
-    -0.005999868270009756,
-    -0.00929463654756546,
-    -0.016849754378199577,
-    -0.0221715047955513,
-    0.03588127717375755,
-    0.007208687253296375,
-    -0.007894176058471203,
-    0.001758868107572198,
-    -0.008763935416936874,
-    -0.011439552530646324,
-    0.012523067183792591,
-    -0.006291016936302185,
-    -0.004787364508956671,
-    0.005601842887699604,
-    -0.012773675844073296,
-    0.007451924961060286,
-    -0.004768937360495329,
-    -0.008144784718751907,
-    -0.007374531123787165,
-    0.04519802704453468,
-    -0.026859361678361893,
-    -0.016599144786596298,
-    -0.033905889838933945,
-    0.016805527731776237,
-    0.012088187038898468,
-    -0.027507996186614037,
-    0.024633366614580154,
-    -0.024220598861575127,
-    -0.013879302889108658,
-    -0.013606580905616283,
-    0.007621454540640116,
-    -0.0160537026822567,
-    0.012699967250227928,
-    -0.018692465499043465,
-    -0.007297137286514044,
-    0.0021191181149333715,
-    0.007315564434975386,
-    -0.0012088187504559755,
-    0.03532109409570694,
-    -0.009095624089241028,
-    -0.00379967107437551,
-    -0.0024876603856682777,
-    0.034996774047613144,
-    0.042839355766773224,
-    -0.0036946365144103765,
-    -0.01816176436841488,
-    0.00779835507273674,
-    -0.004518328700214624,
-    -0.001434550853446126,
-    -0.010297071188688278,
-    0.014343665912747383,
-    -0.003090227022767067,
-    -0.03081013634800911,
-    -0.023321356624364853,
-    -0.01630431041121483,
-    -0.018736690282821655,
-    -0.006567423697561026,
-    0.03903599828481674,
-    0.0004275090468581766,
-    0.03838736563920975,
-    0.030279435217380524,
-    0.027935504913330078,
-    -0.03481987491250038,
-    0.014004606753587723,
-    0.0038438960909843445,
-    0.02613701857626438,
-    3.587528772186488e-05,
-    0.005712405312806368,
-    0.0023605134338140488,
-    -0.001094570616260171,
-    0.02840724028646946,
-    0.019916025921702385,
-    -0.011822836473584175,
-    -0.005638697184622288,
-    0.00979585386812687,
-    0.012862126342952251,
-    -0.0009628167608752847,
-    0.0024028958287090063,
-    0.012169266119599342,
-    -0.017925897613167763,
-    -0.02259901352226734,
-    -0.023173939436674118,
-    0.006372096017003059,
-    0.023188680410385132,
-    0.0020527804736047983,
-    0.007665679790079594,
-    0.010717209428548813,
-    -0.023822573944926262,
-    -0.020712075755000114,
-    -0.0015893386444076896,
-    -0.008704968728125095,
-    0.01652543619275093,
-    -0.008277460001409054,
-    -0.026181243360042572,
-    -0.01452056597918272,
-    -0.019237907603383064,
-    -0.026328660547733307,
-    0.023498255759477615,
-    -0.011749127879738808,
-    0.0046952287666499615,
-    0.02478078380227089,
-    -0.020682593807578087,
-    -0.019694900140166283,
-    -0.022112537175416946,
-    0.0193853247910738,
-    0.01917893998324871,
-    0.0024250082205981016,
-    -0.0008637710125185549,
-    0.03042685054242611,
-    0.0021541297901421785,
-    -0.024014215916395187,
-    0.009508390910923481,
-    -0.012080816552042961,
-    -0.0025982230436056852,
-    -0.007319249678403139,
-    -0.017085621133446693,
-    -0.00315656466409564,
-    0.00807107612490654,
-    -0.022363146767020226,
-    0.005126423202455044,
-    -0.007345047779381275,
-    -0.034082792699337006,
-    0.004735768307000399,
-    0.0007467588293366134,
-    0.005377031862735748,
-    0.0029428100679069757,
-    0.004451991058886051,
-    0.01258203387260437,
-    0.025738993659615517,
-    -0.010768805630505085,
-    0.022348403930664062,
-    0.02466285042464733,
-    0.03013201802968979,
-    0.03944876790046692,
-    -0.01652543619275093,
-    -0.014210990630090237,
-    -0.06993458420038223,
-    -0.050976768136024475,
-    -0.015817835927009583,
-    -0.025311484932899475,
-    0.013208555988967419,
-    -0.015434551052749157,
-    -0.011225798167288303,
-    -0.03514419123530388,
-    -0.011505890637636185,
-    -0.012375649996101856,
-    -0.0010798289440572262,
-    0.014889108948409557,
-    0.011638565920293331,
-    -0.021183811128139496,
-    0.025046134367585182,
-    0.024087924510240555,
-    -0.04903086647391319,
-    0.017881670966744423,
-    -0.02795024774968624,
-    -0.011793353594839573,
-    -0.02305600605905056,
-    -0.05336492508649826,
-    -0.005786113906651735,
-    -0.00935360323637724,
-    -0.019503258168697357,
-    0.0339648574590683,
-    -0.03060375154018402,
-    0.012279829010367393,
-    -0.013650806620717049,
-    0.0007195788202807307,
-    -0.03532109409570694,
-    -0.020505692809820175,
-    0.04888344928622246,
-    -0.00034827247145585716,
-    -0.014321553520858288,
-    -0.023114971816539764,
-    -0.019739124923944473,
-    -0.012029220350086689,
-    -0.020476208999753,
-    -0.0012954261619597673,
-    -0.013230668380856514,
-    -0.024161633104085922,
-    0.01084988471120596,
-    0.009206186048686504,
-    0.012913721613585949,
-    -0.0008623889298178256,
-    0.009876932948827744,
-    0.012611516751348972,
-    -0.023571964353322983,
-    -0.012066074647009373,
-    0.0002510694321244955,
-    -0.009773741476237774,
-    -0.0040060547180473804,
-    -0.034584008157253265,
-    -0.025680026039481163,
-    0.01858927309513092,
-    0.007533004507422447,
-    -0.014866995625197887,
-    0.010813030414283276,
-    -0.016009477898478508,
-    -0.03941928222775459,
-    0.00718657486140728,
-    0.024972425773739815,
-    -0.05619532987475395,
-    -0.007079697214066982,
-    0.015994735062122345,
-    -0.029955117031931877,
-    0.02954234927892685,
-    0.03169463574886322,
-    -0.006383152678608894,
-    0.023866798728704453,
-    0.02596011944115162,
-    -0.011793353594839573,
-    0.032225336879491806,
-    -0.022820139303803444,
-    0.007562487851828337,
-    0.0007900625350885093,
-    -0.03372899070382118,
-    0.0014806186081841588,
-    -0.0006366568268276751,
-    -0.011483777314424515,
-    0.014321553520858288,
-    -0.021434418857097626,
-    -0.02136071026325226,
-    0.01559671014547348,
-    0.027935504913330078,
-    0.022407371550798416,
-    0.005863507743924856,
-    0.014712207950651646,
-    0.009685290977358818,
-    0.015921026468276978,
-    0.013260151259601116,
-    0.016893979161977768,
-    0.0029335967265069485,
-    -0.031635671854019165,
-    -0.0020030273590236902,
-    -0.02074155956506729,
-    -0.012913721613585949,
-    -0.0011074695503339171,
-    0.012935834005475044,
-    0.016024218872189522,
-    0.00872708112001419,
-    0.0206973347812891,
-    -0.013090621680021286,
-    -0.009139848873019218,
-    -0.0432521216571331,
-    -0.004201381932944059,
-    -0.004588351584970951,
-    0.03747338056564331,
-    0.010532938875257969,
-    0.01913471519947052,
-    0.033994339406490326,
-    -0.03411227464675903,
-    -0.01740993745625019,
-    -0.02026982605457306,
-    0.023498255759477615,
-    -0.004488844890147448,
-    0.0019035208970308304,
-    0.005126423202455044,
-    -0.02280539646744728,
-    0.03629404306411743,
-    -0.001756104058586061,
-    -0.014726949855685234,
-    0.0007310957880690694,
-    -0.013083251193165779,
-    0.007989997044205666,
-    0.019739124923944473,
-    -0.011034156195819378,
-    -0.004101875703781843,
-    -0.015110233798623085,
-    0.04531595855951309,
-    0.024176374077796936,
-    -0.018471339717507362,
-    -0.007389273028820753,
-    0.014623758383095264,
-    -0.008041592314839363,
-    0.027080487459897995,
-    -0.008690226823091507,
-    0.013370714150369167,
-    -0.009198815561830997,
-    -0.002085949294269085,
-    0.03072168491780758,
-    0.009700032882392406,
-    -0.0117417573928833,
-    0.015537742525339127,
-    -0.0028985850512981415,
-    -0.0020509378518909216,
-    -0.03013201802968979,
-    -0.03101651929318905,
-    -0.0013553142780438066,
-    -0.0014852253952994943,
-    0.0027548535726964474,
-    -0.0238078311085701,
-    0.006563737988471985,
-    0.020535176619887352,
-    -0.052745770663022995,
-    -0.014454228803515434,
-    0.022569529712200165,
-    -0.006320500280708075,
-    0.03638249635696411,
-    -0.01833866350352764,
-    -0.015095491893589497,
-    0.010061204433441162,
-    -0.02153761126101017,
-    0.06568897515535355,
-    -0.02684462070465088,
-    0.007330306340008974,
-    -0.01913471519947052,
-    0.0023715696297585964
-  ],
-  "Baby & Kids": [
-    0.025845590978860855,
-    0.009176559746265411,
-    -0.033956706523895264,
-    0.021102650091052055,
-    -0.03172958642244339,
-    -0.0681883692741394,
-    0.003503933548927307,
-    0.07099288702011108,
-    -0.033929210156202316,
-    -0.0072862571105360985,
-    0.02488325536251068,
-    -0.06466896831989288,
-    -0.04894164949655533,
-    0.009719591587781906,
-    0.02565312385559082,
-    0.023178545758128166,
-    -0.041765373200178146,
-    0.018504343926906586,
-    -0.003177426755428314,
-    0.01308776717633009,
-    0.024718282744288445,
-    0.021528827026486397,
-    0.017871951684355736,
-    -0.008386068977415562,
-    0.06549382954835892,
-    -0.007946144789457321,
-    -0.007987387478351593,
-    -0.057575177401304245,
-    0.04789682850241661,
-    -0.01105311419814825,
-    0.030244840309023857,
-    -0.02748156152665615,
-    0.027948981150984764,
-    -0.020882686600089073,
-    -0.028031468391418457,
-    -0.013314603827893734,
-    -0.04943656548857689,
-    0.006375474855303764,
-    0.02673918753862381,
-    0.005337527021765709,
-    -0.008372321724891663,
-    -0.028265178203582764,
-    0.006155512295663357,
-    -0.03643128648400307,
-    0.0062139397487044334,
-    0.03648627549409866,
-    -0.06428403407335281,
-    -0.009527124464511871,
-    0.023797189816832542,
-    0.043552570044994354,
-    0.02343975193798542,
-    0.022711126133799553,
-    -0.031124690547585487,
-    -0.010888142511248589,
-    0.005911491345614195,
-    0.006303299684077501,
-    -0.01813315600156784,
-    0.028540130704641342,
-    0.00833107903599739,
-    -0.05823506414890289,
-    -0.008612905628979206,
-    -0.0019487300887703896,
-    0.003163679037243128,
-    0.04160040244460106,
-    -0.04080303758382797,
-    -0.0195766594260931,
-    -0.024168377742171288,
-    -0.007629948202520609,
-    -0.021418845281004906,
-    -0.026684198528528214,
-    -0.0018009428167715669,
-    -0.02547440491616726,
-    -0.02568061836063862,
-    0.003093222388997674,
-    -0.028210187330842018,
-    0.036101341247558594,
-    -0.01472373865544796,
-    -0.024539563804864883,
-    -0.007678064983338118,
-    -0.0028629491571336985,
-    0.01714332588016987,
-    0.013919500634074211,
-    0.0053237793035805225,
-    0.015122420154511929,
-    -0.04528477415442467,
-    -0.027577795088291168,
-    -0.01396761741489172,
-    0.007918649353086948,
-    -0.018188146874308586,
-    0.012860930524766445,
-    0.021556323394179344,
-    -0.022889845073223114,
-    -0.026794178411364555,
-    -0.01876554824411869,
-    0.06928817927837372,
-    0.013802645727992058,
-    -0.018284380435943604,
-    -0.04336010292172432,
-    0.013713285326957703,
-    0.009802077896893024,
-    -0.010104525834321976,
-    -0.06868328154087067,
-    -0.011121852323412895,
-    -0.018614323809742928,
-    -0.01939794048666954,
-    0.02055274322628975,
-    -0.02077270671725273,
-    0.03222450241446495,
-    -0.07803168892860413,
-    -0.004034936428070068,
-    -0.11789988726377487,
-    -0.019480425864458084,
-    -0.0007127299904823303,
-    0.047951821237802505,
-    -0.025433160364627838,
-    0.01795443706214428,
-    0.06516388058662415,
-    -0.020923931151628494,
-    -0.06763846427202225,
-    -0.025996815413236618,
-    0.005502498708665371,
-    0.04597215726971626,
-    -0.007877405732870102,
-    -0.04698948562145233,
-    -0.025886833667755127,
-    0.03901584446430206,
-    -0.03769607096910477,
-    0.0316196046769619,
-    0.0012707988498732448,
-    -0.027399076148867607,
-    0.03623881936073303,
-    -0.020442763343453407,
-    0.007279383018612862,
-    -0.011829856783151627,
-    0.022092480212450027,
-    -0.008159233257174492,
-    0.00901158805936575,
-    0.019769126549363136,
-    -0.022271201014518738,
-    -0.01964539848268032,
-    0.0909544825553894,
-    -0.011857352219522,
-    -0.00015197602624539286,
-    -0.023590976372361183,
-    -0.004670765716582537,
-    0.0024677040055394173,
-    0.00592180248349905,
-    -0.01840811036527157,
-    -0.024924498051404953,
-    0.011094356887042522,
-    -0.012558482587337494,
-    -0.023398507386446,
-    -0.04976651072502136,
-    -0.019769126549363136,
-    0.012551608495414257,
-    0.004461113829165697,
-    0.016414700075984,
-    -0.02775651402771473,
-    -0.032416969537734985,
-    -0.042892683297395706,
-    -0.029172522947192192,
-    0.0007062857621349394,
-    0.03896085172891617,
-    0.002187595469877124,
-    -0.0031361838337033987,
-    0.0021033911034464836,
-    -0.015961026772856712,
-    0.010406974703073502,
-    -0.06527386605739594,
-    0.008709139190614223,
-    0.05510060116648674,
-    0.0068978858180344105,
-    0.0423702709376812,
-    0.008832868188619614,
-    -0.029227513819932938,
-    0.0025467530358582735,
-    0.02217496745288372,
-    0.0070731681771576405,
-    -0.04281019791960716,
-    -0.0002607758215162903,
-    0.031014708802103996,
-    0.014517523348331451,
-    -0.028210187330842018,
-    -0.020387772470712662,
-    0.012414132244884968,
-    0.02361847087740898,
-    -0.02262863889336586,
-    -0.03791603073477745,
-    -0.03082224167883396,
-    -0.024017153307795525,
-    -0.023632219061255455,
-    -0.018738053739070892,
-    0.009987670928239822,
-    -0.008207350037992,
-    0.03159211203455925,
-    0.014393794350326061,
-    -0.015342382714152336,
-    0.002194469328969717,
-    -0.05281848832964897,
-    0.01219416968524456,
-    0.0006508655496872962,
-    -0.030382316559553146,
-    0.03868589922785759,
-    -0.014558766037225723,
-    -0.0013807800132781267,
-    -0.01528739184141159,
-    -0.052763499319553375,
-    0.030657270923256874,
-    0.004626085981726646,
-    -0.01578230783343315,
-    0.0696181207895279,
-    -0.006667612586170435,
-    -0.031069699674844742,
-    0.010503208264708519,
-    -0.018421856686472893,
-    -0.009685222990810871,
-    -0.03260943666100502,
-    0.005234419368207455,
-    -0.03120717592537403,
-    0.023288527503609657,
-    -0.0034334766678512096,
-    0.01714332588016987,
-    0.060709644109010696,
-    0.005660596769303083,
-    0.02154257521033287,
-    0.01380951888859272,
-    -0.003363020019605756,
-    -0.03623881936073303,
-    -0.018009427934885025,
-    -0.02895256131887436,
-    -0.016455942764878273,
-    0.05158120021224022,
-    0.03277440741658211,
-    0.02983241155743599,
-    0.011142474599182606,
-    0.06015973538160324,
-    -0.05191114544868469,
-    -0.016978353261947632,
-    -0.006117706187069416,
-    -0.023797189816832542,
-    -0.01380951888859272,
-    0.00749247195199132,
-    -0.0448998399078846,
-    0.014737485907971859,
-    -0.04663204401731491,
-    0.0020088760647922754,
-    -0.014902457594871521,
-    0.010173264890909195,
-    -0.005320342257618904,
-    0.052131105214357376,
-    0.055430542677640915,
-    -0.04209531843662262,
-    0.03131715580821037,
-    -0.015493607148528099,
-    0.06895823776721954,
-    0.004217092879116535,
-    -0.009375900961458683,
-    0.036458779126405716,
-    -0.006186444777995348,
-    0.020002838224172592,
-    -0.03882337734103203,
-    -0.021240126341581345,
-    0.006946002598851919,
-    -0.10266748815774918,
-    -0.002313042990863323,
-    0.03021734580397606,
-    0.01133494172245264,
-    0.04385501891374588,
-    0.015012439340353012,
-    0.0061005218885838985,
-    -0.021033911034464836,
-    -0.0492715947329998,
-    0.05182866007089615,
-    0.022573649883270264,
-    0.011520534753799438,
-    0.0040864902548491955,
-    -0.010008292272686958,
-    -0.02052524872124195,
-    0.017913194373250008,
-    0.006375474855303764,
-    -0.03159211203455925,
-    0.012386636808514595,
-    0.012991533614695072,
-    -0.04017064720392227,
-    0.004272083751857281,
-    0.017349539324641228,
-    0.006701981648802757,
-    -0.03148213028907776,
-    -0.018463099375367165,
-    0.10068782418966293,
-    -0.0010903609218075871,
-    -0.018504343926906586,
-    0.014105093665421009,
-    -0.03095971792936325,
-    0.0038768386002629995,
-    0.0233710128813982,
-    0.006323921028524637,
-    -0.0707179382443428,
-    -0.012049819342792034,
-    -0.003581264056265354,
-    -0.014929953031241894,
-    0.013287108391523361,
-    0.01827063225209713,
-    0.034066688269376755,
-    -0.02561188116669655,
-    0.007719308137893677,
-    -0.008667896501719952,
-    0.012627220712602139,
-    -0.013575809076428413,
-    -0.018188146874308586,
-    -0.025598132982850075,
-    -0.003581264056265354,
-    0.042782701551914215,
-    -0.03348928689956665,
-    -0.04525727778673172,
-    -0.027536552399396896,
-    -0.04096801206469536,
-    0.005609042942523956,
-    0.01673089526593685,
-    -0.01087439525872469,
-    0.03423165902495384,
-    -0.08820495009422302,
-    0.009320910088717937,
-    0.018298128619790077,
-    -0.007877405732870102,
-    0.00610395846888423,
-    -0.017610745504498482,
-    -0.015699822455644608,
-    0.030107364058494568,
-    -0.00461921188980341,
-    -0.038988348096609116,
-    -0.018463099375367165,
-    -0.03560642525553703,
-    -0.022009994834661484,
-    -0.03293938189744949,
-    -0.03967573121190071,
-    0.039125826209783554,
-    0.004261773079633713,
-    -0.03302186727523804,
-    0.01883428730070591,
-    0.014517523348331451,
-    -0.010654432699084282,
-    -0.024580806493759155,
-    0.017542008310556412,
-    0.011520534753799438,
-    -0.01261347346007824,
-    8.930605690693483e-05,
-    0.05485314130783081,
-    -0.031922053545713425,
-    0.06400907784700394,
-    -0.04701697826385498,
-    0.0012097936123609543,
-    0.001591291045770049,
-    -0.006846331991255283,
-    -0.04344258829951286,
-    -0.031179681420326233,
-    0.022779863327741623,
-    0.0007393660489469767,
-    0.024512067437171936,
-    0.05257103219628334,
-    -0.03909832984209061,
-    -0.016992101445794106,
-    0.025776851922273636,
-    -0.0024780146777629852,
-    -0.00648201908916235,
-    0.009458386339247227,
-    -0.040363114327192307,
-    -0.024993237107992172,
-    0.007004430051892996,
-    0.0013429740210995078,
-    0.017913194373250008,
-    0.02154257521033287,
-    0.03296687453985214,
-    0.006894448772072792,
-    -0.06769344955682755,
-    -0.030794747173786163,
-    0.013390216045081615,
-    -0.0026790741831064224,
-    -0.03513900563120842,
-    0.020002838224172592,
-    -0.012173548340797424,
-    0.0262442734092474,
-    0.014998691156506538,
-    -0.006495766807347536,
-    0.0199203509837389,
-    0.02502073161303997,
-    -0.0543307326734066,
-    -0.021666303277015686,
-    -0.0018765549175441265,
-    0.004409560468047857,
-    -0.021281369030475616,
-    -0.04462488740682602,
-    -0.006354853510856628,
-    -0.020374024286866188,
-    0.011238708160817623,
-    -0.05675031989812851,
-    0.035193994641304016,
-    0.05152621120214462,
-    -0.030519792810082436,
-    -0.011245581321418285,
-    0.0047910576686263084,
-    -0.022504910826683044,
-    -0.03271941840648651,
-    -0.016675904393196106,
-    0.016139745712280273,
-    0.008399817161262035,
-    -0.038850873708724976,
-    0.020896434783935547,
-    0.026051806285977364,
-    -0.04913411661982536,
-    0.027605291455984116,
-    -0.019824117422103882,
-    0.02673918753862381,
-    0.01591978408396244,
-    -0.013878257013857365,
-    0.02066272497177124,
-    -0.040115658193826675,
-    0.01580980233848095,
-    -0.05449570342898369,
-    -0.009767708368599415,
-    -0.04753939062356949,
-    -0.04336010292172432,
-    -0.029227513819932938,
-    0.001178002217784524,
-    -0.019054248929023743,
-    0.02143259346485138,
-    0.014792476780712605,
-    0.0010980939259752631,
-    -0.0034661274403333664,
-    -0.014696243219077587,
-    -0.04234277829527855,
-    0.028155196458101273,
-    -0.05867499113082886,
-    0.01210481021553278,
-    0.003880275646224618,
-    -0.05584297329187393,
-    0.008131737820804119,
-    0.04500982165336609,
-    -0.03579889237880707,
-    0.04220530018210411,
-    0.01921922154724598,
-    0.012544735334813595,
-    0.02014031447470188,
-    0.014545018784701824,
-    -0.04193034768104553,
-    -0.009217802435159683,
-    -0.010695675387978554,
-    0.031647101044654846,
-    -0.09067953377962112,
-    -0.05499061942100525,
-    -0.033571772277355194,
-    0.007396238390356302,
-    -0.008509797975420952,
-    -0.02572186104953289,
-    -0.001812972011975944,
-    0.012290403246879578,
-    0.015713568776845932,
-    -0.01637345738708973,
-    0.019411688670516014,
-    -0.005677781533449888,
-    0.042535245418548584,
-    0.037228647619485855,
-    0.04627460613846779,
-    0.03134465217590332,
-    0.023247284814715385,
-    0.027316590771079063,
-    -0.027357833459973335,
-    0.03321433439850807,
-    -0.02596931904554367,
-    -0.05045389384031296,
-    -0.0024728593416512012,
-    -0.02305481769144535,
-    -0.005306594539433718,
-    0.054660674184560776,
-    0.00665042782202363,
-    -0.004584842827171087,
-    0.013328351080417633,
-    0.00453328900039196,
-    0.028430150821805,
-    0.029007552191615105,
-    0.04971151798963547,
-    0.03428665176033974,
-    -0.010984376072883606,
-    -0.0006023191381245852,
-    0.004626085981726646,
-    -0.016909616068005562,
-    0.01725330576300621,
-    0.06422904133796692,
-    0.007657443638890982,
-    -0.021597566083073616,
-    -0.017335793003439903,
-    0.013589556328952312,
-    0.02631301060318947,
-    -0.015479858964681625,
-    0.015768559649586678,
-    -0.03871339559555054,
-    -0.006891011726111174,
-    0.014819972217082977,
-    -0.04371754080057144,
-    -0.014998691156506538,
-    -0.004835737403482199,
-    -0.04773185774683952,
-    -0.011163095943629742,
-    0.019480425864458084,
-    0.030272334814071655,
-    0.016785886138677597,
-    0.040528085082769394,
-    -0.024195872247219086,
-    1.0015381121775135e-05,
-    -0.03332431614398956,
-    -0.046961989253759384,
-    -0.003907770849764347,
-    0.010757539421319962,
-    0.0009331220644526184,
-    -0.024993237107992172,
-    0.004440492484718561,
-    -0.03384672477841377,
-    -0.030244840309023857,
-    -0.01465499959886074,
-    0.01108748372644186,
-    0.00473606726154685,
-    0.028760094195604324,
-    0.01307401992380619,
-    -0.03244446590542793,
-    -0.009891437366604805,
-    -0.043057654052972794,
-    -0.013520818203687668,
-    0.012235412374138832,
-    -0.004636396653950214,
-    0.016249727457761765,
-    0.004571095108985901,
-    0.023219788447022438,
-    0.005914928391575813,
-    0.0032152326311916113,
-    -0.03439663350582123,
-    0.004608901217579842,
-    0.04624710977077484,
-    0.025171956047415733,
-    -0.009843320585787296,
-    -0.005258477758616209,
-    0.0017665736377239227,
-    0.03629380837082863,
-    0.0454772412776947,
-    0.005011020228266716,
-    0.011197464540600777,
-    0.03071225993335247,
-    0.0068875751458108425,
-    -0.01598852314054966,
-    0.009918932802975178,
-    0.01182298269122839,
-    0.009781456552445889,
-    -0.0167583916336298,
-    0.027632785961031914,
-    0.007629948202520609,
-    0.018078165128827095,
-    -0.0021137020085006952,
-    -0.020057829096913338,
-    -0.009341531433165073,
-    0.064394012093544,
-    0.006842894945293665,
-    0.027426570653915405,
-    0.018641820177435875,
-    0.030272334814071655,
-    -0.002500354778021574,
-    -0.014173831790685654,
-    0.0003512096300255507,
-    -0.006701981648802757,
-    -0.03577139601111412,
-    0.003928392194211483,
-    -0.01447628065943718,
-    -0.04066556319594383,
-    0.029777420684695244,
-    0.004437055438756943,
-    -0.03200453892350197,
-    -0.024938246235251427,
-    0.02199624665081501,
-    0.00292481342330575,
-    -0.013259612955152988,
-    -0.009685222990810871,
-    -0.022161219269037247,
-    -0.027289094403386116,
-    0.01673089526593685,
-    -0.0040968009270727634,
-    -0.06296426057815552,
-    -0.039868198335170746,
-    -0.010152642615139484,
-    0.036981191486120224,
-    -0.011616768315434456,
-    0.04030812531709671,
-    -0.03764107823371887,
-    -0.02073146402835846,
-    -0.03274691477417946,
-    -0.005760267376899719,
-    -0.016538428142666817,
-    0.023151051253080368,
-    -0.008138611912727356,
-    -0.0233710128813982,
-    -0.019384192302823067,
-    -0.031537119299173355,
-    -0.02027779072523117,
-    0.026079300791025162,
-    0.010516955517232418,
-    -0.0028131138533353806,
-    0.018779296427965164,
-    0.010654432699084282,
-    0.012125431559979916,
-    -0.02319229394197464,
-    -0.04528477415442467,
-    0.0033458354882895947,
-    0.01354831364005804,
-    -0.0019573222380131483,
-    0.03527648374438286,
-    0.01121121272444725,
-    0.006382348481565714,
-    -0.014448785223066807,
-    -0.025061974301934242,
-    -0.02298607863485813,
-    0.00019074870215263218,
-    -0.008035504259169102,
-    0.003997130785137415,
-    0.014393794350326061,
-    0.010709422640502453,
-    -0.007293130736798048,
-    0.020580239593982697,
-    0.01612599939107895,
-    0.02614803984761238,
-    -0.00868164375424385,
-    -0.0069597503170371056,
-    0.02093767747282982,
-    0.006781030911952257,
-    0.019439183175563812,
-    -0.0024350532330572605,
-    -0.0009451512596569955,
-    -0.023659713566303253,
-    -0.007822415791451931,
-    0.012414132244884968,
-    0.004773872904479504,
-    0.006626369431614876,
-    -9.886496991384774e-05,
-    0.03637629374861717,
-    -0.01851809024810791,
-    0.030987214297056198,
-    0.007444355171173811,
-    -0.06653864681720734,
-    -0.01159614697098732,
-    -0.011032492853701115,
-    -0.02055274322628975,
-    0.02269737794995308,
-    -0.002072458853945136,
-    -0.018215643242001534,
-    0.016992101445794106,
-    -0.0009322628611698747,
-    0.011458669789135456,
-    -0.008489176630973816,
-    -0.005433760583400726,
-    -0.01453127060085535,
-    0.00436488026753068,
-    -0.007911775261163712,
-    0.01045509148389101,
-    0.008447933942079544,
-    -2.2581596567761153e-05,
-    0.011410553008317947,
-    -0.0005056559457443655,
-    -0.05611792579293251,
-    0.031014708802103996,
-    0.02958495356142521,
-    0.02375594712793827,
-    -0.00418959790840745,
-    -0.004581405781209469,
-    0.008571662940084934,
-    0.05485314130783081,
-    0.028787588700652122,
-    -0.011506786569952965,
-    -0.040500592440366745,
-    0.01193296443670988,
-    -0.028540130704641342,
-    -0.0016969761345535517,
-    0.011554903350770473,
-    0.007815541699528694,
-    0.01393324788659811,
-    -0.006048968061804771,
-    0.002737501636147499,
-    -0.03439663350582123,
-    0.008427312597632408,
-    0.0164421945810318,
-    -0.029859906062483788,
-    0.046961989253759384,
-    -0.002050118986517191,
-    -0.025446908548474312,
-    0.0037874788977205753,
-    -0.010262624360620975,
-    -0.024800769984722137,
-    0.020360276103019714,
-    0.016359709203243256,
-    -0.0033286509569734335,
-    0.01774822175502777,
-    0.02174879051744938,
-    0.009396522305905819,
-    -0.0001279176358366385,
-    -0.1391262710094452,
-    -0.004261773079633713,
-    0.0018421857384964824,
-    0.040885526686906815,
-    -0.01182298269122839,
-    -0.048336755484342575,
-    0.015397373586893082,
-    -0.017102083191275597,
-    0.018806790933012962,
-    0.01651093363761902,
-    0.002161818789318204,
-    0.0051003796979784966,
-    -0.015933532267808914,
-    -0.03018984943628311,
-    -0.008860363624989986,
-    -0.009747087024152279,
-    -0.010351983830332756,
-    0.0016248009633272886,
-    0.018641820177435875,
-    0.010943133383989334,
-    -0.0002588425704743713,
-    -0.03214201703667641,
-    0.016455942764878273,
-    0.001601601717993617,
-    -0.02104765921831131,
-    -0.0031361838337033987,
-    0.029859906062483788,
-    0.046302102506160736,
-    -0.019425436854362488,
-    0.004598590545356274,
-    0.009094073437154293,
-    -0.0010164672276005149,
-    -0.00037655685446225107,
-    0.0014615475665777922,
-    0.008935975842177868,
-    -0.018463099375367165,
-    -0.005811821203678846,
-    -0.03560642525553703,
-    -0.03387422114610672,
-    -0.003945576958358288,
-    -0.037118665874004364,
-    -0.009444639086723328,
-    -0.0029454350005835295,
-    0.005502498708665371,
-    0.03929079696536064,
-    -0.011671759188175201,
-    0.027646534144878387,
-    0.00014682066102977842,
-    -0.014366298913955688,
-    0.015438616275787354,
-    -0.02080020122230053,
-    0.04588967189192772,
-    0.01131431944668293,
-    -0.02228494919836521,
-    0.004248025361448526,
-    -0.008805372752249241,
-    -0.0011118415277451277,
-    0.012434753589332104,
-    -0.0173632875084877,
-    -0.01784445531666279,
-    0.034066688269376755,
-    0.058565009385347366,
-    0.03590887412428856,
-    -0.0249794889241457,
-    0.01996159553527832,
-    0.01207044068723917,
-    -0.014641252346336842,
-    -0.02687666565179825,
-    -0.025914330035448074,
-    -0.0435800664126873,
-    -0.005395954474806786,
-    -0.007540588732808828,
-    -0.013493322767317295,
-    0.021143892779946327,
-    0.006708855275064707,
-    0.010393226519227028,
-    -0.007629948202520609,
-    -0.06516388058662415,
-    -0.005021330900490284,
-    -0.008138611912727356,
-    -0.009795203804969788,
-    0.01291592139750719,
-    0.02969493344426155,
-    0.02009907178580761,
-    -0.0009056267444975674,
-    -0.045834679156541824,
-    0.0015955871203914285,
-    0.03423165902495384,
-    -0.004275520797818899,
-    -0.02491074986755848,
-    0.00038020857027731836,
-    -0.004904475994408131,
-    -0.050508882850408554,
-    0.013541439548134804,
-    -0.03805350884795189,
-    0.004729193169623613,
-    -0.027454067021608353,
-    -0.03307685628533363,
-    -0.03227949142456055,
-    0.059609830379486084,
-    0.024168377742171288,
-    0.03546895086765289,
-    0.005011020228266716,
-    -0.013355846516788006,
-    -0.012744075618684292,
-    0.046302102506160736,
-    -0.013486449606716633,
-    -0.004316763486713171,
-    0.005664033815264702,
-    0.003227262059226632,
-    0.001795787364244461,
-    -0.052131105214357376,
-    -0.0005138185806572437,
-    -0.02955745719373226,
-    0.014105093665421009,
-    0.004244588315486908,
-    0.00277530774474144,
-    -0.013665168546140194,
-    0.030547289177775383,
-    0.014435037039220333,
-    0.007279383018612862,
-    0.013658295385539532,
-    -0.04723694175481796,
-    -0.03208702430129051,
-    0.03714616224169731,
-    0.023398507386446,
-    0.035441454499959946,
-    -0.03640379011631012,
-    0.02073146402835846,
-    0.009657727554440498,
-    0.0058049471117556095,
-    0.02920001931488514,
-    -0.021418845281004906,
-    0.036596257239580154,
-    0.005904617719352245,
-    0.0038012266159057617,
-    -0.029749924317002296,
-    -0.0198928564786911,
-    0.023989656940102577,
-    0.012929669581353664,
-    -0.023164797574281693,
-    0.043167635798454285,
-    -0.010688801296055317,
-    0.014105093665421009,
-    -0.026381749659776688,
-    0.036458779126405716,
-    -0.0011479291133582592,
-    0.020002838224172592,
-    -0.0035331472754478455,
-    -0.06114956736564636,
-    0.019549164921045303,
-    -0.03200453892350197,
-    -0.005430323537439108,
-    -0.0024969177320599556,
-    -0.021377602592110634,
-    -0.03340680152177811,
-    0.01908174529671669,
-    0.046714529395103455,
-    -0.0347265750169754,
-    0.007231266237795353,
-    -0.017968185245990753,
-    -0.038740891963243484,
-    -0.0015070866793394089,
-    -0.006372037809342146,
-    -0.004942281637340784,
-    -0.021597566083073616,
-    -0.0010044380323961377,
-    -0.0013816392747685313,
-    0.01774822175502777,
-    0.048584211617708206,
-    0.022999826818704605,
-    -0.031784579157829285,
-    0.010743792168796062,
-    0.00542001286521554,
-    -0.013067145831882954,
-    0.01935669779777527,
-    -0.011039366945624352,
-    0.005808384157717228,
-    0.010290119796991348,
-    0.008076746948063374,
-    -0.0341491736471653,
-    0.031812071800231934,
-    0.022917339578270912,
-    -0.014242569915950298,
-    0.002792492276057601,
-    -0.0034231659956276417,
-    -0.003385359887033701,
-    0.0007462399080395699,
-    0.03574390336871147,
-    -0.013039650395512581,
-    0.009334657341241837,
-    0.033434297889471054,
-    -0.028237683698534966,
-    0.03890586271882057,
-    -0.003839032491669059,
-    -0.02181752771139145,
-    -0.009307161904871464,
-    -0.010427596047520638,
-    0.006237998139113188,
-    0.00872976053506136,
-    0.015369878150522709,
-    -0.030354822054505348,
-    0.05411076918244362,
-    0.015521102584898472,
-    0.02513071335852146,
-    0.013293982483446598,
-    -0.004131170455366373,
-    -0.007382490672171116,
-    -0.006949439644813538,
-    0.005107253789901733,
-    0.041132982820272446,
-    0.014764981344342232,
-    -0.02168005146086216,
-    -0.010895016603171825,
-    -0.027426570653915405,
-    0.024814516305923462,
-    -0.04094051569700241,
-    0.0011101231211796403,
-    0.01147241797298193,
-    -0.0014211637899279594,
-    -0.008990965783596039,
-    0.02694540284574032,
-    -0.019521670415997505,
-    -0.029474971815943718,
-    -0.01472373865544796,
-    -0.03348928689956665,
-    -0.0004283253801986575,
-    -0.01847684755921364,
-    -0.004467987921088934,
-    0.02224370464682579,
-    0.004522978328168392,
-    -0.012125431559979916,
-    0.018614323809742928,
-    0.00978832971304655,
-    0.011651136912405491,
-    0.019975341856479645,
-    0.008248592726886272,
-    0.0224224254488945,
-    -0.015658577904105186,
-    -0.007210644893348217,
-    -0.026065552607178688,
-    -0.026835421100258827,
-    -0.0013120417715981603,
-    -0.005447508301585913,
-    -0.03060228005051613,
-    0.012943416833877563,
-    0.012750949710607529,
-    0.0036087592598050833,
-    -0.017170820385217667,
-    -0.01648343726992607,
-    -0.026574216783046722,
-    0.010379479266703129,
-    -0.019246716052293777,
-    0.004753251560032368,
-    -0.02125387452542782,
-    -0.020071575418114662,
-    0.013046524487435818,
-    0.008894732221961021,
-    0.003447224386036396,
-    0.03530397638678551,
-    0.014902457594871521,
-    -0.01686837151646614,
-    -0.06400907784700394,
-    -0.0007260480197146535,
-    -0.010001419112086296,
-    0.012874678708612919,
-    0.03502902388572693,
-    -0.008406691253185272,
-    -0.002099954290315509,
-    0.02515820786356926,
-    0.02414088137447834,
-    -0.025873085483908653,
-    0.011307446286082268,
-    -0.0017975058872252703,
-    0.06862828880548477,
-    0.0008686799556016922,
-    0.021776285022497177,
-    -0.018463099375367165,
-    0.02283485420048237,
-    0.022436171770095825,
-    -0.0003325213911011815,
-    -0.0284576453268528,
-    0.03777855634689331,
-    0.004440492484718561,
-    0.0005365881370380521,
-    0.023728452622890472,
-    0.03205953165888786,
-    0.03568891063332558,
-    -0.008324204944074154,
-    0.004220529925078154,
-    -0.015012439340353012,
-    0.025818096473813057,
-    -0.002050118986517191,
-    0.02409963868558407,
-    -0.0032513204496353865,
-    -0.016016017645597458,
-    0.013830140233039856,
-    -0.02572186104953289,
-    0.04839174449443817,
-    0.02326103113591671,
-    0.025240693241357803,
-    -0.01668965257704258,
-    -0.007313752081245184,
-    -0.02249116264283657,
-    0.014819972217082977,
-    0.005055699963122606,
-    0.017157072201371193,
-    0.03687120974063873,
-    -0.022436171770095825,
-    -0.013926373794674873,
-    -0.043057654052972794,
-    0.023907171562314034,
-    -0.008750381879508495,
-    0.04902413487434387,
-    0.041655395179986954,
-    -0.06246934458613396,
-    -0.007018177770078182,
-    0.01008390448987484,
-    -0.009375900961458683,
-    -0.0208414439111948,
-    0.017335793003439903,
-    -0.018146904185414314,
-    0.002959182718768716,
-    -0.006836021319031715,
-    0.03648627549409866,
-    0.032691922038793564,
-    -0.003364738542586565,
-    0.023659713566303253,
-    -0.01784445531666279,
-    0.043057654052972794,
-    -0.020181557163596153,
-    -0.002051837509498,
-    0.02361847087740898,
-    0.00555061548948288,
-    0.01008390448987484,
-    0.01574106514453888,
-    -0.019659146666526794,
-    -0.027110375463962555,
-    -0.009973923675715923,
-    -0.04116047918796539,
-    -0.010654432699084282,
-    -0.061754465103149414,
-    -0.02797647751867771,
-    0.0015483296010643244,
-    0.057300224900245667,
-    -0.06158949434757233,
-    -0.0025415976997464895,
-    0.0047601256519556046,
-    0.021955003961920738,
-    0.015122420154511929,
-    0.012888425961136818,
-    0.022188713774085045,
-    -0.02132261171936989,
-    -0.012214791029691696,
-    -0.015534849837422371,
-    -0.030519792810082436,
-    -0.008021756075322628,
-    0.034561604261398315,
-    -0.0052412934601306915,
-    0.01693711057305336,
-    -0.024718282744288445,
-    -0.011767992749810219,
-    -0.0019263901049271226,
-    -0.0006809385376982391,
-    -0.010984376072883606,
-    0.02181752771139145,
-    -0.01147241797298193,
-    0.004478298593312502,
-    0.006770719774067402,
-    0.03931829333305359,
-    0.016428448259830475,
-    0.003058853093534708,
-    -0.009149064309895039,
-    -0.012042945250868797,
-    0.045312270522117615,
-    0.006014598999172449,
-    0.036321304738521576,
-    -0.03475407138466835,
-    0.0022683630231767893,
-    0.0016505777603015304,
-    -0.016112251207232475,
-    0.006279241293668747,
-    0.010723170824348927,
-    0.020813949406147003,
-    -0.021982500329613686,
-    -0.010606315918266773,
-    -0.00478762062266469,
-    0.002124012680724263,
-    -0.03222450241446495,
-    0.015328635461628437,
-    -0.020456509664654732,
-    -0.015053682029247284,
-    0.03791603073477745,
-    0.013431458733975887,
-    0.06362414360046387,
-    0.008771004155278206,
-    -0.01193296443670988,
-    0.031069699674844742,
-    0.006660738494247198,
-    -0.005444071255624294,
-    -0.006313610356301069,
-    0.03249945491552353,
-    -0.0015457519330084324,
-    -0.021941257640719414,
-    -0.0037771682254970074,
-    -0.010461965575814247,
-    -0.015232400968670845,
-    0.0006336809601634741,
-    -0.0259005818516016,
-    0.005574673879891634,
-    -0.0052103609777987,
-    0.012544735334813595,
-    0.01574106514453888,
-    0.021336359903216362,
-    -0.02452581562101841,
-    0.006014598999172449,
-    -0.006640117149800062,
-    -0.012049819342792034,
-    0.004333948250859976,
-    0.00850292481482029,
-    0.023219788447022438,
-    -0.023109806701540947,
-    0.004378627985715866,
-    0.01084002573043108,
-    0.0036671869456768036,
-    -0.0189442690461874,
-    -0.010235128924250603,
-    -0.011293698102235794,
-    -0.014407542534172535,
-    -0.007712434511631727,
-    0.01453127060085535,
-    -0.0042274040170013905,
-    -0.015438616275787354,
-    -0.011974207125604153,
-    -0.023164797574281693,
-    0.007822415791451931,
-    0.0022185277193784714,
-    -0.0029952703043818474,
-    0.015369878150522709,
-    0.000981238903477788,
-    -0.007636822294443846,
-    0.053643349558115005,
-    0.03412167727947235,
-    -0.028485139831900597,
-    0.02091018296778202,
-    -0.007863658480346203,
-    -0.017349539324641228,
-    0.02414088137447834,
-    0.11223585158586502,
-    -0.004316763486713171,
-    -0.03214201703667641,
-    0.0038734017871320248,
-    0.004320200532674789,
-    -0.007416859734803438,
-    -0.04248025268316269,
-    0.017198316752910614,
-    -0.02646423503756523,
-    -0.003459253581240773,
-    -0.006942565552890301,
-    -0.023151051253080368,
-    -0.011396805755794048,
-    0.038878366351127625,
-    -0.003625944023951888,
-    -0.00996017549186945,
-    0.008399817161262035,
-    0.01781696081161499,
-    0.018861781805753708,
-    -0.012854057364165783,
-    0.02660171128809452,
-    -0.00338707841001451,
-    -0.0036018856335431337,
-    -0.0036431285552680492,
-    0.005694965831935406,
-    -0.019384192302823067,
-    -0.01598852314054966,
-    -0.04740191251039505,
-    0.029612448066473007,
-    0.033819232136011124,
-    -0.0023645965848118067,
-    0.0020690220408141613,
-    -0.007059420924633741,
-    -0.013995112851262093,
-    0.028237683698534966,
-    0.024264611303806305,
-    -0.06769344955682755,
-    -0.03423165902495384,
-    0.022972330451011658,
-    0.006891011726111174,
-    0.0173632875084877,
-    0.020057829096913338,
-    0.038850873708724976,
-    -0.029502466320991516,
-    0.008647275157272816,
-    0.0017682920442894101,
-    0.03530397638678551,
-    -0.045697204768657684,
-    0.013376467861235142,
-    -0.01472373865544796,
-    0.04440492391586304,
-    -0.003242728067561984,
-    -0.01967289298772812,
-    0.011630515567958355,
-    -0.005516246426850557,
-    -0.030519792810082436,
-    -0.03654126450419426,
-    0.004766999278217554,
-    -0.0025742482393980026,
-    -0.010022040456533432,
-    -0.019109239801764488,
-    -0.007574957795441151,
-    0.009286540560424328,
-    0.016634661704301834,
-    0.04220530018210411,
-    -0.0020776144228875637,
-    0.0004455099406186491,
-    -0.023673461750149727,
-    0.0016557332128286362,
-    0.014806224033236504,
-    -0.0040143150836229324,
-    0.0720377117395401,
-    0.01655217632651329,
-    0.0010963755194097757,
-    0.014448785223066807,
-    0.019727883860468864,
-    -0.014998691156506538,
-    -0.017102083191275597,
-    0.031812071800231934,
-    0.022601144388318062,
-    -0.003931829240173101,
-    0.04828176274895668,
-    0.031069699674844742,
-    -0.00973333977162838,
-    0.01887552998960018,
-    -0.054303236305713654,
-    -0.012682211585342884,
-    -0.008990965783596039,
-    -0.004127733409404755,
-    -0.025488151237368584,
-    -0.004746377933770418,
-    0.025570638477802277,
-    0.0068978858180344105,
-    -0.0038218479603528976,
-    0.03687120974063873,
-    -0.0032341356854885817,
-    0.027082879096269608,
-    -0.01054445095360279,
-    -0.005200050305575132,
-    0.026972899213433266,
-    0.0014538144459947944,
-    -0.011926090344786644,
-    -0.01996159553527832,
-    -0.02646423503756523,
-    -0.03120717592537403,
-    0.015699822455644608,
-    -0.010723170824348927,
-    0.001302590244449675,
-    -0.0284576453268528,
-    0.004337384831160307,
-    0.02301357313990593,
-    -0.00885348953306675,
-    -0.005272225476801395,
-    0.00554374186322093,
-    -0.0068978858180344105,
-    0.023178545758128166,
-    0.008929101750254631,
-    -0.029859906062483788,
-    -0.01750076375901699,
-    0.012957165017724037,
-    0.018353119492530823,
-    0.014366298913955688,
-    0.019494174048304558,
-    0.0077674249187111855,
-    0.019177978858351707,
-    -0.012922795489430428,
-    0.017651988193392754,
-    0.04044559970498085,
-    -0.03687120974063873,
-    0.013617051765322685,
-    -0.014641252346336842,
-    0.009973923675715923,
-    0.0002352137817069888,
-    0.019700389355421066,
-    0.019686641171574593,
-    0.006014598999172449,
-    -0.018366865813732147,
-    -0.030299831181764603,
-    0.005196613259613514,
-    -0.03302186727523804,
-    0.011919216252863407,
-    -0.005512809380888939,
-    0.0328843891620636,
-    0.005475003272294998,
-    -0.005791199393570423,
-    0.007300004828721285,
-    -0.011183717288076878,
-    -0.0027959293220192194,
-    -0.04830925911664963,
-    0.01865556836128235,
-    -0.003997130785137415,
-    0.026093048974871635,
-    0.01215980015695095,
-    -0.007698686793446541,
-    0.04586217552423477,
-    0.017610745504498482,
-    0.009389648213982582,
-    -0.0019332639640197158,
-    0.03260943666100502,
-    -0.005258477758616209,
-    -0.010757539421319962,
-    0.00019053390133194625,
-    -0.013390216045081615,
-    -0.011321193538606167,
-    -0.006935691926628351,
-    -0.030877232551574707,
-    0.0227661170065403,
-    -0.0018645257223397493,
-    0.028925064951181412,
-    -0.010695675387978554,
-    -0.005313468631356955,
-    0.0010130302980542183,
-    -0.018669314682483673,
-    -0.027399076148867607,
-    -0.035331472754478455,
-    0.028031468391418457,
-    -0.025625627487897873,
-    0.03560642525553703,
-    -0.01673089526593685,
-    0.0262442734092474,
-    -0.022683629766106606,
-    0.006447650026530027,
-    0.007430607452988625,
-    0.009307161904871464,
-    0.005182866007089615,
-    -0.0018009428167715669,
-    0.011836730875074863,
-    -0.017019595950841904,
-    -0.005217235069721937,
-    -0.013438332825899124,
-    -0.023027321323752403,
-    -0.018793044611811638,
-    0.01869681105017662,
-    0.04124296456575394,
-    0.009643979370594025,
-    -0.019521670415997505,
-    -0.03189455717802048,
-    -0.009905185550451279,
-    -0.010441343300044537,
-    -0.018050670623779297,
-    -0.04330511391162872,
-    0.012400384992361069,
-    -0.006932254880666733,
-    0.02832016907632351,
-    -0.011362436227500439,
-    0.0012269781436771154,
-    0.003962761256843805,
-    0.04396500065922737,
-    -0.01666215807199478,
-    0.013115262612700462,
-    0.015961026772856712,
-    -0.02059398591518402,
-    0.016387203708291054,
-    -0.01668965257704258,
-    0.016675904393196106,
-    0.009829573333263397,
-    -0.011018745601177216,
-    0.0461646243929863,
-    -0.038218479603528976,
-    -0.005495625082403421,
-    -0.01978287473320961,
-    -0.03511150926351547,
-    0.003890586318448186,
-    -0.0021583817433565855,
-    -0.005495625082403421,
-    0.025996815413236618,
-    -0.0003810678026638925,
-    0.017473269253969193,
-    -0.0014443629188463092,
-    0.0003202773805242032,
-    0.021391350775957108,
-    -0.018490595743060112,
-    -0.00423427764326334,
-    -0.04624710977077484,
-    0.019837865605950356,
-    -0.0027478125412017107,
-    -0.04698948562145233,
-    -0.018738053739070892,
-    0.000713589193765074,
-    0.009918932802975178,
-    -0.015658577904105186,
-    -0.010688801296055317,
-    -0.005055699963122606,
-    -0.025075722485780716,
-    0.002050118986517191,
-    0.027069132775068283,
-    0.01159614697098732,
-    0.02583184279501438,
-    -0.0455322340130806,
-    -0.02301357313990593,
-    -0.0335167832672596,
-    0.01971413753926754,
-    0.021941257640719414,
-    -0.019177978858351707,
-    -0.00597335584461689,
-    -0.03453410789370537,
-    0.044184960424900055,
-    -0.023219788447022438,
-    0.005450944881886244,
-    -0.029227513819932938,
-    -0.03060228005051613,
-    0.0012012013467028737,
-    0.01750076375901699,
-    0.03082224167883396,
-    -0.025914330035448074,
-    0.0020707405637949705,
-    -0.00896347127854824,
-    0.019494174048304558,
-    -0.015342382714152336,
-    -0.005502498708665371,
-    -0.027591543272137642,
-    0.017528260126709938,
-    -0.006808525882661343,
-    -0.0027512493543326855,
-    -0.015424869023263454,
-    0.007313752081245184,
-    0.025116965174674988,
-    0.028897570446133614,
-    -0.015314887277781963,
-    -0.017102083191275597,
-    0.01245537493377924,
-    -0.00673635071143508,
-    -0.03084973804652691,
-    -0.02016780897974968,
-    -0.011218085885047913,
-    0.01838061399757862,
-    -0.021803779527544975,
-    -0.012173548340797424,
-    -0.008908480405807495,
-    0.0023852181620895863,
-    0.012393510900437832,
-    0.012977786362171173,
-    -0.026752935722470284,
-    0.010248876176774502,
-    -0.00285951211117208,
-    0.017335793003439903,
-    -0.04154541343450546,
-    -0.036348797380924225,
-    -0.0064270286820828915,
-    -0.00978832971304655,
-    0.027536552399396896,
-    -0.002393810311332345,
-    -0.01605726033449173,
-    0.011273076757788658,
-    -0.008159233257174492,
-    0.04432243853807449,
-    0.023480994626879692,
-    0.015301140025258064,
-    0.029997382313013077,
-    0.04154541343450546,
-    -0.02034652978181839,
-    0.013287108391523361,
-    -0.02807271108031273,
-    -0.01561733614653349,
-    -0.03450661152601242,
-    0.031647101044654846,
-    0.004880417603999376,
-    0.02712412364780903,
-    0.043167635798454285,
-    0.03527648374438286,
-    0.007231266237795353,
-    -0.010771287605166435,
-    0.004268646705895662,
-    -0.008289835415780544,
-    -0.0014160084538161755,
-    -0.004846048075705767,
-    0.0032066404819488525,
-    -0.016428448259830475,
-    -0.025996815413236618,
-    -0.0014890428865328431,
-    0.003581264056265354,
-    0.02687666565179825,
-    -0.017088335007429123,
-    -0.009355278685688972,
-    -0.000839466170873493,
-    -0.0022528970148414373,
-    -0.023907171562314034,
-    -0.01528739184141159,
-    0.0008257185108959675,
-    -0.04124296456575394,
-    -0.013623925857245922,
-    0.016318466514348984,
-    0.019796622917056084,
-    -0.008310457691550255,
-    0.022546153515577316,
-    0.03403919190168381,
-    0.037613581866025925,
-    0.0033887969329953194,
-    0.023728452622890472,
-    0.021955003961920738,
-    -0.01321149617433548,
-    0.002538160653784871,
-    -0.021803779527544975,
-    0.04195784032344818,
-    -0.00478762062266469,
-    0.012778445146977901,
-    -0.009162811562418938,
-    -0.053038451820611954,
-    0.019342949613928795,
-    -0.016813382506370544,
-    -0.023590976372361183,
-    0.02048400603234768,
-    0.004416434094309807,
-    0.01926046423614025,
-    -0.010633811354637146,
-    0.01447628065943718,
-    -0.02185877040028572,
-    0.012517239898443222,
-    0.02143259346485138,
-    0.011135600507259369,
-    -0.0049354080110788345,
-    -0.02400340512394905,
-    -0.025281937792897224,
-    0.01020763348788023,
-    -0.02958495356142521,
-    -0.013390216045081615,
-    -0.000666331616230309,
-    0.005220671650022268,
-    -0.002991833258420229,
-    -0.021446341648697853,
-    -0.0015079458244144917,
-    0.004282394424080849,
-    -0.03780604898929596,
-    0.0012570511316880584,
-    0.004894164856523275,
-    -0.007080042269080877,
-    0.04902413487434387,
-    0.004739503841847181,
-    0.011114979162812233
-  ],
-  "Luxury Goods": [
-    0.0073548718355596066,
-    0.0023437298368662596,
-    -0.0123100895434618,
-    0.006897310726344585,
-    0.028795847669243813,
-    -0.021691787987947464,
-    -0.08112728595733643,
-    0.09750458598136902,
-    0.03633374348282814,
-    -0.033405352383852005,
-    -0.0036130384542047977,
-    0.017000937834382057,
-    -0.04698983579874039,
-    -0.02833489701151848,
-    0.022640803828835487,
-    0.03923502191901207,
-    -0.02955506183207035,
-    -0.05612749978899956,
-    -0.007381986360996962,
-    0.047803279012441635,
-    0.04381741210818291,
-    0.028768733143806458,
-    -0.012662581168115139,
-    0.0072531914338469505,
-    -0.005629696883261204,
-    0.049104783684015274,
-    -0.029148340225219727,
-    0.01784149557352066,
-    0.022966179996728897,
-    0.004080767743289471,
-    0.05300930514931679,
-    -0.027602799236774445,
-    0.07884965091943741,
-    -0.03988577425479889,
-    -0.015224923379719257,
-    0.021868033334612846,
-    0.04612216353416443,
-    0.03972308710217476,
-    0.04601370543241501,
-    -0.008066633716225624,
-    -0.0016751822549849749,
-    0.020268265157938004,
-    -0.06485844403505325,
-    -0.014845317229628563,
-    0.0683833584189415,
-    0.0067007290199398994,
-    -0.01379462145268917,
-    -0.022735705599188805,
-    0.004558664746582508,
-    0.06041162833571434,
-    0.01058830413967371,
-    -0.0025589531287550926,
-    -0.004219730384647846,
-    -0.035222042351961136,
-    -0.03234788030385971,
-    -0.018885413184762,
-    0.009476600214838982,
-    -0.01097468938678503,
-    0.005765270441770554,
-    0.003087690332904458,
-    -0.029311029240489006,
-    -0.03218518942594528,
-    0.008744502440094948,
-    0.013062523677945137,
-    -0.03714718669652939,
-    -0.022844163700938225,
-    -0.05563943460583687,
-    -0.018044855445623398,
-    0.019020985811948776,
-    0.0008456407813355327,
-    0.021542657166719437,
-    -0.02950083091855049,
-    -0.0019048100803047419,
-    -0.001965818228200078,
-    -0.004162111785262823,
-    0.020227592438459396,
-    -0.004595947451889515,
-    0.011157713830471039,
-    0.0317513532936573,
-    0.01416744850575924,
-    0.0026470760349184275,
-    0.03139886260032654,
-    -0.044251248240470886,
-    0.0421362966299057,
-    -0.045281607657670975,
-    -0.033134207129478455,
-    0.006043196655809879,
-    0.007951395586133003,
-    -0.018343118950724602,
-    -0.004165501333773136,
-    -0.021135935559868813,
-    -0.03408322110772133,
-    0.004629841074347496,
-    -0.012818491086363792,
-    -0.04278705269098282,
-    0.029202569276094437,
-    -0.01310319546610117,
-    0.06670224666595459,
-    -0.014492825604975224,
-    0.07142021507024765,
-    0.014696186408400536,
-    -0.021217279136180878,
-    0.009334247559309006,
-    -0.042109183967113495,
-    0.027182521298527718,
-    -0.030992140993475914,
-    -0.0003442300367169082,
-    -0.019495494663715363,
-    -0.031100600957870483,
-    -0.036143939942121506,
-    -0.051789142191410065,
-    0.008588592521846294,
-    -0.010344271548092365,
-    0.054690420627593994,
-    -0.0191565603017807,
-    0.04357337951660156,
-    -0.00146080635022372,
-    -0.015265596099197865,
-    0.010839114896953106,
-    -0.02833489701151848,
-    0.022789934650063515,
-    -0.004267181269824505,
-    0.032863058149814606,
-    -0.07228787988424301,
-    -0.037065841257572174,
-    0.0186142660677433,
-    -0.04235321655869484,
-    0.009469821117818356,
-    0.009483378380537033,
-    -0.05268393084406853,
-    0.013076080940663815,
-    -0.05349737033247948,
-    0.004877262748777866,
-    -0.0013523474335670471,
-    -0.01348958071321249,
-    0.008825846016407013,
-    -0.004057042300701141,
-    -0.01827533170580864,
-    -0.024931998923420906,
-    -0.019441265612840652,
-    0.01113059837371111,
-    -0.03004312701523304,
-    0.04208206757903099,
-    0.0166891198605299,
-    -0.0008401331142522395,
-    0.01466907188296318,
-    -0.00516874622553587,
-    -0.02155621349811554,
-    -0.03747256472706795,
-    0.0437902957201004,
-    -0.027711259201169014,
-    -0.003535083495080471,
-    -0.025311604142189026,
-    0.008934305049479008,
-    0.026626668870449066,
-    -0.027643471956253052,
-    -0.00020579660485964268,
-    -0.01340823620557785,
-    -0.03096502646803856,
-    -0.019346363842487335,
-    0.045335836708545685,
-    -0.011313622817397118,
-    -0.011720344424247742,
-    -0.044142790138721466,
-    0.027223194018006325,
-    -0.010906902141869068,
-    -0.00373505474999547,
-    0.022735705599188805,
-    -0.03074810840189457,
-    -0.025433620437979698,
-    -0.023454245179891586,
-    0.02171890251338482,
-    -0.009096993133425713,
-    0.03514069691300392,
-    0.011218721978366375,
-    -0.03627951443195343,
-    -0.016702676191926003,
-    0.0032097066286951303,
-    6.190844578668475e-05,
-    -0.017366988584399223,
-    0.02287127822637558,
-    -0.00522636529058218,
-    -0.009978222660720348,
-    -0.041892264038324356,
-    -0.06306887418031693,
-    -0.01239821221679449,
-    -0.037770826369524,
-    -0.01729920133948326,
-    -0.0037113293074071407,
-    0.018424462527036667,
-    -0.02467440813779831,
-    -0.0032588522881269455,
-    0.02560986764729023,
-    0.030395617708563805,
-    0.023440688848495483,
-    0.021691787987947464,
-    -0.010961131192743778,
-    0.05021648854017258,
-    -0.006016081664711237,
-    -0.0029707581270486116,
-    0.014750415459275246,
-    -0.014126776717603207,
-    0.026057260110974312,
-    -0.047613475471735,
-    0.0011439028894528747,
-    0.03842157870531082,
-    0.002752145519480109,
-    0.05981510505080223,
-    0.0030080408323556185,
-    -0.032591912895441055,
-    0.019441265612840652,
-    -0.014397923834621906,
-    0.009212231263518333,
-    -0.002450494095683098,
-    -0.000717693124897778,
-    -0.022017164155840874,
-    0.05284661799669266,
-    -0.03633374348282814,
-    0.06588880717754364,
-    0.03546607494354248,
-    0.011747458949685097,
-    0.038394466042518616,
-    0.0044434270821511745,
-    0.03476108983159065,
-    -0.001515883137471974,
-    0.033513810485601425,
-    0.008846182376146317,
-    -0.008995313197374344,
-    -0.03167001157999039,
-    -0.026545325294137,
-    -0.013177760876715183,
-    -0.004172279965132475,
-    -0.034489940851926804,
-    -0.047613475471735,
-    -0.027318095788359642,
-    0.033405352383852005,
-    0.015780774876475334,
-    0.005104348994791508,
-    0.012052499689161777,
-    -0.02768414467573166,
-    -0.024986227974295616,
-    -0.022451000288128853,
-    -0.02238321304321289,
-    -0.022667918354272842,
-    -0.0005918638198636472,
-    -0.026680899783968925,
-    -0.00799206830561161,
-    0.01160510629415512,
-    0.008059854619204998,
-    -0.006219442468136549,
-    -0.04042806848883629,
-    -0.006182159762829542,
-    -0.007449773605912924,
-    0.008981755934655666,
-    0.025799669325351715,
-    0.0007117617642506957,
-    -0.03026004321873188,
-    0.01854647882282734,
-    -0.00799206830561161,
-    -0.037120070308446884,
-    0.0017472057370468974,
-    -0.04406144469976425,
-    -0.0016658615786582232,
-    -0.004290906712412834,
-    0.01157121267169714,
-    -0.012906613759696484,
-    -0.0034334033261984587,
-    -0.024376146495342255,
-    0.0328359454870224,
-    -0.0030741330701857805,
-    -0.04712541028857231,
-    -0.02040383778512478,
-    0.013448908925056458,
-    0.01647220179438591,
-    -0.02396942488849163,
-    -0.029853323474526405,
-    -0.015536743216216564,
-    -0.0432208888232708,
-    0.0010456119198352098,
-    -0.02341357432305813,
-    -0.039641741663217545,
-    -0.017868610098958015,
-    0.011801688000559807,
-    0.026911374181509018,
-    -0.008581813424825668,
-    -0.01712295413017273,
-    0.048399802297353745,
-    -0.0042129517532885075,
-    -0.05159933865070343,
-    0.005046729929745197,
-    0.04208206757903099,
-    -0.04143131524324417,
-    -0.006982044316828251,
-    -0.042488791048526764,
-    0.002860604552552104,
-    -0.011584770865738392,
-    -0.017868610098958015,
-    -0.0056330859661102295,
-    0.025460736826062202,
-    -0.016770463436841965,
-    0.009740968234837055,
-    0.06870874017477036,
-    -0.030124470591545105,
-    0.02451172098517418,
-    -0.026992717757821083,
-    0.020593641325831413,
-    0.028633160516619682,
-    -0.01663488894701004,
-    0.03245633840560913,
-    -0.0047111851163208485,
-    0.027168964967131615,
-    0.028633160516619682,
-    -0.010900123044848442,
-    -0.07028139382600784,
-    -0.012221966870129108,
-    -0.024416819214820862,
-    -0.057917073369026184,
-    -0.022247640416026115,
-    0.02993466705083847,
-    -0.04655599966645241,
-    0.05013514310121536,
-    -0.04547141119837761,
-    0.010540853254497051,
-    0.011415303684771061,
-    0.03085656836628914,
-    -0.035710107535123825,
-    -0.003623206401243806,
-    -0.03880118578672409,
-    -0.06670224666595459,
-    -0.042271871119737625,
-    -0.00831744447350502,
-    0.03142597898840904,
-    -0.00892074778676033,
-    -0.008961419574916363,
-    -0.007192183285951614,
-    -0.025813227519392967,
-    0.02150198444724083,
-    -0.004961996339261532,
-    -0.015604529529809952,
-    -0.045498523861169815,
-    0.019387034699320793,
-    -0.009049543179571629,
-    0.020607197657227516,
-    0.03785216808319092,
-    0.0645872950553894,
-    0.03725564479827881,
-    0.0486980639398098,
-    0.05889320373535156,
-    -0.008324223570525646,
-    0.04097036272287369,
-    -0.00284535251557827,
-    0.014574170112609863,
-    0.013733613304793835,
-    0.06637687236070633,
-    -0.0486980639398098,
-    -0.06203851476311684,
-    0.0317242406308651,
-    0.00979519821703434,
-    -0.05591058358550072,
-    0.03744544833898544,
-    -0.0492674745619297,
-    0.0036299850326031446,
-    -0.005982188507914543,
-    0.0044129230082035065,
-    0.01187625341117382,
-    0.01064253319054842,
-    0.005863561294972897,
-    0.05515136942267418,
-    0.026070818305015564,
-    0.028795847669243813,
-    0.019441265612840652,
-    -0.01064253319054842,
-    0.06887142360210419,
-    -0.020430952310562134,
-    -0.002336951205506921,
-    -0.009313911199569702,
-    -0.000831236073281616,
-    0.01849224977195263,
-    -0.01740765944123268,
-    -0.046528883278369904,
-    -0.033079978078603745,
-    0.00551445921882987,
-    0.02243744395673275,
-    -0.006216052919626236,
-    0.07429437339305878,
-    0.019875099882483482,
-    -0.010412057861685753,
-    0.016756905242800713,
-    -0.009022427722811699,
-    0.00305718625895679,
-    0.0044434270821511745,
-    -0.006893921177834272,
-    0.00946304202079773,
-    0.03031427413225174,
-    -0.038990989327430725,
-    0.020105576142668724,
-    0.05574789643287659,
-    0.03923502191901207,
-    0.03595414012670517,
-    0.0405094139277935,
-    0.002458967501297593,
-    -0.0443325899541378,
-    -5.7142184232361615e-05,
-    -0.032591912895441055,
-    0.014696186408400536,
-    -0.011117041110992432,
-    -0.008324223570525646,
-    -0.010961131192743778,
-    -0.007666691206395626,
-    -0.026965603232383728,
-    0.011984712444245815,
-    -0.02588101476430893,
-    -0.0022064615041017532,
-    -0.010242590680718422,
-    -0.020702099427580833,
-    0.024471048265695572,
-    -0.014397923834621906,
-    0.04685426130890846,
-    0.02670801430940628,
-    -0.03492377698421478,
-    0.019359920173883438,
-    0.017611021175980568,
-    -0.027263866737484932,
-    0.030720993876457214,
-    0.009124108590185642,
-    -0.007151511497795582,
-    0.029148340225219727,
-    -0.06312309950590134,
-    -0.03945193812251091,
-    -0.028443356975913048,
-    -0.0022047669626772404,
-    0.003175813239067793,
-    0.06100815162062645,
-    0.012689695693552494,
-    -0.053090650588274,
-    -0.0011777962790802121,
-    -0.020661428570747375,
-    0.011747458949685097,
-    -0.013333670794963837,
-    -0.04059075936675072,
-    0.01548251323401928,
-    -0.04053653031587601,
-    -0.008446239866316319,
-    -0.0014057295629754663,
-    -0.032158076763153076,
-    0.023061081767082214,
-    -0.007259970065206289,
-    0.008554698899388313,
-    -0.005646643694490194,
-    -0.07071522623300552,
-    0.0060364180244505405,
-    0.03671335056424141,
-    -0.05591058358550072,
-    -0.06973909586668015,
-    -0.0007931059808470309,
-    0.05921858176589012,
-    -0.006622774060815573,
-    0.013909858651459217,
-    -0.02775193192064762,
-    -0.02171890251338482,
-    0.03359515592455864,
-    0.04937593266367912,
-    0.03595414012670517,
-    0.010161247104406357,
-    0.03977731615304947,
-    -0.0033198604360222816,
-    0.003184286644682288,
-    -0.0008066633599810302,
-    0.018261773511767387,
-    -0.016499316319823265,
-    -0.04362760856747627,
-    -0.000520687666721642,
-    -0.005416168365627527,
-    0.014641956426203251,
-    0.010906902141869068,
-    -0.027982406318187714,
-    0.00936136208474636,
-    -0.008663157932460308,
-    0.024172786623239517,
-    0.013211654499173164,
-    -0.01883118413388729,
-    0.03294440358877182,
-    -0.04777616262435913,
-    0.005199250299483538,
-    -0.04031961038708687,
-    0.033351123332977295,
-    -0.0008062396664172411,
-    -0.011266171932220459,
-    -0.06572611629962921,
-    -0.0591101236641407,
-    -0.02479642443358898,
-    -0.03934348002076149,
-    -0.03671335056424141,
-    -0.016065480187535286,
-    0.01006634533405304,
-    -0.00425701355561614,
-    -0.016662005335092545,
-    -0.0048128655180335045,
-    0.06371963024139404,
-    -0.05208740383386612,
-    0.0243490319699049,
-    -0.056886713951826096,
-    0.010601861402392387,
-    -0.006836302578449249,
-    0.017909282818436623,
-    0.004562054295092821,
-    0.02041739597916603,
-    0.011489869095385075,
-    -0.011184828355908394,
-    0.011096705682575703,
-    -0.007700584828853607,
-    0.07033561915159225,
-    -0.03644220530986786,
-    -0.008053076453506947,
-    -0.027019834145903587,
-    -0.012099950574338436,
-    -0.03874695673584938,
-    -0.009388476610183716,
-    0.0016607774887233973,
-    -0.008893633261322975,
-    0.009910435415804386,
-    -0.018478691577911377,
-    0.005355160217732191,
-    -0.022722147405147552,
-    0.005477176513522863,
-    0.009151223115622997,
-    0.008324223570525646,
-    -0.04004846513271332,
-    -0.0064329709857702255,
-    -0.057320550084114075,
-    0.009429149329662323,
-    -0.01586212031543255,
-    -0.02966351993381977,
-    -0.02357626147568226,
-    -0.004921324551105499,
-    -0.01784149557352066,
-    -0.006426192354410887,
-    -0.018587151542305946,
-    0.003272409550845623,
-    0.016390856355428696,
-    0.056995172053575516,
-    0.0012210103450343013,
-    -0.023874523118138313,
-    0.012316868640482426,
-    -0.00044103810796514153,
-    -0.02510824427008629,
-    0.010798443108797073,
-    -0.023332228884100914,
-    -0.016973823308944702,
-    0.027873948216438293,
-    -0.006931203883141279,
-    -0.02478286810219288,
-    0.032266534864902496,
-    0.020878346636891365,
-    0.006605827249586582,
-    0.023440688848495483,
-    -0.00856825616210699,
-    0.03413745015859604,
-    0.02784683182835579,
-    0.03405610844492912,
-    0.018071969971060753,
-    -0.007076945621520281,
-    0.029039880260825157,
-    0.02674868516623974,
-    0.021190164610743523,
-    0.04574255645275116,
-    0.01892608404159546,
-    0.01033749245107174,
-    0.0068261343985795975,
-    0.022301869466900826,
-    -0.02741299755871296,
-    -0.004453595262020826,
-    0.02703339047729969,
-    -0.025813227519392967,
-    0.04351915046572685,
-    -0.017665250226855278,
-    0.028795847669243813,
-    -0.014411482028663158,
-    0.03134463354945183,
-    0.022125624120235443,
-    -0.008405568078160286,
-    0.018966756761074066,
-    -0.006046585738658905,
-    0.012499893084168434,
-    -0.05501579865813255,
-    -0.0007761592860333622,
-    0.01630951277911663,
-    0.014614841900765896,
-    0.03806908801198006,
-    0.023820294067263603,
-    -0.006846470758318901,
-    0.0005325503298081458,
-    -0.010222255252301693,
-    0.023549146950244904,
-    0.00984942726790905,
-    -0.006477032322436571,
-    0.02297973819077015,
-    0.006666835397481918,
-    0.005511069670319557,
-    -0.005067066289484501,
-    0.0007257428369484842,
-    -0.03267325460910797,
-    -0.02512180246412754,
-    -0.014547055587172508,
-    -0.03240210935473442,
-    0.03256479650735855,
-    0.006446528248488903,
-    0.006921036168932915,
-    0.02468796633183956,
-    0.01735343039035797,
-    0.013835293240845203,
-    0.0008583508315496147,
-    0.01513002160936594,
-    -0.05379563570022583,
-    -0.04609505087137222,
-    0.0033859524410218,
-    -0.016716234385967255,
-    -0.01892608404159546,
-    -0.008717386983335018,
-    -0.04164823144674301,
-    0.02090546116232872,
-    0.03332401067018509,
-    0.021637558937072754,
-    -0.003694382729008794,
-    -0.02292550913989544,
-    0.041024595499038696,
-    0.014275907538831234,
-    -0.04514603316783905,
-    -0.0017226330237463117,
-    -0.00694815069437027,
-    0.041024595499038696,
-    -0.005029783118516207,
-    0.008114084601402283,
-    -0.03644220530986786,
-    -0.014574170112609863,
-    0.06165890768170357,
-    -0.013204875402152538,
-    0.0015904486645013094,
-    0.002352203242480755,
-    0.033568043261766434,
-    0.0038740176241844893,
-    0.02072921395301819,
-    0.02079700119793415,
-    -0.01663488894701004,
-    -0.007043052464723587,
-    0.030341388657689095,
-    0.013828515075147152,
-    -0.021705344319343567,
-    0.012791376560926437,
-    0.01159832812845707,
-    0.027724815532565117,
-    0.012682917527854443,
-    -0.017990626394748688,
-    -0.02123083733022213,
-    0.012147401459515095,
-    0.03408322110772133,
-    0.03370361402630806,
-    0.03484243527054787,
-    0.01072387769818306,
-    0.035005122423172,
-    -0.012418548576533794,
-    0.02472863905131817,
-    -0.01701449602842331,
-    0.005317877512425184,
-    0.030070241540670395,
-    0.02955506183207035,
-    0.011218721978366375,
-    0.02806374989449978,
-    -0.00048509956104680896,
-    -0.012411769479513168,
-    0.03251056745648384,
-    0.00785649474710226,
-    0.009008870460093021,
-    -0.01097468938678503,
-    0.0008155604009516537,
-    -0.008419125340878963,
-    0.04739655554294586,
-    -0.010520516894757748,
-    0.00022750957577954978,
-    -0.029907552525401115,
-    0.007768371608108282,
-    -0.01212028693407774,
-    -0.06095392256975174,
-    -0.01690603792667389,
-    -0.007768371608108282,
-    -0.02933814376592636,
-    0.03223941847681999,
-    -0.006504146847873926,
-    0.005094180814921856,
-    0.017990626394748688,
-    -0.03289017453789711,
-    0.01458772737532854,
-    0.009266460314393044,
-    0.011049254797399044,
-    0.022830607369542122,
-    -0.004626451525837183,
-    0.033079978078603745,
-    0.03421879559755325,
-    -0.017977070063352585,
-    -0.06827490031719208,
-    -0.00023661843442823738,
-    -0.012235524132847786,
-    -0.016173940151929855,
-    -0.04067210108041763,
-    -0.03730987384915352,
-    0.020539412274956703,
-    -0.020159805193543434,
-    -0.016011251136660576,
-    0.01077810674905777,
-    -0.005880508106201887,
-    0.017705921083688736,
-    0.006161823403090239,
-    -0.011184828355908394,
-    -0.0036265957169234753,
-    -0.007361650466918945,
-    0.01778726652264595,
-    -0.007361650466918945,
-    -0.023291558027267456,
-    -0.0007448078831657767,
-    -0.007287085056304932,
-    0.012160958722233772,
-    0.018505806103348732,
-    -0.000423244055127725,
-    0.0014057295629754663,
-    0.009524050168693066,
-    -0.019793756306171417,
-    0.006121151614934206,
-    0.07076945900917053,
-    0.005944905802607536,
-    0.003962140530347824,
-    0.03248345106840134,
-    -0.004768804181367159,
-    -0.03617105633020401,
-    -0.011754237115383148,
-    0.025460736826062202,
-    -0.008059854619204998,
-    -0.019346363842487335,
-    -0.024918440729379654,
-    0.01367938332259655,
-    0.006907478906214237,
-    -0.003606259822845459,
-    -0.025596309453248978,
-    -0.004358693491667509,
-    -0.005663590040057898,
-    0.044902000576257706,
-    0.007517560385167599,
-    0.004965385887771845,
-    -0.007043052464723587,
-    -0.0018065192271023989,
-    -0.010540853254497051,
-    0.008581813424825668,
-    0.010418836958706379,
-    0.017977070063352585,
-    -0.02467440813779831,
-    -0.02222052589058876,
-    -0.07071522623300552,
-    0.05132819339632988,
-    0.0054398938082158566,
-    0.03253768011927605,
-    -0.009239345788955688,
-    -0.013509917072951794,
-    0.008602149784564972,
-    0.0108052222058177,
-    0.001319301314651966,
-    -0.007090503349900246,
-    -0.026396194472908974,
-    -0.03435437008738518,
-    -0.010018894448876381,
-    -0.02424057386815548,
-    -0.024715080857276917,
-    -0.02670801430940628,
-    0.013645490631461143,
-    0.020037788897752762,
-    -0.048020195215940475,
-    -0.029744863510131836,
-    -0.03161578252911568,
-    -0.004182447679340839,
-    0.01550962869077921,
-    -0.024091441184282303,
-    -0.019834429025650024,
-    0.028090864419937134,
-    0.00935458391904831,
-    -0.022247640416026115,
-    0.00040947485831566155,
-    -0.026775801554322243,
-    -0.01706872507929802,
-    0.05027071759104729,
-    -0.03251056745648384,
-    0.010168025270104408,
-    0.010967910289764404,
-    0.014506382867693901,
-    -0.027819717302918434,
-    0.009042764082551003,
-    0.0016150213778018951,
-    -0.02703339047729969,
-    0.003180897329002619,
-    0.003206317313015461,
-    -0.048454031348228455,
-    0.01719074137508869,
-    0.006138097960501909,
-    -0.013001515530049801,
-    0.026802916079759598,
-    -0.010812000371515751,
-    -0.006738011725246906,
-    0.003616427769884467,
-    0.02204427868127823,
-    -0.026192834600806236,
-    0.013814957812428474,
-    -0.035438958555459976,
-    -0.012662581168115139,
-    0.020647870376706123,
-    -0.0025437010917812586,
-    -0.006022860296070576,
-    -0.009158001281321049,
-    0.03397476300597191,
-    -0.022695032879710197,
-    -0.015116464346647263,
-    -0.0030232928693294525,
-    -0.026341965422034264,
-    -0.018505806103348732,
-    0.016594218090176582,
-    -0.028606045991182327,
-    -0.029311029240489006,
-    -0.0029097499791532755,
-    0.03183269873261452,
-    0.002784344367682934,
-    -0.014018317684531212,
-    0.012066056951880455,
-    -0.025487851351499557,
-    -0.03736410290002823,
-    -0.010269706137478352,
-    0.005558520555496216,
-    0.01111026294529438,
-    0.03638797253370285,
-    -0.0061347088776528835,
-    0.0355745330452919,
-    0.004599337000399828,
-    -0.012323646806180477,
-    -0.0036876038648188114,
-    0.0063346801325678825,
-    0.03020581416785717,
-    -0.012133844196796417,
-    0.006422802805900574,
-    0.0169602669775486,
-    -0.0031724239233881235,
-    -0.013198097236454487,
-    -0.024267688393592834,
-    -0.009076657705008984,
-    -0.05189760401844978,
-    0.027602799236774445,
-    -0.002450494095683098,
-    -0.0032164854928851128,
-    0.019617510959506035,
-    0.016065480187535286,
-    -0.028768733143806458,
-    -0.004040095489472151,
-    0.00756501080468297,
-    0.013096417300403118,
-    -0.004080767743289471,
-    0.0426785908639431,
-    -0.06599726527929306,
-    0.006846470758318901,
-    -0.006639720872044563,
-    -0.03907233104109764,
-    -0.032754600048065186,
-    0.024199901148676872,
-    0.013848850503563881,
-    0.07299286872148514,
-    0.02090546116232872,
-    0.003616427769884467,
-    0.0120389424264431,
-    -0.02467440813779831,
-    -0.04080767557024956,
-    -0.027114734053611755,
-    0.016811136156320572,
-    -0.0013260799460113049,
-    0.0006134708528406918,
-    0.03397476300597191,
-    -0.006182159762829542,
-    0.009530829265713692,
-    0.032808829098939896,
-    0.0629604160785675,
-    0.011815245263278484,
-    0.007043052464723587,
-    0.010669647715985775,
-    -0.0038367349188774824,
-    0.0001847191306296736,
-    0.04208206757903099,
-    -0.008771616965532303,
-    -0.0050128367729485035,
-    0.02156977169215679,
-    -0.019956445321440697,
-    0.034489940851926804,
-    -0.024443933740258217,
-    -0.03026004321873188,
-    -0.026680899783968925,
-    -0.006090647540986538,
-    0.01794995367527008,
-    0.018302446231245995,
-    -0.010195140726864338,
-    -0.023277999833226204,
-    -0.04004846513271332,
-    -0.010534074157476425,
-    0.014113219454884529,
-    -0.027223194018006325,
-    0.005629696883261204,
-    -0.028578929603099823,
-    0.009801976382732391,
-    -0.0022708589676767588,
-    0.02222052589058876,
-    0.04465796798467636,
-    -0.021976493299007416,
-    -0.05422946810722351,
-    0.02615216188132763,
-    0.03462551534175873,
-    0.01953616552054882,
-    -0.004280738532543182,
-    0.007463330868631601,
-    0.00667700357735157,
-    -0.004921324551105499,
-    0.006819355767220259,
-    0.005199250299483538,
-    -0.03644220530986786,
-    0.0016167160356417298,
-    0.0009447790216654539,
-    0.008852960541844368,
-    0.010601861402392387,
-    -0.02966351993381977,
-    -0.0022759430576115847,
-    -0.015441841445863247,
-    0.014791088178753853,
-    0.00979519821703434,
-    -0.030992140993475914,
-    -0.003085995791479945,
-    0.005422946996986866,
-    -0.022966179996728897,
-    0.03600836917757988,
-    -0.0014438596554100513,
-    -0.00485692685469985,
-    0.011361073702573776,
-    0.003752001328393817,
-    0.03486954793334007,
-    0.004799308255314827,
-    0.00018503688625060022,
-    -0.0017760151531547308,
-    -0.02806374989449978,
-    -0.0002108806074829772,
-    0.035276271402835846,
-    0.020430952310562134,
-    -0.004524771589785814,
-    0.025514965876936913,
-    -0.06908834725618362,
-    -0.0037113293074071407,
-    -0.01582144759595394,
-    0.002269164426252246,
-    0.02917545475065708,
-    0.0010218865936622024,
-    0.00801240373402834,
-    0.04224475845694542,
-    -0.00013377307914197445,
-    -0.019183674827218056,
-    -0.008547919802367687,
-    0.012588015757501125,
-    -0.013964088633656502,
-    -0.02072921395301819,
-    0.016160381957888603,
-    -0.03424590826034546,
-    -0.02577255479991436,
-    -0.01564520224928856,
-    -0.01348958071321249,
-    -0.04075344651937485,
-    0.002658938756212592,
-    0.017868610098958015,
-    0.03709295764565468,
-    0.017868610098958015,
-    0.028497586026787758,
-    0.027657030150294304,
-    -0.0021573160775005817,
-    0.032266534864902496,
-    -0.04040095582604408,
-    0.007924281060695648,
-    0.009537608362734318,
-    0.024308359250426292,
-    0.019834429025650024,
-    -0.0008405568078160286,
-    -0.018180429935455322,
-    0.01379462145268917,
-    0.03354092687368393,
-    0.033351123332977295,
-    -0.009476600214838982,
-    0.04625773802399635,
-    -0.0033639217726886272,
-    -0.033188436180353165,
-    0.03435437008738518,
-    -0.015116464346647263,
-    0.02533872053027153,
-    0.03020581416785717,
-    0.03869272768497467,
-    0.012588015757501125,
-    0.013340449891984463,
-    -0.020783444866538048,
-    0.012025385163724422,
-    -0.011618663556873798,
-    -0.023128869011998177,
-    -0.03508646786212921,
-    -0.004026538226753473,
-    0.020946132019162178,
-    0.022735705599188805,
-    -0.009944329038262367,
-    -0.04116016626358032,
-    0.017244970425963402,
-    0.01866849511861801,
-    -0.04170246049761772,
-    -0.017855053767561913,
-    0.011510204523801804,
-    -0.004246845375746489,
-    0.016268840059638023,
-    -0.02341357432305813,
-    0.0048433695919811726,
-    0.04262436181306839,
-    0.009564722888171673,
-    -0.008371674455702305,
-    0.00913766585290432,
-    0.008188650012016296,
-    0.01789572462439537,
-    0.02795529179275036,
-    0.017095839604735374,
-    0.05195183306932449,
-    0.0008409804431721568,
-    -0.02674868516623974,
-    0.020878346636891365,
-    -0.011937261559069157,
-    -0.028768733143806458,
-    -0.02495911344885826,
-    0.03321554884314537,
-    0.035384729504585266,
-    0.019780199974775314,
-    -0.036794696003198624,
-    -0.024335473775863647,
-    0.016173940151929855,
-    -0.011510204523801804,
-    0.023128869011998177,
-    -9.468974167248234e-05,
-    0.0010693373624235392,
-    0.0022369655780494213,
-    -0.03671335056424141,
-    -0.013421793468296528,
-    0.03145309165120125,
-    0.04636619612574577,
-    -0.047586359083652496,
-    0.01256090123206377,
-    -0.03749967738986015,
-    -0.026057260110974312,
-    0.003646931843832135,
-    -0.011422081850469112,
-    -0.01805841363966465,
-    0.002084445208311081,
-    5.851910464116372e-05,
-    0.03752679377794266,
-    -0.01042561512440443,
-    -0.008791952393949032,
-    -0.002018352970480919,
-    0.026802916079759598,
-    0.016011251136660576,
-    0.04034672677516937,
-    -0.03164289519190788,
-    -0.0017277169972658157,
-    -0.01854647882282734,
-    -0.025203146040439606,
-    0.05523271486163139,
-    0.01991577260196209,
-    0.04069921746850014,
-    0.04319377243518829,
-    -0.01762457750737667,
-    -0.020593641325831413,
-    -0.0008286940865218639,
-    -0.010493402369320393,
-    -0.04658311605453491,
-    0.010534074157476425,
-    0.00897497683763504,
-    -0.004009591415524483,
-    0.021434197202324867,
-    -0.01507579255849123,
-    0.02199004963040352,
-    -0.017272086814045906,
-    0.003497800789773464,
-    0.0018760006641969085,
-    0.030124470591545105,
-    0.02577255479991436,
-    0.005077234003692865,
-    0.0016929762205109,
-    0.017380544915795326,
-    -0.01113059837371111,
-    0.025040457025170326,
-    0.0032334320712834597,
-    0.009517272002995014,
-    0.010107017122209072,
-    0.011442418210208416,
-    0.04246167466044426,
-    -0.019983559846878052,
-    0.05116550624370575,
-    0.04137708619236946,
-    0.025216704234480858,
-    -0.036143939942121506,
-    0.052277207374572754,
-    -0.014872431755065918,
-    0.012852384708821774,
-    0.02533872053027153,
-    -0.001695518265478313,
-    -0.032700370997190475,
-    -0.024525277316570282,
-    -0.0024708302225917578,
-    0.024199901148676872,
-    0.008168313652276993,
-    -0.018207544460892677,
-    -0.025460736826062202,
-    -0.005372107028961182,
-    0.015889234840869904,
-    -0.02363049052655697,
-    -0.006487200502306223,
-    -0.048887867480516434,
-    -0.027426553890109062,
-    0.04717963933944702,
-    -0.0322936475276947,
-    -0.0025894572027027607,
-    0.03880118578672409,
-    -0.024769309908151627,
-    0.03771659731864929,
-    0.016404414549469948,
-    0.005700873211026192,
-    0.005453451070934534,
-    0.032158076763153076,
-    0.033622272312641144,
-    -0.03853003680706024,
-    -0.057103630155324936,
-    -0.005222975742071867,
-    -0.032808829098939896,
-    -0.018532920628786087,
-    -0.07434860616922379,
-    0.021651115268468857,
-    0.005460229702293873,
-    -0.018044855445623398,
-    -0.005582245998084545,
-    -0.027345210313796997,
-    0.005131463520228863,
-    -0.003092774422839284,
-    0.006778683513402939,
-    0.10108373314142227,
-    0.016865365207195282,
-    -0.04669157415628433,
-    0.033839188516139984,
-    0.009368141181766987,
-    -0.015550300478935242,
-    -0.02133929543197155,
-    0.006863417103886604,
-    0.02072921395301819,
-    0.022234082221984863,
-    -0.0008219153969548643,
-    0.019902216270565987,
-    0.02676224336028099,
-    0.00787683017551899,
-    0.01453349832445383,
-    0.0009608783875592053,
-    -0.011625442653894424,
-    -0.017529675737023354,
-    0.0009939244482666254,
-    -0.03242922201752663,
-    0.04262436181306839,
-    9.156519081443548e-05,
-    -0.018966756761074066,
-    0.002003100933507085,
-    0.03316131979227066,
-    -0.006249946542084217,
-    0.004965385887771845,
-    -0.016079038381576538,
-    -0.018804067745804787,
-    -0.008880075998604298,
-    -0.005924569442868233,
-    0.011035697534680367,
-    -0.045281607657670975,
-    0.03934348002076149,
-    -0.002933475421741605,
-    0.016648447141051292,
-    0.013442129828035831,
-    -0.03511358052492142,
-    0.009591837413609028,
-    -0.011815245263278484,
-    0.028443356975913048,
-    -0.0027741764206439257,
-    -0.016621332615613937,
-    0.004673902411013842,
-    0.010432394221425056,
-    0.009402033872902393,
-    -7.922586519271135e-05,
-    -0.009334247559309006,
-    -0.02490488439798355,
-    -0.029799094423651695,
-    0.0012311784084886312,
-    -0.009991779923439026,
-    -0.028551815077662468,
-    0.010079902596771717,
-    0.008371674455702305,
-    -0.009923992678523064,
-    -0.016973823308944702,
-    -0.02151554264128208,
-    -0.03535761311650276,
-    0.01805841363966465,
-    -0.01586212031543255,
-    0.001723480294458568,
-    -0.03516780957579613,
-    0.005748323630541563,
-    0.055286943912506104,
-    -0.026680899783968925,
-    -0.02363049052655697,
-    0.007761592976748943,
-    -0.025853900238871574,
-    0.016824692487716675,
-    0.03134463354945183,
-    0.026192834600806236,
-    0.010879787616431713,
-    0.014208121225237846,
-    -0.04400721564888954,
-    0.005233143921941519,
-    0.02998889610171318,
-    -0.009557943791151047,
-    -0.006900699809193611,
-    -0.012594793923199177,
-    0.004650176968425512,
-    0.013503137975931168,
-    0.024037212133407593,
-    0.012676138430833817,
-    -0.045118920505046844,
-    -0.033242665231227875,
-    -0.021163050085306168,
-    0.010107017122209072,
-    -0.011035697534680367,
-    0.006799019873142242,
-    -0.010561189614236355,
-    -0.03272748365998268,
-    -0.00371471862308681,
-    -0.029907552525401115,
-    -0.004748467821627855,
-    -0.00031478513847105205,
-    0.009232567623257637,
-    0.02062075585126877,
-    -0.005965241696685553,
-    0.007449773605912924,
-    0.01050695963203907,
-    -0.02331867255270481,
-    -0.0328359454870224,
-    0.05300930514931679,
-    -0.017977070063352585,
-    -0.016065480187535286,
-    -0.0024199900217354298,
-    0.06860028207302094,
-    -0.0216104444116354,
-    -0.020837673917412758,
-    -0.019251462072134018,
-    -0.026057260110974312,
-    0.010418836958706379,
-    -0.01159832812845707,
-    0.008676715195178986,
-    0.027426553890109062,
-    -0.024281244724988937,
-    0.017095839604735374,
-    -0.00834455993026495,
-    0.0052365330047905445,
-    -0.016594218090176582,
-    0.004131607711315155,
-    0.02095969021320343,
-    0.021325739100575447,
-    -0.020891902968287468,
-    0.005348381586372852,
-    0.015672316774725914,
-    -0.00927323941141367,
-    -0.02182736061513424,
-    0.004860316403210163,
-    -0.007273527793586254,
-    0.01006634533405304,
-    -0.020891902968287468,
-    -0.018627822399139404,
-    -0.006588880438357592,
-    -0.014045432209968567,
-    -0.042109183967113495,
-    -0.025040457025170326,
-    0.03470686078071594,
-    -0.00016480674094054848,
-    0.025311604142189026,
-    -0.0014311495469883084,
-    0.02917545475065708,
-    0.021257951855659485,
-    0.017963511869311333,
-    0.004036705940961838,
-    -0.005917790811508894,
-    0.007131175138056278,
-    -0.026396194472908974,
-    0.0017243276815861464,
-    0.034489940851926804,
-    0.008846182376146317,
-    0.0030148194637149572,
-    -0.053171996027231216,
-    0.021800246089696884,
-    0.03890964388847351,
-    0.013577703386545181,
-    -0.004728131927549839,
-    0.005873729474842548,
-    -0.016458643600344658,
-    -0.010005337186157703,
-    0.035330500453710556,
-    -0.00236067664809525,
-    -0.004606115631759167,
-    0.007476888131350279,
-    0.014099662192165852,
-    -0.015360496938228607,
-    0.012167736887931824,
-    -0.008453018963336945,
-    0.003653710475191474,
-    -0.01010023895651102,
-    -0.016377300024032593,
-    0.030395617708563805,
-    0.02577255479991436,
-    -0.004999279044568539,
-    0.008385231718420982,
-    0.027318095788359642,
-    0.032863058149814606,
-    -0.006602437701076269,
-    -0.011998269706964493,
-    -0.01854647882282734,
-    -0.007734477985650301,
-    -0.013509917072951794,
-    -0.027182521298527718,
-    -0.014113219454884529,
-    -0.003169034607708454,
-    0.03145309165120125,
-    -0.013767506927251816,
-    -0.027697701007127762,
-    -0.005372107028961182,
-    0.0238067377358675,
-    -0.011774573475122452,
-    0.0317242406308651,
-    -0.0009176643216051161,
-    -0.011537319980561733,
-    0.001515883137471974,
-    -0.0029419488273561,
-    0.00663633132353425,
-    0.0006854943931102753,
-    0.04989111050963402,
-    -0.010378165170550346,
-    -0.03655066341161728,
-    -0.019725969061255455,
-    0.012723589316010475,
-    0.01663488894701004,
-    -0.030287159606814384,
-    0.02944660186767578,
-    0.022695032879710197,
-    -0.005816110409796238,
-    0.03682180866599083,
-    -0.00044654577504843473,
-    0.011225500144064426,
-    -0.014126776717603207,
-    0.00025356514379382133,
-    -0.012465999461710453,
-    0.028714504092931747,
-    -0.01174067985266447,
-    0.04482065513730049,
-    -0.0508943572640419,
-    -0.01113059837371111,
-    -0.019820870831608772,
-    0.015740104019641876,
-    0.011496647261083126,
-    0.036848925054073334,
-    -0.03687603771686554,
-    0.005595803260803223,
-    0.006893921177834272,
-    -0.0007109144353307784,
-    -0.00010792935790959746,
-    0.005463619250804186,
-    0.0012693085009232163,
-    0.038774069398641586,
-    0.00391130056232214,
-    -0.04010269418358803,
-    0.028606045991182327,
-    -0.0061313193291425705,
-    -0.025677653029561043,
-    0.009368141181766987,
-    -0.008168313652276993,
-    -0.003853681730106473,
-    0.00729386368766427,
-    0.001225247047841549,
-    -0.0218815915286541,
-    -0.022451000288128853,
-    -0.008364895358681679,
-    0.02287127822637558,
-    -0.013604817911982536,
-    -0.03739121928811073,
-    -0.018560035154223442,
-    0.007015937473624945,
-    0.02020047791302204,
-    0.03364938497543335,
-    0.02287127822637558,
-    -0.007707363460212946,
-    0.0049077668227255344,
-    -0.05574789643287659,
-    -0.016675561666488647,
-    0.0013752254890277982,
-    -0.021190164610743523,
-    -0.022749261930584908,
-    -0.0216104444116354,
-    0.001748900394886732,
-    0.012099950574338436,
-    -0.003694382729008794,
-    0.014614841900765896,
-    0.012188073247671127,
-    -0.026504652574658394,
-    0.012859162874519825,
-    0.013950531370937824,
-    -0.025162473320961,
-    -0.0006079631857573986,
-    0.010608639568090439,
-    0.00236067664809525,
-    -0.008473354391753674,
-    -0.010276484303176403,
-    0.02418634295463562,
-    0.009008870460093021,
-    -0.013787842355668545,
-    0.0013811568496748805,
-    0.01015446800738573,
-    -0.02506757155060768,
-    -0.011469532735645771,
-    -0.00470440648496151,
-    -0.011191606521606445,
-    0.027060505002737045,
-    0.010513738729059696,
-    -0.008032740093767643,
-    0.017868610098958015,
-    0.012242303229868412,
-    -0.005443282891064882,
-    -0.012899834662675858,
-    -0.00778192887082696,
-    -0.04357337951660156,
-    0.018695609644055367,
-    0.006961707957088947,
-    0.017936397343873978,
-    -0.026585998013615608,
-    0.00010734680836321786,
-    -0.010215476155281067,
-    -0.021203722804784775,
-    0.025623423978686333,
-    -0.010744214057922363,
-    0.00485692685469985,
-    0.016499316319823265,
-    0.012127065099775791,
-    0.0678410679101944,
-    0.007476888131350279,
-    0.03343246877193451,
-    -0.005948294885456562,
-    -0.031046371906995773,
-    -0.003206317313015461,
-    0.04031961038708687,
-    0.010954353027045727,
-    0.0035893130116164684,
-    0.001271003158763051,
-    0.028958536684513092,
-    -0.016729790717363358,
-    -0.02303396724164486,
-    0.027670586481690407,
-    0.013177760876715183,
-    -0.014831759966909885,
-    -0.005243311636149883,
-    0.03779793903231621,
-    -0.05268393084406853,
-    -0.016973823308944702,
-    0.006683782208710909,
-    0.001837023301050067,
-    0.020390281453728676,
-    0.022640803828835487,
-    0.02297973819077015,
-    -0.019685298204421997,
-    -0.01242532767355442,
-    -0.01587567664682865,
-    -0.015794333070516586,
-    -0.015550300478935242,
-    0.02550140768289566,
-    -0.016485758125782013,
-    0.009069878607988358,
-    -0.02193582057952881,
-    -0.02402365580201149,
-    0.04449528083205223,
-    -0.004196005407720804,
-    0.030937911942601204,
-    0.0008846182026900351,
-    0.016173940151929855,
-    0.014750415459275246,
-    -0.006236388813704252,
-    -0.020336050540208817,
-    0.0072531914338469505,
-    0.004846758674830198,
-    0.027277423068881035,
-    0.019847985357046127,
-    -0.029527945443987846,
-    -0.011327180080115795,
-    0.030395617708563805,
-    -0.018180429935455322,
-    -0.0015455399407073855,
-    -0.020322494208812714,
-    -0.0039892555214464664,
-    -0.014221678487956524,
-    -0.012133844196796417,
-    0.010818779468536377,
-    -0.004985721781849861,
-    0.004131607711315155,
-    0.019766641780734062,
-    0.01910233125090599,
-    -0.018370233476161957,
-    -0.033730730414390564,
-    0.007171847391873598,
-    0.013584482483565807,
-    0.025867456570267677,
-    -0.008690272457897663,
-    0.0009261376690119505,
-    0.022139180451631546,
-    0.0009295269846916199,
-    0.009232567623257637,
-    -0.00448748841881752,
-    0.015062235295772552,
-    0.018478691577911377,
-    0.043410688638687134,
-    3.685909177875146e-05,
-    -0.019183674827218056,
-    -0.008608927950263023,
-    -0.02297973819077015,
-    0.036306630820035934,
-    -0.01789572462439537,
-    0.008771616965532303,
-    -0.009903657250106335,
-    -0.001726022339425981
-  ]
-}
+# Category embeddings live in a binary artifact written by
+# scripts/generate_category_embeddings.py: a float32 .npy matrix with unit-norm
+# rows, plus a JSON index naming the category of each row.
+_CONFIG_DIR = os.path.dirname(__file__)
+CATEGORY_EMBEDDINGS_NPY = os.getenv(
+    "CATEGORY_EMBEDDINGS_NPY", os.path.join(_CONFIG_DIR, "category_embeddings.npy")
+)
+CATEGORY_EMBEDDINGS_INDEX = os.getenv(
+    "CATEGORY_EMBEDDINGS_INDEX", os.path.join(_CONFIG_DIR, "category_embeddings.json")
+)
@@ -0,0 +1,71 @@
+# app/config/filter_vocab.py
+"""
+Vocabulary for the rule-based filter parser (app/services/filter_parser.py).
+
+BRANDS maps the brand value stored in product metadata to the lowercase
+phrases shoppers type for it. CATEGORY_KEYWORDS maps each category in
+CATEGORIES to words that name it. Extend both as the catalog grows.
+"""
+
+BRANDS = {
+    "Chanel": ["chanel", "coco chanel"],
+    "Dior": ["dior", "christian dior"],
+    "Gucci": ["gucci"],
+    "Tom Ford": ["tom ford"],
+    "Jo Malone": ["jo malone"],
+    "Lancome": ["lancome", "lancôme"],
+    "Estee Lauder": ["estee lauder", "estée lauder"],
+    "Apple": ["apple", "airpods", "iphone", "ipad"],
+    "Sony": ["sony"],
+    "Bose": ["bose"],
+    "Samsung": ["samsung", "galaxy"],
+    "Johnnie Walker": ["johnnie walker", "johnny walker"],
+    "Chivas Regal": ["chivas", "chivas regal"],
+    "Glenfiddich": ["glenfiddich"],
+    "Macallan": ["macallan", "the macallan"],
+    "Hennessy": ["hennessy"],
+    "Moet & Chandon": ["moet", "moët", "moet & chandon", "moet and chandon"],
+    "Montblanc": ["montblanc", "mont blanc"],
+    "Ray-Ban": ["ray-ban", "rayban", "ray ban"],
+    "Godiva": ["godiva"],
+    "Lindt": ["lindt"],
+    "Toblerone": ["toblerone"],
+    "Lego": ["lego"],
+}
+
+CATEGORY_KEYWORDS = {
+    "Fragrance & Beauty": [
+        "perfume", "perfumes", "fragrance", "fragrances", "cologne", "parfum", "eau de toilette",
+        "scent", "lipstick", "makeup", "skincare", "moisturizer", "serum", "cosmetics",
+    ],
+    "Electronics": [
+        "headphones", "earbuds", "earphones", "speaker", "camera", "tablet", "laptop",
+        "phone", "smartwatch", "charger", "electronics", "gadget", "gadgets",
+    ],
+    "Comfort": ["pillow", "blanket", "eye mask", "neck pillow", "slippers", "socks", "comfort"],
+    "Food & Beverage": [
+        "whisky", "whiskey", "scotch", "wine", "champagne", "cognac", "vodka", "gin", "rum",
+        "chocolate", "chocolates", "snacks", "dates", "coffee", "tea",
+    ],
+    "Connectivity": ["wifi", "wi-fi", "sim", "esim", "roaming", "data plan", "internet"],
+    "Travel Essentials": [
+        "adapter", "power bank", "luggage", "suitcase", "backpack", "passport holder",
+        "toiletries", "travel kit", "luggage tag",
+    ],
+    "Baby & Kids": ["baby", "kids", "toy", "toys", "diapers", "stroller", "children", "plush"],
+    "Luxury Goods": ["watch", "watches", "jewelry", "jewellery", "handbag", "sunglasses", "pen", "wallet"],
+}
+
+# Currency words and symbols; they mark a nearby number as a price
+CURRENCY_MARKERS = [
+    "$", "€", "£", "usd", "eur", "gbp", "aed", "dhs", "dh", "sar", "qar",
+    "dollars", "dollar", "euros", "euro", "pounds", "dirhams", "dirham", "riyals",
+]
+
+# Words that carry no filter meaning
+STOPWORDS = [
+    "a", "an", "the", "for", "of", "in", "on", "with", "and", "or", "to", "my", "me", "i",
+    "some", "any", "show", "find", "get", "buy", "want", "need", "looking", "please",
+    "best", "good", "nice", "new", "cheap", "price", "priced", "cost", "costing", "items",
+    "products", "something", "gift", "gifts", "set", "bottle", "pack",
+]
@@ -1,17 +1,40 @@
 import os
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.orm import declarative_base
 
-# Read from Render env vars (set in dashboard)
-DATABASE_URL = os.getenv("DATABASE_URL")
+Base = declarative_base()
 
-if not DATABASE_URL:
-    raise ValueError("DATABASE_URL is not set. Please configure it in Render environment variables.")
+# Engine and session factory are built on first use (or by the app's lifespan
+# hook), so importing models or routers does not require a database.
+_engine = None
+_session_factory = None
 
-engine = create_async_engine(DATABASE_URL, echo=False, future=True)
-SessionLocal = sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
-Base = declarative_base()
+def get_engine():
+    global _engine
+    if _engine is None:
+        from sqlalchemy.ext.asyncio import create_async_engine
+
+        # Read from Render env vars (set in dashboard)
+        database_url = os.getenv("DATABASE_URL")
+        if not database_url:
+            raise ValueError("DATABASE_URL is not set. Please configure it in Render environment variables.")
+        _engine = create_async_engine(database_url, echo=False, future=True)
+    return _engine
+
+def get_sessionmaker():
+    global _session_factory
+    if _session_factory is None:
+        from sqlalchemy.orm import sessionmaker
+        from sqlalchemy.ext.asyncio import AsyncSession
+
+        _session_factory = sessionmaker(get_engine(), expire_on_commit=False, class_=AsyncSession)
+    return _session_factory
+
+async def dispose_engine():
+    global _engine, _session_factory
+    if _engine is not None:
+        await _engine.dispose()
+    _engine, _session_factory = None, None
 
 async def get_db():
-    async with SessionLocal() as session:
+    async with get_sessionmaker()() as session:
         yield session
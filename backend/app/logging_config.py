@@ -1,17 +1,38 @@
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 import sys
 
 def setup_logging():
-    """Central logging config, controlled by LOG_LEVEL env var."""
+    """Central logging config, controlled by LOG_LEVEL env var.
+
+    With LOG_QUEUE=1 (default) records are handed to a QueueHandler and
+    formatted and written to stdout by a listener thread, so request handlers
+    never block on the stream. Returns that listener (None without the queue)
+    so callers can stop it to flush.
+    """
     log_level = os.getenv("LOG_LEVEL", "INFO").upper()
 
-    logging.basicConfig(
-        level=log_level,
-        format="%(asctime)s [%(levelname)s] %(name)s - %(message)s",
-        handlers=[logging.StreamHandler(sys.stdout)],
-    )
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(name)s - %(message)s"))
+    handler = stream_handler
+    if os.getenv("LOG_QUEUE", "1") == "1":
+        log_queue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
+        handler = logging.handlers.QueueHandler(log_queue)
+        # prepare() formats each record before queueing it; keep that to the bare
+        # message so the listener's formatter adds the prefix exactly once
+        handler.setFormatter(logging.Formatter("%(message)s"))
+    else:
+        listener = None
+
+    logging.basicConfig(level=log_level, handlers=[handler])
 
     logging.getLogger("uvicorn").setLevel(log_level)       # align uvicorn
     logging.getLogger("uvicorn.error").setLevel(log_level)
     logging.getLogger("uvicorn.access").setLevel(log_level)
+    return listener
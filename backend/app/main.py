@@ -1,3 +1,6 @@
+import os
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from app.logging_config import setup_logging
 
@@ -6,9 +9,44 @@ setup_logging()
 
 from fastapi.middleware.cors import CORSMiddleware
 from app.middleware.logging import LoggingMiddleware
-from .routers import search, agentic_search, metrics  # import after logging is set
+from .routers import search, agentic_search, metrics, merchant_config, cache  # import after logging is set
+from app.services.registry import registry
+from app.services.executor import run_blocking
+from app.db import get_engine, dispose_engine
+from app.services.log_writer import search_log_writer
+from app.services.filter_cache import filter_cache
+from app.services.agentic_service import FILTER_MODEL, FILTER_PROMPT_VERSION
+from app.services.merchant_config import (
+    merchant_config as merchant_config_store, MERCHANT_RULES_SOURCE, MERCHANT_RULES_POLL_SECONDS,
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Build clients once per worker before serving; LAZY_CLIENT_INIT=1 defers to first use
+    if os.getenv("LAZY_CLIENT_INIT", "0") != "1":
+        registry.warm()
+        get_engine()
+        # Load merchant rules now rather than on the first request (never raises)
+        await run_blocking(merchant_config_store.load)
+    # Cached LLM filters from another model or prompt version can never be hit again
+    await run_blocking(filter_cache.purge_stale, FILTER_MODEL, FILTER_PROMPT_VERSION)
+    # Poll an external rules source so config changes need no restart
+    poller = None
+    if MERCHANT_RULES_SOURCE and MERCHANT_RULES_POLL_SECONDS > 0:
+        poller = asyncio.create_task(merchant_config_store.poll())
+    # Search logs are written in batches by a background task
+    if os.getenv("SEARCH_LOG_WRITER", "1") == "1":
+        search_log_writer.start()
+    yield
+    if poller is not None:
+        poller.cancel()
+    await search_log_writer.aclose()
+    await registry.aclose()
+    await dispose_engine()
+
 
-app = FastAPI(title="Agentic AI Search API", version="0.1.0")
+app = FastAPI(title="Agentic AI Search API", version="0.1.0", lifespan=lifespan)
 app.add_middleware(LoggingMiddleware)
 
 # CORS for local dev / RN emulators
@@ -24,6 +62,8 @@ app.add_middleware(
 app.include_router(search.router)
 app.include_router(agentic_search.router)
 app.include_router(metrics.router)
+app.include_router(merchant_config.router)
+app.include_router(cache.router)
 
 
 @app.get("/")
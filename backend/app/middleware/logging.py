@@ -1,19 +1,59 @@
+import os
 import time
+import random
 import logging
-from starlette.middleware.base import BaseHTTPMiddleware
+from app.services.stage_metrics import request_stages
 
 logger = logging.getLogger("agentic-ai")
-logging.basicConfig(level=logging.INFO)
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request, call_next):
-        start = time.time()
-        response = await call_next(request)
-        duration = round(time.time() - start, 3)
+# Fraction of successful requests written to the access log (5xx always are)
+ACCESS_LOG_SAMPLE_RATE = float(os.getenv("ACCESS_LOG_SAMPLE_RATE", "1.0"))
+SERVER_TIMING = os.getenv("SERVER_TIMING", "1") == "1"
 
-        logger.info(
-            f"{request.method} {request.url.path} "
-            f"status={response.status_code} duration={duration}s"
-        )
 
-        return response
+class LoggingMiddleware:
+    """Pure ASGI access log + Server-Timing middleware.
+
+    Wraps ``send`` instead of the response body, so streaming responses pass
+    through untouched and no extra task is created per request. The clock is
+    monotonic; log lines use %-style arguments so skipped or filtered lines are
+    never formatted.
+    """
+
+    def __init__(self, app, sample_rate: float = ACCESS_LOG_SAMPLE_RATE, server_timing: bool = SERVER_TIMING):
+        self.app = app
+        self.sample_rate = sample_rate
+        self.server_timing = server_timing
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        stages = []
+        token = request_stages.set(stages)
+        status = 500
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if self.server_timing:
+                    total_ms = (time.perf_counter() - start) * 1000
+                    timing = ", ".join(
+                        [f"{name};dur={seconds * 1000:.1f}" for name, seconds in stages]
+                        + [f"total;dur={total_ms:.1f}"]
+                    )
+                    message = {**message, "headers": [*message.get("headers", []), (b"server-timing", timing.encode())]}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            request_stages.reset(token)
+            if status >= 500 or self.sample_rate >= 1.0 or random.random() < self.sample_rate:
+                logger.info(
+                    "%s %s status=%d duration=%.3fs",
+                    scope["method"], scope["path"], status, time.perf_counter() - start,
+                )
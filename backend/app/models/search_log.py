@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Float, Boolean, TIMESTAMP, JSON, func
+from sqlalchemy import Column, Integer, String, Text, Float, Boolean, TIMESTAMP, JSON, LargeBinary, func
 from app.db import Base
 
 class SearchLog(Base):
@@ -11,6 +11,10 @@ class SearchLog(Base):
     user_id = Column(String(100), nullable=True)
     query = Column(Text, nullable=False)
     query_embedding = Column(JSON, nullable=True)
+    # Compact alternatives, see app/services/embedding_codec.py
+    query_embedding_bin = Column(LargeBinary, nullable=True)
+    embedding_format = Column(String(16), nullable=True)
+    embedding_key = Column(String(64), nullable=True)
     latency_ms = Column(Integer)
     results_count = Column(Integer)
     top_result_id = Column(String(50))
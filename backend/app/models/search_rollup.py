@@ -0,0 +1,29 @@
+from sqlalchemy import Column, Integer, BigInteger, String, TIMESTAMP, PrimaryKeyConstraint
+from app.db import Base
+
+class SearchRollup(Base):
+    """Per-merchant search counts and latency per minute / hour bucket."""
+    __tablename__ = "search_rollups"
+    __table_args__ = (PrimaryKeyConstraint("merchant_id", "granularity", "bucket_start"),)
+
+    merchant_id = Column(String(50), nullable=False)
+    granularity = Column(String(8), nullable=False)      # "minute" | "hour"
+    bucket_start = Column(TIMESTAMP, nullable=False)
+    query_count = Column(Integer, nullable=False, default=0)
+    latency_sum_ms = Column(BigInteger, nullable=False, default=0)
+    latency_count = Column(Integer, nullable=False, default=0)
+    error_count = Column(Integer, nullable=False, default=0)
+
+# Longest term text kept for display; the key is a hash of the whole term
+TERM_MAX_CHARS = 256
+
+class SearchTermRollup(Base):
+    """Per-merchant query term counts per hour bucket, keyed by a hash of the normalized term."""
+    __tablename__ = "search_term_rollups"
+    __table_args__ = (PrimaryKeyConstraint("merchant_id", "bucket_start", "query_hash"),)
+
+    merchant_id = Column(String(50), nullable=False)
+    bucket_start = Column(TIMESTAMP, nullable=False)
+    query_hash = Column(String(32), nullable=False)
+    query = Column(String(TERM_MAX_CHARS), nullable=False)
+    query_count = Column(Integer, nullable=False, default=0)
@@ -1,9 +1,10 @@
 from fastapi import APIRouter, Depends
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.db import get_db
-from typing import Optional, Dict, Any
-from app.services.agentic_service import search_products_nl
+from typing import Optional, Dict, Any, List
+from app.services.agentic_service import search_products_nl, search_products_nl_batch
+from app.services.search_service import SEARCH_BATCH_MAX_ITEMS
 
 router = APIRouter()
 
@@ -13,6 +14,11 @@ class AgenticSearchRequest(BaseModel):
     offset: int = 0
     limit: int = 10
     context: Optional[Dict[str, Any]] = None
+    cursor: Optional[str] = None   # next_cursor from the previous page
+    budget_ms: Optional[float] = None   # latency budget, capped at SEARCH_BUDGET_MS
+
+class AgenticSearchBatchRequest(BaseModel):
+    items: List[AgenticSearchRequest] = Field(..., min_length=1, max_length=SEARCH_BATCH_MAX_ITEMS)
 
 @router.post("/agentic-search")
 async def agentic_search(
@@ -25,5 +31,21 @@ async def agentic_search(
         db=db,                          # ✅ pass DB session
         offset=req.offset,
         limit=req.limit,
-        context=req.context
-    )
\ No newline at end of file
+        context=req.context,
+        cursor=req.cursor,
+        budget_ms=req.budget_ms
+    )
+
+@router.post("/agentic-search/batch")
+async def agentic_search_batch(
+    req: AgenticSearchBatchRequest,
+    db: AsyncSession = Depends(get_db)
+):
+    """Several agentic searches in one call; items answer in order, a failed item carries "error"."""
+    outcomes = await search_products_nl_batch([item.dict() for item in req.items], db)
+    return {
+        "items": [
+            {"error": str(outcome)} if isinstance(outcome, BaseException) else outcome
+            for outcome in outcomes
+        ]
+    }
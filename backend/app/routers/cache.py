@@ -0,0 +1,17 @@
+from typing import Optional
+from fastapi import APIRouter
+from app.services.result_cache import result_cache
+from app.services.semantic_cache import semantic_cache
+
+router = APIRouter(prefix="/cache")
+
+@router.post("/invalidate")
+def invalidate_caches(merchant_id: Optional[str] = None):
+    """Notify hook for catalog changes: drop cached result sets that may be stale.
+
+    The semantic cache is dropped for ``merchant_id`` (every merchant if omitted).
+    The paging cache has no per-merchant index and is cleared entirely.
+    """
+    semantic_cache.invalidate(merchant_id)
+    result_cache.clear()
+    return {"invalidated": merchant_id or "all", "semantic_cache": semantic_cache.stats()}
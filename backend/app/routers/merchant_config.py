@@ -0,0 +1,17 @@
+from fastapi import APIRouter
+from app.services.executor import run_blocking
+from app.services.merchant_config import merchant_config
+
+router = APIRouter(prefix="/merchant-config")
+
+@router.get("/")
+def get_merchant_config():
+    """Rules version currently served by this worker and reload history."""
+    return merchant_config.stats()
+
+
+@router.post("/reload")
+async def reload_merchant_config():
+    """Notify hook: re-check the rules source now instead of waiting for the next poll."""
+    changed = await run_blocking(merchant_config.reload)
+    return {"changed": changed, **merchant_config.stats()}
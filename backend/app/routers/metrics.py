@@ -1,32 +1,94 @@
-from fastapi import APIRouter, Depends
+from datetime import datetime
+from typing import Optional
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import PlainTextResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import func, select
 from app.db import get_db
-from app.models.search_log import SearchLog
+from app.services.rollups import read_metrics
+from app.services.embedding_cache import embedding_cache
+from app.services.search_service import embedding_batcher, index_pool_stats
+from app.services.agentic_service import filter_stats, hedge_stats
+from app.services.result_cache import result_cache
+from app.services.filter_cache import filter_cache
+from app.services.semantic_cache import semantic_cache
+from app.services.log_writer import search_log_writer
+from app.services.stage_metrics import stage_metrics
 
 router = APIRouter(prefix="/metrics")
 
 @router.get("/")
-async def get_metrics(db: AsyncSession = Depends(get_db)):
-    """Return aggregated search metrics from DB instead of in-memory stats."""
-    
-    # Total queries
-    total_queries = await db.scalar(select(func.count(SearchLog.id)))
-
-    # Average latency
-    avg_latency = await db.scalar(select(func.avg(SearchLog.latency_ms)))
-
-    # Top 5 search terms
-    top_terms_query = await db.execute(
-        select(SearchLog.query, func.count(SearchLog.query))
-        .group_by(SearchLog.query)
-        .order_by(func.count(SearchLog.query).desc())
-        .limit(5)
-    )
-    top_terms = {q: c for q, c in top_terms_query.all()}
-
-    return {
-        "total_queries": total_queries or 0,
-        "avg_latency_ms": round(avg_latency or 0, 2),
-        "top_terms": top_terms
-    }
+async def get_metrics(
+    merchant_id: Optional[str] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    top_n: int = Query(5, ge=1, le=100),
+    db: AsyncSession = Depends(get_db)
+):
+    """Search metrics for a merchant and time range (UTC), read from the rollup tables."""
+    return await read_metrics(db, merchant_id=merchant_id, start=start, end=end, top_n=top_n)
+
+
+@router.get("/embedding-cache")
+def get_embedding_cache_stats():
+    """Hit/miss/eviction counters for the embedding cache, per tier."""
+    return embedding_cache.stats()
+
+
+@router.get("/embedding-batcher")
+def get_embedding_batcher_stats():
+    """How many embedding requests were coalesced into how many upstream calls."""
+    return embedding_batcher.stats()
+
+
+@router.get("/pinecone")
+def get_pinecone_pool_stats():
+    """Index handle reuse and connection pool settings for this worker."""
+    return index_pool_stats()
+
+
+@router.get("/hedging")
+def get_hedging_stats():
+    """How often the unfiltered fallback was issued speculatively and what it saved."""
+    return hedge_stats()
+
+
+@router.get("/filter-extraction")
+def get_filter_extraction_stats():
+    """Share of queries whose filters came from the rule-based parser instead of the LLM."""
+    return filter_stats()
+
+
+@router.get("/filter-cache")
+def get_filter_cache_stats():
+    """Hit/miss counters for cached LLM filter extractions."""
+    return filter_cache.stats()
+
+
+@router.get("/result-cache")
+def get_result_cache_stats():
+    """Cached result sets served to paginated searches."""
+    return result_cache.stats()
+
+
+@router.get("/semantic-cache")
+def get_semantic_cache_stats():
+    """Paraphrase hits that skipped the vector query, and the latency they saved."""
+    return semantic_cache.stats()
+
+
+@router.get("/log-writer")
+def get_log_writer_stats():
+    """Queue depth, batch sizes and drops for the background SearchLog writer."""
+    return search_log_writer.stats()
+
+
+@router.get("/stages")
+def get_stage_latency():
+    """p50/p95/p99 latency per pipeline stage and merchant for this worker."""
+    return stage_metrics.summary()
+
+
+@router.get("/prometheus", response_class=PlainTextResponse)
+def get_prometheus_metrics():
+    """Per-stage latency histograms in Prometheus text exposition format."""
+    return PlainTextResponse(stage_metrics.render_prometheus(), media_type="text/plain; version=0.0.4")
\ No newline at end of file
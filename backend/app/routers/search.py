@@ -1,7 +1,7 @@
 from fastapi import APIRouter
-from pydantic import BaseModel
-from typing import Optional, Dict, Any
-from app.services.search_service import search_products
+from pydantic import BaseModel, Field
+from typing import Optional, Dict, Any, List
+from app.services.search_service import SEARCH_BATCH_MAX_ITEMS, search_products, search_products_batch
 
 router = APIRouter()
 
@@ -12,16 +12,31 @@ class SearchRequest(BaseModel):
     filters: Optional[Dict[str, Any]] = None
     merchant_id: Optional[str] = None
 
+class SearchBatchRequest(BaseModel):
+    items: List[SearchRequest] = Field(..., min_length=1, max_length=SEARCH_BATCH_MAX_ITEMS)
+
 # Response schema (optional for clarity)
 class SearchResponse(BaseModel):
     results: list
 
 @router.post("/search", response_model=SearchResponse)
 async def search(request: SearchRequest):
-    results = search_products(
+    results = await search_products(
         query=request.query,
         top_k=request.top_k,
         filters=request.filters,
         merchant_id=request.merchant_id
     )
     return {"results": results}
+
+
+@router.post("/search/batch")
+async def search_batch(request: SearchBatchRequest):
+    """Several searches in one call; items answer in order, a failed item carries "error"."""
+    outcomes = await search_products_batch([item.dict() for item in request.items])
+    return {
+        "items": [
+            {"error": str(outcome)} if isinstance(outcome, BaseException) else {"results": outcome}
+            for outcome in outcomes
+        ]
+    }
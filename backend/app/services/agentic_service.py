@@ -1,21 +1,36 @@
 import os
 import logging
 import json
-import numpy as np
+import asyncio
+import hashlib
 import time
+from collections import deque
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Optional, Dict, Any
+from typing import Any, Awaitable, Callable, Dict, Optional
 from pydantic import BaseModel, ValidationError
-from openai import OpenAI
-from app.services.search_service import pc, get_embedding, get_index_name
-from app.config.categories import CATEGORY_EMBEDDINGS
+from app.services.search_service import EMBEDDING_MODEL, get_embedding, get_embeddings, get_index
+from app.services.embedding_codec import encode_embedding
+from app.services.category_index import category_index
+from app.services.filter_parser import parse_filters
+from app.services.llm import parse_query_intent
+from app.services.filter_cache import filter_cache
 from app.models.search_log import SearchLog
-from app.services.ranking_service import rank_products
+from app.services.log_writer import search_log_writer
+from app.services.ranking_service import RANK_POOL_SIZE, rank_page, score_candidates
+from app.services.executor import run_blocking
+from app.services.registry import get_openai_client
+from app.services.merchant_config import merchant_config
+from app.services.semantic_cache import semantic_cache
+from app.services.stage_metrics import observe, shared_stage_timer, stage_timer
+from app.services.result_cache import (
+    RESULT_WINDOW, result_cache, query_key, entry_id_for, encode_cursor, decode_cursor,
+)
 
 logger = logging.getLogger("app.services.agentic_service")
 logger.setLevel(logging.INFO)
 
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+# How many scored categories to keep as a confidence signal for the filter stage
+CATEGORY_TOP_K = int(os.getenv("CATEGORY_TOP_K", "3"))
 
 # ----------------------------
 # Filter Schema for Validation
@@ -29,25 +44,34 @@ class FilterSchema(BaseModel):
 # ----------------------------
 # Category Mapping
 # ----------------------------
-def best_category(query: str) -> str:
-    """Find most relevant category by cosine similarity with precomputed embeddings."""
-    q_vec = get_embedding(query)
-    best_cat, best_sim = None, -1
+async def category_candidates(
+        query: str,
+        q_vec: Optional[list[float]] = None,
+        k: int = CATEGORY_TOP_K
+    ) -> list[tuple[str, float]]:
+    """Top-k categories by cosine similarity with precomputed embeddings, best first.
 
-    for cat, c_vec in CATEGORY_EMBEDDINGS.items():
-        sim = np.dot(q_vec, c_vec) / (np.linalg.norm(q_vec) * np.linalg.norm(c_vec))
-        if sim > best_sim:
-            best_cat, best_sim = cat, sim
+    Pass ``q_vec`` when the query embedding is already known to avoid embedding it again.
+    """
+    if q_vec is None:
+        q_vec = await get_embedding(query)
+    candidates = category_index.top_k(q_vec, k)
 
+    best_cat, best_sim = candidates[0]
     logger.info(f"[AgenticSearch] Category mapping → {best_cat} (score={best_sim:.3f})")
-    return best_cat
+    return candidates
+
+async def best_category(query: str, q_vec: Optional[list[float]] = None) -> str:
+    """Find most relevant category by cosine similarity with precomputed embeddings."""
+    return (await category_candidates(query, q_vec, k=1))[0][0]
 
 # ----------------------------
 # Filter Extraction
 # ----------------------------
-async def extract_filters_with_llm(query: str) -> dict:
-    """Extract brand/price filters with LLM, map category separately."""
-    prompt = f"""
+# Model and prompt for LLM filter extraction. The prompt's hash is its version:
+# editing the text or switching model invalidates the filter cache.
+FILTER_MODEL = os.getenv("FILTER_MODEL", "gpt-4o-mini")
+FILTER_PROMPT = """
     Extract structured filters from this shopping search query.
     Only extract brand and price range (price_min, price_max). 
     Do NOT guess category — category will be mapped separately.
@@ -55,12 +79,15 @@ async def extract_filters_with_llm(query: str) -> dict:
 
     Query: {query}
     """
+FILTER_PROMPT_VERSION = hashlib.sha256(FILTER_PROMPT.encode("utf-8")).hexdigest()[:12]
 
+async def _extract_raw_filters(query: str) -> dict:
+    """Ask the LLM for brand/price filters."""
     logger.info(f"[AgenticSearch] Extracting filters for query: {query}")
 
-    response = client.chat.completions.create(
-        model="gpt-4o-mini",
-        messages=[{"role": "user", "content": prompt}],
+    response = await get_openai_client().chat.completions.create(
+        model=FILTER_MODEL,
+        messages=[{"role": "user", "content": FILTER_PROMPT.format(query=query)}],
         temperature=0,
         response_format={"type": "json_object"}  # ✅ ensures JSON output
     )
@@ -74,8 +101,153 @@ async def extract_filters_with_llm(query: str) -> dict:
         logger.warning(f"[AgenticSearch] Failed to parse filters, ignoring. Error: {e}")
         filters = {}
 
-    # Always map category deterministically
-    filters["category"] = best_category(query)
+    return filters if isinstance(filters, dict) else {}
+
+# FILTER_FAST_PATH=1 (default) lets the rule-based parser answer simple queries
+# ("perfume", "whisky under 200") without an LLM round trip. The LLM still runs
+# when the parser's confidence is below FILTER_FAST_PATH_MIN_CONFIDENCE.
+FILTER_FAST_PATH = os.getenv("FILTER_FAST_PATH", "1") == "1"
+FILTER_FAST_PATH_MIN_CONFIDENCE = float(os.getenv("FILTER_FAST_PATH_MIN_CONFIDENCE", "0.75"))
+
+# Latency budget. A request gets SEARCH_BUDGET_MS end to end (the client may ask
+# for less). The LLM stage may use up to LLM_FILTER_TIMEOUT_MS of it, always
+# leaving LLM_BUDGET_RESERVE_MS for the vector query and ranking; past that it
+# falls back to the rule-based filters.
+SEARCH_BUDGET_MS = float(os.getenv("SEARCH_BUDGET_MS", "3000"))
+LLM_FILTER_TIMEOUT_MS = float(os.getenv("LLM_FILTER_TIMEOUT_MS", "1500"))
+LLM_BUDGET_RESERVE_MS = float(os.getenv("LLM_BUDGET_RESERVE_MS", "500"))
+
+# LLM_HEDGE=1 sends a second, identical LLM request when the first has not
+# answered after the LLM_HEDGE_PERCENTILE latency of recent calls (or
+# LLM_HEDGE_DELAY_MS until LLM_HEDGE_MIN_SAMPLES calls have been seen).
+LLM_HEDGE = os.getenv("LLM_HEDGE", "0") == "1"
+LLM_HEDGE_PERCENTILE = float(os.getenv("LLM_HEDGE_PERCENTILE", "0.95"))
+LLM_HEDGE_DELAY_MS = float(os.getenv("LLM_HEDGE_DELAY_MS", "800"))
+LLM_HEDGE_MIN_SAMPLES = int(os.getenv("LLM_HEDGE_MIN_SAMPLES", "20"))
+
+_filter_stats = {
+    "queries": 0, "fast_path": 0, "cached": 0, "llm": 0, "llm_skipped": 0,
+    "llm_timeouts": 0, "llm_errors": 0, "llm_hedged": 0, "llm_hedge_wins": 0,
+}
+_llm_latencies: deque = deque(maxlen=512)   # seconds, successful calls only
+
+def _llm_hedge_delay() -> float:
+    if len(_llm_latencies) < LLM_HEDGE_MIN_SAMPLES:
+        return LLM_HEDGE_DELAY_MS / 1000
+    ordered = sorted(_llm_latencies)
+    return ordered[min(len(ordered) - 1, int(LLM_HEDGE_PERCENTILE * len(ordered)))]
+
+async def _call_llm(query: str, timeout: float) -> tuple[dict, bool]:
+    """LLM filters within ``timeout`` seconds, hedged if enabled.
+
+    Returns (filters, hedge_won). Raises asyncio.TimeoutError or the LLM error.
+    """
+    start = time.perf_counter()
+    primary = asyncio.create_task(_extract_raw_filters(query))
+    pending = {primary}
+    error: Optional[BaseException] = None
+    try:
+        if LLM_HEDGE and _llm_hedge_delay() < timeout:
+            done, _ = await asyncio.wait(pending, timeout=_llm_hedge_delay())
+            if not done:
+                _filter_stats["llm_hedged"] += 1
+                pending.add(asyncio.create_task(_extract_raw_filters(query)))
+        while pending:
+            remaining = timeout - (time.perf_counter() - start)
+            done, pending = await asyncio.wait(
+                pending, timeout=max(0.0, remaining), return_when=asyncio.FIRST_COMPLETED
+            )
+            if not done:
+                raise asyncio.TimeoutError()
+            # Retrieve every failure, even when another task won, so none is logged as unhandled
+            errors = [task.exception() for task in done]
+            for task, task_error in zip(done, errors):
+                if task_error is None:
+                    _llm_latencies.append(time.perf_counter() - start)
+                    return task.result(), task is not primary
+            error = errors[-1]
+        raise error
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+async def _extract_filters(
+        query: str,
+        merchant_id: Optional[str] = None,
+        deadline: Optional[float] = None
+    ) -> tuple[dict, str]:
+    """Brand/price filters and the path that produced them.
+
+    Tried in order: the rule-based parser ("rules"), the filter cache ("cache"),
+    the LLM ("llm", or "llm_hedge" when the hedged request answered). When the
+    LLM misses its deadline or fails, the rule-based parse is used anyway
+    ("rules_timeout" / "rules_error"). ``deadline`` is a time.perf_counter()
+    timestamp for the whole request.
+    """
+    _filter_stats["queries"] += 1
+    if FILTER_FAST_PATH:
+        with stage_timer("rule_filter", merchant_id):
+            parsed = parse_filters(query)
+        if parsed.confidence >= FILTER_FAST_PATH_MIN_CONFIDENCE:
+            _filter_stats["fast_path"] += 1
+            logger.info(f"[AgenticSearch] Rule-based filters (confidence={parsed.confidence}): {parsed.filters}")
+            return dict(parsed.filters), "rules"
+        logger.info(f"[AgenticSearch] Rule parser unsure (confidence={parsed.confidence}, unparsed={parsed.unparsed})")
+    cached = await filter_cache.aget(query, FILTER_MODEL, FILTER_PROMPT_VERSION)
+    if cached is not None:
+        _filter_stats["cached"] += 1
+        logger.info(f"[AgenticSearch] Cached LLM filters: {cached}")
+        return cached, "cache"
+
+    timeout = LLM_FILTER_TIMEOUT_MS / 1000
+    if deadline is not None:
+        timeout = min(timeout, deadline - time.perf_counter() - LLM_BUDGET_RESERVE_MS / 1000)
+    if timeout <= 0:
+        # Not an LLM call: the request budget ran out before one could be issued
+        _filter_stats["llm_skipped"] += 1
+        logger.warning("[AgenticSearch] No budget left for LLM filters, using rules")
+        source = "rules_timeout"
+    else:
+        _filter_stats["llm"] += 1
+        try:
+            filters, hedge_won = await _staged("llm_filter", merchant_id, _call_llm(query, timeout))
+        except asyncio.TimeoutError:
+            _filter_stats["llm_timeouts"] += 1
+            logger.warning(f"[AgenticSearch] LLM filters missed the {timeout * 1000:.0f} ms deadline, using rules")
+            source = "rules_timeout"
+        except Exception as e:
+            _filter_stats["llm_errors"] += 1
+            logger.error(f"[AgenticSearch] LLM filter extraction failed, using rules: {e}")
+            source = "rules_error"
+        else:
+            _filter_stats["llm_hedge_wins"] += hedge_won
+            await filter_cache.aset(query, FILTER_MODEL, FILTER_PROMPT_VERSION, filters)
+            return filters, "llm_hedge" if hedge_won else "llm"
+
+    # Degraded: category is mapped from the embedding as usual (best_category)
+    intent = parse_query_intent(query)
+    intent.pop("category", None)
+    return intent, source
+
+def filter_stats() -> dict:
+    queries = _filter_stats["queries"]
+    return {
+        **_filter_stats,
+        "fast_path_rate": round(_filter_stats["fast_path"] / queries, 4) if queries else 0.0,
+        "llm_rate": round(_filter_stats["llm"] / queries, 4) if queries else 0.0,
+        "model": FILTER_MODEL,
+        "prompt_version": FILTER_PROMPT_VERSION,
+        "enabled": FILTER_FAST_PATH,
+        "min_confidence": FILTER_FAST_PATH_MIN_CONFIDENCE,
+        "llm_timeout_ms": LLM_FILTER_TIMEOUT_MS,
+        "llm_hedge_delay_ms": round(_llm_hedge_delay() * 1000, 1) if LLM_HEDGE else None,
+    }
+
+def _validate_filters(filters: dict, category: Optional[str]) -> dict:
+    """Attach the deterministic category and validate the combined filters."""
+    filters["category"] = category
 
     # ✅ Validate with Pydantic schema
     try:
@@ -84,28 +256,94 @@ async def extract_filters_with_llm(query: str) -> dict:
         logger.warning(f"[AgenticSearch] Validation failed: {e}")
         filters = {}
 
-    logger.info(f"[AgenticSearch] LLM-extracted filters (validated): {filters}")
+    logger.info(f"[AgenticSearch] Extracted filters (validated): {filters}")
     return filters
 
+async def extract_filters_with_llm(query: str, query_vector: Optional[list[float]] = None) -> dict:
+    """Extract brand/price filters (rules first, then LLM), map category separately.
+
+    The filter extraction and the query embedding used for category mapping run concurrently.
+    """
+    if query_vector is None:
+        (filters, _), query_vector = await asyncio.gather(
+            _extract_filters(query),
+            get_embedding(query),
+        )
+    else:
+        filters, _ = await _extract_filters(query)
+
+    category = await best_category(query, query_vector)
+    return _validate_filters(filters, category)
+
 # ----------------------------
-# Main Search
+# Hedged Retrieval
 # ----------------------------
-async def search_products_nl(
-        query: str, 
-        merchant_id: str, 
-        db: AsyncSession, 
-        offset: int = 0, 
-        limit: int = 10,
-        context: Optional[Dict[str, Any]] = None
-    ):
+# HEDGE_MODE=off (default) | auto | always. In auto mode the unfiltered fallback
+# query is issued together with the filtered one when the filter looks too
+# strict: a low-confidence category, a brand filter, or a narrow price band.
+HEDGE_MODE = os.getenv("HEDGE_MODE", "off")
+HEDGE_MIN_CATEGORY_SCORE = float(os.getenv("HEDGE_MIN_CATEGORY_SCORE", "0.3"))
+HEDGE_NARROW_PRICE_RATIO = float(os.getenv("HEDGE_NARROW_PRICE_RATIO", "0.5"))
 
-    """Perform natural language search with embeddings + Pinecone + filters."""
-    logger.info(f"[Metrics] Query: {query}")
-    
-    # Extract filters (safe fallback)
-    filters = await extract_filters_with_llm(query)
+_hedge_stats = {"filtered_queries": 0, "hedged": 0, "hedge_wins": 0, "latency_saved_ms": 0.0}
+
+def _should_hedge(filters: dict, candidates: list[tuple[str, float]]) -> bool:
+    if HEDGE_MODE == "always":
+        return True
+    if HEDGE_MODE != "auto":
+        return False
+    if candidates and candidates[0][1] < HEDGE_MIN_CATEGORY_SCORE:
+        return True
+    if filters.get("brand"):
+        return True
+    price_min, price_max = filters.get("price_min"), filters.get("price_max")
+    if price_min is not None and price_max is not None:
+        return price_max - price_min <= HEDGE_NARROW_PRICE_RATIO * max(price_max, 1.0)
+    return False
+
+async def _timed_query(index, params: dict):
+    start = time.perf_counter()
+    results = await run_blocking(index.query, **params)
+    return results, time.perf_counter() - start
+
+async def _staged(stage: str, merchant_id: str, awaitable):
+    """Await ``awaitable`` and record its latency as ``stage``."""
+    start = time.perf_counter()
+    try:
+        return await awaitable
+    finally:
+        observe(stage, merchant_id, time.perf_counter() - start)
 
-    # Build Pinecone filter structure
+def hedge_stats() -> dict:
+    filtered = _hedge_stats["filtered_queries"]
+    return {
+        **_hedge_stats,
+        "latency_saved_ms": round(_hedge_stats["latency_saved_ms"], 1),
+        "hedge_rate": round(_hedge_stats["hedged"] / filtered, 4) if filtered else 0.0,
+        "mode": HEDGE_MODE,
+    }
+
+def _enrich_query(query: str, context: Optional[Dict[str, Any]]) -> str:
+    """Append context hints (cabin, loyalty, trip) to the query text for embedding."""
+    if not context:
+        return query
+    enrich_parts = []
+    if context.get("cabin"):
+        enrich_parts.append(f"cabin: {context['cabin']}")
+    if context.get("loyalty_tier"):
+        enrich_parts.append(f"loyalty: {context['loyalty_tier']}")
+    if context.get("trip"):
+        trip = context["trip"]
+        enrich_parts.append(f"trip from {trip.get('from')} to {trip.get('to')}")
+    enriched_query = query + " | " + ", ".join(enrich_parts)
+    logger.info(f"[AgenticSearch] Enriched query with context: {enriched_query}")
+    return enriched_query
+
+# ----------------------------
+# Result Set Retrieval
+# ----------------------------
+def _structured_filter(filters: dict) -> dict:
+    """Translate validated filters into Pinecone filter syntax."""
     structured_filter = {}
     if filters.get("category"):
         structured_filter["category"] = filters["category"]
@@ -117,35 +355,63 @@ async def search_products_nl(
             structured_filter["price"]["$gte"] = filters["price_min"]
         if filters.get("price_max") is not None:
             structured_filter["price"]["$lte"] = filters["price_max"]
+    return structured_filter
 
-    logger.info(f"[AgenticSearch] Structured filters applied: {structured_filter}")
+async def _retrieve_result_set(
+        query: str,
+        merchant_id: str,
+        context: Optional[Dict[str, Any]],
+        top_k: int,
+        deadline: Optional[float] = None,
+        embed: Optional[Callable[[], Awaitable[list[list[float]]]]] = None
+    ) -> Optional[Dict[str, Any]]:
+    """Run LLM + embeddings + vector query for a window of ``top_k`` candidates.
 
+    ``deadline`` (a time.perf_counter() timestamp) bounds the LLM stage.
+    ``embed`` replaces the embeddings call; it returns the (raw, enriched)
+    query vectors. Returns None when the vector query fails.
+    """
     # Enrich query with context (soft influence)
-    enriched_query = query
-    if context:
-        enrich_parts = []
-        if context.get("cabin"):
-            enrich_parts.append(f"cabin: {context['cabin']}")
-        if context.get("loyalty_tier"):
-            enrich_parts.append(f"loyalty: {context['loyalty_tier']}")
-        if context.get("trip"):
-            trip = context["trip"]
-            enrich_parts.append(f"trip from {trip.get('from')} to {trip.get('to')}")
-        enriched_query = query + " | " + ", ".join(enrich_parts)
-        logger.info(f"[AgenticSearch] Enriched query with context: {enriched_query}")
-
-    # Generate embedding
-    logger.info("[AgenticSearch] Generating embedding...")
-    query_embedding = get_embedding(enriched_query)
+    enriched_query = _enrich_query(query, context)
+
+    # Filter extraction and embeddings run concurrently; the raw query and the
+    # enriched query share one embeddings call (a single string when they are equal).
+    logger.info("[AgenticSearch] Extracting filters and generating embeddings...")
+    (raw_filters, filter_source), (query_vector, query_embedding) = await asyncio.gather(
+        _extract_filters(query, merchant_id, deadline),
+        embed() if embed is not None else _staged("embedding", merchant_id, get_embeddings([query, enriched_query])),
+    )
+    with stage_timer("category_mapping", merchant_id):
+        candidates = await category_candidates(query, query_vector)
+    filters = _validate_filters(raw_filters, candidates[0][0])
+
+    structured_filter = _structured_filter(filters)
+    logger.info(f"[AgenticSearch] Structured filters applied: {structured_filter}")
+
+    # A paraphrase of a recent query with the same filters reuses its result set
+    rules_version = merchant_config.snapshot.version
+    with stage_timer("semantic_cache", merchant_id):
+        similar = semantic_cache.lookup(
+            merchant_id, query_embedding, structured_filter, context, rules_version, min_window=top_k
+        )
+    if similar is not None:
+        logger.info("[AgenticSearch] Semantic cache hit; skipping vector query")
+        return {
+            **similar,
+            "filter_source": filter_source,
+            "candidates": candidates,
+            "query_embedding": query_embedding,
+            "embedded_text": enriched_query,
+            "latency_ms": 0,
+        }
 
     # Choose merchant-specific Pinecone index
-    index_name = get_index_name(merchant_id)
-    index = pc.Index(index_name)
+    index = await get_index(merchant_id)
 
     # Query Pinecone
     pinecone_query = {
         "vector": query_embedding,
-        "top_k": offset + limit,
+        "top_k": top_k,
         "include_metadata": True
     }
     if structured_filter:
@@ -156,26 +422,203 @@ async def search_products_nl(
     qlog["vector"] = f"[{len(query_embedding)}-dim embedding]"
     logger.info(f"[AgenticSearch] Pinecone query params: {json.dumps(qlog, indent=2)}")
 
+    # Hedged mode: start the unfiltered fallback alongside the filtered query
+    fallback_query = {k: v for k, v in pinecone_query.items() if k != "filter"}
+    fallback_task = None
+    if "filter" in pinecone_query:
+        _hedge_stats["filtered_queries"] += 1
+        if _should_hedge(filters, candidates):
+            _hedge_stats["hedged"] += 1
+            fallback_task = asyncio.create_task(_timed_query(index, fallback_query))
+
     # Measure latency
-    start = time.time()
     try:
-        results = index.query(**pinecone_query)
+        results, elapsed = await _timed_query(index, pinecone_query)
     except Exception as e:
+        if fallback_task is not None:
+            fallback_task.cancel()
         logger.error(f"[AgenticSearch] Pinecone query failed: {e}")
-        return {"interpreted_filters": {}, "results": []}
-    duration = int((time.time() - start) * 1000)
+        return None
+    observe("vector_query", merchant_id, elapsed)
+    filtered_done = time.perf_counter()
+    window = results.get("matches", [])
 
-    matches = results.get("matches", [])[offset: offset + limit]
-
-    # Rank the mathes
-    matches = rank_products(matches, merchant_id, context)
+    if window and fallback_task is not None:
+        fallback_task.cancel()
 
     # Fallback if no results with filters
-    if not matches and "filter" in pinecone_query:
+    if not window and "filter" in pinecone_query:
         logger.warning("[AgenticSearch] No results with filters. Retrying without filters...")
-        pinecone_query.pop("filter")
-        results = index.query(**pinecone_query)
-        matches = results.get("matches", [])[offset: offset + limit]
+        if fallback_task is not None:
+            results, fallback_elapsed = await fallback_task
+            waited = time.perf_counter() - filtered_done
+            _hedge_stats["hedge_wins"] += 1
+            _hedge_stats["latency_saved_ms"] += max(0.0, fallback_elapsed - waited) * 1000
+        else:
+            results, fallback_elapsed = await _timed_query(index, fallback_query)
+        observe("fallback_query", merchant_id, fallback_elapsed)
+        window = results.get("matches", [])
+
+    result_set = {
+        "structured_filter": structured_filter,
+        "filter_source": filter_source,
+        "candidates": candidates,
+        "query_embedding": query_embedding,
+        "embedded_text": enriched_query,
+        "latency_ms": int(elapsed * 1000),
+        # plain dicts so cached pages can be copied and ranked independently
+        "matches": [
+            {"id": m.get("id"), "score": m.get("score"), "metadata": m.get("metadata") or {}}
+            for m in window
+        ],
+        # fewer hits than asked for: no deeper page can exist
+        "exhaustive": len(window) < top_k,
+    }
+    semantic_cache.put(merchant_id, query_embedding, structured_filter, context, rules_version, result_set)
+    return result_set
+
+# ----------------------------
+# Main Search
+# ----------------------------
+async def search_products_nl(
+        query: str, 
+        merchant_id: str, 
+        db: AsyncSession, 
+        offset: int = 0, 
+        limit: int = 10,
+        context: Optional[Dict[str, Any]] = None,
+        cursor: Optional[str] = None,
+        budget_ms: Optional[float] = None
+    ):
+
+    """Perform natural language search with embeddings + Pinecone + filters.
+
+    The first page fetches a window of at least RESULT_WINDOW candidates and
+    caches it; ``cursor`` (or a repeat of the same query) pages through that
+    window without any upstream calls. ``budget_ms`` (capped at
+    SEARCH_BUDGET_MS) is the request's latency budget.
+    """
+    logs = []
+    response = await _search_nl(query, merchant_id, offset, limit, context, cursor, budget_ms, logs=logs)
+    await _write_logs(logs, db)
+    return response
+
+async def search_products_nl_batch(items: list[Dict[str, Any]], db: AsyncSession) -> list:
+    """Run several natural language searches in one go.
+
+    ``items`` hold search_products_nl keyword arguments (without ``db``). Every
+    raw and enriched query is embedded in one embeddings call, which runs while
+    the items extract their filters; the items then query and rank
+    concurrently and their logs are written together. Returns, in order, each
+    item's response or the exception it raised.
+    """
+    texts = []
+    for item in items:
+        texts += [item["query"], _enrich_query(item["query"], item.get("context"))]
+
+    async def embed_batch():
+        with shared_stage_timer("batch_embedding", (item["merchant_id"] for item in items)):
+            return await get_embeddings(texts)
+
+    batch_embedding = asyncio.ensure_future(embed_batch())
+
+    def embed_item(i: int):
+        async def embed():
+            try:
+                vectors = await asyncio.shield(batch_embedding)
+            except Exception as e:
+                logger.error(f"[AgenticSearch] Batch embedding failed, embedding item {i} alone: {e}")
+                return await get_embeddings(texts[2 * i:2 * i + 2])
+            return vectors[2 * i:2 * i + 2]
+        return embed
+
+    logs = []
+    try:
+        outcomes = await asyncio.gather(
+            *[_search_nl(**item, embed=embed_item(i), logs=logs) for i, item in enumerate(items)],
+            return_exceptions=True,
+        )
+    finally:
+        if not batch_embedding.done():
+            batch_embedding.cancel()   # every item was served from a cache
+        elif not batch_embedding.cancelled():
+            batch_embedding.exception()   # retrieved, so a failure is not logged as unhandled
+    await _write_logs(logs, db)
+    return outcomes
+
+async def _write_logs(logs: list[Dict[str, Any]], db: AsyncSession) -> None:
+    """Save SearchLog rows in Supabase, batched off the request path when the writer runs.
+
+    The write time is recorded under each merchant the rows belong to.
+    """
+    if not logs:
+        return
+    with shared_stage_timer("db_log_write", (log["merchant_id"] for log in logs)):
+        if search_log_writer.running:
+            for log in logs:
+                search_log_writer.submit(log)
+        else:
+            for log in logs:
+                db.add(SearchLog(**log))
+            await db.commit()
+
+async def _search_nl(
+        query: str,
+        merchant_id: str,
+        offset: int = 0,
+        limit: int = 10,
+        context: Optional[Dict[str, Any]] = None,
+        cursor: Optional[str] = None,
+        budget_ms: Optional[float] = None,
+        embed: Optional[Callable[[], Awaitable[list[list[float]]]]] = None,
+        logs: Optional[list] = None
+    ) -> Dict[str, Any]:
+    """One search; its SearchLog row is appended to ``logs`` for the caller to write."""
+    logger.info(f"[Metrics] Query: {query}")
+    budget = min(budget_ms, SEARCH_BUDGET_MS) if budget_ms else SEARCH_BUDGET_MS
+    deadline = time.perf_counter() + budget / 1000
+
+    key = query_key(merchant_id, query, context)
+    result_set = None
+    if cursor:
+        decoded = decode_cursor(cursor)
+        if decoded is None:
+            logger.warning("[AgenticSearch] Ignoring malformed cursor")
+        else:
+            entry_id, offset = decoded
+            result_set = result_cache.get(entry_id)
+            if result_set is not None and result_set["key"] != key:
+                result_set = None   # cursor belongs to a different query
+    else:
+        result_set = result_cache.lookup(key)
+
+    # A page past the end of a truncated window needs a wider fetch
+    if result_set is not None and not result_set["exhaustive"] and offset + limit > len(result_set["matches"]):
+        result_set = None
+
+    from_cache = result_set is not None
+    if from_cache:
+        logger.info(f"[AgenticSearch] Serving offset={offset} from cached result set")
+    else:
+        result_set = await _retrieve_result_set(
+            query, merchant_id, context, max(RESULT_WINDOW, offset + limit), deadline, embed
+        )
+        if result_set is None:
+            return {"interpreted_filters": {}, "results": []}
+        result_set["key"] = key
+        result_set["entry_id"] = entry_id_for(merchant_id, query, result_set["structured_filter"], context)
+        result_cache.put(result_set["entry_id"], key, result_set)
+
+    # Score the whole ranking pool once per rules version; every page is a
+    # top-k selection over it. A rules reload re-scores without upstream calls.
+    snapshot = merchant_config.snapshot
+    window = result_set["matches"]
+    with stage_timer("ranking", merchant_id):
+        ranking = result_set.get("ranking")
+        if ranking is None or ranking[0] != snapshot.version:
+            scores = score_candidates(window[:RANK_POOL_SIZE], merchant_id, context, snapshot)
+            ranking = result_set["ranking"] = (snapshot.version, scores)
+        matches = rank_page(window, merchant_id, context, offset, limit, scores=ranking[1], snapshot=snapshot)
 
     # Extract top result info
     top_result_id, top_result_score = None, None
@@ -186,27 +629,37 @@ async def search_products_nl(
     else:
         logger.warning("[AgenticSearch] Still 0 results after fallback.")
 
-    # Step 8: Save log in Supabase (via SQLAlchemy model)
-    log = SearchLog(
+    # Step 8: Log row, written by the caller (see _write_logs)
+    log = dict(
         merchant_id=merchant_id,
         session_id="demo-session",   # you can later replace with real session tracking
         query=query,
-        query_embedding=query_embedding,   # JSONB in table
-        latency_ms=duration,
-        results_count=len(results.get("matches", [])),
+        **encode_embedding(   # JSON, packed bytes or a cache-key reference; see embedding_codec
+            None if from_cache else result_set["query_embedding"],
+            text=result_set["embedded_text"], model=EMBEDDING_MODEL,
+        ),
+        latency_ms=0 if from_cache else result_set["latency_ms"],
+        results_count=len(window),
         top_result_id=top_result_id,
         top_result_score=top_result_score,
         error_flag=False,
         client_type="mobile_app",
         country="UAE"
     )
-    db.add(log)
-    await db.commit()
+    if logs is not None:
+        logs.append(log)
+
+    next_offset = offset + limit
+    has_more = next_offset < len(window) or not result_set["exhaustive"]
 
     # Step 9: Return safe JSON serializable response
     return {
-        "interpreted_filters": json.loads(json.dumps(structured_filter)),  # safe dict
+        "interpreted_filters": json.loads(json.dumps(result_set["structured_filter"])),  # safe dict
+        "filter_source": result_set["filter_source"],
         "context_used": context or {},
+        "category_candidates": [
+            {"category": cat, "score": round(score, 4)} for cat, score in result_set["candidates"]
+        ],
         "results": [
             {
                 "id": match.get("id"),
@@ -214,5 +667,7 @@ async def search_products_nl(
                 "metadata": match.get("metadata", {})
             }
             for match in matches
-        ]
+        ],
+        "rules_version": snapshot.version,
+        "next_cursor": encode_cursor(result_set["entry_id"], next_offset) if has_more else None
     }
@@ -0,0 +1,254 @@
+# backend/app/services/cache_tiers.py
+"""
+Cache tiers shared by the embedding and filter caches.
+
+Tiers map a string key to a value and count their own hits, misses and
+evictions:
+
+    LRUTier      in-process LRU with a per-entry TTL
+    SQLiteTier   one SQLite table in WAL mode, shared by every worker on the host
+    NullTier     caching disabled; every lookup is a miss
+
+``TieredCache`` puts a memory tier in front of an optional disk tier and
+promotes disk hits into memory. Its ``aget``/``aset`` run the disk tier on the
+blocking pool so SQLite I/O never stalls the event loop; ``get``/``set`` are
+for synchronous callers.
+
+SQLite rows can carry a tag (e.g. the model and prompt version that produced
+them) so ``purge_stale`` can drop rows no current key will ever hit.
+"""
+import time
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+from app.services.executor import run_blocking
+
+
+class CacheTier:
+    """Interface for a cache tier keyed by strings."""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any, tag: str = "") -> None:
+        """Store ``value``; ``tag`` only matters to tiers that persist it."""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+class LRUTier(CacheTier):
+    """In-process LRU with per-entry TTL. Expired entries count as evictions."""
+
+    def __init__(self, max_entries: int = 10000, ttl: float = 86400, clock=time.monotonic):
+        super().__init__()
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: "OrderedDict[str, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                self.evictions += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: Any, tag: str = "") -> None:
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {**super().stats(), "size": len(self._entries), "max_entries": self.max_entries}
+
+
+class SQLiteTier(CacheTier):
+    """On-disk tier shared by the workers on one host (WAL mode, one row per key).
+
+    Values are stored in ``value_column`` as whatever ``encode`` returns and read
+    back through ``decode``. With ``tagged`` the table has a ``tag`` column for
+    ``purge_stale``.
+    """
+
+    PRUNE_EVERY = 1000  # writes between sweeps of expired rows
+
+    def __init__(
+        self,
+        path: str,
+        table: str,
+        encode: Callable[[Any], Any],
+        decode: Callable[[Any], Any],
+        value_column: str = "value",
+        tagged: bool = False,
+        ttl: float = 86400,
+        clock=time.time,
+    ):
+        super().__init__()
+        self.path = path
+        self.table = table
+        self.ttl = ttl
+        self.tagged = tagged
+        self._encode = encode
+        self._decode = decode
+        self._value_column = value_column
+        self._clock = clock
+        self._writes = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} ("
+            f" key TEXT PRIMARY KEY, {value_column} BLOB NOT NULL, expires_at REAL NOT NULL"
+            f"{', tag TEXT NOT NULL' if tagged else ''})"
+        )
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {self._value_column}, expires_at FROM {self.table} WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            if row[1] <= self._clock():
+                self._conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+                self.evictions += 1
+                self.misses += 1
+                return None
+            self.hits += 1
+        return self._decode(row[0])
+
+    def set(self, key: str, value: Any, tag: str = "") -> None:
+        columns, params = f"key, {self._value_column}, expires_at", (key, self._encode(value), self._clock() + self.ttl)
+        if self.tagged:
+            columns, params = columns + ", tag", params + (tag,)
+        with self._lock:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO {self.table} ({columns}) VALUES ({', '.join('?' * len(params))})", params
+            )
+            self._writes += 1
+            if self._writes % self.PRUNE_EVERY == 0:
+                self.evictions += self._conn.execute(
+                    f"DELETE FROM {self.table} WHERE expires_at <= ?", (self._clock(),)
+                ).rowcount
+
+    def purge_stale(self, tag: str) -> int:
+        """Delete rows written under any tag other than ``tag``."""
+        with self._lock:
+            return self._conn.execute(f"DELETE FROM {self.table} WHERE tag != ?", (tag,)).rowcount
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute(f"DELETE FROM {self.table}")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            size = self._conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+        return {**super().stats(), "size": size, "path": self.path}
+
+
+class NullTier(CacheTier):
+    """Used when a tier is disabled; every lookup is a miss."""
+
+    def get(self, key: str) -> Optional[Any]:
+        self.misses += 1
+        return None
+
+    def set(self, key: str, value: Any, tag: str = "") -> None:
+        pass
+
+    def clear(self) -> None:
+        pass
+
+
+class TieredCache(CacheTier):
+    """Memory first, then disk; disk hits are promoted into memory."""
+
+    def __init__(self, memory: CacheTier, disk: Optional[CacheTier] = None):
+        super().__init__()
+        self.memory = memory
+        self.disk = disk
+
+    def _count(self, value: Optional[Any]) -> Optional[Any]:
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def get(self, key: str) -> Optional[Any]:
+        value = self.memory.get(key)
+        if value is None and self.disk is not None:
+            value = self.disk.get(key)
+            if value is not None:
+                self.memory.set(key, value)
+        return self._count(value)
+
+    async def aget(self, key: str) -> Optional[Any]:
+        """Like ``get``, with the disk lookup off the event loop."""
+        value = self.memory.get(key)
+        if value is None and self.disk is not None:
+            value = await run_blocking(self.disk.get, key)
+            if value is not None:
+                self.memory.set(key, value)
+        return self._count(value)
+
+    def set(self, key: str, value: Any, tag: str = "") -> None:
+        self.memory.set(key, value, tag)
+        if self.disk is not None:
+            self.disk.set(key, value, tag)
+
+    async def aset(self, key: str, value: Any, tag: str = "") -> None:
+        """Like ``set``, with the disk write off the event loop."""
+        self.memory.set(key, value, tag)
+        if self.disk is not None:
+            await run_blocking(self.disk.set, key, value, tag)
+
+    def clear(self) -> None:
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        self.evictions = self.memory.evictions + (self.disk.evictions if self.disk else 0)
+        return {
+            **super().stats(),
+            "memory": self.memory.stats(),
+            "disk": self.disk.stats() if self.disk is not None else None,
+        }
@@ -0,0 +1,77 @@
+# backend/app/services/category_index.py
+"""
+Category mapping as one matrix-vector product.
+
+The category embeddings are a contiguous float32 matrix with L2-normalized
+rows, so cosine similarity against every category is ``M @ q`` after
+normalizing the query. Works for a single query or a batch. The matrix is
+memory-mapped read-only from the .npy artifact, so every worker on a host
+shares the same pages.
+"""
+import json
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from app.config.categories import CATEGORY_EMBEDDINGS_NPY, CATEGORY_EMBEDDINGS_INDEX
+
+
+class CategoryIndex:
+    def __init__(self, names: Sequence[str], matrix: np.ndarray, normalized: bool = False):
+        matrix = np.asarray(matrix, dtype=np.float32)
+        if not normalized:
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            matrix = matrix / norms
+        if len(names) != matrix.shape[0]:
+            raise ValueError(f"{len(names)} category names for {matrix.shape[0]} embedding rows")
+        self.names: List[str] = list(names)
+        self.matrix = np.ascontiguousarray(matrix)
+
+    @classmethod
+    def from_embeddings(cls, embeddings: Dict[str, Sequence[float]]) -> "CategoryIndex":
+        names = list(embeddings)
+        return cls(names, np.array([embeddings[n] for n in names], dtype=np.float32))
+
+    @classmethod
+    def from_artifact(cls, npy_path: str, index_path: str) -> "CategoryIndex":
+        """Memory-map the generated artifact; its rows are already unit-norm."""
+        with open(index_path) as f:
+            names = json.load(f)["categories"]
+        return cls(names, np.load(npy_path, mmap_mode="r"), normalized=True)
+
+    def scores(self, q_vecs) -> np.ndarray:
+        """Cosine similarity of each query (rows of ``q_vecs``) to every category."""
+        q = np.atleast_2d(np.asarray(q_vecs, dtype=np.float32))
+        norms = np.linalg.norm(q, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return (q / norms) @ self.matrix.T
+
+    def top_k_batch(self, q_vecs, k: int = 3) -> List[List[Tuple[str, float]]]:
+        """Top-k (category, score) pairs for each of N queries, best first."""
+        sims = self.scores(q_vecs)
+        k = max(1, min(k, sims.shape[1]))
+        if k < sims.shape[1]:
+            idx = np.argpartition(-sims, k - 1, axis=1)[:, :k]
+        else:
+            idx = np.tile(np.arange(sims.shape[1]), (sims.shape[0], 1))
+        top = np.take_along_axis(sims, idx, axis=1)
+        order = np.argsort(-top, axis=1)
+        idx = np.take_along_axis(idx, order, axis=1)
+        top = np.take_along_axis(top, order, axis=1)
+        return [
+            [(self.names[i], float(s)) for i, s in zip(row_idx, row_scores)]
+            for row_idx, row_scores in zip(idx, top)
+        ]
+
+    def top_k(self, q_vec, k: int = 3) -> List[Tuple[str, float]]:
+        return self.top_k_batch(q_vec, k)[0]
+
+    def best(self, q_vec) -> Tuple[str, float]:
+        sims = self.scores(q_vec)[0]
+        i = int(np.argmax(sims))
+        return self.names[i], float(sims[i])
+
+
+# global instance (safe to import)
+category_index = CategoryIndex.from_artifact(CATEGORY_EMBEDDINGS_NPY, CATEGORY_EMBEDDINGS_INDEX)
@@ -0,0 +1,109 @@
+# backend/app/services/embedding_batcher.py
+"""
+Micro-batching dispatcher for embedding requests.
+
+Concurrent callers each ask for one string; the batcher holds them for at most
+EMBED_BATCH_MAX_WAIT_MS (or until EMBED_BATCH_MAX_SIZE strings are queued) and
+sends a single list-input embeddings call, then fans the vectors back out.
+A string already in flight is not queued again — later callers await the same
+future (single-flight).
+"""
+import os
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, List, Any
+
+logger = logging.getLogger("app.services.embedding_batcher")
+
+EMBED_BATCH_MAX_SIZE = int(os.getenv("EMBED_BATCH_MAX_SIZE", "64"))
+EMBED_BATCH_MAX_WAIT_MS = float(os.getenv("EMBED_BATCH_MAX_WAIT_MS", "5"))
+
+
+class EmbeddingBatcher:
+    def __init__(
+        self,
+        embed_fn: Callable[[List[str]], Awaitable[List[List[float]]]],
+        max_batch_size: int = EMBED_BATCH_MAX_SIZE,
+        max_wait_ms: float = EMBED_BATCH_MAX_WAIT_MS,
+    ):
+        self.embed_fn = embed_fn
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000
+        self._pending: List[str] = []
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._timer = None
+        self._tasks: set = set()   # dispatches in flight; the loop only holds weak references
+
+        self.requests = 0
+        self.coalesced = 0
+        self.batches = 0
+        self.batched_texts = 0
+
+    async def embed(self, text: str) -> List[float]:
+        """Queue ``text`` for the next batch and wait for its vector."""
+        self.requests += 1
+        future = self._inflight.get(text)
+        if future is not None:
+            self.coalesced += 1
+            return await asyncio.shield(future)
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._inflight[text] = future
+        self._pending.append(text)
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+
+        return await asyncio.shield(future)
+
+    async def embed_many(self, texts: List[str]) -> List[List[float]]:
+        return list(await asyncio.gather(*(self.embed(text) for text in texts)))
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        self.batches += 1
+        self.batched_texts += len(batch)
+        futures = [self._inflight[text] for text in batch]
+        task = asyncio.get_running_loop().create_task(self._dispatch(batch, futures))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, batch: List[str], futures: List[asyncio.Future]) -> None:
+        try:
+            vectors = await self.embed_fn(batch)
+            if len(vectors) != len(batch):
+                raise ValueError(f"expected {len(batch)} embeddings, got {len(vectors)}")
+            for future, vector in zip(futures, vectors):
+                if not future.done():
+                    future.set_result(vector)
+        except Exception as e:
+            logger.error(f"[EmbeddingBatcher] Batch of {len(batch)} failed: {e}")
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            # Cancelled or a BaseException: fail what is still unresolved, and always
+            # release the texts so later callers start a fresh request.
+            for text, future in zip(batch, futures):
+                if not future.done():
+                    future.set_exception(RuntimeError(f"embedding batch of {len(batch)} was aborted"))
+                if self._inflight.get(text) is future:
+                    del self._inflight[text]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "coalesced": self.coalesced,
+            "upstream_calls": self.batches,
+            "avg_batch_size": round(self.batched_texts / self.batches, 2) if self.batches else 0.0,
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait * 1000,
+        }
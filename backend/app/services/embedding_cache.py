@@ -0,0 +1,96 @@
+# backend/app/services/embedding_cache.py
+"""
+Embedding cache in front of the OpenAI embeddings API.
+
+Tier 1 is an in-process LRU with a TTL. Tier 2 (optional) is a SQLite file so
+entries survive restarts and are shared by every worker on the host (tiers in
+app/services/cache_tiers.py). Keys are the model name plus the normalized text;
+vectors are stored as float32. Async callers use ``aget``/``aset`` so the disk
+tier runs off the event loop.
+
+Configured from env:
+    EMBEDDING_CACHE_SIZE   max in-memory entries (default 10000, 0 disables)
+    EMBEDDING_CACHE_TTL    seconds an entry stays valid (default 86400)
+    EMBEDDING_CACHE_PATH   SQLite file for the shared tier (unset = memory only)
+"""
+import os
+import re
+import sqlite3
+import hashlib
+import logging
+from typing import Optional, Dict, Any
+
+import numpy as np
+
+from app.services.cache_tiers import CacheTier, LRUTier, NullTier, SQLiteTier, TieredCache
+
+logger = logging.getLogger("app.services.embedding_cache")
+
+_WS_RE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """Case-fold and collapse whitespace so trivial variants share an entry."""
+    return _WS_RE.sub(" ", text).strip().casefold()
+
+
+def cache_key(text: str, model: str) -> str:
+    return hashlib.sha256(f"{model}\x00{normalize_text(text)}".encode("utf-8")).hexdigest()
+
+
+def _encode(vector) -> bytes:
+    return np.asarray(vector, dtype=np.float32).tobytes()
+
+
+def _decode(blob: bytes) -> np.ndarray:
+    return np.frombuffer(blob, dtype=np.float32)
+
+
+def sqlite_embedding_tier(path: str, ttl: float = 86400) -> SQLiteTier:
+    """Disk tier with the ``embeddings`` table layout existing cache files use."""
+    return SQLiteTier(path, "embeddings", _encode, _decode, value_column="vector", ttl=ttl)
+
+
+class EmbeddingCache:
+    """Vectors keyed by model and normalized text. They come out as float32 arrays."""
+
+    def __init__(self, memory: CacheTier, disk: Optional[CacheTier] = None):
+        self.tiers = TieredCache(memory, disk)
+
+    def get(self, text: str, model: str) -> Optional[np.ndarray]:
+        return self.tiers.get(cache_key(text, model))
+
+    async def aget(self, text: str, model: str) -> Optional[np.ndarray]:
+        return await self.tiers.aget(cache_key(text, model))
+
+    def set(self, text: str, model: str, vector) -> None:
+        self.tiers.set(cache_key(text, model), np.asarray(vector, dtype=np.float32))
+
+    async def aset(self, text: str, model: str, vector) -> None:
+        await self.tiers.aset(cache_key(text, model), np.asarray(vector, dtype=np.float32))
+
+    def clear(self) -> None:
+        self.tiers.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return self.tiers.stats()
+
+
+def build_embedding_cache() -> EmbeddingCache:
+    size = int(os.getenv("EMBEDDING_CACHE_SIZE", "10000"))
+    ttl = float(os.getenv("EMBEDDING_CACHE_TTL", "86400"))
+    path = os.getenv("EMBEDDING_CACHE_PATH")
+
+    memory = LRUTier(max_entries=size, ttl=ttl) if size > 0 else NullTier()
+    disk = None
+    if path:
+        try:
+            disk = sqlite_embedding_tier(path, ttl=ttl)
+            logger.info(f"[EmbeddingCache] Disk tier at {path}")
+        except sqlite3.Error as e:
+            logger.error(f"[EmbeddingCache] Disk tier unavailable, using memory only: {e}")
+    return EmbeddingCache(memory, disk)
+
+
+# global instance (safe to import)
+embedding_cache = build_embedding_cache()
@@ -0,0 +1,61 @@
+# backend/app/services/embedding_codec.py
+"""
+How SearchLog stores the query embedding (SEARCH_LOG_EMBEDDING):
+
+    json      legacy JSON array in ``query_embedding`` (~30 KB of text per row)
+    float32   little-endian packed bytes in ``query_embedding_bin`` (6 KB at 1536-d)
+    float16   half-precision packed bytes (3 KB); ~1e-3 relative error, fine for training
+    ref       only ``embedding_key``, the embedding cache key of the embedded text
+    none      nothing
+
+Binary rows record their format in ``embedding_format``. Readers decode with
+``np.frombuffer`` so a single row, or a batch joined into one buffer, becomes an
+array without per-element copies.
+"""
+import os
+from typing import Any, Dict, Iterable, Optional, Sequence
+
+import numpy as np
+
+from app.services.embedding_cache import cache_key
+
+SEARCH_LOG_EMBEDDING = os.getenv("SEARCH_LOG_EMBEDDING", "json")
+
+DTYPES = {"float32": np.dtype("<f4"), "float16": np.dtype("<f2")}
+FORMATS = ("json", "ref", "none", *DTYPES)
+
+
+def encode_embedding(
+        vector: Optional[Sequence[float]],
+        text: Optional[str] = None,
+        model: Optional[str] = None,
+        fmt: str = SEARCH_LOG_EMBEDDING
+    ) -> Dict[str, Any]:
+    """SearchLog column values for one embedding in format ``fmt``.
+
+    The keys depend only on ``fmt`` (values are None without a vector), so rows
+    of one process can share a multi-row INSERT.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown SEARCH_LOG_EMBEDDING format: {fmt}")
+    if fmt == "none":
+        return {}
+    if fmt == "json":
+        return {"query_embedding": list(vector) if vector is not None else None}
+    if fmt == "ref":
+        if vector is None or not text or not model:
+            return {"embedding_key": None, "embedding_format": None}
+        return {"embedding_key": cache_key(text, model), "embedding_format": "ref"}
+    if vector is None:
+        return {"query_embedding_bin": None, "embedding_format": None}
+    return {"query_embedding_bin": np.asarray(vector, dtype=DTYPES[fmt]).tobytes(), "embedding_format": fmt}
+
+
+def decode_embedding(blob: bytes, fmt: str = "float32") -> np.ndarray:
+    """Read-only view over the stored bytes (no copy)."""
+    return np.frombuffer(blob, dtype=DTYPES[fmt])
+
+
+def decode_embeddings(blobs: Iterable[bytes], dim: int, fmt: str = "float32") -> np.ndarray:
+    """(N, dim) matrix from many rows of one format: one buffer join, then a view."""
+    return np.frombuffer(b"".join(blobs), dtype=DTYPES[fmt]).reshape(-1, dim)
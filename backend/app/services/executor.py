@@ -0,0 +1,22 @@
+# backend/app/services/executor.py
+"""
+Bounded thread pool for blocking SDK calls on the request path.
+
+The Pinecone client is synchronous; running its network round trips here keeps
+them off the uvicorn event loop while capping how many threads one worker uses.
+Size it with BLOCKING_POOL_SIZE (default 32).
+"""
+import os
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+BLOCKING_POOL_SIZE = int(os.getenv("BLOCKING_POOL_SIZE", "32"))
+
+_executor = ThreadPoolExecutor(max_workers=BLOCKING_POOL_SIZE, thread_name_prefix="blocking-io")
+
+
+async def run_blocking(func, *args, **kwargs):
+    """Run ``func(*args, **kwargs)`` on the bounded pool and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, functools.partial(func, *args, **kwargs))
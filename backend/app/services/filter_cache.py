@@ -0,0 +1,109 @@
+# backend/app/services/filter_cache.py
+"""
+Cache for LLM-extracted filters.
+
+Filter extraction runs at temperature 0, so a normalized query always gets the
+same answer from a given model and prompt. Entries are keyed by
+
+    model, prompt version, normalize_query(query)
+
+so changing either the model or the prompt text (its hash is the version)
+misses every old entry; ``purge_stale`` deletes them from the shared tier.
+
+Tier 1 is an in-process LRU with a TTL. Tier 2 (optional) is a SQLite file
+shared by every worker on the host; its hits are promoted into memory. Both are
+the tiers in app/services/cache_tiers.py, and disk reads and writes run on the
+blocking pool.
+
+Configured from env:
+    FILTER_CACHE_SIZE   max in-memory entries (default 50000, 0 disables)
+    FILTER_CACHE_TTL    seconds an entry stays valid (default 604800)
+    FILTER_CACHE_PATH   SQLite file for the shared tier (unset = memory only)
+"""
+import os
+import re
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+from typing import Any, Dict, Optional
+
+from app.services.cache_tiers import LRUTier, NullTier, SQLiteTier, TieredCache
+from app.services.embedding_cache import normalize_text
+
+logger = logging.getLogger("app.services.filter_cache")
+
+FILTER_CACHE_SIZE = int(os.getenv("FILTER_CACHE_SIZE", "50000"))
+FILTER_CACHE_TTL = float(os.getenv("FILTER_CACHE_TTL", "604800"))
+FILTER_CACHE_PATH = os.getenv("FILTER_CACHE_PATH")
+
+_NUMBER_RE = re.compile(r"(?<![\w.])(\d[\d,]*(?:\.\d+)?)(k)?(?!\w)")
+
+
+def _canonical_number(m: re.Match) -> str:
+    value = float(m.group(1).replace(",", "")) * (1000 if m.group(2) else 1)
+    return f"{value:.6f}".rstrip("0").rstrip(".")
+
+
+def normalize_query(query: str) -> str:
+    """Case, whitespace and numbers: "Whisky  under 1,200.00" -> "whisky under 1200"."""
+    return _NUMBER_RE.sub(_canonical_number, normalize_text(query))
+
+
+def filter_cache_key(query: str, model: str, prompt_version: str) -> str:
+    return hashlib.sha256(f"{model}\x00{prompt_version}\x00{normalize_query(query)}".encode("utf-8")).hexdigest()
+
+
+def _version_tag(model: str, prompt_version: str) -> str:
+    return f"{model}:{prompt_version}"
+
+
+class FilterCache:
+    """LLM filters by model, prompt version and normalized query."""
+
+    def __init__(
+        self,
+        max_entries: int = FILTER_CACHE_SIZE,
+        ttl: float = FILTER_CACHE_TTL,
+        path: Optional[str] = None,
+        clock=time.time,
+    ):
+        memory = LRUTier(max_entries=max_entries, ttl=ttl, clock=clock) if max_entries > 0 else NullTier()
+        disk = None
+        if path:
+            try:
+                disk = SQLiteTier(path, "filter_cache", json.dumps, json.loads, tagged=True, ttl=ttl, clock=clock)
+                logger.info(f"[FilterCache] Disk tier at {path}")
+            except sqlite3.Error as e:
+                logger.error(f"[FilterCache] Disk tier unavailable, using memory only: {e}")
+        self.tiers = TieredCache(memory, disk)
+
+    async def aget(self, query: str, model: str, prompt_version: str) -> Optional[Dict[str, Any]]:
+        """A copy of the cached filters, or None. The disk tier is read off the event loop."""
+        filters = await self.tiers.aget(filter_cache_key(query, model, prompt_version))
+        return dict(filters) if filters is not None else None
+
+    async def aset(self, query: str, model: str, prompt_version: str, filters: Dict[str, Any]) -> None:
+        await self.tiers.aset(
+            filter_cache_key(query, model, prompt_version), dict(filters), _version_tag(model, prompt_version)
+        )
+
+    def purge_stale(self, model: str, prompt_version: str) -> int:
+        """Drop shared-tier rows written for another model or prompt version."""
+        if self.tiers.disk is None:
+            return 0
+        purged = self.tiers.disk.purge_stale(_version_tag(model, prompt_version))
+        if purged:
+            logger.info(f"[FilterCache] Purged {purged} entries from other models/prompt versions")
+        return purged
+
+    def clear(self) -> None:
+        self.tiers.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return self.tiers.stats()
+
+
+# global instance (safe to import)
+filter_cache = FilterCache(path=FILTER_CACHE_PATH)
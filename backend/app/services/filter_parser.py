@@ -0,0 +1,131 @@
+# backend/app/services/filter_parser.py
+"""
+Deterministic brand/price/category parser for shopping queries.
+
+    parsed = parse_filters("dior perfume under $150")
+    parsed.filters     {"brand": "Dior", "price_max": 150.0}
+    parsed.category    "Fragrance & Beauty"
+    parsed.confidence  1.0
+
+Recognised spans are removed from the query in this order: currency markers,
+price phrases, brand aliases, category keywords, stopwords. Whatever is left
+lowers the confidence, because the LLM might read a filter in it that the
+rules cannot:
+
+    a number outside a price phrase   ambiguous price -> LOW_CONFIDENCE
+    two different brands              the schema holds one -> LOW_CONFIDENCE
+    a minimum above the maximum       both bounds dropped  -> LOW_CONFIDENCE
+    unknown words, no category and    one may be a brand, or the product a brand
+      no price phrase                 word does not sell ("apple juice") -> LOW_CONFIDENCE
+    each other leftover word          -UNKNOWN_WORD_PENALTY
+
+Vocabulary lives in app/config/filter_vocab.py.
+"""
+import re
+from typing import Dict, List, NamedTuple, Optional
+
+from app.config.filter_vocab import BRANDS, CATEGORY_KEYWORDS, CURRENCY_MARKERS, STOPWORDS
+
+LOW_CONFIDENCE = 0.3
+UNKNOWN_WORD_PENALTY = 0.25
+
+
+class ParsedQuery(NamedTuple):
+    filters: Dict[str, object]   # brand / price_min / price_max, as the LLM would return them
+    category: Optional[str]
+    confidence: float
+    unparsed: List[str]
+
+
+def _phrases(words) -> str:
+    """Alternation of literal phrases, longest first, matched on word boundaries."""
+    alternation = "|".join(re.escape(w) for w in sorted(words, key=len, reverse=True))
+    return rf"(?<!\w)(?:{alternation})(?!\w)"
+
+
+_BRAND_BY_ALIAS = {alias: brand for brand, aliases in BRANDS.items() for alias in aliases}
+_CATEGORY_BY_KEYWORD = {kw: category for category, kws in CATEGORY_KEYWORDS.items() for kw in kws}
+_STOPWORDS = frozenset(STOPWORDS)
+
+_CURRENCY_RE = re.compile(
+    "|".join([re.escape(m) for m in CURRENCY_MARKERS if not m.isalpha()]
+             + [_phrases(m for m in CURRENCY_MARKERS if m.isalpha())])
+)
+_BRAND_RE = re.compile(_phrases(_BRAND_BY_ALIAS))
+_CATEGORY_RE = re.compile(_phrases(_CATEGORY_BY_KEYWORD))
+
+_NUM = r"(\d[\d,]*(?:\.\d+)?)(k\b)?"
+_RANGE_RE = re.compile(rf"(?:between|from)\s+{_NUM}\s*(?:and|to|-)\s*{_NUM}|{_NUM}\s*(?:-|to)\s*{_NUM}")
+_MAX_RE = re.compile(
+    rf"(?:under|below|less than|cheaper than|up to|upto|max(?:imum)?|no more than|within|budget(?: of)?|<=?)\s*{_NUM}"
+    rf"|{_NUM}\s*(?:or less|and under|and below|max)(?!\w)"
+)
+_MIN_RE = re.compile(
+    rf"(?:over|above|more than|at least|min(?:imum)?|from|starting at|>=?)\s*{_NUM}"
+    rf"|{_NUM}\s*(?:or more|and up|and above|\+)"
+)
+_PRICE_WORD_RE = re.compile(r"(?<!\w)(?:under|below|less|over|above|more|between|budget|cheaper|than|max|min)(?!\w)")
+_WORD_RE = re.compile(r"[^\W_]+(?:['-][^\W_]+)*")
+
+
+def _amount(digits: Optional[str], thousands: Optional[str]) -> Optional[float]:
+    if digits is None:
+        return None
+    value = float(digits.replace(",", ""))
+    return value * 1000 if thousands else value
+
+
+def _pairs(match: re.Match) -> List[float]:
+    groups = match.groups()
+    return [
+        _amount(groups[i], groups[i + 1]) for i in range(0, len(groups), 2) if groups[i] is not None
+    ]
+
+
+def parse_filters(query: str) -> ParsedQuery:
+    text = " " + query.lower() + " "
+    filters: Dict[str, object] = {}
+
+    # Currency markers only tell us a number is a price; drop them first
+    text = _CURRENCY_RE.sub(" ", text)
+
+    def take_range(m: re.Match) -> str:
+        low, high = sorted(_pairs(m))
+        filters.setdefault("price_min", low)
+        filters.setdefault("price_max", high)
+        return " "
+
+    def take_max(m: re.Match) -> str:
+        filters.setdefault("price_max", _pairs(m)[0])
+        return " "
+
+    def take_min(m: re.Match) -> str:
+        filters.setdefault("price_min", _pairs(m)[0])
+        return " "
+
+    text = _RANGE_RE.sub(take_range, text)
+    text = _MAX_RE.sub(take_max, text)
+    text = _MIN_RE.sub(take_min, text)
+
+    brands = {_BRAND_BY_ALIAS[a] for a in _BRAND_RE.findall(text)}
+    text = _BRAND_RE.sub(" ", text)
+    categories = [_CATEGORY_BY_KEYWORD[k] for k in _CATEGORY_RE.findall(text)]
+    text = _CATEGORY_RE.sub(" ", text)
+
+    # "over 100 under 50" matches nothing; let the LLM (or no price filter) decide
+    contradictory = filters.get("price_min", 0) > filters.get("price_max", float("inf"))
+    if contradictory:
+        del filters["price_min"], filters["price_max"]
+    priced = bool(filters)
+    if len(brands) == 1:
+        filters["brand"] = next(iter(brands))
+
+    unparsed = [w for w in _WORD_RE.findall(text) if w not in _STOPWORDS]
+    confidence = 1.0
+    if contradictory or len(brands) > 1 or any(w[0].isdigit() or _PRICE_WORD_RE.fullmatch(w) for w in unparsed):
+        confidence = LOW_CONFIDENCE
+    elif unparsed and not (categories or priced):
+        confidence = LOW_CONFIDENCE   # a brand alone does not say what the leftover words mean
+    confidence = max(0.0, confidence - UNKNOWN_WORD_PENALTY * sum(not w[0].isdigit() for w in unparsed))
+
+    return ParsedQuery(filters, categories[0] if categories else None, round(confidence, 4), unparsed)
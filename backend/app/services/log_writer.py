@@ -0,0 +1,229 @@
+# backend/app/services/log_writer.py
+"""
+Write-behind queue for SearchLog rows.
+
+Requests hand a row (a dict of SearchLog columns) to ``submit`` and return
+immediately. A background task drains the queue and writes each batch as one
+multi-row INSERT in one transaction, flushing when LOG_BATCH_SIZE rows are
+waiting or LOG_FLUSH_MS after the first row of a batch arrived.
+
+Memory is bounded two ways:
+    LOG_QUEUE_MAX        rows waiting; past it new rows are dropped (counted)
+    LOG_QUEUE_MAX_BYTES  approximate payload; near it rows are kept without
+                         their query_embedding (the bulk of a row), past it dropped
+A full batch wakes the flusher before the timer, so bursts turn into more
+full-size INSERTs rather than drops. ``aclose`` stops intake and drains.
+"""
+import os
+import time
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import insert
+
+from app.models.search_log import SearchLog
+from app.services.rollups import apply_rollups, is_retryable, utcnow
+from app.services.stage_metrics import shared_stage_timer
+
+logger = logging.getLogger("app.services.log_writer")
+
+LOG_BATCH_SIZE = int(os.getenv("LOG_BATCH_SIZE", "500"))
+LOG_FLUSH_MS = int(os.getenv("LOG_FLUSH_MS", "1000"))
+LOG_QUEUE_MAX = int(os.getenv("LOG_QUEUE_MAX", "20000"))
+LOG_QUEUE_MAX_BYTES = int(os.getenv("LOG_QUEUE_MAX_BYTES", str(64 * 1024 * 1024)))
+# Maintain search_rollups / search_term_rollups alongside each batch
+LOG_ROLLUPS = os.getenv("LOG_ROLLUPS", "1") == "1"
+# Attempts at a batch's rollup upsert when it hits a deadlock / serialization failure
+LOG_ROLLUP_ATTEMPTS = int(os.getenv("LOG_ROLLUP_ATTEMPTS", "4"))
+
+
+def _row_bytes(row: Dict[str, Any]) -> int:
+    """Rough in-memory size: the embedding dominates."""
+    embedding = row.get("query_embedding")
+    return (
+        256 + len(row.get("query") or "")
+        + (len(embedding) * 32 if embedding else 0)
+        + len(row.get("query_embedding_bin") or b"")
+    )
+
+
+def _without_embedding(row: Dict[str, Any]) -> Dict[str, Any]:
+    stripped = {**row}
+    for column in ("query_embedding", "query_embedding_bin", "embedding_format"):
+        if column in stripped:
+            stripped[column] = None
+    return stripped
+
+
+class SearchLogWriter:
+    def __init__(
+        self,
+        session_factory=None,
+        rollups: bool = LOG_ROLLUPS,
+        batch_size: int = LOG_BATCH_SIZE,
+        flush_ms: int = LOG_FLUSH_MS,
+        max_rows: int = LOG_QUEUE_MAX,
+        max_bytes: int = LOG_QUEUE_MAX_BYTES,
+    ):
+        self._session_factory = session_factory
+        self.rollups = rollups
+        self.batch_size = batch_size
+        self.flush_interval = flush_ms / 1000
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+
+        self._rows: List[Dict[str, Any]] = []
+        self._bytes = 0
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._closing = False
+
+        self.submitted = 0
+        self.written = 0
+        self.batches = 0
+        self.dropped = 0
+        self.stripped = 0
+        self.failed = 0
+        self.rollup_failures = 0
+        self.rollup_retries = 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._closing
+
+    # ----------------------------
+    # Intake
+    # ----------------------------
+    def submit(self, row: Dict[str, Any]) -> bool:
+        """Queue one row without waiting. Returns False if it was dropped."""
+        if self._closing or len(self._rows) >= self.max_rows:
+            self.dropped += 1
+            return False
+        size = _row_bytes(row)
+        stripped = False
+        if self._bytes + size > self.max_bytes and (row.get("query_embedding") or row.get("query_embedding_bin")):
+            row = _without_embedding(row)
+            size = _row_bytes(row)
+            stripped = True
+        if self._bytes + size > self.max_bytes:
+            self.dropped += 1
+            return False
+        self.stripped += stripped
+        # Stamp on submit so the row and its rollup bucket agree
+        row = {**row, "timestamp": row.get("timestamp") or utcnow()}
+        self._rows.append(row)
+        self._bytes += size
+        self.submitted += 1
+
+        # Backpressure: a filling queue flushes now instead of at the timer
+        if len(self._rows) >= self.batch_size and self._wakeup is not None:
+            self._wakeup.set()
+        return True
+
+    # ----------------------------
+    # Flushing
+    # ----------------------------
+    def _take_batch(self) -> List[Dict[str, Any]]:
+        batch, self._rows = self._rows[:self.batch_size], self._rows[self.batch_size:]
+        self._bytes = max(0, self._bytes - sum(_row_bytes(r) for r in batch)) if self._rows else 0
+        return batch
+
+    async def _write(self, batch: List[Dict[str, Any]]) -> None:
+        if self._session_factory is None:
+            from app.db import get_sessionmaker
+            self._session_factory = get_sessionmaker()
+        start = time.perf_counter()
+        try:
+            # Timed under every merchant with rows in the batch, which they all waited on
+            with shared_stage_timer("db_log_flush", (r.get("merchant_id") for r in batch)):
+                async with self._session_factory() as session:
+                    await session.execute(insert(SearchLog), batch)
+                    if self.rollups:
+                        await self._apply_rollups(session, batch)
+                    await session.commit()
+        except Exception as e:
+            self.failed += len(batch)
+            logger.error(f"[LogWriter] Failed to write {len(batch)} search logs: {e}")
+            return
+        self.written += len(batch)
+        self.batches += 1
+        logger.debug(f"[LogWriter] Wrote {len(batch)} rows in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    async def _apply_rollups(self, session, batch: List[Dict[str, Any]]) -> None:
+        # A savepoint, so missing or broken rollup tables never lose the logs themselves.
+        # Rolling back to it releases the rollup row locks, so a deadlock victim can
+        # simply try again while keeping the batch INSERT.
+        for attempt in range(1, LOG_ROLLUP_ATTEMPTS + 1):
+            try:
+                async with session.begin_nested():
+                    await apply_rollups(session, batch)
+                return
+            except Exception as e:
+                if is_retryable(e) and attempt < LOG_ROLLUP_ATTEMPTS:
+                    self.rollup_retries += 1
+                    logger.info(f"[LogWriter] Rollup update conflicted (attempt {attempt}), retrying: {e}")
+                    await asyncio.sleep(0.01 * 2 ** attempt)
+                    continue
+                self.rollup_failures += 1
+                logger.warning(f"[LogWriter] Rollup update failed, logs still written: {e}")
+                return
+
+    async def flush(self) -> None:
+        """Write everything queued right now."""
+        while self._rows:
+            await self._write(self._take_batch())
+
+    async def _run(self) -> None:
+        while self._rows or not self._closing:
+            if not self._rows:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            # Give a batch time to fill unless it already has
+            if len(self._rows) < self.batch_size and not self._closing:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+            await self._write(self._take_batch())
+
+    # ----------------------------
+    # Lifecycle
+    # ----------------------------
+    def start(self) -> None:
+        if self._task is None:
+            self._closing = False
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+
+    async def aclose(self) -> None:
+        """Stop accepting rows and drain what is queued."""
+        if self._task is None:
+            return
+        self._closing = True
+        self._wakeup.set()
+        await self._task
+        self._task = None
+        logger.info(f"[LogWriter] Drained; {self.written} rows written, {self.dropped} dropped")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "queued": len(self._rows),
+            "queued_bytes": self._bytes,
+            "submitted": self.submitted,
+            "written": self.written,
+            "batches": self.batches,
+            "avg_batch_size": round(self.written / self.batches, 2) if self.batches else 0.0,
+            "dropped": self.dropped,
+            "embeddings_stripped": self.stripped,
+            "failed": self.failed,
+            "rollup_failures": self.rollup_failures,
+            "rollup_retries": self.rollup_retries,
+            "running": self.running,
+        }
+
+
+# global instance (safe to import)
+search_log_writer = SearchLogWriter()
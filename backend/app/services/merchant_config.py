@@ -0,0 +1,234 @@
+# backend/app/services/merchant_config.py
+"""
+Hot-reloadable merchant ranking config.
+
+Rules are loaded from a source, compiled (see merchant_rules) and published as
+an immutable ``RulesSnapshot``. Readers take ``merchant_config.snapshot`` with
+no lock; a reload builds a new snapshot off to the side and swaps the reference
+in one assignment, so a request always sees one consistent version.
+
+Sources (MERCHANT_RULES_SOURCE):
+    unset           the in-code MERCHANT_RULES dict (never changes)
+    path/to/x.json  a JSON file in the MERCHANT_RULES shape; the ETag is its
+                    content hash, re-read only when mtime/size change
+    http(s)://...   fetched with If-None-Match; 304 means unchanged
+
+Nothing is fetched at import. The first load happens in the app lifespan
+(``load()``, next to the client warm-up) or, with LAZY_CLIENT_INIT=1, on the
+blocking pool after the first use of ``snapshot``. Until it lands, or if it
+fails, an empty snapshot (default rules for everyone) serves. Changes are picked up by polling every MERCHANT_RULES_POLL_SECONDS
+(0 = off) or immediately via ``reload()`` (POST /merchant-config/reload).
+"""
+import os
+import json
+import time
+import asyncio
+import hashlib
+import logging
+import threading
+import urllib.error
+import urllib.request
+from typing import Any, Dict, Optional, Tuple
+
+from app.config.merchant_weights import MERCHANT_RULES
+from app.services.executor import run_blocking
+from app.services.merchant_rules import CompiledMerchantRules, DEFAULT_RULES, compile_rules
+
+logger = logging.getLogger("app.services.merchant_config")
+
+MERCHANT_RULES_SOURCE = os.getenv("MERCHANT_RULES_SOURCE", "")
+MERCHANT_RULES_POLL_SECONDS = float(os.getenv("MERCHANT_RULES_POLL_SECONDS", "30"))
+# Version of the snapshot served when the first load fails
+EMPTY_VERSION = "empty"
+
+
+def _etag(raw: bytes) -> str:
+    return hashlib.sha256(raw).hexdigest()[:16]
+
+
+def _version_of(validator: Optional[str]) -> str:
+    """Display form of an HTTP ETag: 'W/"abc"' -> 'abc'."""
+    return (validator or "").removeprefix("W/").strip('"')
+
+
+# ----------------------------
+# Sources
+# ----------------------------
+class BuiltinRulesSource:
+    name = "builtin"
+
+    def fetch(self, etag: Optional[str]) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Return (etag, rules), or None when unchanged since ``etag``."""
+        new_etag = _etag(json.dumps(MERCHANT_RULES, sort_keys=True).encode())
+        return None if new_etag == etag else (new_etag, MERCHANT_RULES)
+
+
+class FileRulesSource:
+    def __init__(self, path: str):
+        self.path = path
+        self.name = f"file:{path}"
+        self._stat = None
+
+    def fetch(self, etag: Optional[str]) -> Optional[Tuple[str, Dict[str, Any]]]:
+        st = os.stat(self.path)
+        stat_key = (st.st_mtime_ns, st.st_size)
+        if etag is not None and stat_key == self._stat:
+            return None
+        with open(self.path, "rb") as f:
+            raw = f.read()
+        self._stat = stat_key
+        new_etag = _etag(raw)
+        return None if new_etag == etag else (new_etag, json.loads(raw))
+
+
+class HttpRulesSource:
+    def __init__(self, url: str, timeout: float = 5.0):
+        self.url = url
+        self.name = url
+        self.timeout = timeout
+        self._validator: Optional[str] = None   # raw ETag header of the last 200
+
+    def fetch(self, etag: Optional[str]) -> Optional[Tuple[str, Dict[str, Any]]]:
+        headers = {}
+        if etag:
+            # Send the validator back exactly as the server sent it (quotes, W/ prefix)
+            headers["If-None-Match"] = self._validator if _version_of(self._validator) == etag else f'"{etag}"'
+        req = urllib.request.Request(self.url, headers=headers)
+        try:
+            with urllib.request.urlopen(req, timeout=self.timeout) as resp:
+                raw = resp.read()
+                validator = resp.headers.get("ETag")
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                return None
+            raise
+        self._validator = validator
+        new_etag = _version_of(validator) or _etag(raw)
+        return None if new_etag == etag else (new_etag, json.loads(raw))
+
+
+def build_source(spec: str = MERCHANT_RULES_SOURCE):
+    if not spec:
+        return BuiltinRulesSource()
+    if spec.startswith(("http://", "https://")):
+        return HttpRulesSource(spec)
+    return FileRulesSource(spec)
+
+
+# ----------------------------
+# Snapshots
+# ----------------------------
+class RulesSnapshot:
+    """One immutable, compiled version of every merchant's rules."""
+
+    __slots__ = ("version", "loaded_at", "_merchants")
+
+    def __init__(self, version: str, merchants: Dict[str, CompiledMerchantRules]):
+        self.version = version
+        self.loaded_at = time.time()
+        self._merchants = dict(merchants)
+
+    def get(self, merchant_id: str) -> CompiledMerchantRules:
+        return self._merchants.get(merchant_id, DEFAULT_RULES)
+
+    def merchants(self):
+        return list(self._merchants)
+
+
+# Served before the first load lands, or after it failed: default rules for everyone
+EMPTY_SNAPSHOT = RulesSnapshot(EMPTY_VERSION, {})
+
+
+class MerchantConfigStore:
+    def __init__(self, source=None):
+        self.source = source or build_source()
+        self._reload_lock = threading.Lock()
+        self.reloads = 0
+        self.reload_errors = 0
+        self.last_error: Optional[str] = None
+        self._snapshot: Optional[RulesSnapshot] = None
+        self._load_task: Optional[asyncio.Task] = None
+
+    @property
+    def snapshot(self) -> RulesSnapshot:
+        """The current snapshot, loading it on first use if the lifespan did not.
+
+        On the event loop the load is scheduled on the blocking pool and the empty
+        snapshot serves until it lands; elsewhere it loads inline.
+        """
+        snapshot = self._snapshot
+        if snapshot is not None:
+            return snapshot
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.load()
+            return self._snapshot
+        if self._load_task is None:
+            self._load_task = loop.create_task(run_blocking(self.load))
+        return EMPTY_SNAPSHOT
+
+    def load(self) -> None:
+        """First load; never raises. A failure leaves an empty snapshot serving."""
+        if self._snapshot is None:
+            self.reload()
+
+    def _load(self, etag: Optional[str]) -> Optional[RulesSnapshot]:
+        fetched = self.source.fetch(etag)
+        if fetched is None:
+            return None
+        new_etag, rules = fetched
+        if not isinstance(rules, dict):
+            raise ValueError("merchant rules must be a JSON object keyed by merchant id")
+        return RulesSnapshot(new_etag, compile_rules(rules))
+
+    def reload(self) -> bool:
+        """Fetch and swap in a new snapshot if the source changed. Never raises.
+
+        A source or validation error keeps the current snapshot serving.
+        """
+        with self._reload_lock:
+            current = self._snapshot
+            try:
+                snapshot = self._load(current.version if current is not None else None)
+            except Exception as e:
+                self.reload_errors += 1
+                self.last_error = str(e)
+                if current is None:
+                    current = self._snapshot = EMPTY_SNAPSHOT
+                logger.error(f"[MerchantConfig] Reload from {self.source.name} failed, keeping {current.version}: {e}")
+                return False
+            if snapshot is None:
+                return False
+            previous = current.version if current is not None else None
+            self._snapshot = snapshot
+            self.reloads += 1
+            self.last_error = None
+        logger.info(f"[MerchantConfig] Rules {previous} → {snapshot.version} ({len(snapshot.merchants())} merchants)")
+        return True
+
+    async def poll(self, interval: float = MERCHANT_RULES_POLL_SECONDS) -> None:
+        """Reload forever every ``interval`` seconds; run as a background task."""
+        while True:
+            await asyncio.sleep(interval)
+            await run_blocking(self.reload)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "version": self.snapshot.version,
+            "loaded_at": self.snapshot.loaded_at,
+            "source": self.source.name,
+            "merchants": self.snapshot.merchants(),
+            "reloads": self.reloads,
+            "reload_errors": self.reload_errors,
+            "last_error": self.last_error,
+        }
+
+
+# global instance (safe to import)
+merchant_config = MerchantConfigStore()
+
+
+def get_merchant_rules(merchant_id: str, snapshot: Optional[RulesSnapshot] = None) -> CompiledMerchantRules:
+    """Compiled rules for a merchant from ``snapshot`` (default: the current one)."""
+    return (snapshot or merchant_config.snapshot).get(merchant_id)
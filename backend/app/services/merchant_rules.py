@@ -0,0 +1,136 @@
+# backend/app/services/merchant_rules.py
+"""
+Merchant ranking rules compiled once at load time.
+
+``MERCHANT_RULES`` is a nested dict meant for humans. Ranking needs, per
+request, one boost per category given the trip route and cabin. Compilation
+turns each merchant's rules into:
+
+    category_ids    category name -> column in the boost tables (plus one
+                    trailing column for categories the merchant never mentions)
+    tables          (route, cabin) -> float64 boost per category id, with the
+                    trip-rule weights and the cabin factor already multiplied in
+
+``route`` is a (from, to) pair; a trip rule matches when both airports are in
+its ``route`` list, so every ordered pair of its airports is a key. Weights are
+multiplied in the same order as the original rule walk, so boosts are
+bit-identical to it. Looking up a request's table is one dict hit however many
+trip rules a merchant defines.
+"""
+import logging
+from itertools import product
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger("app.services.merchant_rules")
+
+DEFAULT_BLEND_WEIGHTS = {"ml": 0.6, "boost": 0.3, "similarity": 0.1}
+
+RouteKey = Tuple[Any, Any]
+
+
+def _number(value, where: str) -> float:
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or value < 0:
+        raise ValueError(f"{where} must be a non-negative number, got {value!r}")
+    return value
+
+
+class CompiledMerchantRules:
+    def __init__(self, merchant_id: str, rules: Dict[str, Any]):
+        where = f"MERCHANT_RULES[{merchant_id!r}]"
+        if not isinstance(rules, dict):
+            raise ValueError(f"{where} must be a dict")
+        self.merchant_id = merchant_id
+
+        blend = rules.get("blend_weights", DEFAULT_BLEND_WEIGHTS)
+        missing = set(DEFAULT_BLEND_WEIGHTS) - set(blend)
+        if missing:
+            raise ValueError(f"{where}['blend_weights'] is missing {sorted(missing)}")
+        self.blend_weights = {k: _number(blend[k], f"{where}['blend_weights'][{k!r}]") for k in DEFAULT_BLEND_WEIGHTS}
+
+        category_boosts = rules.get("category_boosts", {})
+        for category, boost in category_boosts.items():
+            _number(boost, f"{where}['category_boosts'][{category!r}]")
+
+        trip_rules = rules.get("trip_rules", [])
+        for i, rule in enumerate(trip_rules):
+            route = rule.get("route")
+            if not isinstance(route, list) or not route:
+                raise ValueError(f"{where}['trip_rules'][{i}]['route'] must be a non-empty list")
+            if not isinstance(rule.get("boost_category"), str):
+                raise ValueError(f"{where}['trip_rules'][{i}]['boost_category'] must be a string")
+            _number(rule.get("weight", 1.0), f"{where}['trip_rules'][{i}]['weight']")
+
+        cabin_rules = rules.get("cabin_rules", {})
+        for cabin, factors in cabin_rules.items():
+            if not isinstance(factors, dict):
+                raise ValueError(f"{where}['cabin_rules'][{cabin!r}] must be a dict")
+            for name, factor in factors.items():
+                _number(factor, f"{where}['cabin_rules'][{cabin!r}][{name!r}]")
+
+        for tier, weight in rules.get("loyalty_weights", {}).items():
+            _number(weight, f"{where}['loyalty_weights'][{tier!r}]")
+
+        # Column per known category, then one for everything else
+        names = list(category_boosts)
+        names += [r["boost_category"] for r in trip_rules if r["boost_category"] not in category_boosts]
+        self.category_ids: Dict[str, int] = {}
+        for name in names:
+            self.category_ids.setdefault(name, len(self.category_ids))
+        self.other_id = len(self.category_ids)
+        base = np.array(
+            [category_boosts.get(name, 1.0) for name in self.category_ids] + [1.0],
+            dtype=np.float64,
+        )
+
+        # Route tables: apply matching rules in their original order
+        route_tables: Dict[Optional[RouteKey], np.ndarray] = {None: base}
+        for rule in trip_rules:
+            col = self.category_ids[rule["boost_category"]]
+            for key in product(rule["route"], repeat=2):
+                table = route_tables.get(key)
+                if table is None:
+                    table = route_tables[key] = base.copy()
+                table[col] *= rule.get("weight", 1.0)
+
+        # Pre-multiplied cabin factors for every route
+        cabin_factors = {
+            cabin: factors.get("luxury_category_boost", 1.0) for cabin, factors in cabin_rules.items()
+        }
+        self.tables: Dict[Tuple[Optional[RouteKey], Optional[str]], np.ndarray] = {}
+        for route, table in route_tables.items():
+            self.tables[(route, None)] = table
+            for cabin, factor in cabin_factors.items():
+                self.tables[(route, cabin)] = table * factor
+        for table in self.tables.values():
+            table.flags.writeable = False   # shared by every request reading the snapshot
+
+    def boost_table(self, trip: Optional[Dict[str, Any]] = None, cabin: Optional[str] = None) -> np.ndarray:
+        """Boost per category id for a request's trip and cabin."""
+        route = (trip.get("from"), trip.get("to")) if trip else None
+        try:
+            if (route, None) not in self.tables:
+                route = None
+        except TypeError:   # unhashable airport values from the client
+            route = None
+        cabin_key = cabin.lower() if cabin else None
+        table = self.tables.get((route, cabin_key))
+        return table if table is not None else self.tables[(route, None)]
+
+    def category_id(self, category) -> int:
+        return self.category_ids.get(category, self.other_id)
+
+    def boost(self, category, trip: Optional[Dict[str, Any]] = None, cabin: Optional[str] = None) -> float:
+        return float(self.boost_table(trip, cabin)[self.category_id(category)])
+
+
+def compile_rules(rules: Dict[str, Dict[str, Any]]) -> Dict[str, CompiledMerchantRules]:
+    """Compile and validate every merchant; raises ValueError on a bad rule."""
+    compiled = {merchant_id: CompiledMerchantRules(merchant_id, r) for merchant_id, r in rules.items()}
+    logger.info(f"[MerchantRules] Compiled rules for {len(compiled)} merchants")
+    return compiled
+
+
+# neutral rules for merchants missing from the config
+DEFAULT_RULES = CompiledMerchantRules("<default>", {})
@@ -1,31 +1,20 @@
+import os
 import logging
-from typing import List, Dict, Any
-from app.config.merchant_weights import MERCHANT_RULES
+from typing import List, Dict, Any, Optional
+import numpy as np
+from app.services.merchant_config import RulesSnapshot, get_merchant_rules
 
 logger = logging.getLogger("app.services.ranking_service")
 
+# How many retrieved candidates (in vector-similarity order) are re-ranked per
+# result set. Candidates past the pool keep their similarity order. Larger pools
+# trade CPU for recall of merchant-boosted items.
+RANK_POOL_SIZE = int(os.getenv("RANK_POOL_SIZE", "100"))
+
 
 def compute_merchant_boost(merchant_id, category, trip=None, cabin=None):
     """Compute merchant-specific category and context-based boosts."""
-    merchant = MERCHANT_RULES.get(merchant_id, {})
-    boost = merchant.get("category_boosts", {}).get(category, 1.0)
-
-    # Trip-specific boost
-    if trip:
-        for rule in merchant.get("trip_rules", []):
-            if (
-                trip.get("from") in rule.get("route", [])
-                and trip.get("to") in rule.get("route", [])
-                and rule.get("boost_category") == category
-            ):
-                boost *= rule.get("weight", 1.0)
-
-    # Cabin-based adjustment
-    if cabin:
-        cabin_rules = merchant.get("cabin_rules", {}).get(cabin.lower(), {})
-        boost *= cabin_rules.get("luxury_category_boost", 1.0)
-
-    return boost
+    return get_merchant_rules(merchant_id).boost(category, trip, cabin)
 
 
 def ml_infer_score(item: Dict[str, Any], context: Dict[str, Any]) -> float:
@@ -55,42 +44,132 @@ def ml_infer_score(item: Dict[str, Any], context: Dict[str, Any]) -> float:
     return min(1.0, base)
 
 
-def rank_products(matches: List[Dict[str, Any]], merchant_id: str, context: Dict[str, Any] = None) -> List[Dict[str, Any]]:
-    """Blend ML model score, merchant-defined boost, and vector similarity."""
-    merchant = MERCHANT_RULES.get(merchant_id, {})
-    blend_weights = merchant.get("blend_weights", {"ml": 0.6, "boost": 0.3, "similarity": 0.1})
+def _blend_components(
+        matches: List[Dict[str, Any]],
+        merchant_id: str,
+        context: Dict[str, Any] = None,
+        snapshot: Optional[RulesSnapshot] = None
+    ):
+    """Unclipped blended scores for all matches, plus the per-item terms for logging.
+
+    Context-dependent terms are computed once per request; the category boost is
+    an array lookup into the merchant's compiled table for this trip and cabin.
+    """
+    rules = get_merchant_rules(merchant_id, snapshot)
+    blend_weights = rules.blend_weights
 
     context = context or {}
     trip = context.get("trip") or {}
     cabin = context.get("cabin", "")
 
-    ranked = []
-
-    for m in matches:
-        meta = m.get("metadata", {})
-        category = meta.get("category", "General")
-        vector_similarity = m.get("score", 0.0)
-
-        # Compute component scores
-        ml_score = ml_infer_score(m, context)
-        merchant_boost_weight = compute_merchant_boost(merchant_id, category, trip, cabin)
-
-        # Blend
-        final_score = (
-            blend_weights["ml"] * ml_score +
-            blend_weights["boost"] * merchant_boost_weight +
-            blend_weights["similarity"] * vector_similarity
-        )
-
-        # Clamp and attach
-        m["rank_score"] = round(max(0.0, min(1.0, final_score)), 4)
-        ranked.append(m)
-
-        logger.debug(
-            f"[Rank] merchant={merchant_id}, id={m.get('id')} cat={category} "
-            f"ml={ml_score:.2f}, boost={merchant_boost_weight:.2f}, vec={vector_similarity:.2f}, "
-            f"final={final_score:.3f}"
-        )
-
-    ranked.sort(key=lambda x: x["rank_score"], reverse=True)
-    return ranked
+    # ml_infer_score reads only the context, so it is the same for every item
+    ml_score = ml_infer_score({}, context)
+
+    category_ids = np.fromiter(
+        (rules.category_id(m.get("metadata", {}).get("category", "General")) for m in matches),
+        dtype=np.intp, count=len(matches),
+    )
+    boosts = rules.boost_table(trip, cabin)[category_ids]
+    similarity = np.fromiter((m.get("score", 0.0) for m in matches), dtype=np.float64, count=len(matches))
+
+    final = (
+        blend_weights["ml"] * ml_score +
+        blend_weights["boost"] * boosts +
+        blend_weights["similarity"] * similarity
+    )
+    return final, ml_score, boosts, similarity
+
+
+def _round_scores(final: np.ndarray) -> np.ndarray:
+    # Python's round() (correctly rounded), not np.round, so scores are unchanged
+    return np.array([round(v, 4) for v in np.clip(final, 0.0, 1.0).tolist()], dtype=np.float64)
+
+
+def rank_products(
+        matches: List[Dict[str, Any]],
+        merchant_id: str,
+        context: Dict[str, Any] = None,
+        snapshot: Optional[RulesSnapshot] = None
+    ) -> List[Dict[str, Any]]:
+    """Blend ML model score, merchant-defined boost, and vector similarity.
+
+    ``snapshot`` pins the merchant rules version (default: the current one).
+    """
+    final, ml_score, boosts, similarity = _blend_components(matches, merchant_id, context, snapshot)
+    scores = _round_scores(final)
+
+    # Clamp and attach
+    for m, score in zip(matches, scores.tolist()):
+        m["rank_score"] = score
+
+    if logger.isEnabledFor(logging.DEBUG):
+        for m, boost, vec, f in zip(matches, boosts.tolist(), similarity.tolist(), final.tolist()):
+            logger.debug(
+                f"[Rank] merchant={merchant_id}, id={m.get('id')} "
+                f"cat={m.get('metadata', {}).get('category', 'General')} "
+                f"ml={ml_score:.2f}, boost={boost:.2f}, vec={vec:.2f}, final={f:.3f}"
+            )
+
+    # Stable, like sorting on rank_score with reverse=True
+    order = np.argsort(-scores, kind="stable")
+    return [matches[i] for i in order.tolist()]
+
+
+# ----------------------------
+# Pool Ranking
+# ----------------------------
+def score_candidates(
+        matches: List[Dict[str, Any]],
+        merchant_id: str,
+        context: Dict[str, Any] = None,
+        snapshot: Optional[RulesSnapshot] = None
+    ) -> np.ndarray:
+    """Rank scores for a whole candidate pool, equal to what rank_products attaches."""
+    return _round_scores(_blend_components(matches, merchant_id, context, snapshot)[0])
+
+
+def top_k_order(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k best scores, best first, without sorting the whole pool.
+
+    Ties keep candidate order, like the stable sort in rank_products.
+    """
+    n = len(scores)
+    k = min(k, n)
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    # One integer key per candidate: score (4 decimals) descending, then position
+    keys = (10000 - np.rint(scores * 10000).astype(np.int64)) * n + np.arange(n)
+    idx = np.argpartition(keys, k - 1)[:k] if k < n else np.arange(n)
+    return idx[np.argsort(keys[idx])]
+
+
+def rank_page(
+        matches: List[Dict[str, Any]],
+        merchant_id: str,
+        context: Dict[str, Any] = None,
+        offset: int = 0,
+        limit: int = 10,
+        pool_size: int = RANK_POOL_SIZE,
+        scores: Optional[np.ndarray] = None,
+        snapshot: Optional[RulesSnapshot] = None
+    ) -> List[Dict[str, Any]]:
+    """One page of the pool ranked as a whole, as copies carrying ``rank_score``.
+
+    Pass ``scores`` from score_candidates to reuse them across pages of the same pool.
+    """
+    pool = matches[:pool_size]
+    if scores is None:
+        scores = score_candidates(pool, merchant_id, context, snapshot)
+
+    end = offset + limit
+    page = [
+        {**pool[i], "rank_score": float(scores[i])}
+        for i in top_k_order(scores, end)[offset:end]
+    ]
+
+    # Past the pool: similarity order, still scored for the response
+    if end > len(pool):
+        tail = matches[max(offset, len(pool)):end]
+        tail_scores = score_candidates(tail, merchant_id, context, snapshot)
+        page.extend({**m, "rank_score": float(s)} for m, s in zip(tail, tail_scores))
+    return page
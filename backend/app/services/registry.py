@@ -0,0 +1,86 @@
+# backend/app/services/registry.py
+"""
+Lazy, per-worker registry for the external clients (OpenAI, Pinecone).
+
+Nothing is imported or constructed until the first ``get``; after that the
+same instance is reused for the life of the worker. The FastAPI lifespan hook
+in app.main warms the registry at startup and closes it on shutdown, so
+importing the app stays cheap for tooling and tests.
+"""
+import os
+import asyncio
+import logging
+import threading
+from typing import Any, Callable, Dict
+
+logger = logging.getLogger("app.services.registry")
+
+
+class ServiceRegistry:
+    def __init__(self):
+        self._factories: Dict[str, Callable[[], Any]] = {}
+        self._instances: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, factory: Callable[[], Any]) -> None:
+        self._factories[name] = factory
+
+    def get(self, name: str) -> Any:
+        instance = self._instances.get(name)
+        if instance is None:
+            with self._lock:
+                instance = self._instances.get(name)
+                if instance is None:
+                    instance = self._factories[name]()
+                    self._instances[name] = instance
+                    logger.info(f"[Registry] Initialized {name}")
+        return instance
+
+    def override(self, name: str, instance: Any) -> None:
+        """Install a ready-made instance (stubs in tests and benchmarks)."""
+        self._instances[name] = instance
+
+    def warm(self) -> None:
+        for name in self._factories:
+            self.get(name)
+
+    async def aclose(self) -> None:
+        instances, self._instances = self._instances, {}
+        for name, instance in instances.items():
+            close = getattr(instance, "close", None)
+            if close is None:
+                continue
+            try:
+                result = close()
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                logger.warning(f"[Registry] Failed to close {name}: {e}")
+
+
+def _make_openai():
+    from openai import AsyncOpenAI
+    return AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+
+
+def _make_pinecone():
+    from pinecone import Pinecone
+    # One keep-alive pool per index handle, capped at PINECONE_MAX_CONNECTIONS
+    return Pinecone(
+        api_key=os.getenv("PINECONE_API_KEY"),
+        connection_pool_maxsize=int(os.getenv("PINECONE_MAX_CONNECTIONS", "32")),
+    )
+
+
+# global instance (safe to import)
+registry = ServiceRegistry()
+registry.register("openai", _make_openai)
+registry.register("pinecone", _make_pinecone)
+
+
+def get_openai_client():
+    return registry.get("openai")
+
+
+def get_pinecone():
+    return registry.get("pinecone")
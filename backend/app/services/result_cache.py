@@ -0,0 +1,132 @@
+# backend/app/services/result_cache.py
+"""
+Server-side result-set cache for deep pagination.
+
+The first page of a search over-fetches a candidate window (RESULT_WINDOW) and
+stores it here under an entry id derived from (merchant, normalized query,
+filters, context hash). Clients page through it with an opaque cursor; later
+pages are sliced from the cached window with no LLM, embedding or vector calls.
+
+Configured from env:
+    RESULT_WINDOW            candidates fetched on a miss (default 100)
+    RESULT_CACHE_SIZE        max cached result sets (default 2000)
+    RESULT_CACHE_TTL         seconds a result set stays valid (default 300)
+"""
+import os
+import json
+import time
+import base64
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Set, Tuple
+
+from app.services.embedding_cache import normalize_text
+
+RESULT_WINDOW = int(os.getenv("RESULT_WINDOW", "100"))
+
+
+def context_hash(context: Optional[Dict[str, Any]]) -> str:
+    return hashlib.sha256(json.dumps(context or {}, sort_keys=True, default=str).encode()).hexdigest()[:16]
+
+
+def query_key(merchant_id: str, query: str, context: Optional[Dict[str, Any]]) -> str:
+    """Lookup key available before filter extraction (filters are a function of the query)."""
+    return f"{merchant_id}\x00{normalize_text(query)}\x00{context_hash(context)}"
+
+
+def entry_id_for(merchant_id: str, query: str, filters: Dict[str, Any], context: Optional[Dict[str, Any]]) -> str:
+    raw = json.dumps([merchant_id, normalize_text(query), filters, context_hash(context)], sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode()).hexdigest()[:24]
+
+
+def encode_cursor(entry_id: str, offset: int) -> str:
+    return base64.urlsafe_b64encode(f"{entry_id}:{offset}".encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Optional[Tuple[str, int]]:
+    """Return (entry_id, offset), or None for a malformed cursor."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        entry_id, offset = base64.urlsafe_b64decode(padded.encode()).decode().split(":")
+        return entry_id, max(0, int(offset))
+    except (ValueError, UnicodeDecodeError):
+        return None
+
+
+class ResultSetCache:
+    """LRU + TTL map from entry id to a cached result set, with query-key aliases.
+
+    ``_keys`` is the reverse of ``_aliases`` (entry id -> its query keys), so an
+    entry's aliases go with it on expiry or eviction without scanning them all.
+    """
+
+    def __init__(self, max_entries: int = 2000, ttl: float = 300, clock=time.monotonic):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: "OrderedDict[str, tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._aliases: Dict[str, str] = {}
+        self._keys: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _remove(self, entry_id: str) -> None:
+        del self._entries[entry_id]
+        for key in self._keys.pop(entry_id, ()):
+            del self._aliases[key]
+
+    def _get(self, entry_id: Optional[str]) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(entry_id) if entry_id is not None else None
+        if entry is None or entry[0] <= self._clock():
+            if entry is not None:
+                self._remove(entry_id)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(entry_id)
+        self.hits += 1
+        return entry[1]
+
+    def get(self, entry_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._get(entry_id)
+
+    def lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._get(self._aliases.get(key))
+
+    def put(self, entry_id: str, key: str, result_set: Dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[entry_id] = (self._clock() + self.ttl, result_set)
+            self._entries.move_to_end(entry_id)
+            previous = self._aliases.get(key)
+            if previous is not None and previous != entry_id:
+                self._keys[previous].discard(key)
+            self._aliases[key] = entry_id
+            self._keys.setdefault(entry_id, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._aliases.clear()
+            self._keys.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "size": len(self._entries),
+            "window": RESULT_WINDOW,
+        }
+
+
+# global instance (safe to import)
+result_cache = ResultSetCache(
+    max_entries=int(os.getenv("RESULT_CACHE_SIZE", "2000")),
+    ttl=float(os.getenv("RESULT_CACHE_TTL", "300")),
+)
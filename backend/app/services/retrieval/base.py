@@ -0,0 +1,26 @@
+# backend/app/services/retrieval/base.py
+"""
+Retrieval backend interface.
+
+Every backend answers the Pinecone-shaped call the services already make:
+
+    backend.query(vector=..., top_k=..., filter=..., include_metadata=True)
+    -> {"matches": [{"id": ..., "score": ..., "metadata": {...}}, ...]}
+
+``query`` is synchronous; callers run it through ``run_blocking``.
+"""
+from typing import Any, Dict, List, Optional
+
+
+class VectorBackend:
+    name = "base"
+
+    def query(
+        self,
+        vector: List[float],
+        top_k: int,
+        filter: Optional[Dict[str, Any]] = None,
+        include_metadata: bool = True,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        raise NotImplementedError
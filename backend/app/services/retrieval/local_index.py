@@ -0,0 +1,277 @@
+# backend/app/services/retrieval/local_index.py
+"""
+In-process vector index, a drop-in for a Pinecone index handle.
+
+On disk an index is a directory with:
+    vectors.npy    float32 (N, dim), unit-norm rows, memory-mapped read-only
+    records.json   {"ids": [...], "metadata": [{...}, ...]} in row order
+
+Scores are cosine similarity, like a cosine Pinecone index. Two modes:
+    exact  brute-force matrix-vector product over the (filtered) rows
+    ivf    spherical k-means lists; probe the nprobe closest lists, then score
+           exactly. Falls back to exact when the probe yields fewer than top_k hits.
+
+Metadata filters use Pinecone's syntax ($eq, $ne, $in, $nin, $gt, $gte, $lt,
+$lte, $exists, $and, $or, bare values for equality). Equality is answered from
+per-attribute bitmaps (packed bits, one per distinct value) built at load;
+range operators compare against a per-attribute float column.
+"""
+import os
+import json
+import logging
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from app.services.retrieval.base import VectorBackend
+
+logger = logging.getLogger("app.services.retrieval.local_index")
+
+_RANGE_OPS = {
+    "$gt": np.greater,
+    "$gte": np.greater_equal,
+    "$lt": np.less,
+    "$lte": np.less_equal,
+}
+
+
+def _value_key(value):
+    """Equality key matching Pinecone semantics (120 == 120.0, but True != 1)."""
+    if isinstance(value, bool):
+        return ("b", value)
+    if isinstance(value, (int, float)):
+        return ("n", float(value))
+    return ("s", str(value))
+
+
+def _unit_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k highest scores, best first, without a full sort."""
+    if k >= len(scores):
+        return np.argsort(-scores, kind="stable")
+    idx = np.argpartition(-scores, k - 1)[:k]
+    return idx[np.argsort(-scores[idx], kind="stable")]
+
+
+class LocalVectorIndex(VectorBackend):
+    name = "local"
+
+    def __init__(
+        self,
+        ids: Sequence[str],
+        vectors: np.ndarray,
+        metadata: Optional[Sequence[Dict[str, Any]]] = None,
+        mode: str = "exact",
+        nlist: Optional[int] = None,
+        nprobe: int = 8,
+        normalized: bool = False,
+    ):
+        vectors = np.asarray(vectors, dtype=np.float32)
+        self.vectors = vectors if normalized else np.ascontiguousarray(_unit_rows(vectors))
+        self.ids: List[str] = list(ids)
+        self.metadata: List[Dict[str, Any]] = list(metadata) if metadata is not None else [{} for _ in self.ids]
+        if not (len(self.ids) == len(self.metadata) == self.vectors.shape[0]):
+            raise ValueError("ids, metadata and vectors must have the same number of rows")
+
+        self.n = len(self.ids)
+        self.mode = mode
+        self._all = np.packbits(np.ones(self.n, dtype=bool))
+        self._none = np.zeros_like(self._all)
+        self._build_filter_structures()
+
+        self.nprobe = nprobe
+        if mode == "ivf":
+            self._build_ivf(nlist)
+        elif mode != "exact":
+            raise ValueError(f"Unknown local index mode: {mode}")
+
+    # ----------------------------
+    # Persistence
+    # ----------------------------
+    @staticmethod
+    def save(path: str, ids: Sequence[str], vectors, metadata: Sequence[Dict[str, Any]]) -> None:
+        os.makedirs(path, exist_ok=True)
+        matrix = _unit_rows(np.asarray(vectors, dtype=np.float32))
+        np.save(os.path.join(path, "vectors.npy"), np.ascontiguousarray(matrix))
+        with open(os.path.join(path, "records.json"), "w") as f:
+            json.dump({"ids": list(ids), "metadata": list(metadata)}, f)
+
+    @classmethod
+    def load(cls, path: str, mode: str = "exact", nlist: Optional[int] = None, nprobe: int = 8) -> "LocalVectorIndex":
+        vectors = np.load(os.path.join(path, "vectors.npy"), mmap_mode="r")
+        with open(os.path.join(path, "records.json")) as f:
+            records = json.load(f)
+        index = cls(records["ids"], vectors, records["metadata"], mode=mode, nlist=nlist, nprobe=nprobe, normalized=True)
+        logger.info(f"[LocalIndex] Loaded {index.n} vectors from {path} (mode={mode})")
+        return index
+
+    # ----------------------------
+    # Metadata filters
+    # ----------------------------
+    def _build_filter_structures(self) -> None:
+        rows_by_value: Dict[str, Dict[Any, List[int]]] = {}
+        numeric: Dict[str, np.ndarray] = {}
+        present: Dict[str, List[int]] = {}
+
+        for row, meta in enumerate(self.metadata):
+            for field, value in meta.items():
+                present.setdefault(field, []).append(row)
+                values = value if isinstance(value, list) else [value]
+                for v in values:
+                    rows_by_value.setdefault(field, {}).setdefault(_value_key(v), []).append(row)
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    if field not in numeric:
+                        numeric[field] = np.full(self.n, np.nan)
+                    numeric[field][row] = value
+
+        self._eq_bitmaps = {
+            field: {key: self._pack(rows) for key, rows in by_value.items()}
+            for field, by_value in rows_by_value.items()
+        }
+        self._exists_bitmaps = {field: self._pack(rows) for field, rows in present.items()}
+        self._numeric_columns = numeric
+
+    def _pack(self, rows: List[int]) -> np.ndarray:
+        mask = np.zeros(self.n, dtype=bool)
+        mask[rows] = True
+        return np.packbits(mask)
+
+    def _eq(self, field: str, value) -> np.ndarray:
+        return self._eq_bitmaps.get(field, {}).get(_value_key(value), self._none)
+
+    def _any_eq(self, field: str, values) -> np.ndarray:
+        result = self._none
+        for v in values:
+            result = result | self._eq(field, v)
+        return result
+
+    def _field_mask(self, field: str, cond) -> np.ndarray:
+        if not isinstance(cond, dict):
+            cond = {"$eq": cond}
+        result = self._all
+        for op, value in cond.items():
+            if op == "$eq":
+                mask = self._eq(field, value)
+            elif op == "$ne":
+                mask = ~self._eq(field, value)
+            elif op == "$in":
+                mask = self._any_eq(field, value)
+            elif op == "$nin":
+                mask = ~self._any_eq(field, value)
+            elif op in _RANGE_OPS:
+                column = self._numeric_columns.get(field)
+                if column is None:
+                    mask = self._none
+                else:
+                    with np.errstate(invalid="ignore"):
+                        mask = np.packbits(_RANGE_OPS[op](column, float(value)))
+            elif op == "$exists":
+                exists = self._exists_bitmaps.get(field, self._none)
+                mask = exists if value else ~exists
+            else:
+                raise ValueError(f"Unsupported filter operator: {op}")
+            result = result & mask
+        return result
+
+    def _filter_mask(self, flt: Dict[str, Any]) -> np.ndarray:
+        result = self._all
+        for key, cond in flt.items():
+            if key == "$and":
+                for sub in cond:
+                    result = result & self._filter_mask(sub)
+            elif key == "$or":
+                any_mask = self._none
+                for sub in cond:
+                    any_mask = any_mask | self._filter_mask(sub)
+                result = result & any_mask
+            else:
+                result = result & self._field_mask(key, cond)
+        return result
+
+    def filter_rows(self, flt: Optional[Dict[str, Any]]) -> Optional[np.ndarray]:
+        """Row numbers passing ``flt``, or None when there is no filter."""
+        if not flt:
+            return None
+        return np.flatnonzero(np.unpackbits(self._filter_mask(flt), count=self.n))
+
+    # ----------------------------
+    # IVF
+    # ----------------------------
+    def _build_ivf(self, nlist: Optional[int], iters: int = 10, seed: int = 0) -> None:
+        nlist = max(1, min(nlist or int(np.sqrt(self.n)), self.n))
+        rng = np.random.default_rng(seed)
+        centroids = np.array(self.vectors[rng.choice(self.n, nlist, replace=False)], dtype=np.float32)
+
+        for _ in range(iters):
+            assign = np.argmax(self.vectors @ centroids.T, axis=1)
+            lists = self._split_lists(assign, nlist)
+            for c, members in enumerate(lists):
+                if len(members):
+                    centroids[c] = self.vectors[members].mean(axis=0)
+            centroids = _unit_rows(centroids)
+
+        assign = np.argmax(self.vectors @ centroids.T, axis=1)
+        self._centroids = np.ascontiguousarray(centroids, dtype=np.float32)
+        self._lists = self._split_lists(assign, nlist)
+
+    @staticmethod
+    def _split_lists(assign: np.ndarray, nlist: int) -> List[np.ndarray]:
+        order = np.argsort(assign, kind="stable")
+        counts = np.bincount(assign, minlength=nlist)
+        return np.split(order, np.cumsum(counts)[:-1])
+
+    def _ivf_rows(self, q: np.ndarray, allowed: Optional[np.ndarray], top_k: int) -> Optional[np.ndarray]:
+        probe = _top_k(self._centroids @ q, min(self.nprobe, len(self._lists)))
+        rows = np.concatenate([self._lists[c] for c in probe])
+        if allowed is not None:
+            rows = np.intersect1d(rows, allowed, assume_unique=True)
+        if len(rows) < top_k:
+            return allowed  # probe too narrow for this filter; score exactly
+        return rows
+
+    # ----------------------------
+    # Query
+    # ----------------------------
+    def query(
+        self,
+        vector: List[float],
+        top_k: int,
+        filter: Optional[Dict[str, Any]] = None,
+        include_metadata: bool = True,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        q = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(q)
+        if norm:
+            q = q / norm
+
+        rows = self.filter_rows(filter)
+        if self.mode == "ivf":
+            rows = self._ivf_rows(q, rows, top_k)
+
+        if rows is None:
+            scores = self.vectors @ q
+            best = _top_k(scores, top_k)
+            hits = best
+        else:
+            if len(rows) == 0:
+                return {"matches": []}
+            scores = self.vectors[rows] @ q
+            best = _top_k(scores, top_k)
+            hits = rows[best]
+
+        return {
+            "matches": [
+                {
+                    "id": self.ids[row],
+                    "score": float(score),
+                    "metadata": self.metadata[row] if include_metadata else {},
+                }
+                for row, score in zip(hits, scores[best])
+            ]
+        }
@@ -0,0 +1,26 @@
+# backend/app/services/retrieval/pinecone_backend.py
+from typing import Any, Dict, List, Optional
+
+from app.services.retrieval.base import VectorBackend
+
+
+class PineconeBackend(VectorBackend):
+    """Thin adapter over a (cached) Pinecone index handle."""
+
+    name = "pinecone"
+
+    def __init__(self, index):
+        self.index = index
+
+    def query(
+        self,
+        vector: List[float],
+        top_k: int,
+        filter: Optional[Dict[str, Any]] = None,
+        include_metadata: bool = True,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        params = {"vector": vector, "top_k": top_k, "include_metadata": include_metadata, **kwargs}
+        if filter:
+            params["filter"] = filter
+        return self.index.query(**params)
@@ -0,0 +1,245 @@
+# backend/app/services/rollups.py
+"""
+Incremental rollups of search_logs for /metrics.
+
+The log writer calls ``apply_rollups`` in the same transaction as each batch
+INSERT, adding the batch's counts to:
+
+    search_rollups        (merchant, minute|hour, bucket) -> count, latency sum/count, errors
+    search_term_rollups   (merchant, hour, hash of the normalized query) -> count
+
+``read_metrics`` answers /metrics from these tables only, so its cost depends
+on the time range and the number of distinct terms, not on the log table size.
+``rebuild_rollups`` recomputes a range from raw logs (backfill, or logs
+written without the background writer).
+
+Upserts use INSERT ... ON CONFLICT on PostgreSQL and SQLite; other databases
+get a portable UPDATE-then-INSERT per row, which is slower but never stops a
+log flush.
+"""
+import hashlib
+import logging
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, Optional
+
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+
+from app.models.search_log import SearchLog
+from app.models.search_rollup import SearchRollup, SearchTermRollup, TERM_MAX_CHARS
+from app.services.embedding_cache import normalize_text
+
+logger = logging.getLogger("app.services.rollups")
+
+# Ranges up to this long are read from minute buckets, longer ones from hour buckets
+MINUTE_RANGE_LIMIT = timedelta(hours=6)
+
+
+def utcnow() -> datetime:
+    """Naive UTC, matching the TIMESTAMP columns."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def as_utc(ts: Optional[datetime]) -> Optional[datetime]:
+    """Naive UTC for comparisons; aware datetimes (e.g. ...Z in a query string) are converted."""
+    if ts is None or ts.tzinfo is None:
+        return ts
+    return ts.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def bucket_start(ts: datetime, granularity: str) -> datetime:
+    ts = ts.replace(second=0, microsecond=0)
+    return ts.replace(minute=0) if granularity == "hour" else ts
+
+
+def term_hash(term: str) -> str:
+    return hashlib.sha256(term.encode("utf-8")).hexdigest()[:32]
+
+
+def aggregate(rows: Iterable[Dict[str, Any]]):
+    """Counts per (merchant, granularity, bucket) and term counts per (merchant, hour, normalized query)."""
+    buckets: Dict[tuple, list] = {}
+    terms: Counter = Counter()
+    for row in rows:
+        ts = row.get("timestamp") or utcnow()
+        merchant_id = row["merchant_id"]
+        latency = row.get("latency_ms")
+        for granularity in ("minute", "hour"):
+            agg = buckets.setdefault((merchant_id, granularity, bucket_start(ts, granularity)), [0, 0, 0, 0])
+            agg[0] += 1
+            if latency is not None:
+                agg[1] += latency
+                agg[2] += 1
+            agg[3] += bool(row.get("error_flag"))
+        terms[(merchant_id, bucket_start(ts, "hour"), normalize_text(row["query"]))] += 1
+    return buckets, terms
+
+
+# Dialects with INSERT ... ON CONFLICT DO UPDATE
+NATIVE_UPSERT_DIALECTS = {"postgresql", "sqlite"}
+
+
+def _upsert(dialect_name: str, table, keys, counters):
+    """INSERT ... ON CONFLICT DO UPDATE adding ``counters`` to the existing row."""
+    if dialect_name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    stmt = dialect_insert(table)
+    return stmt.on_conflict_do_update(
+        index_elements=keys,
+        set_={c: getattr(table.c, c) + getattr(stmt.excluded, c) for c in counters},
+    )
+
+
+async def _add_counts(session, table, keys, counters, params) -> None:
+    """Add each param row's ``counters`` to the row with its ``keys``, creating it if missing."""
+    dialect_name = session.bind.dialect.name
+    if dialect_name in NATIVE_UPSERT_DIALECTS:
+        await session.execute(_upsert(dialect_name, table, keys, counters), params)
+        return
+    # Portable path. A concurrent insert of the same new key raises IntegrityError,
+    # which is retryable: the savepoint rolls back and the batch runs again.
+    for p in params:
+        result = await session.execute(
+            update(table)
+            .where(*(table.c[k] == p[k] for k in keys))
+            .values({c: table.c[c] + p[c] for c in counters})
+        )
+        if result.rowcount == 0:
+            await session.execute(insert(table).values(**p))
+
+
+# SQLSTATEs worth retrying: deadlock_detected, serialization_failure
+RETRYABLE_SQLSTATES = {"40P01", "40001"}
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """True for deadlock / serialization failures and duplicate-key races, which succeed when re-run."""
+    if isinstance(exc, IntegrityError):
+        return True
+    orig = getattr(exc, "orig", exc)
+    code = getattr(orig, "sqlstate", None) or getattr(orig, "pgcode", None)
+    return code in RETRYABLE_SQLSTATES
+
+
+async def apply_rollups(session, rows: Iterable[Dict[str, Any]]) -> None:
+    """Add a batch of SearchLog rows to the rollups (caller commits).
+
+    Rows are upserted in primary-key order, so concurrent writers take row
+    locks on hot buckets and terms in the same order and cannot deadlock on
+    each other's batches.
+    """
+    buckets, terms = aggregate(rows)
+    if not buckets:
+        return
+
+    await _add_counts(
+        session, SearchRollup.__table__,
+        ["merchant_id", "granularity", "bucket_start"],
+        ["query_count", "latency_sum_ms", "latency_count", "error_count"],
+        [
+            {"merchant_id": m, "granularity": g, "bucket_start": b, "query_count": c,
+             "latency_sum_ms": ls, "latency_count": lc, "error_count": e}
+            for (m, g, b), (c, ls, lc, e) in sorted(buckets.items())
+        ],
+    )
+    term_params = [
+        {"merchant_id": m, "bucket_start": b, "query_hash": term_hash(q), "query": q[:TERM_MAX_CHARS], "query_count": c}
+        for (m, b, q), c in terms.items()
+    ]
+    term_params.sort(key=lambda p: (p["merchant_id"], p["bucket_start"], p["query_hash"]))
+    await _add_counts(
+        session, SearchTermRollup.__table__, ["merchant_id", "bucket_start", "query_hash"], ["query_count"], term_params,
+    )
+
+
+async def read_metrics(
+        session,
+        merchant_id: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        top_n: int = 5
+    ) -> Dict[str, Any]:
+    """Totals, average latency and top terms for [start, end) from the rollups.
+
+    Minute buckets serve ranges up to MINUTE_RANGE_LIMIT, hour buckets the rest
+    (edges then snap to the hour). Top terms are always hour-granular.
+    """
+    start, end = as_utc(start), as_utc(end)
+    granularity = "minute" if start and (end or utcnow()) - start <= MINUTE_RANGE_LIMIT else "hour"
+
+    def in_range(model, query, granularity_):
+        if merchant_id:
+            query = query.where(model.merchant_id == merchant_id)
+        if start:
+            query = query.where(model.bucket_start >= bucket_start(start, granularity_))
+        if end:
+            query = query.where(model.bucket_start < end)
+        return query
+
+    totals = (await session.execute(in_range(
+        SearchRollup,
+        select(
+            func.sum(SearchRollup.query_count),
+            func.sum(SearchRollup.latency_sum_ms),
+            func.sum(SearchRollup.latency_count),
+        ).where(SearchRollup.granularity == granularity),
+        granularity,
+    ))).one()
+    total_queries, latency_sum, latency_count = (v or 0 for v in totals)
+
+    count = func.sum(SearchTermRollup.query_count)
+    top_terms = await session.execute(in_range(
+        SearchTermRollup,
+        select(SearchTermRollup.query, count).group_by(SearchTermRollup.query).order_by(count.desc()).limit(top_n),
+        "hour",
+    ))
+
+    return {
+        "total_queries": int(total_queries),
+        "avg_latency_ms": round(latency_sum / latency_count, 2) if latency_count else 0,
+        "top_terms": {q: int(c) for q, c in top_terms.all()},
+        "merchant_id": merchant_id,
+        "start": start,
+        "end": end,
+        "granularity": granularity,
+    }
+
+
+async def rebuild_rollups(
+        session,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        batch_size: int = 5000
+    ) -> int:
+    """Recompute rollups for hour-aligned [start, end) from search_logs. Returns rows scanned."""
+    start = bucket_start(start, "hour") if start else None
+    for model in (SearchRollup, SearchTermRollup):
+        stmt = delete(model)
+        if start:
+            stmt = stmt.where(model.bucket_start >= start)
+        if end:
+            stmt = stmt.where(model.bucket_start < end)
+        await session.execute(stmt)
+
+    scanned, last_id = 0, 0
+    while True:
+        query = (
+            select(SearchLog.id, SearchLog.merchant_id, SearchLog.timestamp, SearchLog.query,
+                   SearchLog.latency_ms, SearchLog.error_flag)
+            .where(SearchLog.id > last_id).order_by(SearchLog.id).limit(batch_size)
+        )
+        if start:
+            query = query.where(SearchLog.timestamp >= start)
+        if end:
+            query = query.where(SearchLog.timestamp < end)
+        rows = (await session.execute(query)).mappings().all()
+        if not rows:
+            break
+        await apply_rollups(session, rows)
+        scanned += len(rows)
+        last_id = rows[-1]["id"]
+    logger.info(f"[Rollups] Rebuilt rollups from {scanned} search logs")
+    return scanned
@@ -1,11 +1,17 @@
 import os
 import json
-from openai import OpenAI
-from pinecone import Pinecone
+import asyncio
+import logging
+import threading
+from app.services.executor import run_blocking
+from app.services.stage_metrics import shared_stage_timer, stage_timer
+from app.services.registry import get_openai_client, get_pinecone
+from app.services.embedding_cache import embedding_cache
+from app.services.embedding_batcher import EmbeddingBatcher
+from app.services.retrieval.pinecone_backend import PineconeBackend
+from app.services.retrieval.local_index import LocalVectorIndex
 
-
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-pc = Pinecone(api_key=os.getenv("PINECONE_API_KEY"))
+logger = logging.getLogger("app.services.search_service")
 
 # merchant → index mapping
 INDEX_MAP = {
@@ -16,17 +22,105 @@ INDEX_MAP = {
 def get_index_name(merchant_id: str):
     return INDEX_MAP.get(merchant_id, INDEX_MAP["default"])
 
-def get_embedding(text: str) -> list[float]:
-    response = client.embeddings.create(
-        model="text-embedding-3-small",
-        input=text
-    )
-    return response.data[0].embedding
+# ----------------------------
+# Retrieval backends
+# ----------------------------
+# RETRIEVAL_BACKEND=pinecone (default) | local | auto. "local" serves every index
+# from LOCAL_INDEX_DIR/<index_name>; "auto" does so only where that directory
+# exists and uses Pinecone for the rest. LOCAL_INDEX_MODE is exact or ivf.
+RETRIEVAL_BACKEND = os.getenv("RETRIEVAL_BACKEND", "pinecone")
+LOCAL_INDEX_DIR = os.getenv("LOCAL_INDEX_DIR", "data/local_indexes")
+LOCAL_INDEX_MODE = os.getenv("LOCAL_INDEX_MODE", "exact")
+LOCAL_INDEX_NPROBE = int(os.getenv("LOCAL_INDEX_NPROBE", "8"))
+
+def _open_backend(index_name: str):
+    local_path = os.path.join(LOCAL_INDEX_DIR, index_name)
+    if RETRIEVAL_BACKEND == "local" or (RETRIEVAL_BACKEND == "auto" and os.path.isdir(local_path)):
+        return LocalVectorIndex.load(local_path, mode=LOCAL_INDEX_MODE, nprobe=LOCAL_INDEX_NPROBE)
+    return PineconeBackend(get_pinecone().Index(index_name))
 
-def search_products(query: str, top_k: int = 5, filters=None, merchant_id=None):
-    vector = get_embedding(query)
+# ----------------------------
+# Index handle cache
+# ----------------------------
+# pc.Index(name) resolves the index host and builds a client with its own HTTP
+# pool. Handles are built once per index per worker and reused, so keep-alive
+# connections survive across requests instead of paying a new TLS handshake.
+_index_handles = {}
+_index_lock = threading.Lock()
+_index_stats = {"handle_hits": 0, "handle_misses": 0, "queries": 0}
+
+def _open_index(index_name: str):
+    with _index_lock:
+        handle = _index_handles.get(index_name)
+        if handle is None:
+            handle = _open_backend(index_name)
+            _index_handles[index_name] = handle
+            logger.info(f"[Retrieval] Opened {handle.name} backend for {index_name}")
+        return handle
+
+async def get_index(merchant_id: str):
+    """Cached retrieval backend (Pinecone handle or local index) for the merchant's index."""
     index_name = get_index_name(merchant_id)
-    index = pc.Index(index_name)
+    _index_stats["queries"] += 1
+    handle = _index_handles.get(index_name)
+    if handle is not None:
+        _index_stats["handle_hits"] += 1
+        return handle
+    _index_stats["handle_misses"] += 1
+    return await run_blocking(_open_index, index_name)
+
+def invalidate_index(merchant_id: str) -> None:
+    """Drop a cached handle, e.g. after the index was recreated on a new host."""
+    with _index_lock:
+        _index_handles.pop(get_index_name(merchant_id), None)
+
+def index_pool_stats() -> dict:
+    lookups = _index_stats["handle_hits"] + _index_stats["handle_misses"]
+    return {
+        **_index_stats,
+        "handle_reuse_rate": round(_index_stats["handle_hits"] / lookups, 4) if lookups else 0.0,
+        "open_handles": {name: handle.name for name, handle in sorted(_index_handles.items())},
+        "max_connections": int(os.getenv("PINECONE_MAX_CONNECTIONS", "32")),
+    }
+
+EMBEDDING_MODEL = "text-embedding-3-small"
+
+async def _embed_upstream(texts: list[str]) -> list[list[float]]:
+    """One list-input embeddings call; the batcher is the only caller."""
+    response = await get_openai_client().embeddings.create(
+        model=EMBEDDING_MODEL,
+        input=texts
+    )
+    return [item.embedding for item in sorted(response.data, key=lambda d: d.index)]
+
+embedding_batcher = EmbeddingBatcher(_embed_upstream)
+
+async def get_embedding(text: str) -> list[float]:
+    return (await get_embeddings([text]))[0]
+
+async def get_embeddings(texts: list[str]) -> list[list[float]]:
+    """Embed several strings, sending each distinct uncached string upstream once.
+
+    Misses go through the micro-batcher, so concurrent requests share upstream calls.
+    """
+    unique = list(dict.fromkeys(texts))
+    by_text = {}
+    for text in unique:
+        cached = await embedding_cache.aget(text, EMBEDDING_MODEL)
+        if cached is not None:
+            by_text[text] = cached.tolist()
+
+    missing = [text for text in unique if text not in by_text]
+    if missing:
+        vectors = await embedding_batcher.embed_many(missing)
+        for text, vector in zip(missing, vectors):
+            await embedding_cache.aset(text, EMBEDDING_MODEL, vector)
+            by_text[text] = vector
+
+    return [by_text[text] for text in texts]
+
+async def _query_index(vector: list[float], top_k: int = 5, filters=None, merchant_id=None) -> list[dict]:
+    index = await get_index(merchant_id)
 
     pinecone_query = {
         "vector": vector,
@@ -40,7 +134,8 @@ def search_products(query: str, top_k: int = 5, filters=None, merchant_id=None):
     query_log = {**pinecone_query, "vector": f"[{len(vector)}-dim embedding]"}
     logger.info(f"[Pinecone Query] {json.dumps(query_log, indent=2)}")
 
-    results = index.query(**pinecone_query)
+    with stage_timer("vector_query", merchant_id):
+        results = await run_blocking(index.query, **pinecone_query)
 
     return [
         {
@@ -50,3 +145,38 @@ def search_products(query: str, top_k: int = 5, filters=None, merchant_id=None):
         }
         for match in results["matches"]
     ]
+
+async def search_products(query: str, top_k: int = 5, filters=None, merchant_id=None):
+    with stage_timer("embedding", merchant_id):
+        vector = await get_embedding(query)
+    return await _query_index(vector, top_k, filters, merchant_id)
+
+# Most items one /search/batch or /agentic-search/batch request may carry
+SEARCH_BATCH_MAX_ITEMS = int(os.getenv("SEARCH_BATCH_MAX_ITEMS", "20"))
+
+async def search_products_batch(requests: list[dict]) -> list:
+    """Run several searches: one embeddings call for every query, then concurrent vector queries.
+
+    ``requests`` hold search_products keyword arguments. Returns, in order, each
+    item's results or the exception it raised, so one bad item fails only itself.
+    """
+    try:
+        with shared_stage_timer("batch_embedding", (r.get("merchant_id") for r in requests)):
+            vectors = await get_embeddings([r["query"] for r in requests])
+    except Exception as e:
+        # One bad string may have failed the whole call; embed each item alone
+        logger.error(f"[Search] Batch embedding failed, embedding each item alone: {e}")
+        return await asyncio.gather(
+            *[
+                search_products(r["query"], r.get("top_k") or 5, r.get("filters"), r.get("merchant_id"))
+                for r in requests
+            ],
+            return_exceptions=True,
+        )
+    return await asyncio.gather(
+        *[
+            _query_index(vector, r.get("top_k") or 5, r.get("filters"), r.get("merchant_id"))
+            for r, vector in zip(requests, vectors)
+        ],
+        return_exceptions=True,
+    )
@@ -0,0 +1,210 @@
+# backend/app/services/semantic_cache.py
+"""
+Semantic result-set cache: paraphrases share one retrieval.
+
+"perfume for her" and "women's perfume" embed to nearly the same vector and
+return the same candidates. After filter extraction and embedding, a search
+looks here before querying Pinecone. Each merchant has a small in-memory
+matrix of recent query embeddings (L2-normalized float32 rows), so a lookup is
+one matrix-vector product. A row is a hit when its cosine similarity is at
+least the threshold and its structured filter, context and versions all match.
+
+Entries are bounded per merchant (least recently used evicted first) and
+expire after a TTL. They are invalidated when
+
+    the merchant rules change   entries carry the rules snapshot version
+    the catalog changes         ``invalidate(merchant_id)`` drops the merchant's
+                                index (POST /cache/invalidate)
+
+Configured from env:
+    SEMANTIC_CACHE_SIZE        entries per merchant (default 1000, 0 disables)
+    SEMANTIC_CACHE_TTL         seconds an entry stays valid (default 300)
+    SEMANTIC_CACHE_THRESHOLD   minimum cosine similarity for a hit (default 0.95)
+"""
+import os
+import json
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from app.services.result_cache import context_hash
+
+SEMANTIC_CACHE_SIZE = int(os.getenv("SEMANTIC_CACHE_SIZE", "1000"))
+SEMANTIC_CACHE_TTL = float(os.getenv("SEMANTIC_CACHE_TTL", "300"))
+SEMANTIC_CACHE_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.95"))
+
+
+def _filter_key(structured_filter: Dict[str, Any], context: Optional[Dict[str, Any]]) -> str:
+    return json.dumps(structured_filter, sort_keys=True, default=str) + "\x00" + context_hash(context)
+
+
+class _MerchantIndex:
+    """Fixed-capacity matrix of unit query vectors plus per-row metadata."""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.matrix: Optional[np.ndarray] = None
+        # slot -> (expires_at, filter_key, rules_version, result_set), least recently used first
+        self.slots: "OrderedDict[int, tuple]" = OrderedDict()
+        self.free: List[int] = list(range(capacity - 1, -1, -1))
+
+    def remove(self, slot: int) -> None:
+        del self.slots[slot]
+        self.free.append(slot)
+
+
+class SemanticResultCache:
+    def __init__(
+        self,
+        max_entries: int = SEMANTIC_CACHE_SIZE,
+        ttl: float = SEMANTIC_CACHE_TTL,
+        threshold: float = SEMANTIC_CACHE_THRESHOLD,
+        clock=time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.threshold = threshold
+        self._clock = clock
+        self._indexes: Dict[str, _MerchantIndex] = {}
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.saved_latency_ms = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def _index(self, merchant_id: str) -> _MerchantIndex:
+        index = self._indexes.get(merchant_id)
+        if index is None:
+            index = self._indexes[merchant_id] = _MerchantIndex(self.max_entries)
+        return index
+
+    @staticmethod
+    def _unit(vector) -> np.ndarray:
+        q = np.asarray(vector, dtype=np.float32).ravel()
+        norm = np.linalg.norm(q)
+        return q / norm if norm else q
+
+    # ----------------------------
+    # Lookup / insert
+    # ----------------------------
+    def lookup(
+        self,
+        merchant_id: str,
+        vector,
+        structured_filter: Dict[str, Any],
+        context: Optional[Dict[str, Any]],
+        rules_version: str,
+        min_window: int = 0,
+    ) -> Optional[Dict[str, Any]]:
+        """The cached result set of the most similar matching query, or None.
+
+        Expired rows and rows for another rules version are dropped when they come
+        up as candidates; the rest age out through LRU eviction.
+        A hit must also hold at least ``min_window`` candidates (or all there are).
+        """
+        if not self.enabled:
+            return None
+        q = self._unit(vector)
+        filter_key = _filter_key(structured_filter, context)
+        with self._lock:
+            index = self._index(merchant_id)
+            if not index.slots or index.matrix is None or index.matrix.shape[1] != q.shape[0]:
+                self.misses += 1
+                return None
+            sims = index.matrix @ q
+            now = self._clock()
+            best_slot, best_sim = None, self.threshold
+            # Only rows above the threshold need their metadata checked
+            for slot in np.flatnonzero(sims >= self.threshold).tolist():
+                entry = index.slots.get(slot)
+                if entry is None:
+                    continue   # free slot holding an old vector
+                expires_at, key, version, result_set = entry
+                if expires_at <= now or version != rules_version:
+                    index.remove(slot)
+                    self.evictions += 1
+                    continue
+                sim = float(sims[slot])
+                if sim >= best_sim and key == filter_key and (
+                    result_set["exhaustive"] or len(result_set["matches"]) >= min_window
+                ):
+                    best_slot, best_sim = slot, sim
+            if best_slot is None:
+                self.misses += 1
+                return None
+            index.slots.move_to_end(best_slot)
+            result_set = index.slots[best_slot][3]
+            self.hits += 1
+            self.saved_latency_ms += result_set.get("latency_ms") or 0
+        return result_set
+
+    def put(
+        self,
+        merchant_id: str,
+        vector,
+        structured_filter: Dict[str, Any],
+        context: Optional[Dict[str, Any]],
+        rules_version: str,
+        result_set: Dict[str, Any],
+    ) -> None:
+        if not self.enabled:
+            return
+        q = self._unit(vector)
+        with self._lock:
+            index = self._index(merchant_id)
+            if index.matrix is None or index.matrix.shape[1] != q.shape[0]:
+                index.matrix = np.zeros((self.max_entries, q.shape[0]), dtype=np.float32)
+                index.slots.clear()
+                index.free = list(range(self.max_entries - 1, -1, -1))
+            if not index.free:
+                index.remove(next(iter(index.slots)))
+                self.evictions += 1
+            slot = index.free.pop()
+            index.matrix[slot] = q
+            index.slots[slot] = (
+                self._clock() + self.ttl, _filter_key(structured_filter, context), rules_version, result_set,
+            )
+
+    # ----------------------------
+    # Invalidation
+    # ----------------------------
+    def invalidate(self, merchant_id: Optional[str] = None) -> None:
+        """Forget a merchant's entries (all merchants if None) after a catalog change."""
+        with self._lock:
+            if merchant_id is None:
+                self._indexes.clear()
+            else:
+                self._indexes.pop(merchant_id, None)
+            self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._indexes.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "saved_latency_ms": round(self.saved_latency_ms, 1),
+            "avg_saved_latency_ms": round(self.saved_latency_ms / self.hits, 1) if self.hits else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "size": sum(len(index.slots) for index in self._indexes.values()),
+            "max_entries_per_merchant": self.max_entries,
+            "threshold": self.threshold,
+        }
+
+
+# global instance (safe to import)
+semantic_cache = SemanticResultCache()
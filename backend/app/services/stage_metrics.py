@@ -0,0 +1,152 @@
+# backend/app/services/stage_metrics.py
+"""
+Fixed-bucket latency histograms per pipeline stage and merchant.
+
+    with stage_timer("vector_query", merchant_id):
+        ...
+    observe("llm_filter", merchant_id, seconds)
+    with shared_stage_timer("batch_embedding", merchant_ids):   # one call for several merchants
+        ...
+
+Recording is a bisect plus two integer increments with no lock. It is meant to
+be called from the event loop thread, where nothing interleaves mid-update;
+worker threads should hand their timings back to the loop (as run_blocking
+callers do). Exposed as Prometheus text at /metrics/prometheus and as
+p50/p95/p99 JSON at /metrics/stages. Inside a request the timings are also
+collected for the response's Server-Timing header.
+
+Merchant label values are capped at STAGE_METRICS_MAX_MERCHANTS; later ones
+are recorded as "other" to bound series cardinality.
+"""
+import os
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Upper bounds in seconds; the last bucket is +Inf
+BUCKETS: Tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.15, 0.25,
+    0.4, 0.6, 1.0, 1.5, 2.5, 5.0, 10.0,
+)
+STAGE_METRICS_MAX_MERCHANTS = int(os.getenv("STAGE_METRICS_MAX_MERCHANTS", "200"))
+METRIC_NAME = "agentic_stage_latency_seconds"
+
+# Set per request by the timing middleware; stages observed while serving the
+# request are also appended here for its Server-Timing header.
+request_stages: ContextVar[Optional[List[Tuple[str, float]]]] = ContextVar("request_stages", default=None)
+
+
+class Histogram:
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self):
+        self.counts: List[int] = [0] * (len(BUCKETS) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(BUCKETS, seconds)] += 1
+        self.sum += seconds
+        self.count += 1
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate by linear interpolation inside the bucket holding rank q·count."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, c in enumerate(self.counts):
+            if c and seen + c >= rank:
+                lower = BUCKETS[i - 1] if i > 0 else 0.0
+                upper = BUCKETS[i] if i < len(BUCKETS) else BUCKETS[-1]
+                return lower + (upper - lower) * (rank - seen) / c
+            seen += c
+        return BUCKETS[-1]
+
+
+class StageMetrics:
+    def __init__(self, max_merchants: int = STAGE_METRICS_MAX_MERCHANTS):
+        self.max_merchants = max_merchants
+        self._histograms: Dict[Tuple[str, str], Histogram] = {}
+        self._merchants: set = set()
+
+    def _label(self, merchant_id: Optional[str]) -> str:
+        merchant = merchant_id or "unknown"
+        if merchant not in self._merchants:
+            if len(self._merchants) >= self.max_merchants:
+                return "other"
+            self._merchants.add(merchant)
+        return merchant
+
+    def observe(self, stage: str, merchant_id: Optional[str], seconds: float) -> None:
+        key = (stage, self._label(merchant_id))
+        hist = self._histograms.get(key)
+        if hist is None:
+            hist = self._histograms[key] = Histogram()
+        hist.observe(seconds)
+        stages = request_stages.get()
+        if stages is not None:
+            stages.append((stage, seconds))
+
+    @contextmanager
+    def timer(self, stage: str, merchant_id: Optional[str]):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, merchant_id, time.perf_counter() - start)
+
+    @contextmanager
+    def shared_timer(self, stage: str, merchant_ids: Iterable[Optional[str]]):
+        """Time one call made on behalf of several merchants; each records it once."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            for merchant_id in dict.fromkeys(merchant_ids):
+                self.observe(stage, merchant_id, seconds)
+
+    def reset(self) -> None:
+        self._histograms.clear()
+        self._merchants.clear()
+
+    def summary(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """{stage: {merchant: {count, p50_ms, p95_ms, p99_ms, avg_ms}}}."""
+        out: Dict[str, Dict[str, Dict[str, float]]] = {}
+        for (stage, merchant), h in sorted(self._histograms.items()):
+            out.setdefault(stage, {})[merchant] = {
+                "count": h.count,
+                "avg_ms": round(h.sum / h.count * 1000, 2) if h.count else 0.0,
+                **{f"p{int(q * 100)}_ms": round(h.quantile(q) * 1000, 2) for q in (0.5, 0.95, 0.99)},
+            }
+        return out
+
+    def render_prometheus(self) -> str:
+        lines = [
+            f"# HELP {METRIC_NAME} Latency of each search pipeline stage.",
+            f"# TYPE {METRIC_NAME} histogram",
+        ]
+        for (stage, merchant), h in sorted(self._histograms.items()):
+            labels = f'stage="{_escape(stage)}",merchant="{_escape(merchant)}"'
+            cumulative = 0
+            for bound, c in zip(BUCKETS, h.counts):
+                cumulative += c
+                lines.append(f'{METRIC_NAME}_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f'{METRIC_NAME}_bucket{{{labels},le="+Inf"}} {h.count}')
+            lines.append(f"{METRIC_NAME}_sum{{{labels}}} {h.sum}")
+            lines.append(f"{METRIC_NAME}_count{{{labels}}} {h.count}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# global instance (safe to import)
+stage_metrics = StageMetrics()
+observe = stage_metrics.observe
+stage_timer = stage_metrics.timer
+shared_stage_timer = stage_metrics.shared_timer
@@ -0,0 +1,427 @@
+import asyncio
+import time
+from collections import deque
+import pytest
+from app.services import agentic_service
+from app.services.category_index import category_index
+from app.services.filter_cache import FilterCache
+from app.services.result_cache import ResultSetCache, encode_cursor
+from app.services.semantic_cache import SemanticResultCache
+
+UPSTREAM_DELAY = 0.2
+
+# --- FAKES -------------------------------------------------------------------
+
+class FakeIndex:
+    def __init__(self, matches, strict_filter=False):
+        self.matches = matches
+        self.strict_filter = strict_filter   # filtered queries find nothing
+        self.queries = []
+
+    def query(self, **kwargs):
+        self.queries.append(kwargs)
+        time.sleep(UPSTREAM_DELAY)
+        if self.strict_filter and "filter" in kwargs:
+            return {"matches": []}
+        return {"matches": list(self.matches)}
+
+
+class FakeDB:
+    def __init__(self):
+        self.added = []
+
+    def add(self, obj):
+        self.added.append(obj)
+
+    async def commit(self):
+        pass
+
+
+MOCK_MATCHES = [
+    {"id": "p1", "score": 0.9, "metadata": {"category": "Fragrance & Beauty", "price": 120}},
+    {"id": "p2", "score": 0.7, "metadata": {"category": "Fragrance & Beauty", "price": 80}},
+]
+
+
+@pytest.fixture
+def fake_upstream(monkeypatch):
+    """Slow stand-ins for the LLM, embeddings and Pinecone."""
+    calls = {"llm": 0, "embeddings": []}
+    category_vec = category_index.matrix[category_index.names.index("Fragrance & Beauty")].tolist()
+
+    async def fake_raw_filters(query):
+        calls["llm"] += 1
+        await asyncio.sleep(UPSTREAM_DELAY)
+        return {"price_max": 200}
+
+    async def fake_get_embeddings(texts):
+        calls["embeddings"].append(list(texts))
+        await asyncio.sleep(UPSTREAM_DELAY)
+        return [category_vec for _ in texts]
+
+    index = FakeIndex(MOCK_MATCHES)
+    monkeypatch.setattr(agentic_service, "_extract_raw_filters", fake_raw_filters)
+    monkeypatch.setattr(agentic_service, "get_embeddings", fake_get_embeddings)
+    async def fake_get_index(merchant_id):
+        return index
+
+    monkeypatch.setattr(agentic_service, "get_index", fake_get_index)
+    monkeypatch.setattr(agentic_service, "result_cache", ResultSetCache())
+    monkeypatch.setattr(agentic_service, "FILTER_FAST_PATH", False)   # always exercise the LLM
+    monkeypatch.setattr(agentic_service, "filter_cache", FilterCache())
+    monkeypatch.setattr(agentic_service, "semantic_cache", SemanticResultCache())
+    agentic_service.merchant_config.load()   # the app lifespan does this at startup
+    calls["index"] = index
+    return calls
+
+# --- TEST CASES -------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_llm_and_embeddings_run_concurrently(fake_upstream):
+    """Latency should track the slowest upstream call, not the sum of them."""
+    start = time.perf_counter()
+    res = await agentic_service.search_products_nl("perfume", "airlinex", FakeDB())
+    elapsed = time.perf_counter() - start
+
+    # LLM + embeddings overlap, then one Pinecone round trip
+    assert elapsed < UPSTREAM_DELAY * 2.8
+    assert fake_upstream["llm"] == 1
+    assert res["filter_source"] == "llm"
+    assert res["interpreted_filters"]["category"] == "Fragrance & Beauty"
+    assert res["interpreted_filters"]["price"] == {"$lte": 200}
+    assert res["rules_version"] == agentic_service.merchant_config.snapshot.version
+
+
+@pytest.mark.asyncio
+async def test_each_distinct_string_embedded_once(fake_upstream):
+    """Raw and enriched query go out in a single embeddings call."""
+    ctx = {"cabin": "Business", "trip": {"from": "DXB", "to": "CDG"}}
+    await agentic_service.search_products_nl("perfume", "airlinex", FakeDB(), context=ctx)
+
+    assert len(fake_upstream["embeddings"]) == 1
+    assert fake_upstream["embeddings"][0][0] == "perfume"
+    assert "cabin: Business" in fake_upstream["embeddings"][0][1]
+
+
+@pytest.mark.asyncio
+async def test_blocking_queries_do_not_stall_event_loop(fake_upstream):
+    """Concurrent searches overlap their Pinecone round trips instead of serializing."""
+    start = time.perf_counter()
+    await asyncio.gather(*[
+        agentic_service.search_products_nl("perfume", "airlinex", FakeDB())
+        for _ in range(5)
+    ])
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < UPSTREAM_DELAY * 2.8
+
+
+@pytest.mark.asyncio
+async def test_get_embeddings_dedupes(monkeypatch):
+    """Identical strings share one slot in the upstream request."""
+    from types import SimpleNamespace
+    from app.services import search_service
+    from app.services.cache_tiers import NullTier
+    from app.services.embedding_cache import EmbeddingCache
+
+    sent = []
+
+    async def fake_create(model, input):
+        sent.append(list(input))
+        return SimpleNamespace(data=[
+            SimpleNamespace(index=i, embedding=[float(i)]) for i in range(len(input))
+        ])
+
+    fake_client = SimpleNamespace(embeddings=SimpleNamespace(create=fake_create))
+    monkeypatch.setattr(search_service, "get_openai_client", lambda: fake_client)
+    monkeypatch.setattr(search_service, "embedding_cache", EmbeddingCache(NullTier()))
+    vectors = await search_service.get_embeddings(["a", "b", "a"])
+
+    assert sent == [["a", "b"]]
+    assert vectors == [[0.0], [1.0], [0.0]]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mode, expected_hedged", [("off", 0), ("always", 1)])
+async def test_hedged_fallback_overlaps_queries(fake_upstream, monkeypatch, mode, expected_hedged):
+    """With hedging, a zero-result filtered query costs one round trip, not two."""
+    fake_upstream["index"].strict_filter = True
+    monkeypatch.setattr(agentic_service, "HEDGE_MODE", mode)
+    monkeypatch.setattr(agentic_service, "_hedge_stats", dict.fromkeys(agentic_service._hedge_stats, 0))
+
+    start = time.perf_counter()
+    res = await agentic_service.search_products_nl("perfume", "airlinex", FakeDB())
+    elapsed = time.perf_counter() - start
+
+    assert [r["id"] for r in res["results"]] == ["p1", "p2"]
+    stats = agentic_service.hedge_stats()
+    assert stats["hedged"] == stats["hedge_wins"] == expected_hedged
+    if expected_hedged:
+        assert elapsed < UPSTREAM_DELAY * 2.8
+        assert stats["latency_saved_ms"] > UPSTREAM_DELAY * 500
+    else:
+        assert elapsed >= UPSTREAM_DELAY * 3
+
+
+@pytest.mark.asyncio
+async def test_cursor_pages_served_from_cache(fake_upstream):
+    """Page 2 via the cursor makes no LLM, embedding or Pinecone calls."""
+    fake_upstream["index"].matches = [
+        {"id": f"p{i}", "score": 1 - i / 100, "metadata": {"category": "Fragrance & Beauty"}}
+        for i in range(25)
+    ]
+    first = await agentic_service.search_products_nl("perfume", "airlinex", FakeDB(), limit=10)
+    assert fake_upstream["index"].queries[0]["top_k"] == agentic_service.RESULT_WINDOW
+
+    start = time.perf_counter()
+    second = await agentic_service.search_products_nl(
+        "perfume", "airlinex", FakeDB(), limit=10, cursor=first["next_cursor"]
+    )
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < UPSTREAM_DELAY / 2
+    assert fake_upstream["llm"] == 1
+    assert len(fake_upstream["embeddings"]) == 1
+    assert len(fake_upstream["index"].queries) == 1
+    assert {r["id"] for r in second["results"]} == {f"p{i}" for i in range(10, 20)}
+
+    third = await agentic_service.search_products_nl(
+        "perfume", "airlinex", FakeDB(), limit=10, cursor=second["next_cursor"]
+    )
+    assert len(third["results"]) == 5
+    assert third["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_unknown_cursor_runs_full_pipeline(fake_upstream):
+    res = await agentic_service.search_products_nl(
+        "perfume", "airlinex", FakeDB(), cursor=encode_cursor("expired", 0)
+    )
+
+    assert fake_upstream["llm"] == 1
+    assert [r["id"] for r in res["results"]] == ["p1", "p2"]
+
+
+@pytest.mark.asyncio
+async def test_pipeline_stages_are_timed(fake_upstream, monkeypatch):
+    from app.services.stage_metrics import StageMetrics
+    metrics = StageMetrics()
+    monkeypatch.setattr(agentic_service, "observe", metrics.observe)
+    monkeypatch.setattr(agentic_service, "stage_timer", metrics.timer)
+    monkeypatch.setattr(agentic_service, "shared_stage_timer", metrics.shared_timer)
+
+    await agentic_service.search_products_nl("perfume", "airlinex", FakeDB())
+
+    summary = metrics.summary()
+    for stage in ("llm_filter", "embedding", "category_mapping", "vector_query", "ranking", "db_log_write"):
+        assert summary[stage]["airlinex"]["count"] == 1
+    assert summary["vector_query"]["airlinex"]["p50_ms"] >= UPSTREAM_DELAY * 1000 * 0.5
+
+
+@pytest.mark.asyncio
+async def test_simple_query_skips_llm(fake_upstream, monkeypatch):
+    monkeypatch.setattr(agentic_service, "FILTER_FAST_PATH", True)
+    monkeypatch.setattr(agentic_service, "_filter_stats", dict.fromkeys(agentic_service._filter_stats, 0))
+
+    start = time.perf_counter()
+    res = await agentic_service.search_products_nl("dior perfume under $150", "airlinex", FakeDB())
+    elapsed = time.perf_counter() - start
+
+    assert fake_upstream["llm"] == 0
+    assert res["interpreted_filters"]["brand"] == "Dior"
+    assert res["interpreted_filters"]["price"] == {"$lte": 150}
+    assert elapsed < UPSTREAM_DELAY * 2.8
+
+    await agentic_service.search_products_nl("gift for my wife who likes floral scents", "airlinex", FakeDB())
+    assert fake_upstream["llm"] == 1
+    stats = agentic_service.filter_stats()
+    assert (stats["queries"], stats["fast_path"], stats["llm"]) == (2, 1, 1)
+    assert stats["fast_path_rate"] == 0.5
+
+
+@pytest.mark.asyncio
+async def test_repeat_query_reuses_llm_filters(fake_upstream):
+    """A normalized repeat skips the LLM even when the result set is not cached."""
+    await agentic_service.search_products_nl("Perfume  under 200.00", "airlinex", FakeDB())
+    agentic_service.result_cache.clear()
+    res = await agentic_service.search_products_nl("perfume under 200", "airlinex", FakeDB())
+
+    assert fake_upstream["llm"] == 1
+    assert res["interpreted_filters"]["price"] == {"$lte": 200}
+
+
+@pytest.mark.asyncio
+async def test_slow_llm_falls_back_to_rules(fake_upstream, monkeypatch):
+    """Past the LLM deadline the request continues with the rule-based filters."""
+    monkeypatch.setattr(agentic_service, "LLM_FILTER_TIMEOUT_MS", UPSTREAM_DELAY * 250)
+
+    start = time.perf_counter()
+    res = await agentic_service.search_products_nl("chanel perfume 150", "airlinex", FakeDB())
+    elapsed = time.perf_counter() - start
+
+    assert res["filter_source"] == "rules_timeout"
+    assert res["interpreted_filters"]["brand"] == "Chanel"
+    assert res["interpreted_filters"]["category"] == "Fragrance & Beauty"
+    assert elapsed < UPSTREAM_DELAY * 2.5
+
+
+@pytest.mark.asyncio
+async def test_exhausted_budget_skips_llm(fake_upstream, monkeypatch):
+    monkeypatch.setattr(agentic_service, "_filter_stats", dict.fromkeys(agentic_service._filter_stats, 0))
+    res = await agentic_service.search_products_nl("perfume", "airlinex", FakeDB(), budget_ms=100)
+
+    assert res["filter_source"] == "rules_timeout"
+    assert "price" not in res["interpreted_filters"]
+    stats = agentic_service.filter_stats()
+    assert (stats["llm"], stats["llm_skipped"], stats["llm_timeouts"]) == (0, 1, 0)
+
+
+@pytest.mark.asyncio
+async def test_llm_error_falls_back_to_rules(fake_upstream, monkeypatch):
+    async def broken_llm(query):
+        raise RuntimeError("upstream 500")
+
+    monkeypatch.setattr(agentic_service, "_extract_raw_filters", broken_llm)
+    res = await agentic_service.search_products_nl("perfume under 90", "airlinex", FakeDB())
+
+    assert res["filter_source"] == "rules_error"
+    assert res["interpreted_filters"]["price"] == {"$lte": 90.0}
+
+
+@pytest.mark.asyncio
+async def test_hedged_llm_request_wins(fake_upstream, monkeypatch):
+    """A slow first LLM call is overtaken by the hedged second one."""
+    delays = [UPSTREAM_DELAY * 5, UPSTREAM_DELAY / 4]
+
+    async def uneven_llm(query):
+        await asyncio.sleep(delays.pop(0))
+        return {"price_max": 200}
+
+    monkeypatch.setattr(agentic_service, "_extract_raw_filters", uneven_llm)
+    monkeypatch.setattr(agentic_service, "LLM_HEDGE", True)
+    monkeypatch.setattr(agentic_service, "LLM_HEDGE_DELAY_MS", UPSTREAM_DELAY * 250)
+    monkeypatch.setattr(agentic_service, "_filter_stats", dict.fromkeys(agentic_service._filter_stats, 0))
+
+    filters, source = await agentic_service._extract_filters("perfume", "airlinex")
+
+    assert (filters, source) == ({"price_max": 200}, "llm_hedge")
+    stats = agentic_service.filter_stats()
+    assert stats["llm_hedged"] == stats["llm_hedge_wins"] == 1
+
+
+@pytest.mark.asyncio
+async def test_hedged_failure_finishing_with_the_winner_is_retrieved(monkeypatch):
+    """Both hedged calls land in one wakeup; the failed one must not be reported as unhandled."""
+    import gc
+    outcomes = []
+
+    async def gated_llm(query):
+        outcome, gate = outcomes.pop(0)
+        await gate.wait()
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    unhandled = []
+    loop = asyncio.get_running_loop()
+    loop.set_exception_handler(lambda loop, context: unhandled.append(context["message"]))
+    monkeypatch.setattr(agentic_service, "_extract_raw_filters", gated_llm)
+    monkeypatch.setattr(agentic_service, "LLM_HEDGE", True)
+    monkeypatch.setattr(agentic_service, "LLM_HEDGE_DELAY_MS", 5)
+    monkeypatch.setattr(agentic_service, "_llm_latencies", deque(maxlen=512))   # keep the fixed delay
+    try:
+        # Which of the two done tasks is looked at first varies, so try both orders a few times
+        for i in range(16):
+            gate = asyncio.Event()
+            pair = [RuntimeError("rate limited"), {"price_max": 200}]
+            outcomes[:] = [(o, gate) for o in (pair if i % 2 else pair[::-1])]
+            loop.call_later(0.02, gate.set)
+            filters, _ = await agentic_service._call_llm("perfume", 1.0)
+            assert filters == {"price_max": 200}
+        gc.collect()
+    finally:
+        loop.set_exception_handler(None)
+    assert unhandled == []
+
+
+def test_llm_hedge_delay_tracks_percentile(monkeypatch):
+    monkeypatch.setattr(agentic_service, "_llm_latencies", agentic_service.deque([i / 100 for i in range(1, 101)]))
+    monkeypatch.setattr(agentic_service, "LLM_HEDGE_PERCENTILE", 0.9)
+
+    assert agentic_service._llm_hedge_delay() == pytest.approx(0.91)
+
+
+@pytest.mark.asyncio
+async def test_paraphrase_reuses_result_set(fake_upstream):
+    """A near-identical query embedding with the same filters skips Pinecone."""
+    await agentic_service.search_products_nl("perfume for her", "airlinex", FakeDB())
+    res = await agentic_service.search_products_nl("women's perfume", "airlinex", FakeDB())
+
+    assert len(fake_upstream["index"].queries) == 1
+    assert [r["id"] for r in res["results"]] == ["p1", "p2"]
+    assert agentic_service.semantic_cache.stats()["hits"] == 1
+
+    agentic_service.semantic_cache.invalidate("airlinex")   # catalog changed
+    await agentic_service.search_products_nl("perfume for women", "airlinex", FakeDB())
+    assert len(fake_upstream["index"].queries) == 2
+
+
+@pytest.mark.asyncio
+async def test_batch_shares_one_embeddings_call(fake_upstream, monkeypatch):
+    """Every query is embedded in one call, items run concurrently, a failure stays per item."""
+    real_candidates = agentic_service.category_candidates
+
+    async def flaky_candidates(query, q_vec=None, k=agentic_service.CATEGORY_TOP_K):
+        if query == "broken":
+            raise RuntimeError("category index unavailable")
+        return await real_candidates(query, q_vec, k)
+
+    monkeypatch.setattr(agentic_service, "category_candidates", flaky_candidates)
+    db = FakeDB()
+
+    start = time.perf_counter()
+    outcomes = await agentic_service.search_products_nl_batch([
+        {"query": "perfume", "merchant_id": "airlinex"},
+        {"query": "broken", "merchant_id": "airlinex"},
+        {"query": "chocolate", "merchant_id": "airlinex", "context": {"cabin": "Business"}},
+    ], db)
+    elapsed = time.perf_counter() - start
+
+    assert len(fake_upstream["embeddings"]) == 1
+    assert len(fake_upstream["embeddings"][0]) == 6
+    assert [r["id"] for r in outcomes[0]["results"]] == ["p1", "p2"]
+    assert isinstance(outcomes[1], RuntimeError)
+    assert outcomes[2]["context_used"] == {"cabin": "Business"}
+    assert len(db.added) == 2
+    assert elapsed < UPSTREAM_DELAY * 2.8   # embeddings overlap the LLM, vector queries overlap each other
+
+
+@pytest.mark.asyncio
+async def test_batch_timings_use_real_merchants(fake_upstream, monkeypatch):
+    from app.services.stage_metrics import StageMetrics
+    metrics = StageMetrics()
+    monkeypatch.setattr(agentic_service, "observe", metrics.observe)
+    monkeypatch.setattr(agentic_service, "stage_timer", metrics.timer)
+    monkeypatch.setattr(agentic_service, "shared_stage_timer", metrics.shared_timer)
+
+    await agentic_service.search_products_nl_batch([
+        {"query": "perfume", "merchant_id": "airlinex"},
+        {"query": "chocolate", "merchant_id": "airlinex"},
+        {"query": "whisky", "merchant_id": "dnata_shop"},
+    ], FakeDB())
+
+    summary = metrics.summary()
+    for stage in ("batch_embedding", "db_log_write"):
+        assert {m: s["count"] for m, s in summary[stage].items()} == {"airlinex": 1, "dnata_shop": 1}
+    assert all("batch" not in merchants for merchants in summary.values())
+
+
+def test_should_hedge_auto_rules(monkeypatch):
+    monkeypatch.setattr(agentic_service, "HEDGE_MODE", "auto")
+    confident = [("Fragrance & Beauty", 0.6)]
+
+    assert not agentic_service._should_hedge({"category": "Fragrance & Beauty"}, confident)
+    assert agentic_service._should_hedge({}, [("Comfort", 0.1)])
+    assert agentic_service._should_hedge({"brand": "Dior"}, confident)
+    assert agentic_service._should_hedge({"price_min": 90, "price_max": 110}, confident)
+    assert not agentic_service._should_hedge({"price_min": 0, "price_max": 500}, confident)
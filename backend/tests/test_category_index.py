@@ -0,0 +1,57 @@
+import numpy as np
+from app.config.categories import CATEGORIES
+from app.services.category_index import CategoryIndex, category_index
+
+CATEGORY_EMBEDDINGS = {
+    name: category_index.matrix[i].astype(float).tolist() for i, name in enumerate(category_index.names)
+}
+
+
+def legacy_best_category(q_vec):
+    """The original per-category Python loop, kept as the reference result."""
+    best_cat, best_sim = None, -1
+    for cat, c_vec in CATEGORY_EMBEDDINGS.items():
+        sim = np.dot(q_vec, c_vec) / (np.linalg.norm(q_vec) * np.linalg.norm(c_vec))
+        if sim > best_sim:
+            best_cat, best_sim = cat, sim
+    return best_cat, best_sim
+
+# --- TEST CASES -------------------------------------------------------------
+
+def test_matches_legacy_loop():
+    rng = np.random.default_rng(7)
+    names = list(CATEGORY_EMBEDDINGS)
+    for i in range(20):
+        # a category vector plus noise, so every category gets exercised
+        q_vec = np.array(CATEGORY_EMBEDDINGS[names[i % len(names)]]) + rng.normal(0, 0.02, 1536)
+        cat, score = category_index.best(q_vec)
+        ref_cat, ref_score = legacy_best_category(q_vec)
+        assert cat == ref_cat
+        assert abs(score - ref_score) < 1e-5
+
+
+def test_rows_are_normalized_float32():
+    assert category_index.names == CATEGORIES
+    assert category_index.matrix.dtype == np.float32
+    assert category_index.matrix.flags["C_CONTIGUOUS"]
+    assert np.allclose(np.linalg.norm(category_index.matrix, axis=1), 1.0, atol=1e-5)
+
+
+def test_artifact_is_memory_mapped_read_only():
+    assert not category_index.matrix.flags["OWNDATA"]
+    assert not category_index.matrix.flags["WRITEABLE"]
+
+
+def test_top_k_batch_sorted_scores():
+    index = CategoryIndex(["a", "b", "c"], np.eye(3))
+    results = index.top_k_batch([[0.9, 0.4, 0.1], [0.0, 0.0, 2.0]], k=2)
+
+    assert [c for c, _ in results[0]] == ["a", "b"]
+    assert results[0][0][1] > results[0][1][1]
+    assert results[1][0] == ("c", 1.0)
+
+
+def test_zero_query_vector_is_safe():
+    cat, score = category_index.best([0.0] * 1536)
+    assert cat in CATEGORY_EMBEDDINGS
+    assert score == 0.0
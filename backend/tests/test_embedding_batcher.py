@@ -0,0 +1,75 @@
+import asyncio
+import pytest
+from app.services.embedding_batcher import EmbeddingBatcher
+
+
+def make_upstream(calls, fail=False):
+    async def embed(texts):
+        calls.append(list(texts))
+        await asyncio.sleep(0.01)
+        if fail:
+            raise RuntimeError("rate limited")
+        return [[float(len(t))] for t in texts]
+    return embed
+
+# --- TEST CASES -------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_batch():
+    calls = []
+    batcher = EmbeddingBatcher(make_upstream(calls), max_batch_size=64, max_wait_ms=5)
+
+    vectors = await asyncio.gather(*(batcher.embed(t) for t in ["a", "bb", "ccc"]))
+
+    assert vectors == [[1.0], [2.0], [3.0]]
+    assert calls == [["a", "bb", "ccc"]]
+
+
+@pytest.mark.asyncio
+async def test_identical_inflight_strings_single_flight():
+    calls = []
+    batcher = EmbeddingBatcher(make_upstream(calls), max_wait_ms=5)
+
+    vectors = await asyncio.gather(*(batcher.embed("perfume") for _ in range(10)))
+
+    assert all(v == [7.0] for v in vectors)
+    assert calls == [["perfume"]]
+    assert batcher.stats()["coalesced"] == 9
+
+
+@pytest.mark.asyncio
+async def test_max_batch_size_flushes_early():
+    calls = []
+    batcher = EmbeddingBatcher(make_upstream(calls), max_batch_size=2, max_wait_ms=1000)
+
+    await asyncio.wait_for(batcher.embed_many(["a", "b", "c", "d"]), timeout=0.5)
+
+    assert calls == [["a", "b"], ["c", "d"]]
+
+
+@pytest.mark.asyncio
+async def test_upstream_error_reaches_every_caller():
+    batcher = EmbeddingBatcher(make_upstream([], fail=True), max_wait_ms=1)
+
+    results = await asyncio.gather(batcher.embed("a"), batcher.embed("b"), return_exceptions=True)
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert batcher._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_cancelled_dispatch_releases_waiters():
+    """A dispatch that dies without an Exception must not strand its callers."""
+    calls = []
+    batcher = EmbeddingBatcher(make_upstream(calls), max_wait_ms=1)
+
+    caller = asyncio.ensure_future(batcher.embed("perfume"))
+    await asyncio.sleep(0.005)   # flushed, upstream call in progress
+    assert len(batcher._tasks) == 1
+    next(iter(batcher._tasks)).cancel()
+
+    with pytest.raises(RuntimeError, match="aborted"):
+        await asyncio.wait_for(caller, timeout=0.5)
+    assert batcher._inflight == {}
+    assert await asyncio.wait_for(batcher.embed("perfume"), timeout=0.5) == [7.0]
+    assert batcher._tasks == set()
@@ -0,0 +1,107 @@
+import pytest
+from types import SimpleNamespace
+from app.services import search_service
+from app.services.cache_tiers import LRUTier, NullTier
+from app.services.embedding_cache import EmbeddingCache, normalize_text, sqlite_embedding_tier
+
+MODEL = "text-embedding-3-small"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+# --- TEST CASES -------------------------------------------------------------
+
+def test_normalize_text():
+    assert normalize_text("  Whisky   UNDER 200 ") == "whisky under 200"
+
+
+def test_lru_hit_miss_and_eviction():
+    cache = EmbeddingCache(LRUTier(max_entries=2, ttl=60))
+    cache.set("perfume", MODEL, [1.0, 0.0])
+    cache.set("whisky", MODEL, [0.0, 1.0])
+
+    assert cache.get("Perfume ", MODEL).tolist() == [1.0, 0.0]
+    cache.set("chocolate", MODEL, [0.5, 0.5])   # evicts "whisky" (least recently used)
+
+    assert cache.get("whisky", MODEL) is None
+    assert cache.get("perfume", MODEL) is not None
+    assert cache.get("perfume", "other-model") is None
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (2, 2, 1)
+
+
+def test_lru_ttl_expiry():
+    clock = FakeClock()
+    cache = EmbeddingCache(LRUTier(max_entries=10, ttl=30, clock=clock))
+    cache.set("perfume", MODEL, [1.0])
+    clock.now += 31
+
+    assert cache.get("perfume", MODEL) is None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_sqlite_tier_survives_restart(tmp_path):
+    path = str(tmp_path / "embeddings.db")
+    EmbeddingCache(NullTier(), sqlite_embedding_tier(path)).set("perfume", MODEL, [0.25, 0.5])
+
+    reopened = EmbeddingCache(NullTier(), sqlite_embedding_tier(path))
+    assert reopened.get("perfume", MODEL).tolist() == [0.25, 0.5]
+
+
+@pytest.mark.asyncio
+async def test_tiered_promotes_disk_hits(tmp_path):
+    path = str(tmp_path / "embeddings.db")
+    await EmbeddingCache(NullTier(), sqlite_embedding_tier(path)).aset("perfume", MODEL, [1.0])
+    cache = EmbeddingCache(LRUTier(max_entries=10), sqlite_embedding_tier(path))
+
+    assert (await cache.aget("perfume", MODEL)).tolist() == [1.0]
+    assert (await cache.aget("perfume", MODEL)).tolist() == [1.0]
+    stats = cache.stats()
+    assert (stats["hits"], stats["memory"]["hits"], stats["disk"]["hits"]) == (2, 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_get_embedding_skips_upstream_on_hit(monkeypatch):
+    calls = []
+
+    async def fake_create(model, input):
+        calls.append(input)
+        return SimpleNamespace(data=[SimpleNamespace(index=0, embedding=[0.5, 0.25])])
+
+    fake_client = SimpleNamespace(embeddings=SimpleNamespace(create=fake_create))
+    monkeypatch.setattr(search_service, "get_openai_client", lambda: fake_client)
+    monkeypatch.setattr(search_service, "embedding_cache", EmbeddingCache(LRUTier(max_entries=10)))
+
+    first = await search_service.get_embedding("perfume")
+    second = await search_service.get_embedding("Perfume")
+
+    assert first == second == [0.5, 0.25]
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_runs_off_the_event_loop():
+    import threading
+    from app.services.cache_tiers import CacheTier, TieredCache
+
+    threads = []
+
+    class RecordingDisk(CacheTier):
+        def get(self, key):
+            threads.append(threading.current_thread())
+            return None
+
+        def set(self, key, value, tag=""):
+            threads.append(threading.current_thread())
+
+    cache = TieredCache(NullTier(), RecordingDisk())
+    await cache.aget("k")
+    await cache.aset("k", 1)
+
+    assert len(threads) == 2
+    assert threading.current_thread() not in threads
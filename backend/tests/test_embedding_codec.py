@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+from app.services.embedding_cache import cache_key
+from app.services.embedding_codec import encode_embedding, decode_embedding, decode_embeddings
+
+VEC = np.random.default_rng(0).standard_normal(1536).astype(np.float32).tolist()
+
+# --- TEST CASES -------------------------------------------------------------
+
+def test_float32_round_trip_is_exact_and_compact():
+    cols = encode_embedding(VEC, fmt="float32")
+    assert cols["embedding_format"] == "float32"
+    assert len(cols["query_embedding_bin"]) == 1536 * 4
+    assert decode_embedding(cols["query_embedding_bin"]).tolist() == VEC
+
+
+def test_float16_halves_size_with_small_error():
+    blob = encode_embedding(VEC, fmt="float16")["query_embedding_bin"]
+    assert len(blob) == 1536 * 2
+    np.testing.assert_allclose(decode_embedding(blob, "float16"), VEC, rtol=1e-3, atol=1e-3)
+
+
+def test_decode_is_zero_copy():
+    blob = encode_embedding(VEC, fmt="float32")["query_embedding_bin"]
+    arr = decode_embedding(blob)
+    assert not arr.flags.owndata and not arr.flags.writeable
+
+    matrix = decode_embeddings([blob, blob, blob], dim=1536)
+    assert matrix.shape == (3, 1536) and not matrix.flags.owndata
+
+
+def test_ref_stores_only_the_cache_key():
+    cols = encode_embedding(VEC, text="perfume", model="m", fmt="ref")
+    assert cols == {"embedding_key": cache_key("perfume", "m"), "embedding_format": "ref"}
+
+
+@pytest.mark.parametrize("fmt", ["json", "float32", "float16", "ref", "none"])
+def test_columns_depend_only_on_format(fmt):
+    """Rows with and without a vector must share a multi-row INSERT."""
+    assert encode_embedding(VEC, text="q", model="m", fmt=fmt).keys() == encode_embedding(None, fmt=fmt).keys()
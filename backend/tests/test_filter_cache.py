@@ -0,0 +1,73 @@
+import pytest
+from app.services.filter_cache import FilterCache, normalize_query
+
+MODEL = "gpt-4o-mini"
+PROMPT = "v1"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+# --- TEST CASES -------------------------------------------------------------
+
+def test_normalize_query():
+    assert normalize_query("  Whisky   UNDER 1,200.00 ") == "whisky under 1200"
+    assert normalize_query("perfume below 1.5k") == "perfume below 1500"
+    assert normalize_query("perfume 0.50") == "perfume 0.5"
+    assert normalize_query("no. 5 perfume") == "no. 5 perfume"
+
+
+@pytest.mark.asyncio
+async def test_lru_hit_miss_eviction_and_ttl():
+    clock = FakeClock()
+    cache = FilterCache(max_entries=2, ttl=60, clock=clock)
+    await cache.aset("whisky under 200", MODEL, PROMPT, {"price_max": 200})
+    await cache.aset("dior", MODEL, PROMPT, {"brand": "Dior"})
+
+    assert await cache.aget("Whisky under 200.0", MODEL, PROMPT) == {"price_max": 200}
+    await cache.aset("chanel", MODEL, PROMPT, {"brand": "Chanel"})   # evicts "dior"
+    assert await cache.aget("dior", MODEL, PROMPT) is None
+
+    clock.now += 61
+    assert await cache.aget("chanel", MODEL, PROMPT) is None
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (1, 2, 2)
+
+
+@pytest.mark.asyncio
+async def test_returned_filters_are_copies():
+    cache = FilterCache()
+    await cache.aset("dior", MODEL, PROMPT, {"brand": "Dior"})
+    (await cache.aget("dior", MODEL, PROMPT))["category"] = "Fragrance & Beauty"
+
+    assert await cache.aget("dior", MODEL, PROMPT) == {"brand": "Dior"}
+
+
+@pytest.mark.asyncio
+async def test_model_and_prompt_version_invalidate(tmp_path):
+    path = str(tmp_path / "filters.db")
+    cache = FilterCache(path=path)
+    await cache.aset("dior", MODEL, PROMPT, {"brand": "Dior"})
+
+    assert await cache.aget("dior", "gpt-4o", PROMPT) is None
+    assert await cache.aget("dior", MODEL, "v2") is None
+
+    await cache.aset("dior", MODEL, "v2", {"brand": "Dior"})
+    assert cache.purge_stale(MODEL, "v2") == 1
+    assert cache.stats()["disk"]["size"] == 1
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_shared_across_instances(tmp_path):
+    path = str(tmp_path / "filters.db")
+    await FilterCache(path=path).aset("whisky under 200", MODEL, PROMPT, {"price_max": 200})
+
+    other = FilterCache(path=path)   # another worker, empty memory tier
+    assert await other.aget("whisky  under 200", MODEL, PROMPT) == {"price_max": 200}
+    assert await other.aget("whisky under 200", MODEL, PROMPT) == {"price_max": 200}
+    stats = other.stats()
+    assert (stats["hits"], stats["disk"]["hits"]) == (2, 1)
@@ -0,0 +1,56 @@
+import pytest
+from app.services.filter_parser import LOW_CONFIDENCE, parse_filters
+from app.services.llm import parse_query_intent
+
+# --- TEST CASES -------------------------------------------------------------
+
+@pytest.mark.parametrize("query, filters", [
+    ("perfume", {}),
+    ("whisky under 200", {"price_max": 200.0}),
+    ("Dior perfume below $150", {"brand": "Dior", "price_max": 150.0}),
+    ("chanel between 100 and 250 AED", {"brand": "Chanel", "price_min": 100.0, "price_max": 250.0}),
+    ("headphones 100-50 dollars", {"price_min": 50.0, "price_max": 100.0}),
+    ("scotch 1,200 or less", {"price_max": 1200.0}),
+    ("lego toys over 1.5k", {"brand": "Lego", "price_min": 1500.0}),
+    ("johnnie walker whisky up to €80", {"brand": "Johnnie Walker", "price_max": 80.0}),
+])
+def test_confident_parses(query, filters):
+    parsed = parse_filters(query)
+
+    assert parsed.filters == filters
+    assert parsed.confidence == 1.0
+    assert parsed.unparsed == []
+
+
+def test_category_keywords_map_to_catalog_categories():
+    assert parse_filters("perfume").category == "Fragrance & Beauty"
+    assert parse_filters("single malt scotch").category == "Food & Beverage"
+    assert parse_filters("chanel").category is None
+
+
+@pytest.mark.parametrize("query", [
+    "perfume 200",            # a bare number may or may not be a price
+    "chanel or dior",         # two brands, one filter slot
+    "rolex",                  # nothing recognised, probably an unknown brand
+    "apple juice",            # a brand alias, but no category or price to confirm it
+    "gift for my wife who likes floral scents",
+])
+def test_ambiguous_queries_are_low_confidence(query):
+    assert parse_filters(query).confidence <= LOW_CONFIDENCE
+
+
+def test_contradictory_price_bounds_are_dropped():
+    parsed = parse_filters("perfume over 100 under 50")
+
+    assert parsed.filters == {}
+    assert parsed.confidence <= LOW_CONFIDENCE
+    assert parse_filters("perfume over 50 under 100").filters == {"price_min": 50.0, "price_max": 100.0}
+
+
+def test_each_unknown_word_lowers_confidence():
+    assert parse_filters("perfume for women").confidence == 0.75
+    assert parse_filters("noise cancelling headphones").confidence == 0.5
+
+
+def test_parse_query_intent_uses_the_parser():
+    assert parse_query_intent("whisky under 200") == {"category": "Food & Beverage", "price_max": 200.0}
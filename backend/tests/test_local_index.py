@@ -0,0 +1,113 @@
+import numpy as np
+import pytest
+from app.services import search_service
+from app.services.retrieval.local_index import LocalVectorIndex
+
+N, DIM = 500, 32
+
+
+@pytest.fixture(scope="module")
+def catalog():
+    rng = np.random.default_rng(42)
+    vectors = rng.normal(size=(N, DIM)).astype(np.float32)
+    categories = ["Fragrance & Beauty", "Electronics", "Luxury Goods"]
+    metadata = [
+        {"category": categories[i % 3], "brand": f"brand{i % 7}", "price": float(i % 300), "tags": ["duty-free"] if i % 2 else []}
+        for i in range(N)
+    ]
+    ids = [f"p{i}" for i in range(N)]
+    return ids, vectors, metadata
+
+
+def brute_force(vectors, metadata, q, top_k, keep=lambda m: True):
+    unit = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    scores = unit @ (q / np.linalg.norm(q))
+    rows = [i for i in np.argsort(-scores) if keep(metadata[i])]
+    return [f"p{i}" for i in rows[:top_k]]
+
+# --- TEST CASES -------------------------------------------------------------
+
+def test_exact_matches_brute_force(catalog):
+    ids, vectors, metadata = catalog
+    index = LocalVectorIndex(ids, vectors, metadata)
+    q = vectors[3] + 0.1
+
+    res = index.query(vector=q.tolist(), top_k=10, include_metadata=True)
+
+    assert [m["id"] for m in res["matches"]] == brute_force(vectors, metadata, q, 10)
+    assert res["matches"][0]["metadata"] == metadata[int(res["matches"][0]["id"][1:])]
+
+
+def test_pinecone_filter_syntax(catalog):
+    ids, vectors, metadata = catalog
+    index = LocalVectorIndex(ids, vectors, metadata)
+    q = vectors[10]
+    flt = {"category": "Electronics", "price": {"$gte": 50, "$lte": 200}}
+
+    res = index.query(vector=q, top_k=5, filter=flt)
+
+    expected = brute_force(
+        vectors, metadata, q, 5,
+        keep=lambda m: m["category"] == "Electronics" and 50 <= m["price"] <= 200,
+    )
+    assert [m["id"] for m in res["matches"]] == expected
+
+
+@pytest.mark.parametrize("flt, keep", [
+    ({"brand": {"$in": ["brand1", "brand2"]}}, lambda m: m["brand"] in ("brand1", "brand2")),
+    ({"brand": {"$ne": "brand1"}}, lambda m: m["brand"] != "brand1"),
+    ({"price": {"$lt": 10}}, lambda m: m["price"] < 10),
+    ({"tags": "duty-free"}, lambda m: "duty-free" in m["tags"]),
+    ({"$or": [{"price": {"$gt": 290}}, {"category": "Luxury Goods"}]},
+     lambda m: m["price"] > 290 or m["category"] == "Luxury Goods"),
+])
+def test_filter_operators(catalog, flt, keep):
+    ids, vectors, metadata = catalog
+    index = LocalVectorIndex(ids, vectors, metadata)
+
+    rows = index.filter_rows(flt)
+
+    assert [f"p{i}" for i in rows] == [ids[i] for i in range(N) if keep(metadata[i])]
+
+
+def test_no_rows_pass_filter(catalog):
+    ids, vectors, metadata = catalog
+    index = LocalVectorIndex(ids, vectors, metadata)
+    assert index.query(vector=vectors[0], top_k=5, filter={"category": "Toys"}) == {"matches": []}
+
+
+def test_ivf_recall(catalog):
+    ids, vectors, metadata = catalog
+    index = LocalVectorIndex(ids, vectors, metadata, mode="ivf", nlist=16, nprobe=6)
+    rng = np.random.default_rng(0)
+
+    recalls = []
+    for row in rng.choice(N, 20, replace=False):
+        q = vectors[row] + rng.normal(0, 0.05, DIM)
+        got = {m["id"] for m in index.query(vector=q, top_k=10)["matches"]}
+        recalls.append(len(got & set(brute_force(vectors, metadata, q, 10))) / 10)
+
+    assert np.mean(recalls) >= 0.8
+
+
+def test_save_load_memory_maps(catalog, tmp_path):
+    ids, vectors, metadata = catalog
+    LocalVectorIndex.save(str(tmp_path), ids, vectors, metadata)
+    index = LocalVectorIndex.load(str(tmp_path))
+
+    assert not index.vectors.flags["WRITEABLE"]
+    assert index.query(vector=vectors[7], top_k=1)["matches"][0]["id"] == "p7"
+
+
+@pytest.mark.asyncio
+async def test_search_service_serves_local_backend(catalog, tmp_path, monkeypatch):
+    ids, vectors, metadata = catalog
+    LocalVectorIndex.save(str(tmp_path / "products-airlinex"), ids, vectors, metadata)
+    monkeypatch.setattr(search_service, "RETRIEVAL_BACKEND", "auto")
+    monkeypatch.setattr(search_service, "LOCAL_INDEX_DIR", str(tmp_path))
+    monkeypatch.setattr(search_service, "_index_handles", {})
+
+    index = await search_service.get_index("airlinex")
+
+    assert index.name == "local"
+    assert index.query(vector=vectors[5], top_k=1)["matches"][0]["id"] == "p5"
@@ -0,0 +1,103 @@
+import asyncio
+import pytest
+import pytest_asyncio
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.orm import sessionmaker
+from app.db import Base
+from app.models.search_log import SearchLog
+from app.services.log_writer import SearchLogWriter
+
+
+def make_row(i, embedding=None):
+    return dict(
+        merchant_id="airlinex", session_id="s", query=f"q{i}", query_embedding=embedding,
+        latency_ms=5, results_count=1, top_result_id="p1", top_result_score=0.9,
+        error_flag=False, client_type="mobile_app", country="UAE",
+    )
+
+
+@pytest_asyncio.fixture
+async def session_factory(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'logs.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    commits = []
+
+    class CountingSession(AsyncSession):
+        async def commit(self):
+            commits.append(1)
+            await super().commit()
+
+    factory = sessionmaker(engine, expire_on_commit=False, class_=CountingSession)
+    factory.commits = commits
+    yield factory
+    await engine.dispose()
+
+
+async def count_rows(factory):
+    async with factory() as session:
+        return await session.scalar(select(func.count(SearchLog.id)))
+
+# --- TEST CASES -------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_rows_are_batched_into_few_transactions(session_factory):
+    writer = SearchLogWriter(session_factory, batch_size=100, flush_ms=50)
+    writer.start()
+    for i in range(250):
+        assert writer.submit(make_row(i))
+    # the last, partial batch goes out on the flush timer, not on close
+    deadline = asyncio.get_running_loop().time() + 5
+    while writer.stats()["written"] < 250 and asyncio.get_running_loop().time() < deadline:
+        await asyncio.sleep(0.01)
+
+    assert await count_rows(session_factory) == 250
+    assert len(session_factory.commits) == 3
+    await writer.aclose()
+
+
+@pytest.mark.asyncio
+async def test_shutdown_drains_queue(session_factory):
+    writer = SearchLogWriter(session_factory, batch_size=1000, flush_ms=10_000)
+    writer.start()
+    for i in range(40):
+        writer.submit(make_row(i))
+    await writer.aclose()
+
+    assert await count_rows(session_factory) == 40
+    assert not writer.submit(make_row(99))   # closed: no longer accepting
+
+
+@pytest.mark.asyncio
+async def test_memory_caps(session_factory):
+    writer = SearchLogWriter(session_factory, max_rows=5, max_bytes=2000)
+    rows = [make_row(i, embedding=[0.1] * 10) for i in range(8)]   # ~600 bytes each
+    accepted = [writer.submit(r) for r in rows]
+
+    # three full rows, one without its embedding, then over the byte cap
+    assert accepted == [True] * 4 + [False] * 4
+    stats = writer.stats()
+    assert stats["dropped"] == 4
+    assert stats["embeddings_stripped"] == 1
+    assert stats["queued_bytes"] <= 2000
+
+    writer = SearchLogWriter(session_factory, max_rows=3)
+    assert [writer.submit(make_row(i)) for i in range(5)] == [True] * 3 + [False] * 2
+
+
+@pytest.mark.asyncio
+async def test_flush_latency_is_recorded_per_merchant(session_factory, monkeypatch):
+    from app.services import log_writer
+    from app.services.stage_metrics import StageMetrics
+    metrics = StageMetrics()
+    monkeypatch.setattr(log_writer, "shared_stage_timer", metrics.shared_timer)
+
+    writer = SearchLogWriter(session_factory)
+    writer.start()
+    writer.submit(make_row(0))
+    writer.submit({**make_row(1), "merchant_id": "dnata_shop"})
+    await writer.aclose()
+
+    flushes = metrics.summary()["db_log_flush"]
+    assert {m: s["count"] for m, s in flushes.items()} == {"airlinex": 1, "dnata_shop": 1}
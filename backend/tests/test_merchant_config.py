@@ -0,0 +1,142 @@
+import json
+import os
+import pytest
+from app.services.merchant_config import MerchantConfigStore, FileRulesSource, DEFAULT_RULES, EMPTY_SNAPSHOT
+from app.services.ranking_service import rank_products
+
+RULES = {
+    "shop": {
+        "blend_weights": {"ml": 0.0, "boost": 1.0, "similarity": 0.0},
+        "category_boosts": {"A": 0.9, "B": 0.5},
+    }
+}
+MATCHES = [
+    {"id": "a", "score": 0.5, "metadata": {"category": "A"}},
+    {"id": "b", "score": 0.5, "metadata": {"category": "B"}},
+]
+
+
+def write_rules(path, rules):
+    path.write_text(json.dumps(rules))
+    # make the change visible even within one mtime tick
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+
+@pytest.fixture
+def store(tmp_path):
+    path = tmp_path / "rules.json"
+    write_rules(path, RULES)
+    return MerchantConfigStore(FileRulesSource(str(path))), path
+
+# --- TEST CASES -------------------------------------------------------------
+
+def test_reload_swaps_snapshot_only_on_change(store):
+    store, path = store
+    first = store.snapshot
+    assert store.reload() is False
+    assert store.snapshot is first
+
+    write_rules(path, {"shop": {**RULES["shop"], "category_boosts": {"A": 0.1, "B": 0.5}}})
+    assert store.reload() is True
+    assert store.snapshot.version != first.version
+    # the old snapshot is untouched for requests still holding it
+    assert first.get("shop").boost("A") == 0.9
+    assert store.snapshot.get("shop").boost("A") == 0.1
+
+
+def test_invalid_rules_keep_current_snapshot(store):
+    store, path = store
+    version = store.snapshot.version
+    write_rules(path, {"shop": {"category_boosts": {"A": "lots"}}})
+
+    assert store.reload() is False
+    assert store.snapshot.version == version
+    assert store.reload_errors == 1
+    assert "non-negative number" in store.stats()["last_error"]
+
+
+def test_ranking_follows_snapshot(store):
+    store, path = store
+    old = store.snapshot
+    assert [m["id"] for m in rank_products([dict(m) for m in MATCHES], "shop", snapshot=old)] == ["a", "b"]
+
+    write_rules(path, {"shop": {**RULES["shop"], "category_boosts": {"A": 0.1, "B": 0.5}}})
+    store.reload()
+    assert [m["id"] for m in rank_products([dict(m) for m in MATCHES], "shop", snapshot=store.snapshot)] == ["b", "a"]
+
+
+def test_unreachable_source_serves_defaults_until_it_recovers(tmp_path):
+    class FlakySource:
+        name = "flaky"
+        calls = 0
+        up = False
+
+        def fetch(self, etag):
+            self.calls += 1
+            if not self.up:
+                raise ConnectionError("rules endpoint down")
+            return "v1", RULES
+
+    source = FlakySource()
+    store = MerchantConfigStore(source)
+    assert source.calls == 0   # nothing fetched at construction (module import)
+
+    assert store.snapshot.merchants() == []
+    assert store.snapshot.get("shop") is DEFAULT_RULES
+    assert store.reload_errors == 1
+
+    source.up = True
+    assert store.reload() is True
+    assert store.snapshot.version == "v1"
+    assert store.snapshot.get("shop").boost("A") == 0.9
+
+
+@pytest.mark.asyncio
+async def test_first_use_on_event_loop_loads_off_loop(store):
+    import asyncio
+    import threading
+    store, path = store
+    loaded_on = []
+    fetch = store.source.fetch
+
+    def recording_fetch(etag):
+        loaded_on.append(threading.current_thread())
+        return fetch(etag)
+
+    store.source.fetch = recording_fetch
+    assert store.snapshot is EMPTY_SNAPSHOT   # served at once, load scheduled
+    await store._load_task
+
+    assert loaded_on and threading.current_thread() not in loaded_on
+    assert store.snapshot.get("shop").boost("A") == 0.9
+
+
+def test_http_source_sends_etag_back_verbatim(monkeypatch):
+    import io
+    import urllib.error
+    import urllib.request
+    from app.services.merchant_config import HttpRulesSource
+    sent = []
+
+    class Response(io.BytesIO):
+        headers = {"ETag": 'W/"v1"'}
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+    def fake_urlopen(req, timeout):
+        sent.append(req.get_header("If-none-match"))
+        if sent[-1] == 'W/"v1"':
+            raise urllib.error.HTTPError(req.full_url, 304, "Not Modified", {}, None)
+        return Response(json.dumps(RULES).encode())
+
+    monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
+    store = MerchantConfigStore(HttpRulesSource("http://rules.example/rules.json"))
+
+    assert store.snapshot.version == "v1"
+    assert store.reload() is False
+    assert sent == [None, 'W/"v1"']
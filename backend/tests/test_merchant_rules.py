@@ -0,0 +1,66 @@
+import pytest
+from app.config.merchant_weights import MERCHANT_RULES
+from app.services.merchant_rules import CompiledMerchantRules
+from app.services.merchant_config import get_merchant_rules
+
+# --- REFERENCE ----------------------------------------------------------------
+
+def dict_walk_boost(merchant, category, trip=None, cabin=None):
+    """The original rule walk over the nested config dicts."""
+    boost = merchant.get("category_boosts", {}).get(category, 1.0)
+    if trip:
+        for rule in merchant.get("trip_rules", []):
+            if (
+                trip.get("from") in rule.get("route", [])
+                and trip.get("to") in rule.get("route", [])
+                and rule.get("boost_category") == category
+            ):
+                boost *= rule.get("weight", 1.0)
+    if cabin:
+        boost *= merchant.get("cabin_rules", {}).get(cabin.lower(), {}).get("luxury_category_boost", 1.0)
+    return boost
+
+CATEGORIES = ["Fragrance & Beauty", "Luxury", "Electronics", "Comfort", "Gadgets", "Unknown"]
+TRIPS = [None, {}, {"from": "DXB", "to": "CDG"}, {"from": "CDG", "to": "DXB"}, {"from": "DXB", "to": "LHR"},
+         {"from": "DXB", "to": "JFK"}, {"from": "DXB"}]
+CABINS = [None, "", "Business", "first", "Economy", "premium"]
+
+# --- TEST CASES -------------------------------------------------------------
+
+@pytest.mark.parametrize("merchant_id", list(MERCHANT_RULES) + ["unknown_merchant"])
+def test_compiled_boost_identical_to_rule_walk(merchant_id):
+    rules = get_merchant_rules(merchant_id)
+    merchant = MERCHANT_RULES.get(merchant_id, {})
+    for category in CATEGORIES:
+        for trip in TRIPS:
+            for cabin in CABINS:
+                assert rules.boost(category, trip, cabin) == dict_walk_boost(merchant, category, trip, cabin)
+
+
+def test_many_route_rules_compile_to_lookups():
+    airports = [f"A{i:02d}" for i in range(40)]
+    merchant = {
+        "category_boosts": {"Luxury": 1.3},
+        "trip_rules": [
+            {"route": ["DXB", a], "boost_category": c, "weight": 1.0 + i / 1000}
+            for i, (a, c) in enumerate((a, c) for a in airports for c in ("Luxury", "Comfort"))
+        ] + [{"route": ["DXB", "A01"], "boost_category": "Luxury", "weight": 1.1}],   # stacks with the first
+        "cabin_rules": {"first": {"luxury_category_boost": 1.4}},
+    }
+    rules = CompiledMerchantRules("many_routes", merchant)
+    for a in airports[:5]:
+        for category in ("Luxury", "Comfort", "Other"):
+            trip = {"from": a, "to": "DXB"}
+            assert rules.boost(category, trip, "First") == dict_walk_boost(merchant, category, trip, "First")
+
+
+@pytest.mark.parametrize("bad", [
+    {"blend_weights": {"ml": 0.5, "boost": 0.5}},
+    {"category_boosts": {"Luxury": "high"}},
+    {"trip_rules": [{"route": "DXB-CDG", "boost_category": "Luxury", "weight": 1.2}]},
+    {"trip_rules": [{"route": ["DXB", "CDG"], "weight": 1.2}]},
+    {"cabin_rules": {"first": {"luxury_category_boost": -1}}},
+])
+def test_invalid_rules_rejected(bad):
+    with pytest.raises(ValueError):
+        CompiledMerchantRules("bad", bad)
@@ -0,0 +1,84 @@
+import logging
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from app.middleware.logging import LoggingMiddleware
+from app.services.stage_metrics import StageMetrics
+
+
+def make_app(**kwargs):
+    app = FastAPI()
+    app.add_middleware(LoggingMiddleware, **kwargs)
+    metrics = StageMetrics()
+
+    @app.get("/staged")
+    async def staged():
+        metrics.observe("llm_filter", "airlinex", 0.0123)
+        return {"ok": True}
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for i in range(3):
+                yield f"chunk{i};"
+        return StreamingResponse(chunks())
+
+    @app.get("/boom")
+    async def boom():
+        raise RuntimeError("boom")
+
+    return app
+
+
+async def get(app, path):
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.get(path)
+
+# --- TEST CASES -------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_server_timing_lists_request_stages():
+    res = await get(make_app(), "/staged")
+    timing = res.headers["server-timing"]
+    assert "llm_filter;dur=12.3" in timing
+    assert "total;dur=" in timing
+
+
+@pytest.mark.asyncio
+async def test_streaming_response_passes_through():
+    res = await get(make_app(), "/stream")
+    assert res.text == "chunk0;chunk1;chunk2;"
+    assert "server-timing" in res.headers
+
+
+@pytest.mark.asyncio
+async def test_access_log_sampling_keeps_errors(caplog):
+    app = make_app(sample_rate=0.0)
+    with caplog.at_level(logging.INFO, logger="agentic-ai"):
+        await get(app, "/staged")
+        await get(app, "/boom")
+    lines = [r.getMessage() for r in caplog.records if r.name == "agentic-ai"]
+    assert len(lines) == 1 and "/boom status=500" in lines[0]
+
+
+@pytest.mark.parametrize("use_queue", ["1", "0"])
+def test_log_lines_are_formatted_once(monkeypatch, capsys, use_queue):
+    import atexit
+    from app.logging_config import setup_logging
+    root = logging.getLogger()
+    monkeypatch.setattr(root, "handlers", [])   # basicConfig only configures a bare root
+    monkeypatch.setattr(root, "level", root.level)
+    monkeypatch.setenv("LOG_QUEUE", use_queue)
+
+    listener = setup_logging()
+    logging.getLogger("test.logq").info("hello %d", 1)
+    if listener is not None:
+        atexit.unregister(listener.stop)
+        listener.stop()   # drains the queue
+
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 1
+    date, clock, rest = lines[0].split(" ", 2)
+    assert rest == "[INFO] test.logq - hello 1"
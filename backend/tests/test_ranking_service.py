@@ -1,6 +1,8 @@
 import pytest
 from datetime import datetime, timedelta, timezone
-from app.services.ranking_service import rank_products, compute_merchant_boost, ml_infer_score
+from app.services.ranking_service import (
+    rank_products, compute_merchant_boost, ml_infer_score, score_candidates, rank_page,
+)
 
 # --- MOCK DATA SETUP --------------------------------------------------------
 
@@ -102,3 +104,63 @@ def test_rank_order_consistency():
     ranked = rank_products(MOCK_MATCHES, MERCHANT_ID, FULL_CONTEXT)
     scores = [r["rank_score"] for r in ranked]
     assert scores == sorted(scores, reverse=True)
+
+
+def _pool(n):
+    categories = ["Perfume", "Luxury", "Fragrance & Beauty", "Electronics", "Comfort"]
+    return [
+        {"id": f"p{i}", "score": round(1 - i / (n + 1), 3), "metadata": {"category": categories[i % 5]}}
+        for i in range(n)
+    ]
+
+
+def _reference_rank(matches, merchant_id, context=None):
+    """The original per-item loop, kept to pin the batch ranker's output."""
+    blend = {"ml": 0.6, "boost": 0.3, "similarity": 0.1}
+    context = context or {}
+    ranked = []
+    for m in matches:
+        final = (
+            blend["ml"] * ml_infer_score(m, context) +
+            blend["boost"] * compute_merchant_boost(
+                merchant_id, m.get("metadata", {}).get("category", "General"),
+                context.get("trip") or {}, context.get("cabin", ""),
+            ) +
+            blend["similarity"] * m.get("score", 0.0)
+        )
+        ranked.append({**m, "rank_score": round(max(0.0, min(1.0, final)), 4)})
+    ranked.sort(key=lambda x: x["rank_score"], reverse=True)
+    return ranked
+
+
+@pytest.mark.parametrize("context", [None, {}, FULL_CONTEXT, {"cabin": "First", "trip": {"from": "DXB", "to": "LHR"}}])
+def test_rank_products_identical_to_reference(context):
+    pool = _pool(200) + [{"id": "bare", "metadata": {}}]
+    expected = _reference_rank(pool, MERCHANT_ID, context)
+    ranked = rank_products([dict(m) for m in pool], MERCHANT_ID, context)
+    assert ranked == expected
+
+
+def test_score_candidates_matches_rank_products():
+    pool = _pool(50)
+    expected = {m["id"]: m["rank_score"] for m in rank_products([dict(m) for m in pool], MERCHANT_ID, FULL_CONTEXT)}
+    scores = score_candidates(pool, MERCHANT_ID, FULL_CONTEXT)
+    assert [expected[m["id"]] for m in pool] == scores.tolist()
+
+
+def test_rank_page_pages_concatenate_to_full_ranking():
+    """Pages are slices of one ranking of the whole pool."""
+    pool = _pool(50)
+    full = [m["id"] for m in rank_products([dict(m) for m in pool], MERCHANT_ID, FULL_CONTEXT)]
+    paged = []
+    for offset in range(0, 50, 7):
+        paged += [m["id"] for m in rank_page(pool, MERCHANT_ID, FULL_CONTEXT, offset, 7)]
+    assert paged == full
+    assert "rank_score" not in pool[0]
+
+
+def test_rank_page_beyond_pool_keeps_similarity_order():
+    pool = _pool(30)
+    page = rank_page(pool, MERCHANT_ID, FULL_CONTEXT, offset=15, limit=10, pool_size=20)
+    assert len(page) == 10
+    assert [m["id"] for m in page[5:]] == [f"p{i}" for i in range(20, 25)]
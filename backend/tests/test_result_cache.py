@@ -0,0 +1,51 @@
+from app.services.result_cache import ResultSetCache, encode_cursor, decode_cursor, query_key
+
+# --- TEST CASES -------------------------------------------------------------
+
+def test_cursor_round_trip():
+    assert decode_cursor(encode_cursor("abc123", 40)) == ("abc123", 40)
+    assert decode_cursor("not-a-cursor") is None
+
+
+def test_query_key_normalizes_text_and_context_order():
+    assert query_key("m", "  Perfume ", {"a": 1, "b": 2}) == query_key("m", "perfume", {"b": 2, "a": 1})
+    assert query_key("m", "perfume", None) != query_key("other", "perfume", None)
+
+
+def test_ttl_and_lru_eviction():
+    now = [0.0]
+    cache = ResultSetCache(max_entries=2, ttl=10, clock=lambda: now[0])
+    cache.put("e1", "k1", {"n": 1})
+    cache.put("e2", "k2", {"n": 2})
+    assert cache.lookup("k1") == {"n": 1}
+
+    cache.put("e3", "k3", {"n": 3})          # evicts e2, the least recently used
+    assert cache.get("e2") is None
+    assert cache.lookup("k2") is None
+
+    now[0] = 11
+    assert cache.get("e1") is None
+    assert cache.stats()["size"] == 1
+
+
+def test_expired_entry_takes_its_aliases():
+    now = [0.0]
+    cache = ResultSetCache(max_entries=10, ttl=10, clock=lambda: now[0])
+    cache.put("e1", "k1", {"n": 1})
+    cache.put("e1", "k1b", {"n": 1})
+    now[0] = 11
+
+    assert cache.lookup("k1") is None
+    assert cache._aliases == {} and cache._keys == {}
+
+
+def test_eviction_drops_only_the_evicted_aliases():
+    cache = ResultSetCache(max_entries=2)
+    cache.put("e1", "k1", {"n": 1})
+    cache.put("e2", "k2", {"n": 2})
+    cache.put("e3", "k1", {"n": 3})          # k1 now points at e3; evicts e1
+    cache.put("e4", "k4", {"n": 4})          # evicts e2
+
+    assert cache.lookup("k1") == {"n": 3}
+    assert set(cache._aliases) == {"k1", "k4"}
+    assert set(cache._keys) == {"e3", "e4"}
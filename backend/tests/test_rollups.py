@@ -0,0 +1,186 @@
+from datetime import datetime, timedelta
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.orm import sessionmaker
+from app.db import Base
+from app.models.search_log import SearchLog
+from app.models.search_rollup import SearchRollup, SearchTermRollup  # noqa: F401 (registers tables)
+from app.services.log_writer import SearchLogWriter
+from app.services.rollups import read_metrics, rebuild_rollups
+
+T0 = datetime(2026, 10, 18, 9, 0)
+
+
+def make_row(merchant_id, query, minutes, latency):
+    return dict(
+        merchant_id=merchant_id, session_id="s", query=query, latency_ms=latency,
+        results_count=1, error_flag=False, timestamp=T0 + timedelta(minutes=minutes),
+    )
+
+
+ROWS = [
+    make_row("airlinex", "perfume", 0, 100),
+    make_row("airlinex", "perfume", 5, 200),
+    make_row("airlinex", "headphones", 70, 300),
+    make_row("dnata_shop", "perfume", 10, 50),
+]
+
+
+@pytest_asyncio.fixture
+async def session_factory(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'logs.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def written(session_factory):
+    writer = SearchLogWriter(session_factory, batch_size=2, flush_ms=10)
+    writer.start()
+    for row in ROWS:
+        writer.submit(row)
+    await writer.aclose()
+    return session_factory
+
+# --- TEST CASES -------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_metrics_from_incremental_rollups(written):
+    async with written() as db:
+        all_time = await read_metrics(db)
+        airlinex = await read_metrics(db, merchant_id="airlinex")
+        first_hour = await read_metrics(db, merchant_id="airlinex", start=T0, end=T0 + timedelta(hours=1))
+
+    assert all_time["total_queries"] == 4
+    assert all_time["top_terms"] == {"perfume": 3, "headphones": 1}
+    assert airlinex["avg_latency_ms"] == 200.0
+    assert first_hour["granularity"] == "minute"
+    assert first_hour["total_queries"] == 2
+    assert first_hour["avg_latency_ms"] == 150.0
+
+
+@pytest.mark.asyncio
+async def test_rebuild_matches_incremental(written):
+    async with written() as db:
+        incremental = (await db.execute(select(SearchRollup).order_by(
+            SearchRollup.merchant_id, SearchRollup.granularity, SearchRollup.bucket_start
+        ))).scalars().all()
+        before = [(r.merchant_id, r.granularity, r.bucket_start, r.query_count, r.latency_sum_ms) for r in incremental]
+
+        assert await rebuild_rollups(db) == len(ROWS)
+        await db.commit()
+        db.expunge_all()
+        rebuilt = (await db.execute(select(SearchRollup).order_by(
+            SearchRollup.merchant_id, SearchRollup.granularity, SearchRollup.bucket_start
+        ))).scalars().all()
+
+    assert [(r.merchant_id, r.granularity, r.bucket_start, r.query_count, r.latency_sum_ms) for r in rebuilt] == before
+
+
+@pytest.mark.asyncio
+async def test_missing_rollup_tables_do_not_lose_logs(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'bare.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=[SearchLog.__table__])
+    factory = sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+
+    writer = SearchLogWriter(factory)
+    writer.start()
+    writer.submit(ROWS[0])
+    await writer.aclose()
+
+    assert writer.stats()["written"] == 1
+    assert writer.stats()["rollup_failures"] == 1
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_deadlocked_rollup_is_retried(session_factory, monkeypatch):
+    from app.services import log_writer, rollups
+
+    class Deadlock(Exception):
+        sqlstate = "40P01"
+
+    seen = []
+
+    async def flaky_apply(session, rows):
+        seen.append(len(rows))
+        if len(seen) == 1:
+            raise Deadlock("deadlock detected")
+        await rollups.apply_rollups(session, rows)
+
+    monkeypatch.setattr(log_writer, "apply_rollups", flaky_apply)
+    writer = SearchLogWriter(session_factory)
+    writer.start()
+    for row in ROWS:
+        writer.submit(row)
+    await writer.aclose()
+
+    stats = writer.stats()
+    assert (stats["rollup_retries"], stats["rollup_failures"]) == (1, 0)
+    async with session_factory() as db:
+        assert (await read_metrics(db))["total_queries"] == len(ROWS)
+
+
+@pytest.mark.asyncio
+async def test_upserts_run_in_primary_key_order():
+    """Concurrent writers lock hot rows in the same order, so they cannot deadlock."""
+    from types import SimpleNamespace
+    from app.services.rollups import apply_rollups
+
+    class RecordingSession:
+        bind = SimpleNamespace(dialect=SimpleNamespace(name="sqlite"))
+
+        def __init__(self):
+            self.params = []
+
+        async def execute(self, stmt, params):
+            self.params.append(params)
+
+    session = RecordingSession()
+    await apply_rollups(session, list(reversed(ROWS)))
+
+    buckets, terms = session.params
+    bucket_keys = [(p["merchant_id"], p["granularity"], p["bucket_start"]) for p in buckets]
+    term_keys = [(p["merchant_id"], p["bucket_start"], p["query_hash"]) for p in terms]
+    assert bucket_keys == sorted(bucket_keys)
+    assert term_keys == sorted(term_keys)
+
+
+@pytest.mark.asyncio
+async def test_portable_upsert_path(session_factory, monkeypatch):
+    """Databases without ON CONFLICT fall back to UPDATE-then-INSERT with the same totals."""
+    from app.services import rollups
+    monkeypatch.setattr(rollups, "NATIVE_UPSERT_DIALECTS", set())
+
+    writer = SearchLogWriter(session_factory, batch_size=2, flush_ms=10)
+    writer.start()
+    for row in ROWS:
+        writer.submit(row)
+    await writer.aclose()
+
+    assert writer.stats()["rollup_failures"] == 0
+    async with session_factory() as db:
+        metrics = await read_metrics(db)
+    assert metrics["total_queries"] == 4
+    assert metrics["top_terms"] == {"perfume": 3, "headphones": 1}
+
+
+@pytest.mark.asyncio
+async def test_terms_are_keyed_by_normalized_hash(session_factory):
+    from app.models.search_rollup import TERM_MAX_CHARS
+    long_query = "perfume " * 200
+    writer = SearchLogWriter(session_factory)
+    writer.start()
+    for query in ("Perfume", "  perfume ", long_query, long_query + "x"):
+        writer.submit(make_row("airlinex", query, 0, 100))
+    await writer.aclose()
+
+    async with session_factory() as db:
+        terms = (await db.execute(select(SearchTermRollup))).scalars().all()
+    counts = sorted((len(t.query), t.query_count) for t in terms)
+    assert counts == [(7, 2), (TERM_MAX_CHARS, 1), (TERM_MAX_CHARS, 1)]
@@ -0,0 +1,112 @@
+import asyncio
+import pytest
+from app.services import search_service
+
+
+class CountingPinecone:
+    def __init__(self):
+        self.opened = []
+
+    def Index(self, name):
+        self.opened.append(name)
+        return object()
+
+
+@pytest.fixture
+def pinecone(monkeypatch):
+    pc = CountingPinecone()
+    monkeypatch.setattr(search_service, "get_pinecone", lambda: pc)
+    monkeypatch.setattr(search_service, "_index_handles", {})
+    monkeypatch.setattr(search_service, "_index_stats", {"handle_hits": 0, "handle_misses": 0, "queries": 0})
+    return pc
+
+# --- TEST CASES -------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_index_handle_is_reused(pinecone):
+    first = await search_service.get_index("airlinex")
+    second = await search_service.get_index("airlinex")
+    default = await search_service.get_index("unknown_merchant")   # maps to the same index
+
+    assert first is second is default
+    assert pinecone.opened == ["products-airlinex"]
+    stats = search_service.index_pool_stats()
+    assert stats["handle_hits"] == 2
+    assert stats["handle_reuse_rate"] == round(2 / 3, 4)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_open_one_handle(pinecone):
+    handles = await asyncio.gather(*(search_service.get_index("airlinex") for _ in range(10)))
+
+    assert len({id(h) for h in handles}) == 1
+    assert pinecone.opened == ["products-airlinex"]
+
+
+@pytest.mark.asyncio
+async def test_invalidate_reopens(pinecone):
+    await search_service.get_index("airlinex")
+    search_service.invalidate_index("airlinex")
+    await search_service.get_index("airlinex")
+
+    assert pinecone.opened == ["products-airlinex", "products-airlinex"]
+
+
+@pytest.mark.asyncio
+async def test_batch_embeds_once_and_isolates_errors(monkeypatch):
+    import time
+    embedded = []
+
+    async def fake_get_embeddings(texts):
+        embedded.append(list(texts))
+        return [[float(i)] for i in range(len(texts))]
+
+    class SlowIndex:
+        def query(self, vector, top_k, include_metadata, filter=None):
+            time.sleep(0.1)
+            if filter == {"broken": True}:
+                raise RuntimeError("bad filter")
+            return {"matches": [{"id": f"q{vector[0]:.0f}", "score": 1.0, "metadata": {}}]}
+
+    async def fake_get_index(merchant_id):
+        return SlowIndex()
+
+    monkeypatch.setattr(search_service, "get_embeddings", fake_get_embeddings)
+    monkeypatch.setattr(search_service, "get_index", fake_get_index)
+
+    start = time.perf_counter()
+    outcomes = await search_service.search_products_batch([
+        {"query": "perfume"},
+        {"query": "whisky", "filters": {"broken": True}},
+        {"query": "chocolate", "top_k": 3},
+    ])
+    elapsed = time.perf_counter() - start
+
+    assert embedded == [["perfume", "whisky", "chocolate"]]
+    assert outcomes[0][0]["id"] == "q0"
+    assert isinstance(outcomes[1], RuntimeError)
+    assert outcomes[2][0]["id"] == "q2"
+    assert elapsed < 0.25   # vector queries overlap
+
+
+@pytest.mark.asyncio
+async def test_batch_embedding_failure_falls_back_per_item(monkeypatch):
+    async def fake_get_embeddings(texts):
+        if len(texts) > 1 or texts[0] == "bad":
+            raise RuntimeError("upstream rejected the input")
+        return [[1.0]]
+
+    class Index:
+        def query(self, vector, top_k, include_metadata, filter=None):
+            return {"matches": [{"id": "p1", "score": 1.0, "metadata": {}}]}
+
+    async def fake_get_index(merchant_id):
+        return Index()
+
+    monkeypatch.setattr(search_service, "get_embeddings", fake_get_embeddings)
+    monkeypatch.setattr(search_service, "get_index", fake_get_index)
+
+    outcomes = await search_service.search_products_batch([{"query": "perfume"}, {"query": "bad"}])
+
+    assert outcomes[0][0]["id"] == "p1"
+    assert isinstance(outcomes[1], RuntimeError)
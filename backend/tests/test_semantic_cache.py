@@ -0,0 +1,87 @@
+import numpy as np
+from app.services.semantic_cache import SemanticResultCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def result_set(n=3, latency_ms=120, exhaustive=True):
+    return {"matches": [{"id": f"p{i}"} for i in range(n)], "exhaustive": exhaustive, "latency_ms": latency_ms}
+
+
+def vec(*xs):
+    return np.array(xs, dtype=np.float32)
+
+FILTER = {"category": "Fragrance & Beauty"}
+
+# --- TEST CASES -------------------------------------------------------------
+
+def test_near_duplicate_hits_and_reports_saved_latency():
+    cache = SemanticResultCache(threshold=0.95)
+    cached = result_set()
+    cache.put("airlinex", vec(1, 0, 0), FILTER, None, "v1", cached)
+
+    assert cache.lookup("airlinex", vec(0.99, 0.05, 0), FILTER, None, "v1") is cached
+    assert cache.lookup("airlinex", vec(0.6, 0.8, 0), FILTER, None, "v1") is None   # too far
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+    assert stats["saved_latency_ms"] == 120
+
+
+def test_filters_context_and_merchant_must_match():
+    cache = SemanticResultCache()
+    cache.put("airlinex", vec(1, 0), FILTER, {"cabin": "Business"}, "v1", result_set())
+
+    assert cache.lookup("airlinex", vec(1, 0), {"category": "Comfort"}, {"cabin": "Business"}, "v1") is None
+    assert cache.lookup("airlinex", vec(1, 0), FILTER, {"cabin": "Economy"}, "v1") is None
+    assert cache.lookup("airliney", vec(1, 0), FILTER, {"cabin": "Business"}, "v1") is None
+    assert cache.lookup("airlinex", vec(1, 0), FILTER, {"cabin": "Business"}, "v1") is not None
+
+
+def test_most_similar_entry_wins():
+    cache = SemanticResultCache(threshold=0.9)
+    far, near = result_set(), result_set()
+    cache.put("airlinex", vec(0.95, 0.31), FILTER, None, "v1", far)
+    cache.put("airlinex", vec(1, 0.05), FILTER, None, "v1", near)
+
+    assert cache.lookup("airlinex", vec(1, 0), FILTER, None, "v1") is near
+
+
+def test_truncated_window_too_small_is_a_miss():
+    cache = SemanticResultCache()
+    cache.put("airlinex", vec(1, 0), FILTER, None, "v1", result_set(n=3, exhaustive=False))
+
+    assert cache.lookup("airlinex", vec(1, 0), FILTER, None, "v1", min_window=10) is None
+    assert cache.lookup("airlinex", vec(1, 0), FILTER, None, "v1", min_window=3) is not None
+
+
+def test_ttl_size_rules_and_catalog_invalidation():
+    clock = FakeClock()
+    cache = SemanticResultCache(max_entries=2, ttl=60, clock=clock)
+    cache.put("airlinex", vec(1, 0, 0), FILTER, None, "v1", result_set())
+    cache.put("airlinex", vec(0, 1, 0), FILTER, None, "v1", result_set())
+    cache.put("airlinex", vec(0, 0, 1), FILTER, None, "v1", result_set())   # evicts the first
+
+    assert cache.lookup("airlinex", vec(1, 0, 0), FILTER, None, "v1") is None
+    assert cache.lookup("airlinex", vec(0, 1, 0), FILTER, None, "v2") is None   # rules changed
+    assert cache.lookup("airlinex", vec(0, 1, 0), FILTER, None, "v1") is None   # and was dropped
+
+    clock.now += 61
+    assert cache.lookup("airlinex", vec(0, 0, 1), FILTER, None, "v1") is None
+
+    cache.put("airlinex", vec(1, 0, 0), FILTER, None, "v1", result_set())
+    cache.invalidate("airlinex")
+    assert cache.lookup("airlinex", vec(1, 0, 0), FILTER, None, "v1") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_disabled_cache_never_stores():
+    cache = SemanticResultCache(max_entries=0)
+    cache.put("airlinex", vec(1, 0), FILTER, None, "v1", result_set())
+
+    assert cache.lookup("airlinex", vec(1, 0), FILTER, None, "v1") is None
@@ -0,0 +1,36 @@
+from app.services.stage_metrics import StageMetrics, METRIC_NAME
+
+# --- TEST CASES -------------------------------------------------------------
+
+def test_quantiles_from_buckets():
+    m = StageMetrics()
+    for _ in range(90):
+        m.observe("vector_query", "airlinex", 0.02)    # 10–25 ms bucket
+    for _ in range(10):
+        m.observe("vector_query", "airlinex", 0.9)     # 600 ms–1 s bucket
+
+    s = m.summary()["vector_query"]["airlinex"]
+    assert s["count"] == 100
+    assert 10 <= s["p50_ms"] <= 25
+    assert 600 <= s["p95_ms"] <= 1000
+    assert 600 <= s["p99_ms"] <= 1000
+
+
+def test_prometheus_exposition_is_cumulative():
+    m = StageMetrics()
+    m.observe("llm_filter", "airlinex", 0.003)
+    m.observe("llm_filter", "airlinex", 0.3)
+    text = m.render_prometheus()
+
+    assert f"# TYPE {METRIC_NAME} histogram" in text
+    assert f'{METRIC_NAME}_bucket{{stage="llm_filter",merchant="airlinex",le="0.005"}} 1' in text
+    assert f'{METRIC_NAME}_bucket{{stage="llm_filter",merchant="airlinex",le="0.4"}} 2' in text
+    assert f'{METRIC_NAME}_bucket{{stage="llm_filter",merchant="airlinex",le="+Inf"}} 2' in text
+    assert f'{METRIC_NAME}_count{{stage="llm_filter",merchant="airlinex"}} 2' in text
+
+
+def test_merchant_label_cardinality_is_capped():
+    m = StageMetrics(max_merchants=2)
+    for merchant in ("a", "b", "c", "d"):
+        m.observe("ranking", merchant, 0.001)
+    assert set(m.summary()["ranking"]) == {"a", "b", "other"}
@@ -0,0 +1,89 @@
+# scripts/bench_middleware.py
+"""
+Per-request overhead of the access-log middleware.
+
+Drives a one-route FastAPI app with direct ASGI calls (no sockets, no client)
+and reports mean microseconds per request for: no middleware, the previous
+BaseHTTPMiddleware implementation, and the pure ASGI LoggingMiddleware.
+Access logs go to a NullHandler so only middleware cost is measured.
+
+Usage (from the repo root):
+    PYTHONPATH=backend python scripts/bench_middleware.py
+"""
+import os
+import time
+import asyncio
+import logging
+from fastapi import FastAPI
+from starlette.middleware.base import BaseHTTPMiddleware
+from app.middleware.logging import LoggingMiddleware
+
+REQUESTS = int(os.getenv("BENCH_REQUESTS", "20000"))
+
+logging.getLogger("agentic-ai").addHandler(logging.NullHandler())
+logging.getLogger("agentic-ai").propagate = False
+logging.getLogger("agentic-ai").setLevel(logging.INFO)
+logger = logging.getLogger("agentic-ai")
+
+
+class BaseHTTPLoggingMiddleware(BaseHTTPMiddleware):
+    """The previous implementation, for comparison."""
+    async def dispatch(self, request, call_next):
+        start = time.time()
+        response = await call_next(request)
+        duration = round(time.time() - start, 3)
+        logger.info(
+            f"{request.method} {request.url.path} "
+            f"status={response.status_code} duration={duration}s"
+        )
+        return response
+
+
+def make_app(middleware=None, **kwargs):
+    app = FastAPI()
+    if middleware:
+        app.add_middleware(middleware, **kwargs)
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+    return app
+
+
+SCOPE = {
+    "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+    "scheme": "http", "path": "/ping", "raw_path": b"/ping", "root_path": "", "query_string": b"",
+    "headers": [(b"host", b"bench")], "client": ("127.0.0.1", 1234), "server": ("bench", 80),
+}
+
+
+async def run(app) -> float:
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    for _ in range(500):   # warm up routing, lifespan-free startup paths
+        await app(dict(SCOPE), receive, send)
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        await app(dict(SCOPE), receive, send)
+    return (time.perf_counter() - start) / REQUESTS * 1e6
+
+
+async def main():
+    results = {
+        "none": await run(make_app()),
+        "BaseHTTPMiddleware (before)": await run(make_app(BaseHTTPLoggingMiddleware)),
+        "pure ASGI (after)": await run(make_app(LoggingMiddleware)),
+        "pure ASGI, 10% sampled": await run(make_app(LoggingMiddleware, sample_rate=0.1)),
+    }
+    base = results["none"]
+    print(f"{'middleware':<30} {'us/request':>10} {'overhead':>9}")
+    for name, us in results.items():
+        print(f"{name:<30} {us:>10.1f} {us - base:>+9.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
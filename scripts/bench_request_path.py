@@ -0,0 +1,168 @@
+# scripts/bench_request_path.py
+"""
+Requests/sec for one worker on /search and /agentic-search against local stubs.
+
+A threaded stub server (in its own process) stands in for OpenAI (embeddings +
+chat completions) and the Pinecone data plane, sleeping STUB_DELAY_MS per call
+like a real round trip. The FastAPI app runs in-process on a single event loop,
+so the numbers are what one uvicorn worker can sustain.
+
+Usage (from the repo root):
+    PYTHONPATH=backend python scripts/bench_request_path.py
+    PYTHONPATH=backend BENCH_CONCURRENCY=64 STUB_DELAY_MS=80 python scripts/bench_request_path.py
+"""
+import os
+import json
+import base64
+import struct
+import time
+import asyncio
+import logging
+import multiprocessing
+import urllib.request
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+STUB_DELAY_MS = int(os.getenv("STUB_DELAY_MS", "50"))
+CONCURRENCY = int(os.getenv("BENCH_CONCURRENCY", "32"))
+REQUESTS = int(os.getenv("BENCH_REQUESTS", "256"))
+DIM = 1536
+VECTOR = [0.01] * DIM
+VECTOR_B64 = base64.b64encode(struct.pack(f"<{DIM}f", *VECTOR)).decode()
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers.get("content-length", 0))) or b"{}")
+        time.sleep(STUB_DELAY_MS / 1000)
+
+        if self.path.endswith("/embeddings"):
+            inputs = body["input"] if isinstance(body["input"], list) else [body["input"]]
+            # Like the real API, honour the base64 encoding the SDK asks for by default
+            vector = VECTOR_B64 if body.get("encoding_format") == "base64" else VECTOR
+            out = {
+                "object": "list",
+                "model": body.get("model"),
+                "data": [{"object": "embedding", "index": i, "embedding": vector} for i in range(len(inputs))],
+                "usage": {"prompt_tokens": 1, "total_tokens": 1},
+            }
+        elif self.path.endswith("/chat/completions"):
+            out = {
+                "id": "stub", "object": "chat.completion", "created": 0, "model": body.get("model"),
+                "choices": [{"index": 0, "finish_reason": "stop",
+                             "message": {"role": "assistant", "content": '{"price_max": 200}'}}],
+                "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+            }
+        else:  # Pinecone /query
+            out = {"matches": [
+                {"id": f"p{i}", "score": 1 - i / 20, "metadata": {"category": "Fragrance & Beauty", "price": 50 + i}}
+                for i in range(body.get("topK", 10))
+            ]}
+
+        payload = json.dumps(out).encode()
+        self.send_response(200)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+class StubIndex:
+    """Blocking HTTP client shaped like pinecone's Index.query, pointed at the stub."""
+
+    def __init__(self, base_url: str):
+        self.url = f"{base_url}/query"
+
+    def query(self, vector, top_k, filter=None, include_metadata=True, **kwargs):
+        body = json.dumps({"vector": vector, "topK": top_k, "filter": filter}).encode()
+        req = urllib.request.Request(self.url, data=body, headers={"content-type": "application/json"})
+        with urllib.request.urlopen(req) as resp:
+            return json.loads(resp.read())
+
+
+class StubPinecone:
+    def __init__(self, base_url: str):
+        self.base_url = base_url
+
+    def Index(self, name=None, **kwargs):
+        return StubIndex(self.base_url)
+
+
+class FakeSession:
+    def add(self, obj):
+        pass
+
+    async def commit(self):
+        pass
+
+
+async def fake_db():
+    yield FakeSession()
+
+
+async def drive(client, path: str, payload: dict) -> float:
+    sem = asyncio.Semaphore(CONCURRENCY)
+
+    async def one():
+        async with sem:
+            resp = await client.post(path, json=payload)
+            resp.raise_for_status()
+
+    start = time.perf_counter()
+    await asyncio.gather(*[one() for _ in range(REQUESTS)])
+    return REQUESTS / (time.perf_counter() - start)
+
+
+def serve_stub(port_queue):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.daemon_threads = True
+    port_queue.put(server.server_address[1])
+    server.serve_forever()
+
+
+async def main():
+    port_queue = multiprocessing.Queue()
+    stub = multiprocessing.Process(target=serve_stub, args=(port_queue,), daemon=True)
+    stub.start()
+    base_url = f"http://127.0.0.1:{port_queue.get()}"
+
+    os.environ["OPENAI_BASE_URL"] = f"{base_url}/v1"
+    os.environ.setdefault("OPENAI_API_KEY", "bench")
+    os.environ.setdefault("PINECONE_API_KEY", "bench")
+    os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+    # Every request repeats the same query; keep the embedding cache out of the numbers
+    os.environ.setdefault("EMBEDDING_CACHE_SIZE", "0")
+
+    import httpx
+    from app.main import app
+    from app.db import get_db
+    from app.services import search_service
+    from app.services.registry import registry
+
+    # Per-request INFO logging would dominate the measurement
+    logging.disable(logging.INFO)
+
+    registry.override("pinecone", StubPinecone(base_url))
+    app.dependency_overrides[get_db] = fake_db
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=60) as client:
+        print(f"stub delay={STUB_DELAY_MS}ms concurrency={CONCURRENCY} requests={REQUESTS}")
+        rps = await drive(client, "/search", {"query": "perfume", "top_k": 5, "merchant_id": "airlinex"})
+        print(f"/search          {rps:8.1f} req/s")
+        rps = await drive(client, "/agentic-search", {"query": "perfume under 200", "merchant_id": "airlinex"})
+        print(f"/agentic-search  {rps:8.1f} req/s")
+
+    batcher = getattr(search_service, "embedding_batcher", None)
+    if batcher is not None:
+        print(f"embedding batcher: {batcher.stats()}")
+
+    stub.terminate()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
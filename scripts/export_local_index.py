@@ -0,0 +1,38 @@
+# scripts/export_local_index.py
+"""
+Copy a Pinecone index into the on-disk format served by LocalVectorIndex.
+
+Usage (from the repo root):
+    PYTHONPATH=backend python scripts/export_local_index.py products-airlinex
+    # then: RETRIEVAL_BACKEND=auto LOCAL_INDEX_DIR=data/local_indexes ./backend/run.sh
+"""
+import os
+import sys
+import logging
+from pinecone import Pinecone
+from app.services.retrieval.local_index import LocalVectorIndex
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger("export_local_index")
+
+OUT_DIR = os.getenv("LOCAL_INDEX_DIR", "data/local_indexes")
+
+def main(index_name: str, namespace: str = ""):
+    pc = Pinecone(api_key=os.getenv("PINECONE_API_KEY"))
+    index = pc.Index(index_name)
+
+    ids, vectors, metadata = [], [], []
+    for id_batch in index.list(namespace=namespace):
+        fetched = index.fetch(ids=list(id_batch), namespace=namespace)
+        for vid, vec in fetched.vectors.items():
+            ids.append(vid)
+            vectors.append(vec.values)
+            metadata.append(vec.metadata or {})
+        logger.info("Fetched %d vectors", len(ids))
+
+    path = os.path.join(OUT_DIR, index_name)
+    LocalVectorIndex.save(path, ids, vectors, metadata)
+    logger.info("Saved %d vectors to %s", len(ids), path)
+
+if __name__ == "__main__":
+    main(*sys.argv[1:])
@@ -1,15 +1,31 @@
+# scripts/generate_category_embeddings.py
+"""
+Embed every category and write the binary artifact the backend memory-maps:
+
+    backend/app/config/category_embeddings.npy   float32 (n_categories, dim), unit-norm rows
+    backend/app/config/category_embeddings.json  {"model", "dim", "categories": [...]} in row order
+
+Usage (from the repo root):
+    PYTHONPATH=backend python scripts/generate_category_embeddings.py
+"""
 import os, json
+import numpy as np
 from openai import OpenAI
 from app.config.categories import CATEGORIES
 
+MODEL = "text-embedding-3-small"
+OUT_DIR = "backend/app/config"
+
 client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 
-embeddings = {}
-for cat in CATEGORIES:
-    resp = client.embeddings.create(model="text-embedding-3-small", input=cat)
-    embeddings[cat] = resp.data[0].embedding
+resp = client.embeddings.create(model=MODEL, input=CATEGORIES)
+vectors = [d.embedding for d in sorted(resp.data, key=lambda d: d.index)]
+
+matrix = np.asarray(vectors, dtype=np.float32)
+matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
 
-with open("backend/app/config/category_embeddings.json", "w") as f:
-    json.dump(embeddings, f)
+np.save(os.path.join(OUT_DIR, "category_embeddings.npy"), np.ascontiguousarray(matrix))
+with open(os.path.join(OUT_DIR, "category_embeddings.json"), "w") as f:
+    json.dump({"model": MODEL, "dim": matrix.shape[1], "categories": CATEGORIES}, f, indent=2)
 
-print("✅ Saved category embeddings to backend/app/config/category_embeddings.json")
+print(f"✅ Saved {matrix.shape[0]} category embeddings ({matrix.shape[1]}-dim) to {OUT_DIR}/category_embeddings.npy")
@@ -0,0 +1,81 @@
+# scripts/migrate_search_log_embeddings.py
+"""
+Migrate search_logs to compact embedding storage.
+
+1. Adds query_embedding_bin / embedding_format / embedding_key if missing.
+2. Backfills packed bytes from the JSON query_embedding in id-ordered batches.
+3. With --drop-json, clears the JSON copy of each converted row (then VACUUM).
+
+Safe to re-run: only rows without query_embedding_bin are converted.
+Afterwards set SEARCH_LOG_EMBEDDING=float16 (or float32 / ref) for new rows.
+
+Usage (from the repo root):
+    PYTHONPATH=backend python scripts/migrate_search_log_embeddings.py --format float16
+    PYTHONPATH=backend python scripts/migrate_search_log_embeddings.py --format float16 --drop-json
+"""
+import asyncio
+import argparse
+import logging
+from sqlalchemy import LargeBinary, String, bindparam, inspect, null, select, text
+from app.db import get_engine, dispose_engine
+from app.models.search_log import SearchLog
+from app.services.embedding_codec import DTYPES, encode_embedding
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger("migrate_search_log_embeddings")
+
+NEW_COLUMNS = {
+    "query_embedding_bin": LargeBinary(),
+    "embedding_format": String(16),
+    "embedding_key": String(64),
+}
+
+async def add_columns(conn):
+    existing = await conn.run_sync(
+        lambda sync_conn: {c["name"] for c in inspect(sync_conn).get_columns(SearchLog.__tablename__)}
+    )
+    for name, type_ in NEW_COLUMNS.items():
+        if name not in existing:
+            ddl = type_.compile(dialect=conn.dialect)
+            await conn.execute(text(f"ALTER TABLE {SearchLog.__tablename__} ADD COLUMN {name} {ddl}"))
+            logger.info("Added column %s %s", name, ddl)
+
+async def backfill(fmt: str, drop_json: bool, batch_size: int):
+    engine = get_engine()
+    async with engine.begin() as conn:
+        await add_columns(conn)
+
+    last_id, converted = 0, 0
+    while True:
+        async with engine.begin() as conn:
+            rows = (await conn.execute(
+                select(SearchLog.id, SearchLog.query_embedding)
+                .where(SearchLog.id > last_id)
+                .where(SearchLog.query_embedding.isnot(None))
+                .where(SearchLog.query_embedding_bin.is_(None))
+                .order_by(SearchLog.id)
+                .limit(batch_size)
+            )).all()
+            if not rows:
+                break
+            params = [{"row_id": row_id, **encode_embedding(embedding, fmt=fmt)} for row_id, embedding in rows]
+            table = SearchLog.__table__
+            await conn.execute(table.update().where(table.c.id == bindparam("row_id")), params)
+            if drop_json:
+                # SQL NULL, not a JSON 'null' document
+                ids = [row_id for row_id, _ in rows]
+                await conn.execute(table.update().where(table.c.id.in_(ids)).values(query_embedding=null()))
+        last_id = rows[-1][0]
+        converted += len(rows)
+        logger.info("Converted %d rows (up to id %d)", converted, last_id)
+
+    await dispose_engine()
+    logger.info("Done: %d rows now store %s bytes", converted, fmt)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--format", choices=list(DTYPES), default="float16")
+    parser.add_argument("--drop-json", action="store_true")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+    asyncio.run(backfill(args.format, args.drop_json, args.batch_size))
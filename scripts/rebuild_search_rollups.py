@@ -0,0 +1,39 @@
+# scripts/rebuild_search_rollups.py
+"""
+Create the /metrics rollup tables and (re)build them from search_logs.
+
+Run once after deploying the rollups, and whenever logs were written without
+the background writer (SEARCH_LOG_WRITER=0) or with LOG_ROLLUPS=0. Can be
+scheduled as a periodic compactor over a recent window.
+
+Usage (from the repo root):
+    PYTHONPATH=backend python scripts/rebuild_search_rollups.py
+    PYTHONPATH=backend python scripts/rebuild_search_rollups.py --since-hours 24
+"""
+import asyncio
+import argparse
+import logging
+from datetime import timedelta
+from app.db import Base, get_engine, get_sessionmaker, dispose_engine
+from app.models.search_rollup import SearchRollup, SearchTermRollup
+from app.services.rollups import rebuild_rollups, utcnow
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger("rebuild_search_rollups")
+
+async def main(since_hours):
+    async with get_engine().begin() as conn:
+        await conn.run_sync(
+            Base.metadata.create_all, tables=[SearchRollup.__table__, SearchTermRollup.__table__]
+        )
+    start = utcnow() - timedelta(hours=since_hours) if since_hours else None
+    async with get_sessionmaker()() as session:
+        scanned = await rebuild_rollups(session, start=start)
+        await session.commit()
+    await dispose_engine()
+    logger.info("Rolled up %d search logs", scanned)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--since-hours", type=float, default=None)
+    asyncio.run(main(parser.parse_args().since_hours))